@@ -13,6 +13,58 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
     openai_model: str = Field("gpt-4o-mini", env="OPENAI_MODEL")
 
+    llm_cache_enabled: bool = Field(True, env="LLM_CACHE_ENABLED")
+    llm_cache_ttl_seconds: int = Field(7 * 24 * 3600, env="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_entries: int = Field(512, env="LLM_CACHE_MAX_ENTRIES")
+
+    llm_chunk_token_threshold: int = Field(12000, env="LLM_CHUNK_TOKEN_THRESHOLD")
+    llm_chunk_target_tokens: int = Field(4000, env="LLM_CHUNK_TARGET_TOKENS")
+    llm_max_concurrent_chunks: int = Field(4, env="LLM_MAX_CONCURRENT_CHUNKS")
+    llm_max_prompt_tokens: int = Field(100000, env="LLM_MAX_PROMPT_TOKENS")
+    llm_compact_transcripts: bool = Field(False, env="LLM_COMPACT_TRANSCRIPTS")
+    llm_json_repair_requests: int = Field(1, env="LLM_JSON_REPAIR_REQUESTS")
+
+    llm_http_max_connections: int = Field(20, env="LLM_HTTP_MAX_CONNECTIONS")
+    llm_http_max_keepalive_connections: int = Field(10, env="LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    llm_http_keepalive_expiry: float = Field(30.0, env="LLM_HTTP_KEEPALIVE_EXPIRY")
+    llm_http_connect_timeout: float = Field(5.0, env="LLM_HTTP_CONNECT_TIMEOUT")
+    llm_http_read_timeout: float = Field(60.0, env="LLM_HTTP_READ_TIMEOUT")
+    llm_http_max_retries: int = Field(3, env="LLM_HTTP_MAX_RETRIES")
+    llm_http_deadline_seconds: float = Field(120.0, env="LLM_HTTP_DEADLINE_SECONDS")
+    llm_http_hedge_delay_seconds: Optional[float] = Field(None, env="LLM_HTTP_HEDGE_DELAY_SECONDS")
+
+    whisper_model: str = Field("base", env="WHISPER_MODEL")
+    whisper_device: str = Field("cpu", env="WHISPER_DEVICE")
+    whisper_compute_type: str = Field("int8", env="WHISPER_COMPUTE_TYPE")
+    whisper_cpu_threads: int = Field(0, env="WHISPER_CPU_THREADS")
+    whisper_num_workers: int = Field(1, env="WHISPER_NUM_WORKERS")
+    whisper_beam_size: int = Field(5, env="WHISPER_BEAM_SIZE")
+    whisper_batch_size: int = Field(0, env="WHISPER_BATCH_SIZE")
+    whisper_parallel_workers: int = Field(0, env="WHISPER_PARALLEL_WORKERS")
+    whisper_parallel_chunk_seconds: float = Field(60.0, env="WHISPER_PARALLEL_CHUNK_SECONDS")
+
+    diarization_backend: str = Field("pyannote", env="DIARIZATION_BACKEND")
+    diarization_light_max_seconds: float = Field(180.0, env="DIARIZATION_LIGHT_MAX_SECONDS")
+    diarization_optimized: bool = Field(False, env="DIARIZATION_OPTIMIZED")
+    diarization_segmentation_batch_size: int = Field(32, env="DIARIZATION_SEGMENTATION_BATCH_SIZE")
+    diarization_embedding_batch_size: int = Field(32, env="DIARIZATION_EMBEDDING_BATCH_SIZE")
+    multichannel_diarization: bool = Field(False, env="MULTICHANNEL_DIARIZATION")
+    speaker_bounds_slack: int = Field(1, env="SPEAKER_BOUNDS_SLACK")
+    speaker_occurrence_threshold: float = Field(0.6, env="SPEAKER_OCCURRENCE_THRESHOLD")
+    ecapa_backend: str = Field("eager", env="ECAPA_BACKEND")
+    ecapa_quantize: bool = Field(False, env="ECAPA_QUANTIZE")
+    ecapa_parity_threshold: float = Field(0.99, env="ECAPA_PARITY_THRESHOLD")
+
+    live_window_seconds: float = Field(12.0, env="LIVE_WINDOW_SECONDS")
+    live_step_seconds: float = Field(2.0, env="LIVE_STEP_SECONDS")
+    live_holdback_seconds: float = Field(1.0, env="LIVE_HOLDBACK_SECONDS")
+    live_max_lag_seconds: float = Field(10.0, env="LIVE_MAX_LAG_SECONDS")
+    live_cluster_threshold: float = Field(0.5, env="LIVE_CLUSTER_THRESHOLD")
+    live_stable_windows: int = Field(3, env="LIVE_STABLE_WINDOWS")
+
+    response_compression: str = Field("gzip", env="RESPONSE_COMPRESSION")
+    response_compression_min_bytes: int = Field(1024, env="RESPONSE_COMPRESSION_MIN_BYTES")
+
     huggingface_token: Optional[str] = Field(default=None, env="HUGGINGFACE_TOKEN")
 
     data_dir: Path = Field(default=Path("data"), env="DATA_DIR")
@@ -24,6 +76,45 @@ class Settings(BaseSettings):
         "extra": "ignore"  # Ignore extra fields in .env
     }
     
+    @property
+    def llm_cache_dir(self) -> Path:
+        """Directory holding persisted LLM responses."""
+        return self.data_dir / "cache" / "llm"
+
+    @property
+    def diarization_cache_dir(self) -> Path:
+        """Directory holding per-meeting turn embeddings and words for re-clustering."""
+        return self.data_dir / "cache" / "diarization"
+
+    @property
+    def meeting_store_path(self) -> Path:
+        """SQLite database indexing processed meetings for partial retrieval."""
+        return self.data_dir / "meetings.sqlite3"
+
+    @property
+    def search_index_path(self) -> Path:
+        """SQLite FTS5 index over processed meeting transcripts."""
+        return self.data_dir / "search.sqlite3"
+
+    @property
+    def ecapa_export_dir(self) -> Path:
+        """Directory holding exported TorchScript/ONNX speaker encoder graphs."""
+        return self.data_dir / "cache" / "ecapa"
+
+    @property
+    def llm_http_options(self) -> dict:
+        """Keyword arguments for the pooled LLM HTTP clients."""
+        return {
+            'max_connections': self.llm_http_max_connections,
+            'max_keepalive_connections': self.llm_http_max_keepalive_connections,
+            'keepalive_expiry': self.llm_http_keepalive_expiry,
+            'connect_timeout': self.llm_http_connect_timeout,
+            'read_timeout': self.llm_http_read_timeout,
+            'max_retries': self.llm_http_max_retries,
+            'deadline_seconds': self.llm_http_deadline_seconds,
+            'hedge_delay': self.llm_http_hedge_delay_seconds
+        }
+
     @property
     def pipeline_log_path(self) -> Path:
         """Path to the pipeline log file."""
@@ -1,10 +1,11 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 import uuid
 import os
+import asyncio
 import json
 from dotenv import load_dotenv
 import structlog
@@ -12,7 +13,16 @@ import structlog
 from .pipeline.processor import MeetingProcessor
 from .pipeline.processor import SpeakerDiarizer
 from .pipeline.processor import AudioProcessor
+from .pipeline.processor import DIARIZATION_BACKENDS
 from .pipeline.speaker_database import SpeakerDatabase
+from .pipeline.speaker_bounds import derive_speaker_bounds
+from .pipeline.segments import as_segments
+from .pipeline.meeting_store import MeetingStore
+from .pipeline.search_index import SEARCH_SOURCES, TranscriptSearchIndex
+from .pipeline.speaker_index import SpeakerOccurrenceIndex, propagate_label
+from .utils.serialization import FastJSONResponse, RawJSON, dumps
+from .utils.compression import CompressionMiddleware
+from .services.token_budget import TokenBudgetExceededError
 from .core.config import get_settings
 from .core.logging import setup_logging
 
@@ -36,9 +46,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses; SSE progress streams are passed through unbuffered
+app.add_middleware(
+    CompressionMiddleware,
+    mode=get_settings().response_compression,
+    minimum_size=get_settings().response_compression_min_bytes,
+)
+
+# Supported strategies for generating all action item views
+ACTION_VIEW_METHODS = ("n_plus_1", "single_call")
+
 # Global processor instance
 processor: Optional[MeetingProcessor] = None
 speaker_db: Optional[SpeakerDatabase] = None
+meeting_store: Optional[MeetingStore] = None
+search_index: Optional[TranscriptSearchIndex] = None
+speaker_index: Optional[SpeakerOccurrenceIndex] = None
 
 @app.on_event("startup")
 async def startup_event():
@@ -105,11 +128,46 @@ def get_speaker_db() -> SpeakerDatabase:
         speaker_db = SpeakerDatabase()
     return speaker_db
 
+def get_meeting_store() -> MeetingStore:
+    """Lazy initialization of the meeting store."""
+    global meeting_store
+    if meeting_store is None:
+        meeting_store = MeetingStore(get_settings().meeting_store_path)
+    return meeting_store
+
+def get_search_index() -> TranscriptSearchIndex:
+    """Lazy initialization of the transcript search index."""
+    global search_index
+    if search_index is None:
+        search_index = TranscriptSearchIndex(get_settings().search_index_path)
+    return search_index
+
+def get_speaker_index() -> SpeakerOccurrenceIndex:
+    """Lazy initialization of the cross-meeting speaker occurrence index."""
+    global speaker_index
+    if speaker_index is None:
+        speaker_index = SpeakerOccurrenceIndex(get_settings().meeting_store_path)
+    return speaker_index
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok", "message": "Meeting Notes API is running"}
 
+@app.get("/llm/stats")
+async def llm_stats_endpoint():
+    """Report LLM HTTP retry/latency statistics and response cache statistics."""
+    try:
+        proc = get_processor()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    llm_service = proc.llm_service
+    return FastJSONResponse(content={
+        "http": llm_service.get_http_stats(),
+        "cache": llm_service.cache.get_stats() if llm_service.cache else None
+    })
+
 @app.get("/speakers")
 async def list_speakers_endpoint():
     """List all registered speakers and their metadata."""
@@ -125,7 +183,7 @@ async def list_speakers_endpoint():
                 "name": name,
                 "metadata": data.get("metadata", {})
             })
-        return JSONResponse(content={"speakers": speakers})
+        return FastJSONResponse(content={"speakers": speakers})
     except Exception as e:
         logger.exception("list_speakers_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to list speakers: {str(e)}")
@@ -137,7 +195,17 @@ async def get_speaker_endpoint(name: str):
     data = db.get_speaker(name)
     if not data:
         raise HTTPException(status_code=404, detail="Speaker not found")
-    return JSONResponse(content={"name": name, "metadata": data.get("metadata", {})})
+    return FastJSONResponse(content={"name": name, "metadata": data.get("metadata", {})})
+
+@app.get("/speakers/{name}/meetings")
+async def get_speaker_meetings_endpoint(name: str, threshold: Optional[float] = None):
+    """Meetings where a registered speaker's voice occurs, matched by embedding."""
+    embedding = get_speaker_db().get_speaker_embedding(name)
+    if embedding is None:
+        raise HTTPException(status_code=404, detail="Speaker not found")
+    threshold = get_settings().speaker_occurrence_threshold if threshold is None else threshold
+    meetings = await asyncio.to_thread(get_speaker_index().find, embedding, threshold)
+    return FastJSONResponse(content={"name": name, "threshold": threshold, "meetings": meetings})
 
 @app.post("/speakers")
 async def add_speaker_endpoint(
@@ -182,7 +250,7 @@ async def add_speaker_endpoint(
             if not success:
                 raise RuntimeError("Failed to persist speaker")
 
-            return JSONResponse(content={"id": clean_name, "name": clean_name, "metadata": db.get_speaker(clean_name).get("metadata", {})})
+            return FastJSONResponse(content={"id": clean_name, "name": clean_name, "metadata": db.get_speaker(clean_name).get("metadata", {})})
         finally:
             import shutil
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -200,13 +268,75 @@ async def delete_speaker_endpoint(name: str):
             raise HTTPException(status_code=404, detail="Speaker not found")
         if not db.remove_speaker(name):
             raise HTTPException(status_code=500, detail="Failed to remove speaker")
-        return JSONResponse(content={"success": True})
+        return FastJSONResponse(content={"success": True})
     except HTTPException:
         raise
     except Exception as e:
         logger.exception("delete_speaker_failed", speaker=name, error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to delete speaker: {str(e)}")
 
+def _save_result(meeting_id: str, result: dict) -> RawJSON:
+    """Write a meeting result as compact JSON and index it in the meeting store.
+
+    Segments are serialized once; the returned ``RawJSON`` list is embedded in the file,
+    the store rows and the HTTP response.
+    """
+    segment_json = [dumps(segment.to_dict()) for segment in as_segments(result['segments'])]
+    segments_json = RawJSON(b'[' + b','.join(segment_json) + b']')
+
+    result_file = Path("data/results") / f"meeting_{meeting_id}.json"
+    result_file.parent.mkdir(parents=True, exist_ok=True)
+    result_file.write_bytes(dumps({**result, 'segments': segments_json}))
+
+    try:
+        get_meeting_store().save(meeting_id, result, segment_json=segment_json)
+    except Exception as e:
+        # The result file is the record of truth; a failed index write must not fail the request
+        structlog.get_logger(__name__).warning("meeting_store_save_failed", meeting_id=meeting_id, error=str(e))
+    return segments_json
+
+def _build_process_response(request_id: str, result: dict, known_speakers: List[str],
+                            segments_json: Optional[RawJSON] = None) -> dict:
+    """Flatten a meeting result into the response shape the frontend expects."""
+    # Extract speaker information for frontend display
+    detected_speakers = []
+    known_speakers = set(known_speakers)
+
+    segments = as_segments(result['segments'])
+    for speaker_name in dict.fromkeys(segment.get('matched_speaker', 'Unknown') for segment in segments):
+        detected_speakers.append({
+            "name": speaker_name,
+            "matched": speaker_name in known_speakers
+        })
+    if segments_json is None:
+        segments_json = RawJSON(dumps([segment.to_dict() for segment in segments]))
+
+    # Flatten response structure to match frontend expectations
+    response_data = {
+        "success": True,
+        "request_id": request_id,
+        "transcription": {
+            "segments": segments_json
+        },
+        "speakers": detected_speakers,
+        "metadata": {
+            "segments": len(segments),
+            "speakers": result['processing_metadata']['speakers_identified'],
+            "duration": result['processing_metadata']['total_duration']
+        }
+    }
+
+    # Add LLM insights if available
+    if 'llm_insights' in result and isinstance(result['llm_insights'], dict):
+        if 'summary' in result['llm_insights']:
+            response_data['summary'] = result['llm_insights']['summary']
+        if 'action_items_by_speaker' in result['llm_insights']:
+            response_data['action_items_by_speaker'] = result['llm_insights']['action_items_by_speaker']
+        if 'participants' in result['llm_insights']:
+            response_data['participants'] = result['llm_insights']['participants']
+
+    return response_data
+
 @app.post("/process")
 async def process_meeting_endpoint(
     meeting_audio: UploadFile = File(...),
@@ -215,11 +345,29 @@ async def process_meeting_endpoint(
     voice_sample_2: Optional[UploadFile] = File(None),
     voice_sample_3: Optional[UploadFile] = File(None),
     generate_insights: bool = Form(True),
-    generate_all_action_views: bool = Form(False)
+    generate_all_action_views: bool = Form(False),
+    action_views_method: str = Form("n_plus_1"),
+    diarization_backend: Optional[str] = Form(None),
+    multichannel: Optional[bool] = Form(None),
+    num_speakers: Optional[int] = Form(None),
+    attendee_count: Optional[int] = Form(None)
 ):
-    """Process a meeting with optional voice samples for speaker identification."""
+    """Process a meeting with optional voice samples for speaker identification.
+
+    ``diarization_backend`` is ``pyannote``, ``light`` or ``auto`` (light for short meetings);
+    defaults to the DIARIZATION_BACKEND setting. ``multichannel`` diarizes recordings with one
+    participant per channel from per-channel speech activity (default: MULTICHANNEL_DIARIZATION).
+    ``num_speakers`` fixes the speaker count; the speaker count can also be changed afterwards
+    with ``POST /meetings/{request_id}/recluster``. Otherwise ``speaker_names``, the voice
+    samples and ``attendee_count`` (e.g. calendar invitees) bound automatic speaker detection.
+    """
     logger = structlog.get_logger(__name__)
 
+    if action_views_method not in ACTION_VIEW_METHODS:
+        raise HTTPException(status_code=400, detail=f"action_views_method must be one of {ACTION_VIEW_METHODS}")
+    if diarization_backend is not None and diarization_backend not in DIARIZATION_BACKENDS:
+        raise HTTPException(status_code=400, detail=f"diarization_backend must be one of {DIARIZATION_BACKENDS}")
+
     try:
         proc = get_processor()
     except RuntimeError as e:
@@ -269,76 +417,36 @@ async def process_meeting_endpoint(
                    request_id=request_id,
                    generate_insights=generate_insights,
                    generate_all_action_views=generate_all_action_views)
-        result = proc.process_meeting(meeting_path, voice_samples,
-                                         generate_insights=generate_insights,
-                                         generate_all_action_views=generate_all_action_views)
+        # Narrow automatic speaker detection with what the caller already knows
+        speaker_bounds = derive_speaker_bounds(speaker_list, voice_samples.keys(), attendee_count,
+                                               num_speakers, slack=get_settings().speaker_bounds_slack)
+        logger.info("speaker_bounds_derived", **speaker_bounds)
+
+        # Off the event loop, so live sessions keep streaming during a batch run
+        result = await asyncio.to_thread(
+            proc.process_meeting, meeting_path, voice_samples,
+            num_speakers=speaker_bounds['num_speakers'],
+            min_speakers=speaker_bounds['min_speakers'],
+            max_speakers=speaker_bounds['max_speakers'],
+            generate_insights=generate_insights,
+            generate_all_action_views=generate_all_action_views,
+            action_views_method=action_views_method,
+            diarization_backend=diarization_backend,
+            multichannel=multichannel,
+            meeting_id=request_id
+        )
 
         # Save results
-        results_dir = Path("data/results")
-        results_dir.mkdir(exist_ok=True)
-        result_file = results_dir / f"meeting_{request_id}.json"
-
-        with open(result_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        segments_json = _save_result(request_id, result)
 
-        logger.info("meeting_processing_complete",
-                   request_id=request_id,
-                   result_file=str(result_file))
+        logger.info("meeting_processing_complete", request_id=request_id)
 
         # Clean up temporary files
         import shutil
         shutil.rmtree(temp_dir, ignore_errors=True)
 
-        # Extract speaker information for frontend display
-        detected_speakers = []
-        known_speakers = set(proc.speaker_db.list_speakers())
-        
-        # Clean segments to ensure JSON serializable values
-        clean_segments = []
-        for segment in result['segments']:
-            speaker_name = segment.get('matched_speaker', 'Unknown')
-            if speaker_name not in [s['name'] for s in detected_speakers]:
-                detected_speakers.append({
-                    "name": speaker_name,
-                    "matched": speaker_name in known_speakers
-                })
-            
-            # Convert numpy types to native Python types for JSON serialization
-            clean_segment = {}
-            for key, value in segment.items():
-                if hasattr(value, 'item'):  # numpy scalar
-                    clean_segment[key] = value.item()
-                elif isinstance(value, (list, tuple)):
-                    clean_segment[key] = [v.item() if hasattr(v, 'item') else v for v in value]
-                else:
-                    clean_segment[key] = value
-            clean_segments.append(clean_segment)
-        
-        # Flatten response structure to match frontend expectations
-        response_data = {
-            "success": True,
-            "request_id": request_id,
-            "transcription": {
-                "segments": clean_segments
-            },
-            "speakers": detected_speakers,
-            "metadata": {
-                "segments": len(clean_segments),
-                "speakers": result['processing_metadata']['speakers_identified'],
-                "duration": result['processing_metadata']['total_duration']
-            }
-        }
-        
-        # Add LLM insights if available
-        if 'llm_insights' in result and isinstance(result['llm_insights'], dict):
-            if 'summary' in result['llm_insights']:
-                response_data['summary'] = result['llm_insights']['summary']
-            if 'action_items_by_speaker' in result['llm_insights']:
-                response_data['action_items_by_speaker'] = result['llm_insights']['action_items_by_speaker']
-            if 'participants' in result['llm_insights']:
-                response_data['participants'] = result['llm_insights']['participants']
-        
-        return JSONResponse(content=response_data)
+        response_data = _build_process_response(request_id, result, proc.speaker_db.list_speakers(), segments_json)
+        return FastJSONResponse(content=response_data)
 
     except Exception as e:
         logger.exception("meeting_processing_failed",
@@ -351,11 +459,175 @@ async def process_meeting_endpoint(
 
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
+@app.post("/meetings/{meeting_id}/recluster")
+async def recluster_meeting_endpoint(
+    meeting_id: str,
+    num_speakers: Optional[int] = Form(None),
+    min_speakers: Optional[int] = Form(None),
+    max_speakers: Optional[int] = Form(None),
+    generate_insights: bool = Form(False),
+    generate_all_action_views: bool = Form(False),
+    action_views_method: str = Form("n_plus_1")
+):
+    """Re-cluster a processed meeting with a different speaker count.
+
+    Reuses the cached turn embeddings and Whisper words from ``/process``, so only
+    clustering, speaker matching and transcript assembly run. Returns the ``/process``
+    response shape and replaces the saved result.
+    """
+    logger = structlog.get_logger(__name__)
+
+    if action_views_method not in ACTION_VIEW_METHODS:
+        raise HTTPException(status_code=400, detail=f"action_views_method must be one of {ACTION_VIEW_METHODS}")
+    if min_speakers and max_speakers and min_speakers > max_speakers:
+        raise HTTPException(status_code=400, detail="min_speakers must not exceed max_speakers")
+
+    try:
+        proc = get_processor()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    try:
+        proc.speaker_db.reload()
+        result = await asyncio.to_thread(
+            proc.recluster_meeting, meeting_id, num_speakers, min_speakers, max_speakers,
+            generate_insights, generate_all_action_views, action_views_method
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.exception("recluster_failed", meeting_id=meeting_id, error=str(e))
+        raise HTTPException(status_code=500, detail=f"Re-clustering failed: {str(e)}")
+
+    segments_json = _save_result(meeting_id, result)
+
+    logger.info("recluster_complete", meeting_id=meeting_id,
+               speakers=result['diarization_metadata']['total_speakers'])
+    return FastJSONResponse(content=_build_process_response(meeting_id, result, proc.speaker_db.list_speakers(),
+                                                            segments_json))
+
+@app.get("/meetings")
+async def list_meetings_endpoint(
+    speaker: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0
+):
+    """List processed meetings, newest first, optionally by speaker or ISO date range."""
+    if not 1 <= limit <= 500 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit must be 1-500 and offset non-negative")
+    try:
+        meetings = get_meeting_store().list_meetings(speaker, since, until, limit, offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {str(e)}")
+    return FastJSONResponse(content={"meetings": meetings})
+
+@app.get("/meetings/{meeting_id}")
+async def get_meeting_endpoint(meeting_id: str):
+    """Metadata of a processed meeting: date, duration, speakers and pipeline metadata."""
+    meeting = get_meeting_store().get_meeting(meeting_id)
+    if meeting is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return FastJSONResponse(content=meeting)
+
+@app.get("/meetings/{meeting_id}/transcript")
+async def get_meeting_transcript_endpoint(meeting_id: str, start: Optional[float] = None,
+                                          end: Optional[float] = None):
+    """Segments and speaker turns overlapping ``start``-``end`` seconds (whole meeting by default)."""
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    transcript = get_meeting_store().get_transcript(meeting_id, start, end)
+    if transcript is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return FastJSONResponse(content=transcript)
+
+@app.get("/meetings/{meeting_id}/insights")
+async def get_meeting_insights_endpoint(meeting_id: str):
+    """Stored LLM insights (summary, action items) of a processed meeting."""
+    insights = get_meeting_store().get_insights(meeting_id)
+    if insights is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return FastJSONResponse(content={"meeting_id": meeting_id, "insights": insights})
+
+@app.get("/meetings/{meeting_id}/speakers/{speaker}/occurrences")
+async def get_speaker_occurrences_endpoint(meeting_id: str, speaker: str, threshold: Optional[float] = None):
+    """Other meetings where this meeting's speaker (diarized or matched label) also appears."""
+    threshold = get_settings().speaker_occurrence_threshold if threshold is None else threshold
+    occurrences = await asyncio.to_thread(get_speaker_index().occurrences, meeting_id, speaker, threshold)
+    if occurrences is None:
+        raise HTTPException(status_code=404, detail="Speaker not indexed for this meeting")
+    return FastJSONResponse(content={"meeting_id": meeting_id, "speaker": speaker,
+                                     "threshold": threshold, "meetings": occurrences})
+
+@app.post("/meetings/{meeting_id}/speakers/{speaker}/label")
+async def label_meeting_speaker_endpoint(
+    meeting_id: str,
+    speaker: str,
+    name: str = Form(...),
+    threshold: Optional[float] = Form(None),
+    add_to_database: bool = Form(True)
+):
+    """Name a meeting's speaker and every unknown occurrence of the same voice in other meetings.
+
+    The meeting store and search index are relabelled in each affected meeting. With
+    ``add_to_database`` a new name is also registered in the speaker database, so later
+    meetings and re-clustering match it directly.
+    """
+    logger = structlog.get_logger(__name__)
+    clean_name = name.strip()
+    if not clean_name:
+        raise HTTPException(status_code=400, detail="Speaker name cannot be empty")
+    threshold = get_settings().speaker_occurrence_threshold if threshold is None else threshold
+
+    index = get_speaker_index()
+    source = index.lookup(meeting_id, speaker)
+    if source is None:
+        raise HTTPException(status_code=404, detail="Speaker not indexed for this meeting")
+
+    result = await asyncio.to_thread(propagate_label, index, meeting_id, speaker, clean_name, threshold,
+                                     (get_meeting_store(), get_search_index()))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Speaker not indexed for this meeting")
+
+    db = get_speaker_db()
+    added = False
+    if add_to_database and db.get_speaker(clean_name) is None:
+        added = db.add_speaker(clean_name, source['embedding'], {
+            'source_meeting': meeting_id,
+            'source_speaker': source['speaker']
+        })
+
+    logger.info("meeting_speaker_labelled", meeting_id=meeting_id, speaker=speaker, name=clean_name,
+                relabelled=len(result['relabelled']), added_to_database=added)
+    return FastJSONResponse(content={**result, "threshold": threshold, "added_to_database": added})
+
+@app.get("/search")
+async def search_meetings_endpoint(
+    q: str,
+    speaker: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    source: str = "transcript",
+    limit: int = 20
+):
+    """Full-text search over processed meetings; hits carry meeting, speaker and timestamps.
+
+    ``source`` picks speaker turns (``transcript``, default) or diarization ``segment`` text.
+    """
+    if source not in SEARCH_SOURCES:
+        raise HTTPException(status_code=400, detail=f"source must be one of {SEARCH_SOURCES}")
+    if not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="limit must be 1-100")
+
+    hits = await asyncio.to_thread(get_search_index().search, q, speaker, meeting_id, source, limit)
+    return FastJSONResponse(content={"query": q, "hits": hits})
+
 @app.post("/summarize")
 async def generate_summary_endpoint(
     transcript: str = Form(...),
     duration_minutes: Optional[float] = Form(None),
-    user_notes: Optional[str] = Form(None)
+    user_notes: Optional[str] = Form(None),
+    compact_transcript: Optional[bool] = Form(None)
 ):
     """Generate a meeting summary from a speaker-annotated transcript."""
     logger = structlog.get_logger(__name__)
@@ -373,15 +645,19 @@ async def generate_summary_endpoint(
         if duration_minutes:
             metadata['duration'] = duration_minutes
 
-        summary_result = proc.llm_service.generate_meeting_summary(transcript, metadata, user_notes)
+        summary_result = proc.llm_service.generate_meeting_summary(
+            transcript, metadata, user_notes, compact=compact_transcript
+        )
 
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "summary": summary_result["summary"],
             "participants": summary_result["participants"],
             "metadata": summary_result["metadata"]
         })
 
+    except TokenBudgetExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.exception("summary_generation_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Summary generation failed: {str(e)}")
@@ -390,7 +666,8 @@ async def generate_summary_endpoint(
 async def extract_action_items_endpoint(
     transcript: str = Form(...),
     speaker: Optional[str] = Form(None),
-    user_notes: Optional[str] = Form(None)
+    user_notes: Optional[str] = Form(None),
+    compact_transcript: Optional[bool] = Form(None)
 ):
     """Extract action items from a speaker-annotated transcript.
 
@@ -398,6 +675,7 @@ async def extract_action_items_endpoint(
         transcript: Speaker-annotated meeting transcript
         speaker: Optional speaker name for personalized view (if not provided, returns general view)
         user_notes: Optional user-provided notes to incorporate into action items
+        compact_transcript: Send a compacted transcript to the LLM (defaults to LLM_COMPACT_TRANSCRIPTS)
     """
     logger = structlog.get_logger(__name__)
 
@@ -412,15 +690,17 @@ async def extract_action_items_endpoint(
                    target_speaker=speaker)
 
         action_items_result = proc.llm_service.extract_action_items_by_speaker(
-            transcript, target_speaker=speaker, user_notes=user_notes
+            transcript, target_speaker=speaker, user_notes=user_notes, compact=compact_transcript
         )
 
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "action_items_by_speaker": action_items_result["action_items"],
             "metadata": action_items_result["metadata"]
         })
 
+    except TokenBudgetExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.exception("action_items_extraction_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Action items extraction failed: {str(e)}")
@@ -428,11 +708,20 @@ async def extract_action_items_endpoint(
 @app.post("/action-items/all-views")
 async def extract_all_action_items_views_endpoint(
     transcript: str = Form(...),
-    user_notes: Optional[str] = Form(None)
+    user_notes: Optional[str] = Form(None),
+    generation_method: str = Form("n_plus_1"),
+    compact_transcript: Optional[bool] = Form(None)
 ):
-    """Extract all action item views: general + speaker-specific views for each participant."""
+    """Extract all action item views: general + speaker-specific views for each participant.
+
+    Args:
+        generation_method: "n_plus_1" (one request per view) or "single_call" (one structured request)
+    """
     logger = structlog.get_logger(__name__)
 
+    if generation_method not in ACTION_VIEW_METHODS:
+        raise HTTPException(status_code=400, detail=f"generation_method must be one of {ACTION_VIEW_METHODS}")
+
     try:
         proc = get_processor()
     except RuntimeError as e:
@@ -440,17 +729,22 @@ async def extract_all_action_items_views_endpoint(
 
     try:
         logger.info("extracting_all_action_item_views_from_transcript",
-                   transcript_length=len(transcript))
+                   transcript_length=len(transcript),
+                   generation_method=generation_method)
 
-        all_views_result = proc.llm_service.extract_all_action_item_views(transcript, user_notes)
+        all_views_result = proc.llm_service.extract_all_action_item_views(
+            transcript, user_notes, generation_method=generation_method, compact=compact_transcript
+        )
 
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "general_view": all_views_result["general_view"],
             "speaker_views": all_views_result["speaker_views"],
             "metadata": all_views_result["metadata"]
         })
 
+    except TokenBudgetExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.exception("all_action_items_views_extraction_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"All action items views extraction failed: {str(e)}")
@@ -459,7 +753,8 @@ async def extract_all_action_items_views_endpoint(
 async def generate_insights_endpoint(
     transcript: str = Form(...),
     duration_minutes: Optional[float] = Form(None),
-    user_notes: Optional[str] = Form(None)
+    user_notes: Optional[str] = Form(None),
+    compact_transcript: Optional[bool] = Form(None)
 ):
     """Generate comprehensive meeting insights (summary + action items) from a transcript."""
     logger = structlog.get_logger(__name__)
@@ -477,9 +772,11 @@ async def generate_insights_endpoint(
         if duration_minutes:
             metadata['duration'] = duration_minutes
 
-        insights = proc.llm_service.generate_meeting_insights(transcript, metadata, user_notes)
+        insights = proc.llm_service.generate_meeting_insights(
+            transcript, metadata, user_notes, compact=compact_transcript
+        )
 
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "summary": insights["summary"],
             "action_items_by_speaker": insights["action_items_by_speaker"],
@@ -487,10 +784,151 @@ async def generate_insights_endpoint(
             "metadata": insights["metadata"]
         })
 
+    except TokenBudgetExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.exception("insights_generation_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Insights generation failed: {str(e)}")
 
+def _sse_response(events: Iterator[Tuple[str, Any]]) -> StreamingResponse:
+    """Serve ``(event, data)`` pairs as server-sent events, ending with a ``done`` event.
+
+    Markdown deltas are sent as ``{"text": ...}``; every other event carries its JSON result.
+    """
+    def stream():
+        for event, data in events:
+            payload = {"text": data} if event == "delta" else data
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/summarize/stream")
+async def stream_summary_endpoint(
+    transcript: str = Form(...),
+    duration_minutes: Optional[float] = Form(None),
+    user_notes: Optional[str] = Form(None),
+    compact_transcript: Optional[bool] = Form(None)
+):
+    """Stream a meeting summary as server-sent events.
+
+    Events: ``delta`` (Markdown text as it is generated), ``summary`` (the complete
+    /summarize result), ``error`` and finally ``done``.
+    """
+    try:
+        proc = get_processor()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    metadata = {}
+    if duration_minutes:
+        metadata['duration'] = duration_minutes
+
+    return _sse_response(proc.llm_service.stream_meeting_summary(
+        transcript, metadata, user_notes, compact=compact_transcript
+    ))
+
+@app.post("/insights/stream")
+async def stream_insights_endpoint(
+    transcript: str = Form(...),
+    duration_minutes: Optional[float] = Form(None),
+    user_notes: Optional[str] = Form(None),
+    compact_transcript: Optional[bool] = Form(None)
+):
+    """Stream meeting insights as server-sent events.
+
+    Events: ``delta`` (summary Markdown as it is generated), ``action_items`` (the action
+    item JSON once complete), ``summary``, ``insights`` (the complete /insights result),
+    ``error`` and finally ``done``.
+    """
+    try:
+        proc = get_processor()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    metadata = {}
+    if duration_minutes:
+        metadata['duration'] = duration_minutes
+
+    return _sse_response(proc.llm_service.stream_meeting_insights(
+        transcript, metadata, user_notes, compact=compact_transcript
+    ))
+
+@app.websocket("/live")
+async def live_transcription_endpoint(websocket: WebSocket):
+    """Transcribe a meeting live from streamed audio.
+
+    The client sends binary messages of 16kHz mono 16-bit little-endian PCM and the text
+    message ``end`` when the meeting is over. The server pushes ``{"type": "segment", ...}``
+    messages (start, end, speaker, matched_speaker, text, words, latency) as windows are
+    committed, ``{"type": "speaker_update", "speaker", "matched_speaker"}`` when a speaker
+    cluster is renamed, then ``{"type": "done", "stats": ...}``.
+    """
+    logger = structlog.get_logger(__name__)
+    await websocket.accept()
+
+    try:
+        session = get_processor().create_live_session()
+    except RuntimeError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1011)
+        return
+
+    audio_received = asyncio.Event()
+    ended = asyncio.Event()
+
+    async def send_segments(segments):
+        for segment in segments:
+            await websocket.send_json({"type": "segment", **segment})
+        # Clusters renamed once enough audio matched them to a known speaker
+        for update in session.pop_speaker_updates():
+            await websocket.send_json({"type": "speaker_update", **update})
+
+    async def worker():
+        # One window in flight at a time; audio keeps buffering while Whisper runs
+        while True:
+            await audio_received.wait()
+            audio_received.clear()
+            if ended.is_set():
+                break
+            if session.ready():
+                await send_segments(await asyncio.to_thread(session.process))
+        await send_segments(await asyncio.to_thread(session.finish))
+
+    worker_task = asyncio.create_task(worker())
+    try:
+        while not ended.is_set():
+            receive_task = asyncio.create_task(websocket.receive())
+            done, _ = await asyncio.wait({receive_task, worker_task}, return_when=asyncio.FIRST_COMPLETED)
+            if worker_task in done:
+                receive_task.cancel()
+                worker_task.result()  # re-raise processing errors
+            message = receive_task.result()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes"):
+                session.add_audio(message["bytes"])
+            elif (message.get("text") or "").strip() == "end":
+                ended.set()
+            audio_received.set()
+
+        await worker_task
+        await websocket.send_json({"type": "done", "stats": session.stats()})
+        logger.info("live_session_complete", **session.stats())
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        worker_task.cancel()
+        logger.info("live_session_disconnected", **session.stats())
+    except Exception as e:
+        worker_task.cancel()
+        logger.exception("live_session_failed", error=str(e))
+        await websocket.close(code=1011)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
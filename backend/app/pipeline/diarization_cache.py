@@ -0,0 +1,117 @@
+"""Cached diarization state for re-clustering a processed meeting.
+
+After a meeting is processed, the diarization turns, one ECAPA embedding per turn and
+the Whisper words are stored together in one ``.npz`` file per meeting. Changing the
+number of speakers then only re-runs clustering over the cached turn embeddings and
+re-derives speaker matching and the transcript from the cached words, with no
+diarization model or Whisper involved.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+
+import numpy as np
+import structlog
+
+from .light_diarization import agglomerative_cluster
+from .word_table import WordTable
+
+logger = structlog.get_logger(__name__)
+
+
+class DiarizationCache:
+    """Stores per-meeting diarization turns, turn embeddings and words on disk."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, meeting_id: str) -> Path:
+        return self.cache_dir / f"{meeting_id}.npz"
+
+    def exists(self, meeting_id: str) -> bool:
+        return self._path(meeting_id).exists()
+
+    def save(self, meeting_id: str, segments: List[Dict], turn_embeddings: List[Optional[np.ndarray]],
+             words, metadata: Optional[Dict] = None) -> Path:
+        """Persist one meeting; ``turn_embeddings`` is aligned with ``segments`` (None if skipped).
+
+        ``words`` is a ``WordTable`` or word dicts (``word``, ``start``, ``end``).
+        """
+        words = WordTable.coerce(words)
+        dim = next((len(embedding) for embedding in turn_embeddings if embedding is not None), 0)
+        embeddings = np.zeros((len(segments), dim), dtype=np.float32)
+        has_embedding = np.zeros(len(segments), dtype=bool)
+        for index, embedding in enumerate(turn_embeddings):
+            if embedding is not None:
+                embeddings[index] = np.asarray(embedding, dtype=np.float32).ravel()
+                has_embedding[index] = True
+
+        path = self._path(meeting_id)
+        np.savez_compressed(
+            path,
+            starts=np.array([segment['start'] for segment in segments], dtype=np.float64),
+            ends=np.array([segment['end'] for segment in segments], dtype=np.float64),
+            speakers=np.array([segment['speaker'] for segment in segments], dtype=str),
+            embeddings=embeddings,
+            has_embedding=has_embedding,
+            metadata=np.array(json.dumps(metadata or {}, default=str)),
+            **words.to_arrays()
+        )
+        logger.info("diarization_cache_saved", meeting_id=meeting_id, turns=len(segments),
+                    words=len(words), size_bytes=path.stat().st_size)
+        return path
+
+    def load(self, meeting_id: str) -> Optional[Dict]:
+        """Return ``segments``, ``turn_embeddings``, ``words`` (a ``WordTable``) and ``metadata``, or None."""
+        path = self._path(meeting_id)
+        if not path.exists():
+            return None
+
+        with np.load(path) as data:
+            segments = [
+                {'start': float(start), 'end': float(end), 'speaker': str(speaker), 'duration': float(end - start)}
+                for start, end, speaker in zip(data['starts'], data['ends'], data['speakers'])
+            ]
+            turn_embeddings = [
+                embedding if present else None
+                for embedding, present in zip(data['embeddings'], data['has_embedding'])
+            ]
+            words = WordTable.from_arrays(data)
+            metadata = json.loads(str(data['metadata']))
+
+        return {'segments': segments, 'turn_embeddings': turn_embeddings, 'words': words, 'metadata': metadata}
+
+
+def recluster_turns(segments: List[Dict], turn_embeddings: List[Optional[np.ndarray]],
+                    num_speakers: Optional[int] = None, min_speakers: Optional[int] = None,
+                    max_speakers: Optional[int] = None, threshold: float = 0.65) -> Dict:
+    """Relabel cached diarization turns by clustering their embeddings.
+
+    Turns without an embedding (too short to embed) take the label of the nearest
+    embedded turn in time.
+
+    Returns:
+        A diarization result in the ``SpeakerDiarizer.diarize`` format
+    """
+    embedded = [index for index, embedding in enumerate(turn_embeddings) if embedding is not None]
+    if not embedded:
+        return {'segments': [dict(segment) for segment in segments],
+                'unique_speakers': list(dict.fromkeys(s['speaker'] for s in segments)),
+                'total_speakers': len({s['speaker'] for s in segments})}
+
+    labels = agglomerative_cluster(np.stack([turn_embeddings[index] for index in embedded]),
+                                   num_speakers, threshold, min_speakers, max_speakers)
+    label_by_turn = dict(zip(embedded, labels))
+    centers = np.array([(segments[index]['start'] + segments[index]['end']) / 2 for index in embedded])
+
+    relabeled = []
+    for index, segment in enumerate(segments):
+        if index not in label_by_turn:
+            center = (segment['start'] + segment['end']) / 2
+            label_by_turn[index] = label_by_turn[embedded[int(np.argmin(np.abs(centers - center)))]]
+        relabeled.append({**segment, 'speaker': f"SPEAKER_{int(label_by_turn[index]):02d}"})
+
+    unique_speakers = list(dict.fromkeys(segment['speaker'] for segment in relabeled))
+    return {'segments': relabeled, 'unique_speakers': unique_speakers, 'total_speakers': len(unique_speakers)}
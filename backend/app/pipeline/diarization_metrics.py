@@ -0,0 +1,104 @@
+"""Diarization error rate for comparing diarization backends."""
+
+from itertools import permutations
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def load_rttm(path: Path) -> List[Dict]:
+    """Read reference segments from an RTTM file."""
+    segments = []
+    for line in Path(path).read_text().splitlines():
+        fields = line.split()
+        if len(fields) >= 8 and fields[0] == 'SPEAKER':
+            start, duration = float(fields[3]), float(fields[4])
+            segments.append({'start': start, 'end': start + duration, 'speaker': fields[7]})
+    return segments
+
+
+def _activity(segments: List[Dict], speakers: List[str], frames: int, resolution: float) -> np.ndarray:
+    """(speakers, frames) boolean matrix of who is talking in each frame."""
+    activity = np.zeros((len(speakers), frames), dtype=bool)
+    index = {speaker: i for i, speaker in enumerate(speakers)}
+    for segment in segments:
+        first = int(round(segment['start'] / resolution))
+        last = int(round(segment['end'] / resolution))
+        activity[index[segment['speaker']], first:last] = True
+    return activity
+
+
+def _best_mapping(overlap: np.ndarray) -> List[Tuple[int, int]]:
+    """Reference/hypothesis speaker pairs maximizing total overlap.
+
+    Exhaustive for up to 6 speakers on the smaller side (meetings rarely have more),
+    greedy beyond that.
+    """
+    transposed = overlap.shape[0] > overlap.shape[1]
+    matrix = overlap.T if transposed else overlap
+    rows, cols = matrix.shape
+    if rows == 0:
+        return []
+
+    if rows <= 6 and cols <= 8:
+        best, best_pairs = -1.0, []
+        for chosen in permutations(range(cols), rows):
+            total = matrix[range(rows), chosen].sum()
+            if total > best:
+                best, best_pairs = total, list(zip(range(rows), chosen))
+    else:
+        best_pairs, used_rows, used_cols = [], set(), set()
+        for flat in np.argsort(matrix, axis=None)[::-1]:
+            row, col = np.unravel_index(flat, matrix.shape)
+            if row not in used_rows and col not in used_cols:
+                best_pairs.append((int(row), int(col)))
+                used_rows.add(row)
+                used_cols.add(col)
+
+    return [(col, row) for row, col in best_pairs] if transposed else best_pairs
+
+
+def diarization_error_rate(reference: List[Dict], hypothesis: List[Dict],
+                           resolution: float = 0.01) -> Dict:
+    """Frame-based DER: (missed + false alarm + confusion) / reference speech.
+
+    Hypothesis labels are mapped to reference labels with the mapping that maximizes
+    overlap, so label names do not need to agree. Overlapping speech is supported.
+
+    Returns:
+        Dict with ``der`` and its ``missed``, ``false_alarm`` and ``confusion`` components
+        (fractions of reference speech) plus ``reference_seconds``
+    """
+    ref_speakers = sorted({segment['speaker'] for segment in reference})
+    hyp_speakers = sorted({segment['speaker'] for segment in hypothesis})
+    end = max([segment['end'] for segment in reference + hypothesis] or [0.0])
+    frames = int(round(end / resolution)) + 1
+
+    ref = _activity(reference, ref_speakers, frames, resolution)
+    hyp = _activity(hypothesis, hyp_speakers, frames, resolution)
+
+    overlap = ref.astype(np.float32) @ hyp.T.astype(np.float32)
+    mapping = _best_mapping(overlap)
+
+    n_ref = ref.sum(axis=0)
+    n_hyp = hyp.sum(axis=0)
+    n_correct = np.zeros(frames, dtype=np.int64)
+    for ref_index, hyp_index in mapping:
+        n_correct += ref[ref_index] & hyp[hyp_index]
+
+    total = n_ref.sum()
+    missed = np.maximum(n_ref - n_hyp, 0).sum()
+    false_alarm = np.maximum(n_hyp - n_ref, 0).sum()
+    confusion = (np.minimum(n_ref, n_hyp) - n_correct).sum()
+
+    def rate(value):
+        return float(value / total) if total else 0.0
+
+    return {
+        'der': rate(missed + false_alarm + confusion),
+        'missed': rate(missed),
+        'false_alarm': rate(false_alarm),
+        'confusion': rate(confusion),
+        'reference_seconds': float(total * resolution)
+    }
@@ -0,0 +1,195 @@
+"""Optimized CPU inference backends for the SpeechBrain ECAPA speaker encoder.
+
+``EncoderClassifier.encode_batch`` runs filterbank features, mean/variance
+normalization and the ECAPA-TDNN network eagerly in fp32. The features are cheap; the
+network is not. ``ECAPAEncoder`` keeps SpeechBrain's feature front end and swaps the
+network for a locally exported TorchScript graph or an ONNX Runtime session (optionally
+with dynamic int8 weights). Exports are written once and reused, and every optimized
+encoder is checked against the eager model before it is used.
+"""
+
+from pathlib import Path
+from typing import Dict
+import time
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Selectable with ECAPA_BACKEND (see load_ecapa_encoder)
+ECAPA_BACKENDS = ("eager", "torchscript", "onnx")
+
+# Probe lengths in seconds: exports are traced on the first and checked on all of them,
+# so a graph that fixed the input length at trace time fails verification
+PROBE_SECONDS = (3.0, 1.3, 7.7)
+
+
+def embedding_parity(reference: np.ndarray, candidate: np.ndarray) -> Dict:
+    """Cosine similarity between matching rows of two ``(n, dim)`` embedding arrays."""
+    reference = np.asarray(reference, dtype=np.float64).reshape(len(reference), -1)
+    candidate = np.asarray(candidate, dtype=np.float64).reshape(len(candidate), -1)
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    cosines = np.sum(reference * candidate, axis=1) / np.maximum(norms, 1e-12)
+    return {
+        'cosines': [round(float(value), 6) for value in cosines],
+        'min_cosine': float(cosines.min()) if len(cosines) else 1.0,
+        'mean_cosine': float(cosines.mean()) if len(cosines) else 1.0
+    }
+
+
+class ECAPAEncoder:
+    """Drop-in replacement for ``EncoderClassifier.encode_batch`` on an exported graph."""
+
+    def __init__(self, classifier, backend: str, export_dir: Path, quantize: bool = False):
+        if backend not in ECAPA_BACKENDS or backend == 'eager':
+            raise ValueError(f"Unknown optimized ECAPA backend: {backend}")
+        if quantize and backend != 'onnx':
+            # Dynamic int8 in PyTorch only covers Linear/LSTM layers; ECAPA is all Conv1d
+            logger.warning("ecapa_quantization_onnx_only", backend=backend)
+            quantize = False
+
+        self.classifier = classifier
+        self.backend = backend
+        self.quantize = quantize
+        self.export_dir = Path(export_dir)
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self._model = None
+        self._session = None
+        self._load()
+
+    @property
+    def name(self) -> str:
+        return f"{self.backend}-int8" if self.quantize else self.backend
+
+    @staticmethod
+    def _probe_waveforms(seconds: float, batch: int = 1):
+        import torch
+        generator = torch.Generator().manual_seed(0)
+        return torch.randn(batch, int(16000 * seconds), generator=generator) * 0.1
+
+    def _probe_features(self, seconds: float = PROBE_SECONDS[0]):
+        return self._features(self._probe_waveforms(seconds))
+
+    def _features(self, wavs, wav_lens=None):
+        import torch
+        if wavs.dim() == 1:
+            wavs = wavs.unsqueeze(0)
+        if wav_lens is None:
+            wav_lens = torch.ones(wavs.shape[0])
+        mods = self.classifier.mods
+        with torch.no_grad():
+            feats = mods.compute_features(wavs.float())
+            return mods.mean_var_norm(feats, wav_lens)
+
+    def _load(self):
+        started = time.perf_counter()
+        if self.backend == 'torchscript':
+            self._load_torchscript()
+        else:
+            self._load_onnx()
+        logger.info("ecapa_backend_loaded", backend=self.name,
+                    load_seconds=round(time.perf_counter() - started, 3))
+
+    def _load_torchscript(self):
+        import torch
+        path = self.export_dir / "ecapa_embedding.torchscript.pt"
+        if not path.exists():
+            network = self.classifier.mods.embedding_model.eval()
+            with torch.no_grad():
+                # The trace check re-runs the graph on the other probe lengths and compares it to eager
+                traced = torch.jit.trace(
+                    network, (self._probe_features(),),
+                    check_inputs=[(self._probe_features(seconds),) for seconds in PROBE_SECONDS[1:]]
+                )
+            torch.jit.save(traced, str(path))
+            logger.info("ecapa_exported", backend=self.backend, path=str(path))
+        model = torch.jit.load(str(path), map_location='cpu').eval()
+        self._model = torch.jit.optimize_for_inference(torch.jit.freeze(model))
+
+    def _load_onnx(self):
+        import torch
+        import onnxruntime
+
+        fp32_path = self.export_dir / "ecapa_embedding.onnx"
+        if not fp32_path.exists():
+            network = self.classifier.mods.embedding_model.eval()
+            with torch.no_grad():
+                torch.onnx.export(
+                    network, (self._probe_features(),), str(fp32_path),
+                    input_names=['feats'], output_names=['embedding'],
+                    dynamic_axes={'feats': {0: 'batch', 1: 'frames'}, 'embedding': {0: 'batch'}},
+                    opset_version=17
+                )
+            logger.info("ecapa_exported", backend=self.backend, path=str(fp32_path))
+
+        path = fp32_path
+        if self.quantize:
+            path = self.export_dir / "ecapa_embedding.int8.onnx"
+            if not path.exists():
+                from onnxruntime.quantization import QuantType, quantize_dynamic
+                quantize_dynamic(str(fp32_path), str(path), weight_type=QuantType.QInt8)
+                logger.info("ecapa_quantized", path=str(path),
+                            size_bytes=path.stat().st_size, fp32_size_bytes=fp32_path.stat().st_size)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = torch.get_num_threads()
+        self._session = onnxruntime.InferenceSession(str(path), options, providers=['CPUExecutionProvider'])
+
+    def encode_batch(self, wavs, wav_lens=None):
+        """Embed ``(batch, samples)`` waveforms; returns ``(batch, 1, dim)`` like SpeechBrain."""
+        import torch
+        feats = self._features(wavs, wav_lens)
+        if self._model is not None:
+            with torch.no_grad():
+                return self._model(feats)
+        embeddings = self._session.run(None, {'feats': feats.numpy()})[0]
+        return torch.from_numpy(embeddings)
+
+    def verify(self, waveforms=None) -> Dict:
+        """Compare against the eager model.
+
+        ``waveforms`` is a ``(batch, samples)`` tensor or a list of them; defaults to seeded
+        noise probes of every ``PROBE_SECONDS`` length.
+        """
+        import torch
+        if waveforms is None:
+            waveforms = [self._probe_waveforms(seconds, batch=2) for seconds in PROBE_SECONDS]
+        elif not isinstance(waveforms, (list, tuple)):
+            waveforms = [waveforms]
+        reference, candidate = [], []
+        with torch.no_grad():
+            for batch in waveforms:
+                reference.append(self.classifier.encode_batch(batch).squeeze(1).numpy())
+                candidate.append(self.encode_batch(batch).squeeze(1).numpy())
+        return embedding_parity(np.concatenate(reference), np.concatenate(candidate))
+
+
+def load_ecapa_encoder(classifier, backend: str, export_dir: Path, quantize: bool = False,
+                       parity_threshold: float = 0.99):
+    """Return an object with ``encode_batch`` for the requested backend.
+
+    Falls back to the eager ``classifier`` (with a warning) when the backend cannot be
+    exported or loaded, e.g. onnxruntime is not installed, or when its embeddings drift
+    below ``parity_threshold`` cosine similarity from the eager model.
+    """
+    if backend not in ECAPA_BACKENDS:
+        raise ValueError(f"Unknown ECAPA backend: {backend}")
+    if backend == 'eager':
+        return classifier
+
+    try:
+        encoder = ECAPAEncoder(classifier, backend, export_dir, quantize)
+        parity = encoder.verify()
+    except Exception as e:
+        logger.warning("ecapa_backend_unavailable", backend=backend, error=str(e))
+        return classifier
+
+    if parity['min_cosine'] < parity_threshold:
+        logger.warning("ecapa_backend_parity_failed", backend=encoder.name,
+                       min_cosine=round(parity['min_cosine'], 4), threshold=parity_threshold)
+        return classifier
+
+    logger.info("ecapa_backend_ready", backend=encoder.name, min_cosine=round(parity['min_cosine'], 4))
+    return encoder
@@ -0,0 +1,231 @@
+"""Lightweight speaker diarization without pyannote.
+
+Speech is found with a frame-energy detector, each speech region is covered by
+fixed-length sliding windows that are embedded in batches with the ECAPA model, and the
+window embeddings are grouped by average-linkage agglomerative clustering in NumPy.
+Cold start is only the ECAPA model, and the cost per meeting is dominated by a few
+batched embedding calls, which makes it a good fit for short meetings. Clustering keeps
+each window's nearest neighbour, so a merge only rescans the rows that pointed at the
+merged pair; that is about quadratic in the number of windows in practice (cubic in the
+worst case) and quadratic in memory, so long meetings should stay on pyannote.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# (windows float32 (n, samples), sample_rate) -> embeddings (n, dim)
+EmbedBatchFn = Callable[[np.ndarray, int], np.ndarray]
+
+
+def frame_energy_db(audio: np.ndarray, frame_samples: int) -> np.ndarray:
+    """RMS energy in dBFS of consecutive frames along the last axis.
+
+    Works on mono ``(samples,)`` or multi-channel ``(channels, samples)`` audio in one
+    vectorized pass.
+    """
+    frames = audio.shape[-1] // frame_samples
+    framed = audio[..., :frames * frame_samples].reshape(*audio.shape[:-1], frames, frame_samples)
+    return 10.0 * np.log10(np.mean(framed.astype(np.float32) ** 2, axis=-1) + 1e-10)
+
+
+def speech_mask(energy_db: np.ndarray, margin_db: float = 12.0, floor_db: float = -55.0) -> np.ndarray:
+    """Frames louder than the noise floor (10th percentile) by ``margin_db``, per channel."""
+    noise_floor = np.percentile(energy_db, 10, axis=-1, keepdims=True)
+    return energy_db > np.maximum(noise_floor + margin_db, floor_db)
+
+
+def mask_to_regions(mask: np.ndarray, frame_seconds: float, min_speech_seconds: float = 0.25,
+                    min_silence_seconds: float = 0.3) -> List[Tuple[float, float]]:
+    """Convert a 1D per-frame speech mask to (start, end) regions in seconds.
+
+    Pauses shorter than ``min_silence_seconds`` are bridged and regions shorter than
+    ``min_speech_seconds`` are dropped.
+    """
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    regions: List[List[float]] = []
+    for start, end in zip(starts * frame_seconds, ends * frame_seconds):
+        if regions and start - regions[-1][1] < min_silence_seconds:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+    return [(float(start), float(end)) for start, end in regions if end - start >= min_speech_seconds]
+
+
+def energy_vad(waveform: np.ndarray, sample_rate: int, frame_seconds: float = 0.03,
+               margin_db: float = 12.0, min_speech_seconds: float = 0.25,
+               min_silence_seconds: float = 0.3) -> List[Tuple[float, float]]:
+    """Speech regions of a mono waveform, found from frame energy."""
+    frame_samples = max(1, int(frame_seconds * sample_rate))
+    energy = frame_energy_db(waveform, frame_samples)
+    if not energy.size:
+        return []
+    return mask_to_regions(speech_mask(energy, margin_db), frame_samples / sample_rate,
+                           min_speech_seconds, min_silence_seconds)
+
+
+def agglomerative_cluster(embeddings: np.ndarray, num_speakers: Optional[int] = None,
+                          threshold: float = 0.65, min_speakers: Optional[int] = None,
+                          max_speakers: Optional[int] = None) -> np.ndarray:
+    """Average-linkage clustering on cosine distance.
+
+    Merging stops at ``num_speakers`` clusters when given; otherwise once the closest
+    pair is further apart than ``threshold``, within ``min_speakers``/``max_speakers``.
+
+    Returns:
+        Cluster label per row, numbered in order of first appearance
+    """
+    count = len(embeddings)
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    vectors = embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-10)
+    distances = 1.0 - vectors @ vectors.T
+    np.fill_diagonal(distances, np.inf)
+    sizes = np.ones(count)
+    labels = np.arange(count)
+
+    # Nearest neighbour of every row (first index on ties), so a merge need not rescan the matrix
+    neighbours = np.argmin(distances, axis=1)
+    neighbour_distances = distances[np.arange(count), neighbours]
+
+    clusters = count
+    while clusters > 1:
+        i = int(np.argmin(neighbour_distances))
+        j = int(neighbours[i])
+        if num_speakers is not None:
+            if clusters <= num_speakers:
+                break
+        elif min_speakers is not None and clusters <= min_speakers:
+            break
+        elif distances[i, j] > threshold and (max_speakers is None or clusters <= max_speakers):
+            break
+
+        # Lance-Williams update for average linkage: size-weighted mean of the two rows
+        merged = (sizes[i] * distances[i] + sizes[j] * distances[j]) / (sizes[i] + sizes[j])
+        distances[i, :] = merged
+        distances[:, i] = merged
+        distances[i, i] = np.inf
+        distances[j, :] = np.inf
+        distances[:, j] = np.inf
+        sizes[i] += sizes[j]
+        labels[labels == j] = i
+        clusters -= 1
+
+        # Rows whose neighbour was merged away or moved get rescanned; others may now prefer i
+        neighbour_distances[j] = np.inf
+        stale = np.flatnonzero((neighbours == i) | (neighbours == j))
+        closer = (merged < neighbour_distances) | ((merged == neighbour_distances) & (i < neighbours))
+        closer[stale] = False
+        closer[[i, j]] = False
+        neighbours[closer] = i
+        neighbour_distances[closer] = merged[closer]
+        for row in stale.tolist() + [i]:
+            if row != j:
+                neighbours[row] = int(np.argmin(distances[row]))
+                neighbour_distances[row] = distances[row, neighbours[row]]
+
+    remap: Dict[int, int] = {}
+    return np.array([remap.setdefault(int(label), len(remap)) for label in labels], dtype=np.int64)
+
+
+class LightweightDiarizer:
+    """Energy VAD + sliding-window ECAPA + agglomerative clustering.
+
+    Returns the same result format as ``SpeakerDiarizer.diarize``.
+    """
+
+    def __init__(self, embed_windows: EmbedBatchFn, window_seconds: float = 1.5,
+                 step_seconds: float = 0.75, cluster_threshold: float = 0.65,
+                 vad_margin_db: float = 12.0):
+        self.embed_windows = embed_windows
+        self.window_seconds = window_seconds
+        self.step_seconds = step_seconds
+        self.cluster_threshold = cluster_threshold
+        self.vad_margin_db = vad_margin_db
+
+    def window_starts(self, regions: List[Tuple[float, float]], duration: float) -> List[Tuple[int, float]]:
+        """(region index, window start) pairs covering every speech region."""
+        windows = []
+        for index, (start, end) in enumerate(regions):
+            if end - start <= self.window_seconds:
+                # Short region: one window centred on it, padded with surrounding audio
+                center = (start + end) / 2
+                starts = [center - self.window_seconds / 2]
+            else:
+                starts = list(np.arange(start, end - self.window_seconds, self.step_seconds))
+                starts.append(end - self.window_seconds)
+            for window_start in starts:
+                window_start = min(max(0.0, window_start), max(0.0, duration - self.window_seconds))
+                windows.append((index, float(window_start)))
+        return windows
+
+    def diarize(self, waveform: np.ndarray, sample_rate: int, num_speakers: Optional[int] = None,
+                min_speakers: Optional[int] = None, max_speakers: Optional[int] = None) -> Dict:
+        """Diarize a mono float32 waveform."""
+        regions = energy_vad(waveform, sample_rate, margin_db=self.vad_margin_db)
+        return self.diarize_regions(waveform, sample_rate, regions, num_speakers, min_speakers, max_speakers)
+
+    def diarize_regions(self, waveform: np.ndarray, sample_rate: int, regions: List[Tuple[float, float]],
+                        num_speakers: Optional[int] = None, min_speakers: Optional[int] = None,
+                        max_speakers: Optional[int] = None) -> Dict:
+        """Diarize the given speech regions of a mono float32 waveform."""
+        duration = waveform.shape[-1] / sample_rate
+        windows = self.window_starts(regions, duration)
+        logger.info("light_diarization_started", duration=round(duration, 2),
+                    speech_regions=len(regions), windows=len(windows))
+
+        if not windows:
+            return {'segments': [], 'unique_speakers': [], 'total_speakers': 0}
+
+        window_samples = min(int(self.window_seconds * sample_rate), waveform.shape[-1])
+        last_start = waveform.shape[-1] - window_samples
+        first_samples = [min(int(start * sample_rate), last_start) for _, start in windows]
+        batch = np.stack([waveform[first:first + window_samples] for first in first_samples]).astype(np.float32)
+        embeddings = np.asarray(self.embed_windows(batch, sample_rate), dtype=np.float32)
+
+        labels = agglomerative_cluster(embeddings, num_speakers, self.cluster_threshold,
+                                       min_speakers, max_speakers)
+        segments = self.build_segments(regions, windows, labels)
+        unique_speakers = list(dict.fromkeys(segment['speaker'] for segment in segments))
+
+        logger.info("light_diarization_complete", num_segments=len(segments),
+                    unique_speakers=len(unique_speakers))
+        return {
+            'segments': segments,
+            'unique_speakers': unique_speakers,
+            'total_speakers': len(unique_speakers)
+        }
+
+    def build_segments(self, regions: List[Tuple[float, float]], windows: List[Tuple[int, float]],
+                       labels: np.ndarray) -> List[Dict]:
+        """Label each part of a region with its nearest window and merge same-speaker runs."""
+        half = self.window_seconds / 2
+        segments: List[Dict] = []
+        for index, (start, end) in enumerate(regions):
+            centers = [(window_start + half, int(label))
+                       for (region, window_start), label in zip(windows, labels) if region == index]
+            if not centers:
+                continue
+            centers.sort()
+            boundaries = [start] + [
+                (left[0] + right[0]) / 2 for left, right in zip(centers, centers[1:])
+            ] + [end]
+            for (_, label), seg_start, seg_end in zip(centers, boundaries, boundaries[1:]):
+                seg_start, seg_end = max(seg_start, start), min(seg_end, end)
+                if seg_end <= seg_start:
+                    continue
+                speaker = f"SPEAKER_{label:02d}"
+                if segments and segments[-1]['speaker'] == speaker and seg_start - segments[-1]['end'] < 1e-6:
+                    segments[-1]['end'] = seg_end
+                    segments[-1]['duration'] = seg_end - segments[-1]['start']
+                else:
+                    segments.append({'start': seg_start, 'end': seg_end, 'speaker': speaker,
+                                     'duration': seg_end - seg_start})
+        return segments
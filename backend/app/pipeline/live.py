@@ -0,0 +1,265 @@
+"""Live meeting transcription from streamed PCM audio.
+
+Audio arrives in small chunks over a WebSocket. Whisper is re-run over a rolling
+window that ends at the newest audio; only words that end before a short holdback are
+committed, so a word cut off at the window edge is transcribed again once its end has
+arrived. A segment is held back until the speaker pauses (or it reaches
+``max_segment_seconds``) so segments are not split at window boundaries. Each
+committed segment is embedded with the ECAPA model and assigned to a speaker cluster
+by ``OnlineSpeakerClusterer``, which names clusters from the database snapshot.
+
+The session takes its models as callables so it can run without the ML stack.
+"""
+
+from collections import deque
+from typing import Callable, Dict, List, Optional
+import threading
+import time
+
+import numpy as np
+import structlog
+
+from .online_clustering import OnlineSpeakerClusterer
+
+logger = structlog.get_logger(__name__)
+
+# (audio float32, offset seconds) -> word dicts with 'word', 'start', 'end' in stream time
+TranscribeFn = Callable[..., List[Dict]]
+# (waveform float32, sample_rate) -> 1D embedding
+EmbedFn = Callable[[np.ndarray, int], np.ndarray]
+
+
+def pcm16_to_float32(data: bytes) -> np.ndarray:
+    """Convert little-endian 16-bit PCM to float32 samples in [-1, 1]."""
+    return np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+
+
+class LiveTranscriptionSession:
+    """Incremental transcription and speaker assignment for one live stream.
+
+    ``add_audio`` may be called from the receiving coroutine while ``process`` runs in a
+    worker thread. End-to-end latency is bounded: when processing falls more than
+    ``max_lag_seconds`` behind the stream, the oldest untranscribed audio is skipped.
+    """
+
+    def __init__(self, transcribe: TranscribeFn, embed: EmbedFn,
+                 known_speakers: Optional[Dict[str, np.ndarray]] = None,
+                 sample_rate: int = 16000, window_seconds: float = 12.0,
+                 step_seconds: float = 2.0, holdback_seconds: float = 1.0,
+                 context_seconds: float = 2.0, max_lag_seconds: float = 10.0,
+                 min_embedding_seconds: float = 1.5, segment_gap_seconds: float = 0.8,
+                 max_segment_seconds: float = 4.0,
+                 clusterer: Optional[OnlineSpeakerClusterer] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.transcribe = transcribe
+        self.embed = embed
+        self.sample_rate = sample_rate
+        self.window_seconds = window_seconds
+        self.step_seconds = step_seconds
+        self.holdback_seconds = holdback_seconds
+        self.context_seconds = context_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.min_embedding_seconds = min_embedding_seconds
+        self.segment_gap_seconds = segment_gap_seconds
+        self.max_segment_seconds = max_segment_seconds
+        self.clock = clock
+
+        self.clusterer = clusterer or OnlineSpeakerClusterer(known_speakers)
+        self._reported_labels: Dict[str, str] = {}
+
+        self._lock = threading.Lock()
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_start = 0  # stream sample index of self._buffer[0]
+        self._total_samples = 0
+        self._arrivals: deque = deque()  # (stream end seconds, wall clock) per chunk
+        self._committed = 0.0  # stream time up to which words have been emitted
+        self._last_processed = 0.0
+        self._prompt = ''
+
+        self._latencies: List[float] = []
+        self._segments_emitted = 0
+        self._windows_processed = 0
+        self._skipped_seconds = 0.0
+        self._processing_seconds = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio received so far."""
+        return self._total_samples / self.sample_rate
+
+    def add_audio(self, data: bytes):
+        """Append a chunk of 16-bit mono PCM at ``sample_rate``."""
+        samples = pcm16_to_float32(data)
+        if not samples.size:
+            return
+        with self._lock:
+            self._buffer = np.concatenate([self._buffer, samples])
+            self._total_samples += samples.size
+            self._arrivals.append((self._total_samples / self.sample_rate, self.clock()))
+
+    def ready(self) -> bool:
+        """Whether enough new audio has arrived since the last window to process another."""
+        return self.duration - self._last_processed >= self.step_seconds
+
+    def process(self) -> List[Dict]:
+        """Transcribe the current window and return newly committed segments."""
+        return self._process(final=False)
+
+    def finish(self) -> List[Dict]:
+        """Flush the remaining audio without holdback at the end of the stream."""
+        return self._process(final=True)
+
+    def _process(self, final: bool) -> List[Dict]:
+        started = self.clock()
+        with self._lock:
+            buffer = self._buffer
+            buffer_start = self._buffer_start / self.sample_rate
+        now = buffer_start + buffer.size / self.sample_rate
+        self._last_processed = now
+
+        # Bound latency: skip audio that can no longer be reached within the window
+        lag = now - self._committed
+        if lag > self.max_lag_seconds:
+            resume = now - self.max_lag_seconds
+            self._skipped_seconds += resume - self._committed
+            logger.warning("live_audio_skipped", skipped_seconds=round(resume - self._committed, 2),
+                           lag_seconds=round(lag, 2))
+            self._committed = resume
+
+        window_start = max(buffer_start, self._committed - self.context_seconds, now - self.window_seconds)
+        commit_until = now if final else now - self.holdback_seconds
+        if commit_until <= self._committed:
+            return []
+
+        window = self._slice(buffer, buffer_start, window_start, now)
+        words = self.transcribe(window, window_start, initial_prompt=self._prompt or None) if window.size else []
+        self._windows_processed += 1
+
+        # Words are keyed by midpoint so re-transcribed context is never emitted twice
+        new_words = [
+            word for word in words
+            if self._committed <= (word['start'] + word['end']) / 2 and word['end'] <= commit_until
+        ]
+        groups = self._group_words(new_words)
+        if groups and not final and self._is_open(groups[-1], commit_until):
+            # The speaker may still be mid-sentence; keep the last segment for the next window
+            groups.pop()
+            pending = True
+        else:
+            pending = any(word['end'] > commit_until for word in words)
+
+        if groups:
+            self._committed = max(self._committed, groups[-1][-1]['end'])
+        elif not pending:
+            # Silence: everything before the holdback is settled
+            self._committed = commit_until
+
+        segments = [self._build_segment(group, buffer, buffer_start) for group in groups]
+        self._trim_buffer()
+
+        emitted_at = self.clock()
+        for segment in segments:
+            segment['latency'] = round(emitted_at - self._arrival_time(segment['end']), 3)
+            self._latencies.append(segment['latency'])
+        self._segments_emitted += len(segments)
+        self._processing_seconds += emitted_at - started
+
+        if segments:
+            self._prompt = ' '.join(segment['text'] for segment in segments)[-200:]
+            logger.info("live_segments_emitted", count=len(segments), committed=round(self._committed, 2),
+                        stream_seconds=round(now, 2), final=final)
+        return segments
+
+    def _slice(self, buffer: np.ndarray, buffer_start: float, start: float, end: float) -> np.ndarray:
+        first = max(0, int((start - buffer_start) * self.sample_rate))
+        last = min(buffer.size, int((end - buffer_start) * self.sample_rate))
+        return buffer[first:last]
+
+    def _group_words(self, words: List[Dict]) -> List[List[Dict]]:
+        """Split committed words into segments at pauses."""
+        groups: List[List[Dict]] = []
+        for word in words:
+            if groups and word['start'] - groups[-1][-1]['end'] <= self.segment_gap_seconds:
+                groups[-1].append(word)
+            else:
+                groups.append([word])
+        return groups
+
+    def _is_open(self, words: List[Dict], commit_until: float) -> bool:
+        """Whether a segment may still continue: no pause after it yet and not too long."""
+        return (commit_until - words[-1]['end'] < self.segment_gap_seconds
+                and words[-1]['end'] - words[0]['start'] < self.max_segment_seconds)
+
+    def _build_segment(self, words: List[Dict], buffer: np.ndarray, buffer_start: float) -> Dict:
+        start, end = float(words[0]['start']), float(words[-1]['end'])
+
+        # Short segments are embedded with surrounding audio for a stable voice print
+        padding = max(0.0, self.min_embedding_seconds - (end - start)) / 2
+        audio = self._slice(buffer, buffer_start, start - padding, end + padding)
+        if audio.size:
+            assignment = self.clusterer.assign(self.embed(audio, self.sample_rate))
+            speaker, matched_speaker = assignment['speaker'], assignment['matched_speaker']
+            similarity = assignment['similarity_score']
+            self._reported_labels[speaker] = matched_speaker
+        else:
+            speaker, matched_speaker, similarity = 'Unknown', 'Unknown', 0.0
+
+        return {
+            'start': start,
+            'end': end,
+            'duration': end - start,
+            'speaker': speaker,
+            'matched_speaker': matched_speaker,
+            'similarity_score': similarity,
+            'text': ''.join(word['word'] for word in words).strip(),
+            'words': [
+                {'word': word['word'], 'start': float(word['start']), 'end': float(word['end'])}
+                for word in words
+            ]
+        }
+
+    def pop_speaker_updates(self) -> List[Dict]:
+        """Clusters whose matched speaker changed since their segments were sent.
+
+        Earlier segments of ``speaker`` should be shown as ``matched_speaker`` from now on.
+        """
+        updates = []
+        for speaker, matched_speaker in self.clusterer.labels().items():
+            reported = self._reported_labels.get(speaker)
+            if reported is not None and reported != matched_speaker:
+                updates.append({'speaker': speaker, 'matched_speaker': matched_speaker})
+                self._reported_labels[speaker] = matched_speaker
+        return updates
+
+    def _arrival_time(self, stream_time: float) -> float:
+        """Wall-clock time at which audio up to ``stream_time`` had been received."""
+        for chunk_end, arrived in self._arrivals:
+            if chunk_end >= stream_time:
+                return arrived
+        return self._arrivals[-1][1] if self._arrivals else self.clock()
+
+    def _trim_buffer(self):
+        """Drop audio (and arrival records) that no future window or embedding can reach."""
+        keep_from = self._committed - max(self.context_seconds, self.min_embedding_seconds)
+        with self._lock:
+            drop = int(keep_from * self.sample_rate) - self._buffer_start
+            if drop > 0:
+                self._buffer = self._buffer[drop:]
+                self._buffer_start += drop
+            while len(self._arrivals) > 1 and self._arrivals[0][0] < self._committed:
+                self._arrivals.popleft()
+
+    def stats(self) -> Dict:
+        """Latency and throughput figures for the session so far."""
+        latencies = sorted(self._latencies)
+        return {
+            'audio_seconds': round(self.duration, 3),
+            'segments': self._segments_emitted,
+            'windows_processed': self._windows_processed,
+            'skipped_seconds': round(self._skipped_seconds, 3),
+            'latency_p50': latencies[len(latencies) // 2] if latencies else None,
+            'latency_max': latencies[-1] if latencies else None,
+            'real_time_factor': round(self._processing_seconds / self.duration, 3) if self.duration else None,
+            'clustering': self.clusterer.stats()
+        }
+
@@ -0,0 +1,376 @@
+"""SQLite index of processed meetings for partial retrieval.
+
+Each processed meeting is stored once as rows: a metadata row indexed by creation date,
+one row per matched speaker, one row per segment (its JSON as stored bytes) and one row
+per transcript turn. Listing meetings, reading a time range of a transcript or fetching
+only the insights then touches just those rows, without loading or parsing the full
+result document. Segment JSON and insights are returned as ``RawJSON`` so the stored
+bytes go straight into the response.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import sqlite3
+import time
+
+import structlog
+
+from ..utils.serialization import RawJSON, dumps
+from .segments import as_segments
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    duration REAL,
+    segment_count INTEGER NOT NULL,
+    speaker_count INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    insights BLOB
+);
+CREATE INDEX IF NOT EXISTS meetings_created_at ON meetings (created_at);
+
+CREATE TABLE IF NOT EXISTS meeting_speakers (
+    meeting_id TEXT NOT NULL,
+    speaker TEXT NOT NULL,
+    speaking_seconds REAL NOT NULL,
+    PRIMARY KEY (meeting_id, speaker)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS meeting_speakers_speaker ON meeting_speakers (speaker, meeting_id);
+
+CREATE TABLE IF NOT EXISTS meeting_segments (
+    meeting_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (meeting_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS meeting_segments_start ON meeting_segments (meeting_id, start);
+
+CREATE TABLE IF NOT EXISTS meeting_turns (
+    meeting_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    speaker TEXT NOT NULL,
+    start REAL,
+    end REAL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (meeting_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS meeting_turns_start ON meeting_turns (meeting_id, start);
+"""
+
+# Result sections kept as meeting metadata; segments, transcript and insights have their own rows
+_METADATA_KEYS = ('audio_path', 'diarization_metadata', 'processing_metadata', 'speaker_mapping')
+
+_SUMMARY_COLUMNS = "id, created_at, updated_at, duration, segment_count, insights IS NOT NULL AS has_insights"
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def _timestamp(value: str) -> float:
+    """Seconds since the epoch for an ISO date or datetime (UTC unless it has an offset)."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def transcript_turns(transcript: Any) -> List[Dict[str, Any]]:
+    """Turn dicts from a ``Transcript`` or its ``to_dict`` form."""
+    if transcript is None:
+        return []
+    if hasattr(transcript, 'turns'):
+        return [turn.to_dict() for turn in transcript.turns]
+    return list(transcript.get('turns', []))
+
+
+def _overlap(start: float, end: float, spans: List[Tuple[float, float]]) -> float:
+    return sum(max(0.0, min(end, span_end) - max(start, span_start)) for span_start, span_end in spans)
+
+
+def turn_belongs_to(start: Optional[float], end: Optional[float], spans: List[Tuple[float, float]],
+                    other_spans: List[Tuple[float, float]]) -> bool:
+    """Whether a turn under a shared label belongs to the diarized speaker of ``spans``.
+
+    Turns carry only the matched label, so when several diarized speakers share it
+    (``other_spans`` holds the others' segments) a turn goes to whichever speaker's
+    segments overlap it most; a turn without offsets then belongs to none of them.
+    """
+    if not other_spans:
+        return True
+    if start is None or end is None:
+        return False
+    return _overlap(start, end, spans) > _overlap(start, end, other_spans)
+
+
+class MeetingStore:
+    """Stores meeting results in SQLite, indexed by meeting id, date and speaker."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call keeps the store safe to use from worker threads
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def save(self, meeting_id: str, result: Dict, created_at: Optional[float] = None,
+             segment_json: Optional[List[bytes]] = None):
+        """Insert or replace one meeting result.
+
+        ``segment_json`` holds the already-serialized segments (one JSON document each)
+        when the caller has them. Re-saving a meeting keeps its original creation date
+        unless ``created_at`` is given.
+        """
+        segments = as_segments(result.get('segments', []))
+        if segment_json is None:
+            segment_json = [dumps(segment.to_dict()) for segment in segments]
+
+        speaking_seconds: Dict[str, float] = {}
+        for segment in segments:
+            speaker = segment.get('matched_speaker', 'Unknown')
+            speaking_seconds[speaker] = speaking_seconds.get(speaker, 0.0) + segment.duration
+
+        metadata = {key: result[key] for key in _METADATA_KEYS if key in result}
+        insights = dumps(result['llm_insights']) if result.get('llm_insights') is not None else None
+        turns = transcript_turns(result.get('transcript'))
+        duration = result.get('processing_metadata', {}).get('total_duration')
+        now = time.time()
+
+        with self._connect() as connection:
+            row = connection.execute("SELECT created_at FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+            if created_at is None:
+                created_at = row['created_at'] if row else now
+            for table in ('meeting_speakers', 'meeting_segments', 'meeting_turns'):
+                connection.execute(f"DELETE FROM {table} WHERE meeting_id = ?", (meeting_id,))
+            connection.execute(
+                "INSERT OR REPLACE INTO meetings VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (meeting_id, created_at, now, duration, len(segments), len(speaking_seconds),
+                 dumps(metadata).decode('utf-8'), insights)
+            )
+            connection.executemany(
+                "INSERT INTO meeting_speakers VALUES (?, ?, ?)",
+                [(meeting_id, speaker, seconds) for speaker, seconds in speaking_seconds.items()]
+            )
+            connection.executemany(
+                "INSERT INTO meeting_segments VALUES (?, ?, ?, ?, ?)",
+                [(meeting_id, position, segment.start, segment.end, data)
+                 for position, (segment, data) in enumerate(zip(segments, segment_json))]
+            )
+            connection.executemany(
+                "INSERT INTO meeting_turns VALUES (?, ?, ?, ?, ?, ?)",
+                [(meeting_id, position, turn['speaker'], turn.get('start'), turn.get('end'), turn['text'])
+                 for position, turn in enumerate(turns)]
+            )
+
+        logger.info("meeting_stored", meeting_id=meeting_id, segments=len(segments),
+                    turns=len(turns), speakers=len(speaking_seconds))
+
+    @staticmethod
+    def _speakers(connection: sqlite3.Connection, meeting_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        placeholders = ','.join('?' * len(meeting_ids))
+        rows = connection.execute(
+            f"SELECT meeting_id, speaker, speaking_seconds FROM meeting_speakers "
+            f"WHERE meeting_id IN ({placeholders}) ORDER BY speaking_seconds DESC, speaker", meeting_ids
+        ).fetchall()
+        speakers: Dict[str, List[Dict[str, Any]]] = {meeting_id: [] for meeting_id in meeting_ids}
+        for row in rows:
+            speakers[row['meeting_id']].append({'name': row['speaker'],
+                                                'speaking_seconds': round(row['speaking_seconds'], 2)})
+        return speakers
+
+    @staticmethod
+    def _summary(row: sqlite3.Row, speakers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'id': row['id'],
+            'created_at': _iso(row['created_at']),
+            'updated_at': _iso(row['updated_at']),
+            'duration': row['duration'],
+            'segment_count': row['segment_count'],
+            'speakers': speakers,
+            'has_insights': bool(row['has_insights'])
+        }
+
+    def list_meetings(self, speaker: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Newest meetings first, optionally only those with ``speaker`` or within a date range.
+
+        ``since``/``until`` are ISO dates or datetimes; ``until`` is exclusive.
+        """
+        clauses, params = [], []
+        if speaker:
+            clauses.append("id IN (SELECT meeting_id FROM meeting_speakers WHERE speaker = ?)")
+            params.append(speaker)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(_timestamp(since))
+        if until:
+            clauses.append("created_at < ?")
+            params.append(_timestamp(until))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM meetings {where} "
+                f"ORDER BY created_at DESC LIMIT ? OFFSET ?", (*params, limit, offset)
+            ).fetchall()
+            speakers = self._speakers(connection, [row['id'] for row in rows])
+        return [self._summary(row, speakers[row['id']]) for row in rows]
+
+    def get_meeting(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """Meeting summary plus stored metadata, or None."""
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT {_SUMMARY_COLUMNS}, metadata FROM meetings WHERE id = ?", (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            speakers = self._speakers(connection, [meeting_id])
+        meeting = self._summary(row, speakers[meeting_id])
+        meeting['metadata'] = json.loads(row['metadata'])
+        return meeting
+
+    def get_transcript(self, meeting_id: str, start: Optional[float] = None,
+                       end: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Segments and transcript turns overlapping ``[start, end)`` seconds, or None.
+
+        Segments come back as one ``RawJSON`` list built from the stored bytes.
+        """
+        range_clause, range_params = "", []
+        if end is not None:
+            range_clause += " AND start < ?"
+            range_params.append(end)
+        if start is not None:
+            range_clause += " AND end > ?"
+            range_params.append(start)
+
+        with self._connect() as connection:
+            if connection.execute("SELECT 1 FROM meetings WHERE id = ?", (meeting_id,)).fetchone() is None:
+                return None
+            segment_rows = connection.execute(
+                f"SELECT data FROM meeting_segments WHERE meeting_id = ?{range_clause} ORDER BY start",
+                (meeting_id, *range_params)
+            ).fetchall()
+            turn_rows = connection.execute(
+                f"SELECT speaker, start, end, text FROM meeting_turns WHERE meeting_id = ?{range_clause} "
+                f"ORDER BY position", (meeting_id, *range_params)
+            ).fetchall()
+
+        turns = [dict(row) for row in turn_rows]
+        return {
+            'meeting_id': meeting_id,
+            'start': start,
+            'end': end,
+            'segments': RawJSON(b'[' + b','.join(row['data'] for row in segment_rows) + b']'),
+            'turns': turns,
+            'speaker_annotated_transcript': '\n\n'.join(f'{turn["speaker"]}: "{turn["text"]}"' for turn in turns)
+        }
+
+    def get_insights(self, meeting_id: str) -> Optional[RawJSON]:
+        """Stored LLM insights as ``RawJSON`` (``null`` if none were generated), or None if unknown."""
+        with self._connect() as connection:
+            row = connection.execute("SELECT insights FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+        if row is None:
+            return None
+        return RawJSON(row['insights'] if row['insights'] is not None else b'null')
+
+    def rename_speaker(self, meeting_id: str, old: str, new: str, speaker: Optional[str] = None) -> bool:
+        """Relabel a matched speaker in one meeting's speakers, segments and turns.
+
+        With ``speaker`` (a diarized label such as ``SPEAKER_01``) only that cluster's
+        segments, speaking time and turns are relabelled, so another cluster matched to
+        the same name keeps it.
+        """
+        with self._connect() as connection:
+            updates, spans, other_spans = [], [], []
+            for row in connection.execute("SELECT position, data FROM meeting_segments WHERE meeting_id = ?",
+                                          (meeting_id,)):
+                segment = json.loads(row['data'])
+                if segment.get('matched_speaker') != old:
+                    continue
+                if speaker is None or segment.get('speaker') == speaker:
+                    segment['matched_speaker'] = new
+                    updates.append((dumps(segment), meeting_id, row['position']))
+                    spans.append((segment['start'], segment['end']))
+                else:
+                    other_spans.append((segment['start'], segment['end']))
+
+            if other_spans:
+                if not spans:
+                    return False
+                seconds = sum(end - start for start, end in spans)
+                connection.execute(
+                    "UPDATE meeting_speakers SET speaking_seconds = speaking_seconds - ? "
+                    "WHERE meeting_id = ? AND speaker = ?", (seconds, meeting_id, old)
+                )
+                connection.execute(
+                    "INSERT INTO meeting_speakers VALUES (?, ?, ?) ON CONFLICT (meeting_id, speaker) "
+                    "DO UPDATE SET speaking_seconds = speaking_seconds + excluded.speaking_seconds",
+                    (meeting_id, new, seconds)
+                )
+            else:
+                # WHERE true disambiguates the upsert clause from a join constraint
+                connection.execute(
+                    "INSERT INTO meeting_speakers SELECT meeting_id, ?, speaking_seconds FROM meeting_speakers "
+                    "WHERE true AND meeting_id = ? AND speaker = ? ON CONFLICT (meeting_id, speaker) "
+                    "DO UPDATE SET speaking_seconds = speaking_seconds + excluded.speaking_seconds",
+                    (new, meeting_id, old)
+                )
+                renamed = connection.execute("DELETE FROM meeting_speakers WHERE meeting_id = ? AND speaker = ?",
+                                             (meeting_id, old)).rowcount > 0
+                if not renamed:
+                    return False
+            connection.execute(
+                "UPDATE meetings SET speaker_count = (SELECT COUNT(*) FROM meeting_speakers WHERE meeting_id = ?), "
+                "updated_at = ? WHERE id = ?", (meeting_id, time.time(), meeting_id)
+            )
+
+            turn_positions = [
+                (new, meeting_id, row['position'])
+                for row in connection.execute(
+                    "SELECT position, start, end FROM meeting_turns WHERE meeting_id = ? AND speaker = ?",
+                    (meeting_id, old)
+                )
+                if turn_belongs_to(row['start'], row['end'], spans, other_spans)
+            ]
+            connection.executemany("UPDATE meeting_turns SET speaker = ? WHERE meeting_id = ? AND position = ?",
+                                   turn_positions)
+            connection.executemany("UPDATE meeting_segments SET data = ? WHERE meeting_id = ? AND position = ?",
+                                   updates)
+
+        logger.info("meeting_speaker_renamed", meeting_id=meeting_id, old=old, new=new, speaker=speaker)
+        return True
+
+    def delete(self, meeting_id: str) -> bool:
+        with self._connect() as connection:
+            for table in ('meeting_speakers', 'meeting_segments', 'meeting_turns'):
+                connection.execute(f"DELETE FROM {table} WHERE meeting_id = ?", (meeting_id,))
+            return connection.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,)).rowcount > 0
+
+    def import_result_file(self, path: Path) -> str:
+        """Index an existing ``data/results/meeting_<id>.json`` file; returns the meeting id."""
+        path = Path(path)
+        meeting_id = path.stem[len('meeting_'):] if path.stem.startswith('meeting_') else path.stem
+        with open(path, 'rb') as f:
+            result = json.load(f)
+        self.save(meeting_id, result, created_at=path.stat().st_mtime)
+        return meeting_id
@@ -0,0 +1,138 @@
+"""Diarization of multi-track recordings with one participant per channel.
+
+Conferencing tools often export a separate channel per participant, so who is speaking
+can be read directly from per-channel speech activity. Frame energies of all channels
+are computed in one vectorized pass; a channel counts as active in a frame when it is
+above its own noise floor and close to the loudest channel in that frame, which
+suppresses crosstalk bleeding into other participants' microphones.
+
+A channel that carries more than one voice (a room microphone, a shared laptop) is
+"mixed" and falls back to neural diarization of that channel alone.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import structlog
+
+from .light_diarization import EmbedBatchFn, LightweightDiarizer, frame_energy_db, mask_to_regions, speech_mask
+
+logger = structlog.get_logger(__name__)
+
+# (mono waveform float32, sample_rate) -> diarization result dict
+DiarizeFn = Callable[[np.ndarray, int], Dict]
+
+
+def channel_activity(audio: np.ndarray, sample_rate: int, frame_seconds: float = 0.03,
+                     margin_db: float = 12.0, dominance_db: float = 10.0) -> np.ndarray:
+    """(channels, frames) mask of frames where each channel's own speaker is talking."""
+    frame_samples = max(1, int(frame_seconds * sample_rate))
+    energy = frame_energy_db(audio, frame_samples)
+    if not energy.size:
+        return np.zeros(energy.shape, dtype=bool)
+    dominant = energy >= energy.max(axis=0, keepdims=True) - dominance_db
+    return speech_mask(energy, margin_db) & dominant
+
+
+def channels_are_duplicates(audio: np.ndarray, min_correlation: float = 0.98, stride: int = 4) -> bool:
+    """Whether every channel carries the same signal (e.g. a mono mix exported as stereo)."""
+    if audio.shape[0] < 2:
+        return True
+    sampled = audio[:, ::stride].astype(np.float32)
+    sampled = sampled - sampled.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(sampled, axis=1)
+    if np.any(norms == 0):
+        return False
+    correlation = (sampled @ sampled.T) / np.outer(norms, norms)
+    return bool(correlation.min() >= min_correlation)
+
+
+class MultiChannelDiarizer:
+    """Builds diarization segments from per-channel speech activity.
+
+    Args:
+        embed_windows: Batch ECAPA embedder used to check whether a channel holds more
+            than one voice; without it every channel is assumed to be one participant
+        diarize_mixed: Neural diarization for a single mixed channel
+    """
+
+    def __init__(self, embed_windows: Optional[EmbedBatchFn] = None,
+                 diarize_mixed: Optional[DiarizeFn] = None, frame_seconds: float = 0.03,
+                 margin_db: float = 12.0, dominance_db: float = 10.0,
+                 min_speech_seconds: float = 0.25, min_silence_seconds: float = 0.3):
+        self.embed_windows = embed_windows
+        self.diarize_mixed = diarize_mixed
+        self.frame_seconds = frame_seconds
+        self.margin_db = margin_db
+        self.dominance_db = dominance_db
+        self.min_speech_seconds = min_speech_seconds
+        self.min_silence_seconds = min_silence_seconds
+
+    def find_mixed_channels(self, audio: np.ndarray, sample_rate: int,
+                            channel_regions: List[List[Tuple[float, float]]]) -> Dict[int, Dict]:
+        """Channels whose own speech clusters into more than one voice, with that result.
+
+        Only frames where the channel dominates are embedded, so crosstalk from other
+        participants does not make every channel look mixed.
+        """
+        if self.embed_windows is None:
+            return {}
+        light = LightweightDiarizer(self.embed_windows)
+        mixed = {}
+        for channel, regions in enumerate(channel_regions):
+            result = light.diarize_regions(audio[channel], sample_rate, regions)
+            if result['total_speakers'] > 1:
+                mixed[channel] = result
+        return mixed
+
+    def diarize(self, audio: np.ndarray, sample_rate: int,
+                mixed_channels: Optional[List[int]] = None) -> Dict:
+        """Diarize ``(channels, samples)`` audio.
+
+        ``mixed_channels`` lists channels known to hold several voices; when omitted
+        they are detected with ``embed_windows``.
+        """
+        frame_samples = max(1, int(self.frame_seconds * sample_rate))
+        activity = channel_activity(audio, sample_rate, self.frame_seconds, self.margin_db, self.dominance_db)
+        channel_regions = [
+            mask_to_regions(mask, frame_samples / sample_rate, self.min_speech_seconds, self.min_silence_seconds)
+            for mask in activity
+        ]
+
+        detected = {} if mixed_channels is not None else \
+            self.find_mixed_channels(audio, sample_rate, channel_regions)
+        mixed = set(mixed_channels) if mixed_channels is not None else set(detected)
+
+        segments: List[Dict] = []
+        for channel in range(audio.shape[0]):
+            label = f"CHANNEL_{channel + 1}"
+            if channel in mixed:
+                if self.diarize_mixed is not None:
+                    # Silence other participants' crosstalk so it is not diarized as extra voices
+                    own_speech = np.zeros(audio.shape[1], dtype=np.float32)
+                    for start, end in channel_regions[channel]:
+                        own_speech[int(start * sample_rate):int(end * sample_rate)] = 1.0
+                    result = self.diarize_mixed(audio[channel] * own_speech, sample_rate)
+                else:
+                    result = detected.get(channel) or {'segments': []}
+                for segment in result['segments']:
+                    segments.append({**segment, 'speaker': f"{label}/{segment['speaker']}", 'channel': channel})
+                continue
+
+            segments.extend(
+                {'start': start, 'end': end, 'speaker': label, 'duration': end - start, 'channel': channel}
+                for start, end in channel_regions[channel]
+            )
+
+        segments.sort(key=lambda segment: (segment['start'], segment['end']))
+        unique_speakers = list(dict.fromkeys(segment['speaker'] for segment in segments))
+        logger.info("multichannel_diarization_complete", channels=audio.shape[0],
+                    mixed_channels=sorted(mixed), num_segments=len(segments),
+                    unique_speakers=len(unique_speakers))
+        return {
+            'segments': segments,
+            'unique_speakers': unique_speakers,
+            'total_speakers': len(unique_speakers),
+            'channels': audio.shape[0],
+            'mixed_channels': sorted(mixed)
+        }
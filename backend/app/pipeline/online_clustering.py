@@ -0,0 +1,149 @@
+"""Incremental speaker clustering for live audio.
+
+Full-file diarization is not available while a meeting is still running, so each
+window's ECAPA embedding is assigned to the closest existing cluster or starts a new
+one. Centroids are running means of unit-normalized embeddings, and the work per
+window depends only on the number of clusters, never on how long the meeting has been
+running. Clusters are matched against the ``SpeakerDatabase`` snapshot once they have
+enough windows to be trusted, and re-checked as they keep growing.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class OnlineSpeakerClusterer:
+    """Assigns windowed speaker embeddings to clusters as they arrive.
+
+    Args:
+        known_speakers: Name -> embedding snapshot of the speaker database
+        cluster_threshold: Minimum cosine similarity to join an existing cluster
+        stable_windows: Windows a cluster needs before its database match is trusted;
+            until then it is re-matched on every window
+        match_threshold / match_margin: Same criteria as ``SpeakerMatcher``: the best
+            known speaker must reach the threshold and beat the runner-up by the margin
+        max_clusters: Upper bound on clusters; beyond it windows join the closest one
+    """
+
+    def __init__(self, known_speakers: Optional[Dict[str, np.ndarray]] = None,
+                 cluster_threshold: float = 0.5, stable_windows: int = 3,
+                 match_threshold: float = 0.1, match_margin: float = 0.1,
+                 max_clusters: int = 32):
+        self.cluster_threshold = cluster_threshold
+        self.stable_windows = stable_windows
+        self.match_threshold = match_threshold
+        self.match_margin = match_margin
+        self.max_clusters = max_clusters
+
+        known_speakers = known_speakers or {}
+        self.known_names: List[str] = list(known_speakers)
+        self._known = _normalize(np.array(
+            [np.asarray(embedding, dtype=np.float32).ravel() for embedding in known_speakers.values()],
+            dtype=np.float32
+        )) if known_speakers else None
+
+        self._sums: Optional[np.ndarray] = None  # (max_clusters, dim) running sums
+        self._centroids: Optional[np.ndarray] = None  # (max_clusters, dim) unit centroids
+        self._counts: List[int] = []
+        self._labels: List[str] = []
+        self._similarities: List[float] = []
+        self._unknown_count = 0
+
+    @property
+    def num_clusters(self) -> int:
+        return len(self._counts)
+
+    def assign(self, embedding: np.ndarray) -> Dict:
+        """Assign one window embedding and return its cluster.
+
+        Returns:
+            Dict with ``cluster`` (index), ``speaker`` (``SPEAKER_NN``), ``matched_speaker``
+            (database name or ``Unknown N``), ``similarity`` (to the cluster centroid),
+            ``similarity_score`` (cluster to its database match) and ``new_cluster``
+        """
+        vector = _normalize(np.asarray(embedding, dtype=np.float32).ravel())
+        if self._sums is None:
+            self._sums = np.zeros((self.max_clusters, vector.size), dtype=np.float32)
+            self._centroids = np.zeros((self.max_clusters, vector.size), dtype=np.float32)
+
+        cluster, similarity = -1, -1.0
+        if self._counts:
+            similarities = self._centroids[:self.num_clusters] @ vector
+            cluster = int(np.argmax(similarities))
+            similarity = float(similarities[cluster])
+
+        new_cluster = cluster < 0 or (
+            similarity < self.cluster_threshold and self.num_clusters < self.max_clusters
+        )
+        if new_cluster:
+            cluster = self.num_clusters
+            self._counts.append(0)
+            self._labels.append('')
+            self._similarities.append(0.0)
+            similarity = 1.0
+
+        # Running mean of unit vectors; the centroid direction is the normalized sum
+        self._sums[cluster] += vector
+        self._counts[cluster] += 1
+        self._centroids[cluster] = _normalize(self._sums[cluster])
+
+        count = self._counts[cluster]
+        if count <= self.stable_windows or count & (count - 1) == 0:
+            # Re-match while the cluster is young, then only when its size doubles
+            self._match(cluster)
+
+        return {
+            'cluster': cluster,
+            'speaker': f"SPEAKER_{cluster:02d}",
+            'matched_speaker': self._labels[cluster],
+            'similarity': similarity,
+            'similarity_score': self._similarities[cluster],
+            'new_cluster': new_cluster
+        }
+
+    def _match(self, cluster: int):
+        """Match a cluster centroid against the database snapshot and update its label."""
+        name, similarity = None, 0.0
+        if self._known is not None:
+            similarities = self._known @ self._centroids[cluster]
+            order = np.argsort(similarities)[::-1]
+            best = float(similarities[order[0]])
+            second = float(similarities[order[1]]) if len(order) > 1 else 0.0
+            similarity = best
+            if best >= self.match_threshold and best - second >= self.match_margin:
+                name = self.known_names[order[0]]
+
+        previous = self._labels[cluster]
+        if name is None:
+            if not previous or not previous.startswith('Unknown'):
+                self._unknown_count += 1
+                name = f"Unknown {self._unknown_count}"
+            else:
+                name = previous
+
+        self._labels[cluster] = name
+        self._similarities[cluster] = similarity
+        if previous and previous != name:
+            logger.info("online_cluster_relabeled", cluster=cluster, previous=previous,
+                        speaker=name, windows=self._counts[cluster])
+
+    def labels(self) -> Dict[str, str]:
+        """Current ``SPEAKER_NN`` -> matched speaker mapping."""
+        return {f"SPEAKER_{cluster:02d}": label for cluster, label in enumerate(self._labels)}
+
+    def stats(self) -> Dict:
+        return {
+            'clusters': self.num_clusters,
+            'windows': sum(self._counts),
+            'stable_clusters': sum(count >= self.stable_windows for count in self._counts),
+            'matched_clusters': sum(not label.startswith('Unknown') for label in self._labels)
+        }
@@ -0,0 +1,179 @@
+"""Chunk-parallel Whisper transcription for long recordings.
+
+One faster-whisper call decodes a single stream, so a long meeting keeps only a few
+cores busy. ``ChunkParallelTranscriber`` cuts the audio at the quietest point near each
+chunk boundary, transcribes the chunks in a process pool where every worker holds its
+own model, shifts word timestamps back onto the meeting timeline and stitches the
+chunks. Chunks overlap slightly so a word clipped by a cut is still heard whole; each
+word is kept only by the chunk that owns its midpoint.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import structlog
+
+from .light_diarization import frame_energy_db
+
+logger = structlog.get_logger(__name__)
+
+FRAME_SECONDS = 0.1
+
+# Set in each worker process by _init_worker
+_worker_model = None
+
+
+def plan_chunks(audio: np.ndarray, sample_rate: int = 16000, chunk_seconds: float = 60.0,
+                search_seconds: float = 5.0, overlap_seconds: float = 0.5) -> List[Dict]:
+    """Split mono audio into roughly ``chunk_seconds`` chunks cut at silence.
+
+    Each cut is the quietest 0.3s stretch within ``search_seconds`` of the target
+    boundary.
+
+    Returns:
+        Chunks with ``start``/``end`` sample bounds (including ``overlap_seconds`` on
+        each side) and ``keep_start``/``keep_end`` in seconds, the span whose words the
+        chunk owns
+    """
+    total = len(audio)
+    duration = total / sample_rate
+    cuts = [0.0]
+    if duration > chunk_seconds + search_seconds:
+        frame = int(sample_rate * FRAME_SECONDS)
+        energy = frame_energy_db(audio, frame)
+        smoothed = np.convolve(energy, np.ones(3) / 3, mode='same')
+        position = 0.0
+        while duration - position > chunk_seconds + search_seconds:
+            target = position + chunk_seconds
+            first = int((target - search_seconds) / FRAME_SECONDS)
+            last = min(len(smoothed), int((target + search_seconds) / FRAME_SECONDS) + 1)
+            quietest = first + int(np.argmin(smoothed[first:last]))
+            position = (quietest + 0.5) * FRAME_SECONDS
+            cuts.append(position)
+    cuts.append(duration)
+
+    overlap = int(overlap_seconds * sample_rate)
+    return [
+        {
+            'start': max(0, int(keep_start * sample_rate) - overlap),
+            'end': min(total, int(keep_end * sample_rate) + overlap),
+            'keep_start': keep_start,
+            'keep_end': keep_end
+        }
+        for keep_start, keep_end in zip(cuts[:-1], cuts[1:])
+    ]
+
+
+def stitch_words(chunk_words: List[Tuple[Dict, List[Dict]]]) -> List[Dict]:
+    """Merge per-chunk words (already on the meeting timeline) into one ordered list.
+
+    A word belongs to the chunk whose keep span holds its midpoint. Where the two
+    chunks placed the same word slightly differently around a cut, the repeat is
+    dropped.
+    """
+    stitched: List[Dict] = []
+    for chunk, words in chunk_words:
+        for word in words:
+            midpoint = (word['start'] + word['end']) / 2
+            if not chunk['keep_start'] <= midpoint < chunk['keep_end']:
+                continue
+            if stitched and _is_repeat(stitched[-1], word):
+                continue
+            stitched.append(word)
+    return stitched
+
+
+def _is_repeat(previous: Dict, word: Dict) -> bool:
+    """Same text overlapping in time by more than half of the shorter word."""
+    if previous['word'].strip().lower() != word['word'].strip().lower():
+        return False
+    overlap = min(previous['end'], word['end']) - max(previous['start'], word['start'])
+    shorter = min(previous['end'] - previous['start'], word['end'] - word['start'])
+    return overlap > 0.5 * max(shorter, 1e-3)
+
+
+def _init_worker(model_options: Dict):
+    global _worker_model
+    from faster_whisper import WhisperModel
+    _worker_model = WhisperModel(**model_options)
+
+
+def _transcribe_chunk(audio: np.ndarray, offset: float, beam_size: int) -> Tuple[List[Dict], Optional[str]]:
+    segments, info = _worker_model.transcribe(audio, word_timestamps=True, beam_size=beam_size)
+    words = [
+        {'word': word.word, 'start': word.start + offset, 'end': word.end + offset}
+        for segment in segments
+        for word in segment.words or []
+    ]
+    return words, info.language
+
+
+class ChunkParallelTranscriber:
+    """Transcribes long audio as silence-cut chunks across a pool of Whisper processes."""
+
+    def __init__(self, model_name: str, workers: int, device: str = "cpu", compute_type: str = "int8",
+                 cpu_threads: int = 0, beam_size: int = 5, chunk_seconds: float = 60.0,
+                 overlap_seconds: float = 0.5):
+        self.workers = workers
+        self.beam_size = beam_size
+        self.chunk_seconds = chunk_seconds
+        self.overlap_seconds = overlap_seconds
+        # Split the cores between workers unless the thread count is pinned
+        self.model_options = {
+            'model_size_or_path': model_name, 'device': device, 'compute_type': compute_type,
+            'cpu_threads': cpu_threads or max(1, (os.cpu_count() or 1) // workers), 'num_workers': 1
+        }
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            logger.info("whisper_pool_starting", workers=self.workers,
+                        cpu_threads=self.model_options['cpu_threads'])
+            # spawn: CTranslate2 thread pools do not survive fork
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker, initargs=(self.model_options,)
+            )
+        return self._pool
+
+    def should_split(self, duration: float) -> bool:
+        """Only recordings spanning at least two chunks are worth the pool."""
+        return duration >= 2 * self.chunk_seconds
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> Tuple[List[Dict], SimpleNamespace]:
+        """Transcribe 16kHz mono float32 samples.
+
+        Returns:
+            Words on the meeting timeline and an info object with ``duration`` and the
+            most common chunk ``language``
+        """
+        started = time.perf_counter()
+        chunks = plan_chunks(audio, sample_rate, self.chunk_seconds, overlap_seconds=self.overlap_seconds)
+        pool = self._get_pool()
+        futures = [
+            pool.submit(_transcribe_chunk, audio[chunk['start']:chunk['end']],
+                        chunk['start'] / sample_rate, self.beam_size)
+            for chunk in chunks
+        ]
+        results = [future.result() for future in futures]
+
+        words = stitch_words([(chunk, chunk_words) for chunk, (chunk_words, _) in zip(chunks, results)])
+        languages = Counter(language for _, language in results if language)
+        duration = len(audio) / sample_rate
+        logger.info("parallel_transcription_complete", chunks=len(chunks), workers=self.workers,
+                    words=len(words), duration=round(duration, 2),
+                    seconds=round(time.perf_counter() - started, 3))
+        info = SimpleNamespace(duration=duration,
+                               language=languages.most_common(1)[0][0] if languages else None)
+        return words, info
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -11,10 +11,29 @@ from speechbrain.pretrained import EncoderClassifier
 from faster_whisper import WhisperModel
 import structlog
 from .speaker_database import SpeakerDatabase
+from .live import LiveTranscriptionSession
+from .online_clustering import OnlineSpeakerClusterer
+from .light_diarization import LightweightDiarizer
+from .multichannel import MultiChannelDiarizer, channels_are_duplicates
+from .diarization_cache import DiarizationCache, recluster_turns
+from .search_index import TranscriptSearchIndex
+from .speaker_index import SpeakerOccurrenceIndex
+from .ecapa_backends import load_ecapa_encoder
+from .pyannote_optimization import optimize_pipeline
+from .parallel_transcription import ChunkParallelTranscriber
+from .word_table import WordTable, assign_speakers, segment_texts
+from .segments import Segment, as_segments
 from ..services.llm_service import LLMService
+from ..services.llm_cache import LLMResponseCache
+from ..services.transcript import Transcript
+from ..services.http_client import get_shared_http_client
+from ..core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Diarization engines selectable per request (see SpeakerDiarizer.diarize)
+DIARIZATION_BACKENDS = ("auto", "pyannote", "light")
+
 
 class AudioProcessor:
     """Handles audio file conversion and preprocessing."""
@@ -22,19 +41,22 @@ class AudioProcessor:
     def __init__(self):
         pass
 
-    def convert_to_wav(self, input_path: Path, output_path: Optional[Path] = None) -> Path:
-        """Convert audio file to 16kHz mono WAV format."""
+    def convert_to_wav(self, input_path: Path, output_path: Optional[Path] = None,
+                       keep_channels: bool = False) -> Path:
+        """Convert audio file to 16kHz WAV format, mono unless ``keep_channels`` is set."""
         if output_path is None:
-            output_path = input_path.with_suffix('.wav')
+            output_path = input_path.with_suffix('.multichannel.wav' if keep_channels else '.wav')
 
         logger.info("converting_audio", input=str(input_path), output=str(output_path))
 
         # Load and convert audio
         audio = AudioSegment.from_file(str(input_path))
-        audio = audio.set_frame_rate(16000).set_channels(1)
+        audio = audio.set_frame_rate(16000)
+        if not keep_channels:
+            audio = audio.set_channels(1)
         audio.export(str(output_path), format="wav")
 
-        logger.info("audio_converted", duration_seconds=len(audio) / 1000.0)
+        logger.info("audio_converted", duration_seconds=len(audio) / 1000.0, channels=audio.channels)
         return output_path
 
 
@@ -48,45 +70,133 @@ class SpeakerDiarizer:
 
     def _load_models(self):
         """Lazy load the models to avoid startup delays."""
+        self._load_pipeline()
+        self._load_embedding_model()
+
+    def _load_pipeline(self):
         if self.pipeline is None:
             logger.info("loading_diarization_pipeline")
             self.pipeline = Pipeline.from_pretrained(
                 "pyannote/speaker-diarization-3.1",
                 use_auth_token=self.hf_token
             )
+            settings = get_settings()
+            optimize_pipeline(
+                self.pipeline, quantize=settings.diarization_optimized,
+                segmentation_batch_size=settings.diarization_segmentation_batch_size,
+                embedding_batch_size=settings.diarization_embedding_batch_size
+            )
 
+    def _load_embedding_model(self):
         if self.embedding_model is None:
             logger.info("loading_speechbrain_embedding_model")
-            self.embedding_model = EncoderClassifier.from_hparams(
+            classifier = EncoderClassifier.from_hparams(
                 source="speechbrain/spkrec-ecapa-voxceleb",
                 savedir="pretrained_models/spkrec-ecapa-voxceleb"
             )
+            settings = get_settings()
+            self.embedding_model = load_ecapa_encoder(
+                classifier, settings.ecapa_backend, settings.ecapa_export_dir,
+                quantize=settings.ecapa_quantize, parity_threshold=settings.ecapa_parity_threshold
+            )
 
-    def diarize(self, audio_path: Path, num_speakers: Optional[int] = None) -> Dict:
-        """Perform speaker diarization on audio file with automatic speaker detection."""
-        self._load_models()
+    def resolve_backend(self, audio_path: Path, backend: Optional[str] = None) -> str:
+        """Pick the diarization backend; ``auto`` uses the lightweight one for short audio."""
+        settings = get_settings()
+        backend = backend or settings.diarization_backend
+        if backend not in DIARIZATION_BACKENDS:
+            raise ValueError(f"Unknown diarization backend: {backend}")
+        if backend == 'auto':
+            import torchaudio
+            info = torchaudio.info(str(audio_path))
+            duration = info.num_frames / info.sample_rate
+            backend = 'light' if duration <= settings.diarization_light_max_seconds else 'pyannote'
+            logger.info("diarization_backend_selected", backend=backend, duration=round(duration, 2),
+                        light_max_seconds=settings.diarization_light_max_seconds)
+        return backend
+
+    def diarize(self, audio_path: Path, num_speakers: Optional[int] = None,
+                backend: Optional[str] = None, min_speakers: Optional[int] = None,
+                max_speakers: Optional[int] = None) -> Dict:
+        """Perform speaker diarization on audio file with automatic speaker detection.
+
+        ``backend`` is ``pyannote``, ``light`` (energy VAD + windowed ECAPA + agglomerative
+        clustering, no pyannote) or ``auto``; defaults to ``settings.diarization_backend``.
+        ``min_speakers``/``max_speakers`` bound automatic detection when the count is not fixed.
+        """
+        backend = self.resolve_backend(audio_path, backend)
+        if backend == 'light':
+            waveform, sample_rate = self.load_waveform(audio_path)
+            result = LightweightDiarizer(self.extract_embeddings_batch).diarize(
+                waveform, sample_rate, num_speakers=num_speakers,
+                min_speakers=min_speakers, max_speakers=max_speakers
+            )
+            result['segments'] = as_segments(result['segments'])
+            result['backend'] = backend
+            return result
 
         logger.info("starting_diarization", audio_path=str(audio_path), auto_speakers=num_speakers is None)
+        result = self._run_pipeline(str(audio_path), num_speakers, min_speakers, max_speakers)
+        result['backend'] = backend
+        return result
+
+    def diarize_waveform(self, waveform: np.ndarray, sample_rate: int,
+                         num_speakers: Optional[int] = None) -> Dict:
+        """Run the pyannote pipeline on a mono float32 waveform held in memory."""
+        audio = {'waveform': torch.from_numpy(np.ascontiguousarray(waveform, dtype=np.float32)).unsqueeze(0),
+                 'sample_rate': sample_rate}
+        return self._run_pipeline(audio, num_speakers)
+
+    def diarize_multichannel(self, audio_path: Path, backend: Optional[str] = None) -> Optional[Dict]:
+        """Diarize a multi-track recording from per-channel speech activity.
+
+        Channels that hold several voices fall back to the selected diarization backend.
+        Returns None when the file has a single channel (or identical channels), in which
+        case the caller should use ``diarize``.
+        """
+        import torchaudio
+        waveform, sample_rate = torchaudio.load(str(audio_path))
+        audio = waveform.numpy()
+        if channels_are_duplicates(audio):
+            logger.info("multichannel_not_applicable", channels=audio.shape[0])
+            return None
+
+        backend = self.resolve_backend(audio_path, backend)
+        diarizer = MultiChannelDiarizer(
+            self.extract_embeddings_batch,
+            diarize_mixed=self.diarize_waveform if backend == 'pyannote' else None
+        )
+        result = diarizer.diarize(audio, sample_rate)
+        result['segments'] = as_segments(result['segments'])
+        result['backend'] = 'multichannel'
+        result['mixed_channel_backend'] = backend
+        return result
+
+    def _run_pipeline(self, audio, num_speakers: Optional[int] = None,
+                      min_speakers: Optional[int] = None, max_speakers: Optional[int] = None) -> Dict:
+        """Run pyannote on a file path or an in-memory ``{'waveform', 'sample_rate'}`` dict."""
+        self._load_pipeline()
 
         # Run diarization - default is AUTO speaker detection
         if num_speakers:
             logger.info("using_fixed_speaker_count", count=num_speakers)
-            diarization = self.pipeline(str(audio_path), num_speakers=num_speakers)
+            diarization = self.pipeline(audio, num_speakers=num_speakers)
+        elif min_speakers or max_speakers:
+            # Known participants narrow the speaker counts the clustering step considers
+            bounds = {key: value for key, value in
+                      (('min_speakers', min_speakers), ('max_speakers', max_speakers)) if value}
+            logger.info("using_bounded_speaker_detection", **bounds)
+            diarization = self.pipeline(audio, **bounds)
         else:
             logger.info("using_automatic_speaker_detection")
-            diarization = self.pipeline(str(audio_path))  # AUTO detection
+            diarization = self.pipeline(audio)  # AUTO detection
 
         # Convert to simple format
         segments = []
         unique_speakers = set()
 
         for turn, _, speaker in diarization.itertracks(yield_label=True):
-            segments.append({
-                'start': turn.start,
-                'end': turn.end,
-                'speaker': speaker,
-                'duration': turn.end - turn.start
-            })
+            segments.append(Segment(turn.start, turn.end, speaker))
             unique_speakers.add(speaker)
 
         logger.info("diarization_complete",
@@ -100,9 +210,27 @@ class SpeakerDiarizer:
             'total_speakers': len(unique_speakers)
         }
 
+    def load_waveform(self, audio_path: Path) -> Tuple[np.ndarray, int]:
+        """Load audio as a mono float32 NumPy array."""
+        import torchaudio
+        waveform, sample_rate = torchaudio.load(str(audio_path))
+        return waveform.mean(dim=0).numpy().astype(np.float32), sample_rate
+
+    def extract_embeddings_batch(self, windows: np.ndarray, sample_rate: int = 16000,
+                                 batch_size: int = 32) -> np.ndarray:
+        """Embed equal-length windows ``(n, samples)`` in batches; returns ``(n, dim)``."""
+        self._load_embedding_model()
+        embeddings = []
+        for first in range(0, len(windows), batch_size):
+            batch = torch.from_numpy(np.ascontiguousarray(windows[first:first + batch_size], dtype=np.float32))
+            with torch.no_grad():
+                encoded = self.embedding_model.encode_batch(batch)
+            embeddings.append(encoded.squeeze(1).cpu().numpy())
+        return np.concatenate(embeddings) if embeddings else np.zeros((0, 192), dtype=np.float32)
+
     def extract_speaker_embedding(self, audio_path: Path, start_time: float = None, end_time: float = None) -> np.ndarray:
         """Extract speaker embedding from voice sample or audio segment using SpeechBrain."""
-        self._load_models()
+        self._load_embedding_model()
 
         logger.info("extracting_speaker_embedding",
                    audio_path=str(audio_path),
@@ -141,18 +269,7 @@ class SpeakerDiarizer:
 
             # Extract embedding using SpeechBrain's encode_batch method
             logger.info("extracting_embedding_with_speechbrain")
-            with torch.no_grad():
-                embeddings = self.embedding_model.encode_batch(waveform)
-
-            # Convert to numpy array
-            if torch.is_tensor(embeddings):
-                embedding = embeddings.squeeze().cpu().numpy()
-            else:
-                embedding = np.array(embeddings).squeeze()
-
-            # Ensure 1D embedding
-            if embedding.ndim > 1:
-                embedding = np.mean(embedding, axis=0)
+            embedding = self._encode(waveform)
 
             logger.info("embedding_extracted",
                        embedding_shape=embedding.shape,
@@ -166,6 +283,28 @@ class SpeakerDiarizer:
                         error=str(e))
             raise
 
+    def extract_embedding_from_waveform(self, waveform: np.ndarray, sample_rate: int = 16000) -> np.ndarray:
+        """Extract a speaker embedding from mono float32 samples already in memory (live audio)."""
+        self._load_embedding_model()
+        return self._encode(torch.from_numpy(np.ascontiguousarray(waveform, dtype=np.float32)).unsqueeze(0))
+
+    def _encode(self, waveform: "torch.Tensor") -> np.ndarray:
+        """Run the ECAPA model on a (1, samples) waveform and return a 1D embedding."""
+        with torch.no_grad():
+            embeddings = self.embedding_model.encode_batch(waveform)
+
+        # Convert to numpy array
+        if torch.is_tensor(embeddings):
+            embedding = embeddings.squeeze().cpu().numpy()
+        else:
+            embedding = np.array(embeddings).squeeze()
+
+        # Ensure 1D embedding
+        if embedding.ndim > 1:
+            embedding = np.mean(embedding, axis=0)
+
+        return embedding
+
 
 class SpeakerMatcher:
     """Matches diarized speakers against known voice samples."""
@@ -190,74 +329,78 @@ class SpeakerMatcher:
     def extract_and_match_speakers(self, audio_path: Path, diarization_result: Dict, diarizer) -> Dict:
         """Extract speaker embeddings using equal-weight averaging and match to known speakers.
 
-        This consolidates the logic that was previously scattered across test files.
+        This consolidates the logic that was previously scattered across test files. The
+        per-turn embeddings are returned under ``turn_embeddings`` so the meeting can be
+        re-clustered later without touching the audio again.
         """
-        import numpy as np
+        turn_embeddings = []
+        for segment in diarization_result['segments']:
+            # Skip extremely short segments that would cause model errors
+            if segment['end'] - segment['start'] < 0.1:
+                turn_embeddings.append(None)
+                continue
+
+            turn_embeddings.append(diarizer.extract_speaker_embedding(
+                audio_path,
+                start_time=segment['start'],
+                end_time=segment['end']
+            ))
+
+        matching_result = self.match_turn_embeddings(diarization_result, turn_embeddings)
+        matching_result['turn_embeddings'] = turn_embeddings
+        return matching_result
 
+    def match_turn_embeddings(self, diarization_result: Dict,
+                              turn_embeddings: List[Optional[np.ndarray]]) -> Dict:
+        """Average each diarized speaker's turn embeddings (equal weights) and match them."""
         segments = diarization_result['segments']
 
-        # Group segments by speaker
-        segments_by_speaker = {}
-        for segment in segments:
+        # Group turn embeddings by speaker
+        embeddings_by_speaker = {}
+        segment_details = {}  # For debugging/logging
+
+        for segment, embedding in zip(segments, turn_embeddings):
             speaker = segment['speaker']
+            details = segment_details.setdefault(speaker, [])
+            speaker_embeddings = embeddings_by_speaker.setdefault(speaker, [])
             duration = segment['end'] - segment['start']
 
-            if speaker not in segments_by_speaker:
-                segments_by_speaker[speaker] = []
+            if embedding is None:
+                details.append(f"Segment {len(details) + 1}: SKIPPED (too short)")
+                continue
+            speaker_embeddings.append(embedding)
+
+            # Calculate similarities to known speakers for this segment (for debugging)
+            similarities = []
+            for voice_name, known_embedding in self.known_speakers.items():
+                similarity = self._cosine_similarity(embedding, known_embedding)
+                similarities.append(f"{voice_name}:{similarity:.3f}")
 
-            segments_by_speaker[speaker].append({
-                'start': segment['start'],
-                'end': segment['end'],
-                'duration': duration
-            })
+            similarities_str = " | ".join(similarities)
+            details.append(f"Segment {len(details) + 1}: {segment['start']:.1f}-{segment['end']:.1f}s ({duration:.2f}s) → {similarities_str}")
 
         # Extract embeddings using equal-weight averaging for each speaker
         unique_speaker_embeddings = {}
-        segment_details = {}  # For debugging/logging
-
-        for speaker, speaker_segments in segments_by_speaker.items():
-            segment_embeddings = []
-            segment_details[speaker] = []
+        for speaker, speaker_embeddings in embeddings_by_speaker.items():
+            if not speaker_embeddings:
+                continue
 
-            for i, seg in enumerate(speaker_segments):
-                # Skip extremely short segments that would cause model errors
-                if seg['duration'] < 0.1:
-                    segment_details[speaker].append(f"Segment {i+1}: SKIPPED (too short)")
-                    continue
-
-                embedding = diarizer.extract_speaker_embedding(
-                    audio_path,
-                    start_time=seg['start'],
-                    end_time=seg['end']
-                )
-                segment_embeddings.append(embedding)
-
-                # Calculate similarities to known speakers for this segment (for debugging)
-                similarities = []
-                for voice_name, known_embedding in self.known_speakers.items():
-                    similarity = self._cosine_similarity(embedding, known_embedding)
-                    similarities.append(f"{voice_name}:{similarity:.3f}")
-
-                similarities_str = " | ".join(similarities)
-                segment_details[speaker].append(f"Segment {i+1}: {seg['start']:.1f}-{seg['end']:.1f}s ({seg['duration']:.2f}s) → {similarities_str}")
-
-            if segment_embeddings:
-                # Calculate simple average embedding (equal weights)
-                if len(segment_embeddings) == 1:
-                    final_embedding = segment_embeddings[0]
-                else:
-                    final_embedding = np.mean(segment_embeddings, axis=0)
+            # Calculate simple average embedding (equal weights)
+            if len(speaker_embeddings) == 1:
+                final_embedding = speaker_embeddings[0]
+            else:
+                final_embedding = np.mean(speaker_embeddings, axis=0)
 
-                unique_speaker_embeddings[speaker] = final_embedding
+            unique_speaker_embeddings[speaker] = final_embedding
 
-                # Calculate similarities for the averaged embedding
-                averaged_similarities = []
-                for voice_name, known_embedding in self.known_speakers.items():
-                    similarity = self._cosine_similarity(final_embedding, known_embedding)
-                    averaged_similarities.append(f"{voice_name}:{similarity:.3f}")
+            # Calculate similarities for the averaged embedding
+            averaged_similarities = []
+            for voice_name, known_embedding in self.known_speakers.items():
+                similarity = self._cosine_similarity(final_embedding, known_embedding)
+                averaged_similarities.append(f"{voice_name}:{similarity:.3f}")
 
-                averaged_str = " | ".join(averaged_similarities)
-                segment_details[speaker].append(f"Final averaged embedding → {averaged_str}")
+            averaged_str = " | ".join(averaged_similarities)
+            segment_details[speaker].append(f"Final averaged embedding → {averaged_str}")
 
         # Create segment embeddings list (reuse speaker embeddings for all segments)
         segment_embeddings = []
@@ -278,24 +421,27 @@ class SpeakerMatcher:
         return matching_result
 
     def match_segments(self, diarization_result: Dict, segment_embeddings: List[np.ndarray]) -> Dict:
-        """Match diarized segments to known speakers."""
-        segments = diarization_result['segments']
+        """Match diarized segments to known speakers, filling in ``matched_speaker`` in place."""
+        segments = as_segments(diarization_result['segments'])
 
         if len(segment_embeddings) != len(segments):
             raise ValueError(f"Mismatch: {len(segments)} segments but {len(segment_embeddings)} embeddings")
 
-        matched_segments = []
         speaker_mapping = {}
-
-        for i, (segment, embedding) in enumerate(zip(segments, segment_embeddings)):
-            # Calculate similarities to all known speakers
-            similarities = []
-            for speaker_name, known_embedding in self.known_speakers.items():
-                similarity = self._cosine_similarity(embedding, known_embedding)
-                similarities.append((speaker_name, similarity))
-
-            # Sort by similarity (highest first)
-            similarities.sort(key=lambda x: x[1], reverse=True)
+        # Segments of one diarized speaker share its averaged embedding; score it once
+        similarities_by_embedding = {}
+
+        for segment, embedding in zip(segments, segment_embeddings):
+            similarities = similarities_by_embedding.get(id(embedding))
+            if similarities is None:
+                # Calculate similarities to all known speakers
+                similarities = [
+                    (speaker_name, self._cosine_similarity(embedding, known_embedding))
+                    for speaker_name, known_embedding in self.known_speakers.items()
+                ]
+                # Sort by similarity (highest first)
+                similarities.sort(key=lambda x: x[1], reverse=True)
+                similarities_by_embedding[id(embedding)] = similarities
 
             best_match = None
             if similarities:
@@ -310,27 +456,21 @@ class SpeakerMatcher:
 
             # Use original speaker ID if no match found
             if best_match is None:
-                original_speaker = segment['speaker']
+                original_speaker = segment.speaker
                 if original_speaker not in speaker_mapping:
                     speaker_mapping[original_speaker] = f"Unknown {len(speaker_mapping) + 1}"
-                matched_speaker = speaker_mapping[original_speaker]
-                final_similarity = similarities[0][1] if similarities else 0.0
+                segment.matched_speaker = speaker_mapping[original_speaker]
+                segment.similarity_score = float(similarities[0][1]) if similarities else 0.0
             else:
-                matched_speaker = best_match
-                final_similarity = similarities[0][1]
-
-            matched_segments.append({
-                **segment,
-                'matched_speaker': matched_speaker,
-                'similarity_score': final_similarity
-            })
+                segment.matched_speaker = best_match
+                segment.similarity_score = float(similarities[0][1])
 
         logger.info("speaker_matching_complete",
-                   total_segments=len(matched_segments),
-                   matched_speakers=len([s for s in matched_segments if not s['matched_speaker'].startswith('Unknown')]))
+                   total_segments=len(segments),
+                   matched_speakers=len([s for s in segments if not s.matched_speaker.startswith('Unknown')]))
 
         return {
-            'segments': matched_segments,
+            'segments': segments,
             'speaker_mapping': speaker_mapping
         }
 
@@ -349,92 +489,106 @@ class SpeakerMatcher:
 class Transcriber:
     """Handles speech-to-text transcription."""
 
-    def __init__(self, model_name: str = "base"):
+    def __init__(self, model_name: str = "base", device: str = "cpu", compute_type: str = "int8",
+                 cpu_threads: int = 0, num_workers: int = 1, beam_size: int = 5, batch_size: int = 0,
+                 parallel_workers: int = 0, parallel_chunk_seconds: float = 60.0):
         self.model_name = model_name
+        self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.beam_size = beam_size
+        self.batch_size = batch_size
         self.model = None
+        self.batched_model = None
+        self.parallel = None
+        if parallel_workers > 1:
+            self.parallel = ChunkParallelTranscriber(
+                model_name, parallel_workers, device=device, compute_type=compute_type,
+                cpu_threads=cpu_threads, beam_size=beam_size, chunk_seconds=parallel_chunk_seconds
+            )
 
     def _load_model(self):
         """Lazy load Whisper model."""
         if self.model is None:
-            logger.info("loading_whisper_model", model=self.model_name)
-            self.model = WhisperModel(self.model_name, device="cpu", compute_type="int8")
+            logger.info("loading_whisper_model", model=self.model_name, device=self.device,
+                        compute_type=self.compute_type, cpu_threads=self.cpu_threads,
+                        num_workers=self.num_workers, beam_size=self.beam_size, batch_size=self.batch_size)
+            self.model = WhisperModel(self.model_name, device=self.device, compute_type=self.compute_type,
+                                      cpu_threads=self.cpu_threads, num_workers=self.num_workers)
+            if self.batch_size > 1:
+                try:
+                    # Batched decoding over VAD chunks needs faster-whisper >= 1.1
+                    from faster_whisper import BatchedInferencePipeline
+                    self.batched_model = BatchedInferencePipeline(model=self.model)
+                except ImportError:
+                    logger.warning("whisper_batched_inference_unavailable", batch_size=self.batch_size)
+
+    def transcribe_words(self, audio, initial_prompt: Optional[str] = None) -> Tuple[List[Dict], object]:
+        """Run Whisper with word timestamps on a path or 16kHz float32 samples.
+
+        Long recordings are split across the chunk-parallel worker pool when
+        ``parallel_workers`` is set.
+
+        Returns:
+            Words (``word``, ``start``, ``end``) and faster-whisper's ``TranscriptionInfo``
+            (an object with ``duration`` and ``language`` for parallel runs)
+        """
+        if self.parallel is not None and initial_prompt is None:
+            if not isinstance(audio, np.ndarray):
+                from faster_whisper import decode_audio
+                audio = decode_audio(str(audio), sampling_rate=16000)
+            if self.parallel.should_split(len(audio) / 16000):
+                return self.parallel.transcribe(audio, 16000)
 
-    def transcribe_segments(self, audio_path: Path, segments: List[Dict]) -> List[Dict]:
-        """Transcribe each diarized segment with improved word selection."""
         self._load_model()
+        options = {'initial_prompt': initial_prompt, 'word_timestamps': True, 'beam_size': self.beam_size}
+        if self.batched_model is not None:
+            segments_result, info = self.batched_model.transcribe(audio, batch_size=self.batch_size, **options)
+        else:
+            segments_result, info = self.model.transcribe(audio, **options)
+
+        words = [
+            {'word': word.word, 'start': word.start, 'end': word.end}
+            for segment in segments_result
+            for word in segment.words or []
+        ]
+        return words, info
+
+    def transcribe_array(self, audio: np.ndarray, offset: float = 0.0,
+                         initial_prompt: Optional[str] = None) -> List[Dict]:
+        """Transcribe 16kHz mono float32 samples; word times are shifted by ``offset`` seconds."""
+        words, _ = self.transcribe_words(audio, initial_prompt=initial_prompt)
+        return [
+            {'word': word['word'], 'start': word['start'] + offset, 'end': word['end'] + offset}
+            for word in words
+        ]
 
+    def transcribe_segments(self, audio_path: Path, segments: List[Dict]) -> List[Dict]:
+        """Transcribe each diarized segment with improved word selection."""
         logger.info("starting_transcription", audio_path=str(audio_path), num_segments=len(segments))
 
         # Transcribe the entire audio once with word timestamps
         logger.info("transcribing_full_audio_for_segment_assignment")
-        transcription_result, _ = self.model.transcribe(
-            str(audio_path),
-            initial_prompt=None,
-            word_timestamps=True
-        )
-        
+        all_words, _ = self.transcribe_words(str(audio_path))
+
         # Safety assertion: ensure we're not in a loop calling model.transcribe
         assert not hasattr(self, '_transcribe_call_count'), "Model transcribe should only be called once per segments processing"
 
-        # Extract all words with timestamps for efficient lookup
-        all_words = []
-        for transcript_segment in transcription_result:
-            for word in transcript_segment.words:
-                all_words.append({
-                    'text': word.word,
-                    'start': word.start,
-                    'end': word.end,
-                    'midpoint': (word.start + word.end) / 2
-                })
-
         logger.info("full_transcription_complete", total_words=len(all_words))
 
-        transcribed_segments = []
+        return self.assign_words_to_segments(all_words, segments)
 
-        for segment in segments:
-            start_time = segment['start']
-            end_time = segment['end']
-
-            # Extract words that belong to this segment using improved logic
-            segment_words = []
-            
-            for word in all_words:
-                # Calculate word overlap with segment
-                word_overlap = self._calculate_overlap(
-                    word['start'], word['end'], start_time, end_time
-                )
-                
-                # Include word if midpoint is within segment or has significant overlap
-                if (start_time <= word['midpoint'] <= end_time or 
-                    word_overlap >= 0.05):  # Very low threshold for maximum coverage
-                    segment_words.append(word['text'])
-
-            segment_text = " ".join(segment_words).strip()
-            
-            # If still empty after word selection, try expanding the window significantly
-            if not segment_text:
-                expanded_start = max(0, start_time - 2.0)  # Much larger window
-                expanded_end = end_time + 2.0
-                
-                for word in all_words:
-                    if expanded_start <= word['midpoint'] <= expanded_end:
-                        segment_words.append(word['text'])
-                
-                segment_text = " ".join(segment_words).strip()
-                
-                # Final fallback: if still empty, include any word that overlaps at all
-                if not segment_text:
-                    for word in all_words:
-                        # Any overlap at all
-                        if not (word['end'] <= start_time or word['start'] >= end_time):
-                            segment_words.append(word['text'])
-                    segment_text = " ".join(segment_words).strip()
-
-            transcribed_segments.append({
-                **segment,
-                'text': segment_text,
-                'confidence': 0.8  # Placeholder confidence
-            })
+    def assign_words_to_segments(self, all_words, segments: List[Dict]) -> List[Dict]:
+        """Fill in the text of the words falling in each segment (in place for ``Segment``s).
+
+        ``all_words`` is a ``WordTable`` or word dicts (``word``, ``start``, ``end``).
+        """
+        transcribed_segments = as_segments(segments)
+        texts = segment_texts(WordTable.coerce(all_words), transcribed_segments)
+        for segment, text in zip(transcribed_segments, texts):
+            segment.text = text
+            segment.confidence = 0.8  # Placeholder confidence
 
         logger.info("transcription_complete", 
                    segments_transcribed=len(transcribed_segments),
@@ -456,119 +610,44 @@ class Transcriber:
 
     def transcribe_full_meeting(self, audio_path: Path, matched_segments: List[Dict]) -> Dict:
         """Transcribe entire meeting and create speaker-annotated transcript."""
-        self._load_model()
-
         logger.info("starting_full_meeting_transcription", audio_path=str(audio_path))
 
         # Get full transcription with word timestamps
-        segments_result, info = self.model.transcribe(
-            str(audio_path),
-            word_timestamps=True
-        )
+        words, info = self.transcribe_words(str(audio_path))
+        return self.build_transcript(words, matched_segments, info.duration, info.language)
 
-        # Extract all words with timestamps
-        words_with_speakers = []
-        for segment in segments_result:
-            for word in segment.words:
-                speaker = self._assign_word_to_speaker(word, matched_segments)
-                words_with_speakers.append({
-                    'word': word.word,
-                    'start': word.start,
-                    'end': word.end,
-                    'speaker': speaker
-                })
+    def build_transcript(self, words, matched_segments: List[Dict],
+                         duration: float, language: Optional[str] = None) -> Dict:
+        """Assign Whisper words to matched speakers and group them into turns.
 
-        # Format as conversation
-        formatted_transcript = self._format_as_conversation(words_with_speakers)
+        ``words`` is a ``WordTable`` or word dicts (``word``, ``start``, ``end``); the
+        speaker-labelled table is returned as ``word_table``.
+        """
+        word_table = assign_speakers(WordTable.coerce(words), matched_segments)
 
-        # Get full text
-        full_text = " ".join([word_info['word'] for word_info in words_with_speakers])
+        # Group into speaker turns once; the LLM service reuses this structure
+        transcript = Transcript.from_word_table(word_table, duration=duration)
 
         result = {
-            'full_text': full_text.strip(),
-            'speaker_annotated_transcript': formatted_transcript,
-            'word_count': len(words_with_speakers),
-            'duration': info.duration,
-            'language': info.language,
-            'words_with_speakers': words_with_speakers
+            'full_text': word_table.full_text,
+            'transcript': transcript,
+            'speaker_annotated_transcript': transcript.text,
+            'word_count': len(word_table),
+            'duration': duration,
+            'language': language,
+            'word_table': word_table
         }
 
         logger.info("full_meeting_transcription_complete",
-                   word_count=len(words_with_speakers),
-                   duration=info.duration)
+                   word_count=len(word_table),
+                   duration=duration,
+                   word_table_bytes=word_table.nbytes)
 
         return result
 
-    def _assign_word_to_speaker(self, word, diarization_segments, tolerance=0.3):
-        """Assign a word to a speaker based on timestamp and sentence context."""
-        timestamp = word.start
-        word_text = word.word
-
-        # First: try direct hit (word timestamp within a segment)
-        for segment in diarization_segments:
-            if segment['start'] <= timestamp <= segment['end']:
-                return segment.get('matched_speaker', 'Unknown')
-
-        # Second: find all segments within tolerance
-        nearby_segments = []
-        for segment in diarization_segments:
-            distance = None
-
-            if timestamp < segment['start']:
-                distance = segment['start'] - timestamp
-                direction = 'next'
-            elif timestamp > segment['end']:
-                distance = timestamp - segment['end']
-                direction = 'previous'
-
-            if distance is not None and distance <= tolerance:
-                nearby_segments.append((direction, segment, distance))
-
-        if not nearby_segments:
-            return "UNASSIGNED"
-
-        # Third: Apply assignment rules
-        is_sentence_end = word_text.rstrip().endswith(('.', '!', '?'))
-
-        if is_sentence_end:
-            # Rule 1: End of sentence → assign to previous speaker
-            previous_segments = [(s, d) for direction, s, d in nearby_segments if direction == 'previous']
-            if previous_segments:
-                closest_previous = min(previous_segments, key=lambda x: x[1])[0]
-                return closest_previous.get('matched_speaker', 'Unknown')
-
-        # Rule 2: Otherwise → assign to closest segment
-        closest_segment = min(nearby_segments, key=lambda x: x[2])[1]
-        return closest_segment.get('matched_speaker', 'Unknown')
-
     def _format_as_conversation(self, words_with_speakers):
         """Group words by speaker and format as natural conversation."""
-        utterances = []
-        current_speaker = None
-        current_words = []
-
-        for word_info in words_with_speakers:
-            speaker = word_info['speaker']
-            word = word_info['word']
-
-            # Speaker change
-            if speaker != current_speaker:
-                if current_words and current_speaker:
-                    text = ''.join(current_words).strip()
-                    if text:
-                        utterances.append(f"{current_speaker}: \"{text}\"")
-                current_words = []
-                current_speaker = speaker
-
-            current_words.append(word)
-
-        # Don't forget the last utterance
-        if current_words and current_speaker:
-            text = ''.join(current_words).strip()
-            if text:
-                utterances.append(f"{current_speaker}: \"{text}\"")
-
-        return '\n\n'.join(utterances)
+        return Transcript.from_words(words_with_speakers).text
 
 
 class MeetingProcessor:
@@ -578,18 +657,78 @@ class MeetingProcessor:
         self.audio_processor = AudioProcessor()
         self.diarizer = SpeakerDiarizer(hf_token)
         self.matcher = SpeakerMatcher()
-        self.transcriber = Transcriber()
-        self.llm_service = LLMService(openai_api_key)
+        settings = get_settings()
+        self.transcriber = Transcriber(
+            settings.whisper_model, device=settings.whisper_device,
+            compute_type=settings.whisper_compute_type, cpu_threads=settings.whisper_cpu_threads,
+            num_workers=settings.whisper_num_workers, beam_size=settings.whisper_beam_size,
+            batch_size=settings.whisper_batch_size, parallel_workers=settings.whisper_parallel_workers,
+            parallel_chunk_seconds=settings.whisper_parallel_chunk_seconds
+        )
+
+        llm_cache = None
+        if settings.llm_cache_enabled:
+            llm_cache = LLMResponseCache(
+                settings.llm_cache_dir,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+                max_entries=settings.llm_cache_max_entries
+            )
+        self.llm_service = LLMService(
+            openai_api_key, settings.openai_model, cache=llm_cache,
+            chunk_token_threshold=settings.llm_chunk_token_threshold,
+            chunk_target_tokens=settings.llm_chunk_target_tokens,
+            max_concurrent_chunks=settings.llm_max_concurrent_chunks,
+            max_prompt_tokens=settings.llm_max_prompt_tokens,
+            http_client=get_shared_http_client(**settings.llm_http_options),
+            compact_transcripts=settings.llm_compact_transcripts,
+            max_json_repair_requests=settings.llm_json_repair_requests
+        )
+
+        self.diarization_cache = DiarizationCache(settings.diarization_cache_dir)
+        self.search_index = TranscriptSearchIndex(settings.search_index_path)
+        self.speaker_index = SpeakerOccurrenceIndex(settings.meeting_store_path)
 
         # Initialize speaker database
         self.speaker_db = SpeakerDatabase(speaker_db_path)
         logger.info("meeting_processor_initialized",
                    known_speakers=len(self.speaker_db.list_speakers()))
 
+    def create_live_session(self) -> LiveTranscriptionSession:
+        """Start a live transcription session matched against the current speaker database."""
+        settings = get_settings()
+        self.speaker_db.reload()
+        clusterer = OnlineSpeakerClusterer(
+            self.speaker_db.get_all_embeddings(),
+            cluster_threshold=settings.live_cluster_threshold,
+            stable_windows=settings.live_stable_windows
+        )
+        return LiveTranscriptionSession(
+            self.transcriber.transcribe_array,
+            self.diarizer.extract_embedding_from_waveform,
+            clusterer=clusterer,
+            window_seconds=settings.live_window_seconds,
+            step_seconds=settings.live_step_seconds,
+            holdback_seconds=settings.live_holdback_seconds,
+            max_lag_seconds=settings.live_max_lag_seconds
+        )
+
     def process_meeting(self, audio_path: Path, voice_samples: Optional[Dict[str, Path]] = None,
                        num_speakers: Optional[int] = None, generate_insights: bool = True,
-                       generate_all_action_views: bool = False) -> Dict:
-        """Process a complete meeting: diarize, match speakers, transcribe."""
+                       generate_all_action_views: bool = False,
+                       action_views_method: str = "n_plus_1",
+                       diarization_backend: Optional[str] = None,
+                       multichannel: Optional[bool] = None,
+                       meeting_id: Optional[str] = None,
+                       min_speakers: Optional[int] = None,
+                       max_speakers: Optional[int] = None) -> Dict:
+        """Process a complete meeting: diarize, match speakers, transcribe.
+
+        With a ``meeting_id`` the diarization turns, turn embeddings and words are cached
+        for ``recluster_meeting``, the transcript is added to the search index and each
+        diarized speaker's embedding to the speaker occurrence index.
+        ``min_speakers``/``max_speakers`` (see ``derive_speaker_bounds``) constrain
+        automatic speaker detection.
+        """
         # Log audio file metadata
         import os
         audio_size = os.path.getsize(audio_path) if audio_path.exists() else 0
@@ -636,8 +775,20 @@ class MeetingProcessor:
         logger.info("loaded_speakers_for_matching", count=len(known_embeddings))
 
         # Perform diarization with AUTO speaker detection (unless specified)
-        logger.info("starting_diarization", num_speakers=num_speakers, auto_detection=num_speakers is None)
-        diarization_result = self.diarizer.diarize(wav_path, num_speakers=num_speakers)
+        logger.info("starting_diarization", num_speakers=num_speakers, auto_detection=num_speakers is None,
+                   min_speakers=min_speakers, max_speakers=max_speakers)
+        if multichannel is None:
+            multichannel = get_settings().multichannel_diarization
+        diarization_result = None
+        if multichannel:
+            # Per-channel activity needs the original channels; transcription keeps the mono mix
+            multichannel_path = self.audio_processor.convert_to_wav(audio_path, keep_channels=True)
+            diarization_result = self.diarizer.diarize_multichannel(multichannel_path, backend=diarization_backend)
+        if diarization_result is None:
+            diarization_result = self.diarizer.diarize(wav_path, num_speakers=num_speakers,
+                                                       backend=diarization_backend,
+                                                       min_speakers=min_speakers,
+                                                       max_speakers=max_speakers)
         logger.info("diarization_complete",
                    unique_speakers=diarization_result.get('unique_speakers', []),
                    total_speakers=diarization_result.get('total_speakers', 0),
@@ -664,19 +815,107 @@ class MeetingProcessor:
                    matched_count=len(matched_speakers),
                    unknown_count=len(unknown_speakers))
 
-        # Transcribe segments
+        # One Whisper pass feeds both the segment text and the speaker-annotated transcript
         logger.info("starting_transcription", segments_to_transcribe=len(matching_result['segments']))
-        transcribed_segments = self.transcriber.transcribe_segments(wav_path, matching_result['segments'])
+        words, info = self.transcriber.transcribe_words(str(wav_path))
+        word_table = WordTable.from_words(words)
+        del words
+        transcribed_segments = self.transcriber.assign_words_to_segments(word_table, matching_result['segments'])
         logger.info("transcription_complete", segments_transcribed=len(transcribed_segments))
-        
+
         # Get full meeting transcription with speaker annotations
-        transcription_result = self.transcriber.transcribe_full_meeting(wav_path, matching_result['segments'])
+        transcription_result = self.transcriber.build_transcript(word_table, matching_result['segments'],
+                                                                 info.duration, info.language)
+
+        # Keep turns, turn embeddings and words so the meeting can be re-clustered cheaply
+        if meeting_id:
+            try:
+                self.diarization_cache.save(
+                    meeting_id,
+                    diarization_result['segments'],
+                    matching_result['turn_embeddings'],
+                    word_table,
+                    {
+                        'audio_path': str(audio_path),
+                        'processed_audio_path': str(wav_path),
+                        'duration': transcription_result['duration'],
+                        'language': transcription_result['language'],
+                        'backend': diarization_result.get('backend')
+                    }
+                )
+            except Exception as e:
+                logger.warning("diarization_cache_save_failed", meeting_id=meeting_id, error=str(e))
+
+        result = self._compile_result(audio_path, wav_path, diarization_result, matching_result,
+                                      transcribed_segments, transcription_result, num_speakers,
+                                      generate_insights, generate_all_action_views, action_views_method)
+        result['diarization_metadata'].update({'min_speakers': min_speakers, 'max_speakers': max_speakers})
+        if meeting_id:
+            self._index_meeting(meeting_id, result, matching_result)
+        return result
+
+    def recluster_meeting(self, meeting_id: str, num_speakers: Optional[int] = None,
+                          min_speakers: Optional[int] = None, max_speakers: Optional[int] = None,
+                          generate_insights: bool = False, generate_all_action_views: bool = False,
+                          action_views_method: str = "n_plus_1") -> Dict:
+        """Re-cluster a processed meeting with a different speaker count.
+
+        Only the clustering step is repeated, over the cached per-turn embeddings; speaker
+        matching, segment text and the transcript are re-derived from cached Whisper words.
+        No diarization or transcription model is run.
+        """
+        cached = self.diarization_cache.load(meeting_id)
+        if cached is None:
+            raise FileNotFoundError(f"No cached diarization for meeting {meeting_id}")
+
+        logger.info("recluster_meeting_start", meeting_id=meeting_id, num_speakers=num_speakers,
+                    min_speakers=min_speakers, max_speakers=max_speakers, turns=len(cached['segments']))
+
+        diarization_result = recluster_turns(cached['segments'], cached['turn_embeddings'],
+                                             num_speakers, min_speakers, max_speakers)
+        diarization_result['backend'] = 'recluster'
+
+        for speaker_name, embedding in self.speaker_db.get_all_embeddings().items():
+            self.matcher.add_speaker(speaker_name, embedding)
+        matching_result = self.matcher.match_turn_embeddings(diarization_result, cached['turn_embeddings'])
+
+        metadata = cached['metadata']
+        transcribed_segments = self.transcriber.assign_words_to_segments(cached['words'], matching_result['segments'])
+        transcription_result = self.transcriber.build_transcript(
+            cached['words'], matching_result['segments'], metadata.get('duration'), metadata.get('language')
+        )
+
+        result = self._compile_result(metadata.get('audio_path'), metadata.get('processed_audio_path'),
+                                      diarization_result, matching_result, transcribed_segments,
+                                      transcription_result, num_speakers, generate_insights,
+                                      generate_all_action_views, action_views_method)
+        result['diarization_metadata'].update({'min_speakers': min_speakers, 'max_speakers': max_speakers})
+        self._index_meeting(meeting_id, result, matching_result)
+        return result
+
+    def _index_meeting(self, meeting_id: str, result: Dict, matching_result: Dict):
+        """Replace the meeting's entries in the search index and the speaker occurrence index."""
+        try:
+            self.search_index.index_meeting(meeting_id, result['segments'], result.get('transcript'))
+        except Exception as e:
+            logger.warning("search_index_update_failed", meeting_id=meeting_id, error=str(e))
+        try:
+            labels = {segment['speaker']: segment.get('matched_speaker') for segment in matching_result['segments']}
+            self.speaker_index.add_meeting(meeting_id, matching_result.get('unique_speaker_embeddings', {}), labels)
+        except Exception as e:
+            logger.warning("speaker_index_update_failed", meeting_id=meeting_id, error=str(e))
 
+    def _compile_result(self, audio_path, wav_path, diarization_result: Dict, matching_result: Dict,
+                        transcribed_segments: List[Dict], transcription_result: Dict,
+                        num_speakers: Optional[int], generate_insights: bool,
+                        generate_all_action_views: bool, action_views_method: str) -> Dict:
+        """Assemble the meeting result and generate LLM insights if requested."""
         # Compile final result
         result = {
             'audio_path': str(audio_path),
             'processed_audio_path': str(wav_path),
             'segments': transcribed_segments,
+            'transcript': transcription_result['transcript'],
             'speaker_mapping': matching_result.get('speaker_mapping', {}),
             'matching_debug': {
                 'segment_details': matching_result.get('segment_details', {}),
@@ -685,7 +924,9 @@ class MeetingProcessor:
             'diarization_metadata': {
                 'unique_speakers': diarization_result.get('unique_speakers', []),
                 'total_speakers': diarization_result.get('total_speakers', 0),
-                'auto_detection_used': num_speakers is None
+                'auto_detection_used': num_speakers is None,
+                'backend': diarization_result.get('backend'),
+                'mixed_channels': diarization_result.get('mixed_channels')
             },
             'speaker_database_stats': self.speaker_db.get_database_stats(),
             'processing_metadata': {
@@ -696,17 +937,18 @@ class MeetingProcessor:
         }
 
         # Generate LLM insights if requested
-        if generate_insights and transcription_result.get('speaker_annotated_transcript'):
-            transcript_length = len(transcription_result['speaker_annotated_transcript'])
+        transcript = transcription_result['transcript']
+        if generate_insights and transcript.turns:
             logger.info("generating_llm_insights",
-                       transcript_length=transcript_length,
-                       transcript_word_count=len(transcription_result['speaker_annotated_transcript'].split()),
+                       transcript_length=len(transcript),
+                       transcript_word_count=transcript.word_count,
+                       transcript_turns=len(transcript.turns),
                        generate_all_views=generate_all_action_views)
             try:
                 if generate_all_action_views:
                     # Generate summary separately
                     summary_result = self.llm_service.generate_meeting_summary(
-                        transcription_result['speaker_annotated_transcript'],
+                        transcript,
                         {
                             'duration': transcription_result['duration'] / 60,
                             'participants_count': result['processing_metadata']['speakers_identified'],
@@ -716,7 +958,8 @@ class MeetingProcessor:
 
                     # Generate all action item views (general + speaker-specific)
                     all_action_views = self.llm_service.extract_all_action_item_views(
-                        transcription_result['speaker_annotated_transcript']
+                        transcript,
+                        generation_method=action_views_method
                     )
 
                     # Combine results
@@ -737,7 +980,7 @@ class MeetingProcessor:
                 else:
                     # Use existing comprehensive insights method (summary + general action items)
                     insights = self.llm_service.generate_meeting_insights(
-                        transcription_result['speaker_annotated_transcript'],
+                        transcript,
                         {
                             'duration': transcription_result['duration'] / 60,  # Convert to minutes
                             'participants_count': result['processing_metadata']['speakers_identified'],
@@ -0,0 +1,54 @@
+"""Faster CPU inference for the pyannote speaker-diarization pipeline.
+
+``pyannote/speaker-diarization-3.1`` slides a segmentation network (SincNet + LSTM)
+over the audio and embeds every local speaker with a ResNet speaker-embedding model,
+both in eager fp32. ``optimize_pipeline`` tunes the sliding-window batch sizes and, in
+optimized mode, swaps both sub-models for dynamically int8-quantized copies: the
+segmentation LSTM/Linear layers carry most of its compute, the embedding model only
+its final Linear projection.
+"""
+
+from typing import Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def _quantize(module):
+    """Dynamic int8 copy of ``module`` (LSTM and Linear weights); the original is untouched."""
+    import torch
+    return torch.quantization.quantize_dynamic(module, {torch.nn.LSTM, torch.nn.Linear}, dtype=torch.qint8)
+
+
+def optimize_pipeline(pipeline, quantize: bool = False, segmentation_batch_size: Optional[int] = None,
+                      embedding_batch_size: Optional[int] = None) -> Dict:
+    """Apply batch sizes and optional quantization to a loaded pyannote pipeline in place.
+
+    Returns:
+        What was applied: batch sizes and which sub-models were quantized
+    """
+    applied = {'quantized': []}
+
+    if segmentation_batch_size and hasattr(pipeline, 'segmentation_batch_size'):
+        pipeline.segmentation_batch_size = segmentation_batch_size
+        applied['segmentation_batch_size'] = segmentation_batch_size
+    if embedding_batch_size and hasattr(pipeline, 'embedding_batch_size'):
+        pipeline.embedding_batch_size = embedding_batch_size
+        applied['embedding_batch_size'] = embedding_batch_size
+
+    if quantize:
+        segmentation = getattr(pipeline, '_segmentation', None)
+        if getattr(segmentation, 'model', None) is not None:
+            segmentation.model = _quantize(segmentation.model.eval())
+            applied['quantized'].append('segmentation')
+
+        # Pretrained pyannote embeddings keep their network in ``model_``; other
+        # embedding wrappers (SpeechBrain, NeMo) are left as they are
+        embedding = getattr(pipeline, '_embedding', None)
+        if getattr(embedding, 'model_', None) is not None:
+            embedding.model_ = _quantize(embedding.model_.eval())
+            applied['quantized'].append('embedding')
+
+    logger.info("diarization_pipeline_optimized", **applied)
+    return applied
@@ -0,0 +1,197 @@
+"""Full-text search over processed meeting transcripts with SQLite FTS5.
+
+Every processed meeting contributes one entry per speaker turn of its speaker-annotated
+transcript and one per diarization segment, each with speaker and time offsets. Turns
+and segments hold the same words, so a search covers one ``source`` (turns by default)
+and each passage is returned once. The entries live in a plain table; an external-content
+FTS5 table kept in sync by triggers indexes their text, so re-indexing a meeting (after
+re-clustering) is a delete plus an insert of that meeting's rows only.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import re
+import sqlite3
+
+import structlog
+
+from .meeting_store import transcript_turns, turn_belongs_to
+
+logger = structlog.get_logger(__name__)
+
+SEARCH_SOURCES = ("transcript", "segment")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_entries (
+    id INTEGER PRIMARY KEY,
+    meeting_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    speaker TEXT NOT NULL,
+    start REAL,
+    end REAL,
+    text TEXT NOT NULL,
+    diarized_speaker TEXT
+);
+CREATE INDEX IF NOT EXISTS search_entries_meeting ON search_entries (meeting_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    text, content='search_entries', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS search_entries_insert AFTER INSERT ON search_entries BEGIN
+    INSERT INTO search_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS search_entries_delete AFTER DELETE ON search_entries BEGIN
+    INSERT INTO search_fts (search_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+_PHRASE = re.compile(r'"([^"]+)"|(\w+)', re.UNICODE)
+
+
+def match_expression(query: str) -> Optional[str]:
+    """FTS5 expression for free text: every word (or ``"quoted phrase"``) must occur.
+
+    Terms are quoted so user input never reaches FTS5 as syntax; returns None when the
+    query has no searchable words.
+    """
+    terms = []
+    for phrase, word in _PHRASE.findall(query):
+        words = re.findall(r'\w+', phrase or word, re.UNICODE)
+        if words:
+            terms.append('"' + ' '.join(words) + '"')
+    return ' '.join(terms) or None
+
+
+class TranscriptSearchIndex:
+    """FTS5 index of meeting transcript turns and segment text, ranked with BM25."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            columns = {row['name'] for row in connection.execute("PRAGMA table_info(search_entries)")}
+            if 'diarized_speaker' not in columns:
+                # Indexes created before entries kept their diarized label
+                connection.execute("ALTER TABLE search_entries ADD COLUMN diarized_speaker TEXT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def index_meeting(self, meeting_id: str, segments: Iterable, transcript: Any = None) -> int:
+        """Replace the indexed entries of one meeting; returns the number indexed.
+
+        ``segments`` are ``Segment`` objects or dicts with ``text``; ``transcript`` is a
+        ``Transcript`` or its ``to_dict`` form. Without transcript turns, the segments are
+        indexed as the meeting's transcript entries too.
+        """
+        segment_rows = [
+            (meeting_id, 'segment', segment.get('matched_speaker', segment['speaker']),
+             segment['start'], segment['end'], segment['text'], segment['speaker'])
+            for segment in segments if segment.get('text')
+        ]
+        rows = [(meeting_id, 'transcript', turn['speaker'], turn.get('start'), turn.get('end'), turn['text'], None)
+                for turn in transcript_turns(transcript) if turn.get('text')]
+        if not rows:
+            rows = [(meeting_id, 'transcript', *row[2:]) for row in segment_rows]
+        rows.extend(segment_rows)
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM search_entries WHERE meeting_id = ?", (meeting_id,))
+            connection.executemany(
+                "INSERT INTO search_entries (meeting_id, source, speaker, start, end, text, diarized_speaker) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+        logger.info("meeting_search_indexed", meeting_id=meeting_id, entries=len(rows))
+        return len(rows)
+
+    def rename_speaker(self, meeting_id: str, old: str, new: str, speaker: Optional[str] = None) -> int:
+        """Relabel a speaker's entries in one meeting; the indexed text is unchanged.
+
+        With ``speaker`` (a diarized label) only that cluster's segment entries and the
+        turns they overlap most are relabelled, as in ``MeetingStore.rename_speaker``.
+        """
+        with self._connect() as connection:
+            if speaker is None:
+                return connection.execute("UPDATE search_entries SET speaker = ? WHERE meeting_id = ? AND speaker = ?",
+                                          (new, meeting_id, old)).rowcount
+
+            rows = connection.execute(
+                "SELECT id, start, end, diarized_speaker FROM search_entries WHERE meeting_id = ? AND speaker = ?",
+                (meeting_id, old)
+            ).fetchall()
+            spans = [(row['start'], row['end']) for row in rows if row['diarized_speaker'] == speaker]
+            other_spans = [(row['start'], row['end']) for row in rows
+                           if row['diarized_speaker'] not in (None, speaker)]
+            ids = [
+                (new, row['id']) for row in rows
+                if row['diarized_speaker'] == speaker
+                or (row['diarized_speaker'] is None and turn_belongs_to(row['start'], row['end'], spans, other_spans))
+            ]
+            connection.executemany("UPDATE search_entries SET speaker = ? WHERE id = ?", ids)
+            return len(ids)
+
+    def remove_meeting(self, meeting_id: str) -> int:
+        with self._connect() as connection:
+            return connection.execute("DELETE FROM search_entries WHERE meeting_id = ?", (meeting_id,)).rowcount
+
+    def search(self, query: str, speaker: Optional[str] = None, meeting_id: Optional[str] = None,
+               source: Optional[str] = "transcript", limit: int = 20) -> List[Dict[str, Any]]:
+        """Best-matching entries first (BM25 over every match), each with meeting, speaker, offsets and a snippet.
+
+        ``source`` is ``transcript`` (speaker turns), ``segment`` or None for both, in which
+        case a passage can be returned once per source.
+        """
+        if source is not None and source not in SEARCH_SOURCES:
+            raise ValueError(f"Unknown search source: {source}")
+        expression = match_expression(query)
+        if expression is None:
+            return []
+
+        clauses, params = ["search_fts MATCH ?"], [expression]
+        for column, value in (('speaker', speaker), ('meeting_id', meeting_id), ('source', source)):
+            if value is not None:
+                clauses.append(f"e.{column} = ?")
+                params.append(value)
+        if meeting_id is not None:
+            # A meeting's entries are inserted together, so they form one rowid range
+            clauses.append("search_fts.rowid BETWEEN (SELECT MIN(id) FROM search_entries WHERE meeting_id = ?) "
+                           "AND (SELECT MAX(id) FROM search_entries WHERE meeting_id = ?)")
+            params.extend([meeting_id, meeting_id])
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT e.id, e.meeting_id, e.source, e.speaker, e.start, e.end, bm25(search_fts) AS score "
+                "FROM search_fts JOIN search_entries e ON e.id = search_fts.rowid "
+                f"WHERE {' AND '.join(clauses)} ORDER BY score LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+            # Snippets only for the returned hits, not for every ranked match
+            ids = [row['id'] for row in rows]
+            snippets = dict(connection.execute(
+                "SELECT rowid, snippet(search_fts, 0, '[', ']', '…', 16) FROM search_fts "
+                f"WHERE search_fts MATCH ? AND rowid IN ({','.join('?' * len(ids))})",
+                (expression, *ids)
+            ).fetchall()) if ids else {}
+
+        return [{'meeting_id': row['meeting_id'], 'source': row['source'], 'speaker': row['speaker'],
+                 'start': row['start'], 'end': row['end'], 'snippet': snippets.get(row['id'], ''),
+                 'score': round(-row['score'], 4)} for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT COUNT(DISTINCT meeting_id) AS meetings, COUNT(*) AS entries FROM search_entries"
+            ).fetchone()
+        return dict(row)
@@ -0,0 +1,96 @@
+"""Slot-based diarization segment shared by diarization, matching and transcription.
+
+A segment is created once by the diarizer; speaker matching and transcription fill in
+``matched_speaker``/``similarity_score`` and ``text``/``confidence`` on the same object
+instead of copying a dict at every stage. Values are stored as native Python types, so
+``to_dict`` is the only serialization step. Dict-style access (``segment['start']``,
+``segment.get('text')``) keeps existing callers working.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+_MISSING = object()
+
+
+class Segment:
+    """One diarized speaker turn."""
+
+    __slots__ = ('start', 'end', 'speaker', 'matched_speaker', 'similarity_score',
+                 'text', 'confidence', 'extra')
+
+    # Fields serialized only once they are set
+    _OPTIONAL = ('matched_speaker', 'similarity_score', 'text', 'confidence')
+
+    def __init__(self, start: float, end: float, speaker: str, matched_speaker: Optional[str] = None,
+                 similarity_score: Optional[float] = None, text: Optional[str] = None,
+                 confidence: Optional[float] = None, **extra: Any):
+        self.start = float(start)
+        self.end = float(end)
+        self.speaker = str(speaker)
+        self.matched_speaker = matched_speaker
+        self.similarity_score = None if similarity_score is None else float(similarity_score)
+        self.text = text
+        self.confidence = confidence
+        # Backend-specific keys such as ``channel``; None until one is set
+        self.extra: Optional[Dict[str, Any]] = extra or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Segment':
+        fields = {key: value for key, value in data.items() if key != 'duration'}
+        return cls(**fields)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self.__slots__ and key != 'extra':
+            setattr(self, key, value)
+        elif key != 'duration':
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self) -> List[str]:
+        """Keys of ``to_dict``, so ``dict(segment)`` and ``{**segment}`` work."""
+        return list(self.to_dict())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in ('start', 'end', 'speaker'):
+            return getattr(self, key)
+        if key == 'duration':
+            return self.duration
+        if key in self._OPTIONAL:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict; unset optional fields are omitted."""
+        data = {'start': self.start, 'end': self.end, 'speaker': self.speaker, 'duration': self.end - self.start}
+        for key in self._OPTIONAL:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self) -> str:
+        return f"Segment({self.start:.2f}-{self.end:.2f} {self.matched_speaker or self.speaker})"
+
+
+def as_segments(segments: Iterable) -> List[Segment]:
+    """Segments as ``Segment`` objects; existing objects are reused, dicts converted."""
+    return [segment if isinstance(segment, Segment) else Segment.from_dict(segment) for segment in segments]
@@ -0,0 +1,52 @@
+"""Speaker-count bounds derived from what the caller knows about a meeting.
+
+Fully automatic diarization searches every plausible speaker count. Callers usually
+know more: the names they typed, the voice samples they uploaded, the number of
+calendar attendees. Turning that into ``min_speakers``/``max_speakers`` lets the
+clustering step search a much smaller space.
+"""
+
+from typing import Dict, Iterable, Optional
+
+
+def derive_speaker_bounds(speaker_names: Optional[Iterable[str]] = None,
+                          voice_sample_names: Optional[Iterable[str]] = None,
+                          attendee_count: Optional[int] = None,
+                          num_speakers: Optional[int] = None,
+                          slack: int = 1) -> Dict:
+    """Derive diarization speaker-count hints.
+
+    Every uploaded voice sample is someone expected to speak, so their count is the
+    lower bound. The upper bound is the larger of the attendee count and the number of
+    named people, plus ``slack`` for an unexpected or unnamed participant. An explicit
+    ``num_speakers`` wins over both.
+
+    Returns:
+        Dict with ``num_speakers``, ``min_speakers``, ``max_speakers`` (each None when
+        unconstrained) and ``source`` describing which hints were used
+    """
+    if num_speakers:
+        return {'num_speakers': num_speakers, 'min_speakers': None, 'max_speakers': None,
+                'source': 'num_speakers'}
+
+    names = {name.strip() for name in speaker_names or [] if name and name.strip()}
+    samples = {name.strip() for name in voice_sample_names or [] if name and name.strip()}
+    names |= samples
+    sources = [label for label, present in (('speaker_names', names - samples), ('voice_samples', samples),
+                                            ('attendee_count', attendee_count)) if present]
+
+    known_count = max(attendee_count or 0, len(names))
+    max_speakers = known_count + slack if known_count else None
+    min_speakers = len(samples) or None
+    if min_speakers and max_speakers and min_speakers > max_speakers:
+        min_speakers = max_speakers
+    if min_speakers == 1:
+        # A lower bound of one constrains nothing
+        min_speakers = None
+
+    return {
+        'num_speakers': None,
+        'min_speakers': min_speakers,
+        'max_speakers': max_speakers,
+        'source': '+'.join(sources) if sources else 'auto'
+    }
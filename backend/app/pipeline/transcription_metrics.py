@@ -0,0 +1,48 @@
+"""Word error rate for comparing transcription profiles."""
+
+from typing import Dict, List
+import re
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase and drop punctuation so only word choice is scored."""
+    return _TOKEN.findall(text.lower().replace("’", "'"))
+
+
+def word_error_rate(reference: str, hypothesis: str) -> Dict:
+    """Levenshtein WER between two transcripts.
+
+    Returns:
+        Dict with ``wer``, ``substitutions``, ``deletions``, ``insertions`` and
+        ``reference_words``
+    """
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+
+    # Each cell holds (edits, substitutions, deletions, insertions); one row at a time
+    previous = [(j, 0, 0, j) for j in range(len(hyp) + 1)]
+    for i, ref_word in enumerate(ref, start=1):
+        current = [(i, 0, i, 0)]
+        for j, hyp_word in enumerate(hyp, start=1):
+            diagonal = previous[j - 1]
+            if ref_word == hyp_word:
+                best = diagonal
+            else:
+                best = min(
+                    (diagonal[0] + 1, diagonal[1] + 1, diagonal[2], diagonal[3]),
+                    (previous[j][0] + 1, previous[j][1], previous[j][2] + 1, previous[j][3]),
+                    (current[j - 1][0] + 1, current[j - 1][1], current[j - 1][2], current[j - 1][3] + 1)
+                )
+            current.append(best)
+        previous = current
+
+    edits, substitutions, deletions, insertions = previous[-1]
+    return {
+        'wer': edits / len(ref) if ref else float(bool(hyp)),
+        'substitutions': substitutions,
+        'deletions': deletions,
+        'insertions': insertions,
+        'reference_words': len(ref)
+    }
@@ -0,0 +1,233 @@
+"""Columnar storage for Whisper words.
+
+A multi-hour meeting has hundreds of thousands of words. As one dict per word (plus a
+second dict per word once speakers are assigned) that is mostly object overhead.
+``WordTable`` keeps the same information as a structure of arrays: float32 start/end
+times, int32 indexes into an interned text pool and, once assigned, int32 indexes into
+a speaker pool. Segment text assignment, speaker assignment, transcript grouping and
+the diarization cache all work on the columns directly.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+UNASSIGNED = "UNASSIGNED"
+
+# Time-ordered words compared at once against the segments near them
+_BLOCK = 512
+
+
+def _seconds(times: np.ndarray) -> np.ndarray:
+    """float32 times back to float64 at millisecond precision, so boundaries compare exactly."""
+    return np.round(times.astype(np.float64), 3)
+
+
+def _intern(values: Iterable[str], pool: List[str], index: Dict[str, int]) -> List[int]:
+    ids = []
+    for value in values:
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(pool)
+            pool.append(value)
+        ids.append(position)
+    return ids
+
+
+class WordTable:
+    """Words as parallel arrays with interned text and speaker labels."""
+
+    __slots__ = ('starts', 'ends', 'text_ids', 'texts', 'speaker_ids', 'speakers')
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, text_ids: np.ndarray, texts: List[str],
+                 speaker_ids: Optional[np.ndarray] = None, speakers: Optional[List[str]] = None):
+        self.starts = np.asarray(starts, dtype=np.float32)
+        self.ends = np.asarray(ends, dtype=np.float32)
+        self.text_ids = np.asarray(text_ids, dtype=np.int32)
+        self.texts = list(texts)
+        self.speaker_ids = None if speaker_ids is None else np.asarray(speaker_ids, dtype=np.int32)
+        self.speakers = list(speakers or [])
+
+    @classmethod
+    def from_words(cls, words: Iterable[Dict]) -> 'WordTable':
+        """Build from word dicts (``word``, ``start``, ``end`` and optionally ``speaker``)."""
+        words = list(words)
+        texts: List[str] = []
+        speakers: List[str] = []
+        text_ids = _intern((word['word'] for word in words), texts, {})
+        speaker_ids = None
+        if words and all('speaker' in word for word in words):
+            speaker_ids = _intern((word['speaker'] for word in words), speakers, {})
+        return cls(
+            np.fromiter((word['start'] for word in words), dtype=np.float32, count=len(words)),
+            np.fromiter((word['end'] for word in words), dtype=np.float32, count=len(words)),
+            text_ids, texts, speaker_ids, speakers
+        )
+
+    @classmethod
+    def coerce(cls, words) -> 'WordTable':
+        """Return ``words`` unchanged if already a table, otherwise build one from dicts."""
+        return words if isinstance(words, WordTable) else cls.from_words(words)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def midpoints(self) -> np.ndarray:
+        return (self.starts + self.ends) / 2
+
+    @property
+    def words(self) -> List[str]:
+        """Word text in order (with Whisper's leading spaces)."""
+        texts = self.texts
+        return [texts[text_id] for text_id in self.text_ids.tolist()]
+
+    @property
+    def full_text(self) -> str:
+        return " ".join(self.words).strip()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and pools."""
+        import sys
+        arrays = [self.starts, self.ends, self.text_ids] + ([self.speaker_ids] if self.speaker_ids is not None else [])
+        return (sum(array.nbytes for array in arrays)
+                + sum(sys.getsizeof(value) for value in self.texts + self.speakers))
+
+    def with_speakers(self, speaker_ids: np.ndarray, speakers: Sequence[str]) -> 'WordTable':
+        """Copy sharing the word columns, with per-word indexes into ``speakers``."""
+        return WordTable(self.starts, self.ends, self.text_ids, self.texts, speaker_ids, list(speakers))
+
+    def to_dicts(self) -> List[Dict]:
+        """Per-word dicts for callers that need them; times rounded to milliseconds."""
+        texts, speakers = self.texts, self.speakers
+        starts = _seconds(self.starts).tolist()
+        ends = _seconds(self.ends).tolist()
+        words = [{'word': texts[text_id], 'start': start, 'end': end}
+                 for text_id, start, end in zip(self.text_ids.tolist(), starts, ends)]
+        if self.speaker_ids is not None:
+            for word, speaker_id in zip(words, self.speaker_ids.tolist()):
+                word['speaker'] = speakers[speaker_id]
+        return words
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Columns for ``np.savez``; see ``from_arrays``."""
+        return {
+            'word_starts': self.starts,
+            'word_ends': self.ends,
+            'word_ids': self.text_ids,
+            'word_pool': np.array(self.texts, dtype=str)
+        }
+
+    @classmethod
+    def from_arrays(cls, data) -> 'WordTable':
+        """Inverse of ``to_arrays``; also reads the older one-string-per-word ``word_text`` column."""
+        if 'word_pool' in data:
+            return cls(data['word_starts'], data['word_ends'], data['word_ids'],
+                       [str(text) for text in data['word_pool']])
+        texts: List[str] = []
+        text_ids = _intern((str(text) for text in data['word_text']), texts, {})
+        return cls(data['word_starts'], data['word_ends'], text_ids, texts)
+
+
+def segment_texts(table: WordTable, segments: List[Dict], min_overlap: float = 0.05,
+                  expand_seconds: float = 2.0) -> List[str]:
+    """Text of the words belonging to each diarized segment.
+
+    A word belongs to a segment when its midpoint falls inside it or its IoU with the
+    segment is at least ``min_overlap``. Segments left empty take the words whose
+    midpoint is within ``expand_seconds`` of them, and failing that any overlapping word.
+    """
+    if not len(table):
+        return ["" for _ in segments]
+
+    order = np.argsort(table.starts, kind='stable')
+    starts = _seconds(table.starts[order])
+    ends = _seconds(table.ends[order])
+    midpoints = (starts + ends) / 2
+    text_ids = table.text_ids[order]
+    texts = table.texts
+    reach = float(np.max(ends - starts)) + expand_seconds
+
+    results = []
+    for segment in segments:
+        seg_start, seg_end = segment['start'], segment['end']
+        # Only words starting near the segment can qualify under any rule
+        first = int(np.searchsorted(starts, seg_start - reach, side='left'))
+        last = int(np.searchsorted(starts, seg_end + expand_seconds, side='right'))
+        word_starts, word_ends = starts[first:last], ends[first:last]
+        word_mids = midpoints[first:last]
+
+        intersection = np.minimum(word_ends, seg_end) - np.maximum(word_starts, seg_start)
+        union = (word_ends - word_starts) + (seg_end - seg_start) - intersection
+        iou = np.where((intersection > 0) & (union > 0), intersection / np.where(union > 0, union, 1.0), 0.0)
+        selected = ((word_mids >= seg_start) & (word_mids <= seg_end)) | (iou >= min_overlap)
+
+        text = _join(texts, text_ids[first:last][selected])
+        if not text:
+            expanded = (word_mids >= max(0, seg_start - expand_seconds)) & (word_mids <= seg_end + expand_seconds)
+            text = _join(texts, text_ids[first:last][selected | expanded])
+            if not text:
+                overlapping = ~((word_ends <= seg_start) | (word_starts >= seg_end))
+                text = _join(texts, text_ids[first:last][selected | expanded | overlapping])
+        results.append(text)
+    return results
+
+
+def _join(texts: List[str], text_ids: np.ndarray) -> str:
+    return " ".join(texts[text_id] for text_id in text_ids.tolist()).strip()
+
+
+def assign_speakers(table: WordTable, segments: List[Dict], tolerance: float = 0.3) -> WordTable:
+    """Label every word with the ``matched_speaker`` of its diarized segment.
+
+    A word whose start falls inside a segment takes the first such segment's speaker.
+    Otherwise, among segments within ``tolerance`` seconds, a sentence-ending word takes
+    the closest preceding segment and any other word the closest segment; words with no
+    segment nearby are ``UNASSIGNED``.
+    """
+    speakers: List[str] = []
+    speaker_index: Dict[str, int] = {}
+    labels = np.array(_intern((segment.get('matched_speaker', 'Unknown') for segment in segments),
+                              speakers, speaker_index) or [0], dtype=np.int32)
+    unassigned = _intern([UNASSIGNED], speakers, speaker_index)[0]
+
+    speaker_ids = np.full(len(table), unassigned, dtype=np.int32)
+    if not segments or not len(table):
+        return table.with_speakers(speaker_ids, speakers)
+
+    seg_starts = np.array([segment['start'] for segment in segments], dtype=np.float64)
+    seg_ends = np.array([segment['end'] for segment in segments], dtype=np.float64)
+    sentence_end = np.array([text.rstrip().endswith(('.', '!', '?')) for text in table.texts], dtype=bool)
+
+    # Blocks of time-ordered words only need the segments near their time span;
+    # candidates keep list order so ties resolve to the earlier segment
+    word_starts = _seconds(table.starts)
+    order = np.argsort(word_starts, kind='stable')
+    for first in range(0, len(order), _BLOCK):
+        block_words = order[first:first + _BLOCK]
+        times = word_starts[block_words][:, None]
+        nearby = np.flatnonzero((seg_ends >= times[0, 0] - tolerance) & (seg_starts <= times[-1, 0] + tolerance))
+        if not len(nearby):
+            continue
+        starts, ends = seg_starts[nearby], seg_ends[nearby]
+        inside = (starts <= times) & (times <= ends)
+
+        before = times < starts
+        after = times > ends
+        distance = np.where(before, starts - times, np.where(after, times - ends, np.inf))
+        distance[distance > tolerance] = np.inf
+        previous = np.where(after, distance, np.inf)
+
+        has_hit = inside.any(axis=1)
+        has_near = np.isfinite(distance.min(axis=1))
+        has_previous = np.isfinite(previous.min(axis=1))
+        ends_sentence = sentence_end[table.text_ids[block_words]]
+
+        chosen = np.where(
+            has_hit, inside.argmax(axis=1),
+            np.where(ends_sentence & has_previous, previous.argmin(axis=1), distance.argmin(axis=1))
+        )
+        speaker_ids[block_words] = np.where(has_hit | has_near, labels[nearby[chosen]], unassigned)
+
+    return table.with_speakers(speaker_ids, speakers)
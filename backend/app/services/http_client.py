@@ -0,0 +1,377 @@
+"""Pooled keep-alive HTTP clients for LLM calls with deadlines, jittered retries and hedging."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import random
+import threading
+import time
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class HttpStats:
+    """Thread-safe retry and latency statistics for an HTTP client."""
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.status_counts: Dict[int, int] = {}
+
+    def record_attempt(self, status_code: Optional[int]):
+        with self._lock:
+            self.attempts += 1
+            if status_code is not None:
+                self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+
+    def record_request(self, latency: float, failed: bool = False):
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(latency)
+            if failed:
+                self.failures += 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_hedge(self, won: bool):
+        with self._lock:
+            self.hedged_requests += 1
+            if won:
+                self.hedge_wins += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get counters and latency percentiles (seconds) over the recent window."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                'requests': self.requests,
+                'attempts': self.attempts,
+                'retries': self.retries,
+                'failures': self.failures,
+                'hedged_requests': self.hedged_requests,
+                'hedge_wins': self.hedge_wins,
+                'status_counts': dict(self.status_counts)
+            }
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 4)
+
+        stats.update({
+            'latency_p50': percentile(0.50),
+            'latency_p95': percentile(0.95),
+            'latency_p99': percentile(0.99),
+            'latency_max': round(latencies[-1], 4) if latencies else None
+        })
+        return stats
+
+
+class RetryPolicy:
+    """Retry rules: which responses to retry, jittered exponential backoff and an overall deadline."""
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 deadline_seconds: Optional[float] = 120.0,
+                 retry_status_codes: Tuple[int, ...] = RETRY_STATUS_CODES):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline_seconds = deadline_seconds
+        self.retry_status_codes = retry_status_codes
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before retry number ``attempt`` (0-based): full jitter, or the server's Retry-After."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def remaining(self, started_at: float) -> Optional[float]:
+        """Seconds left before the deadline, or None when there is no deadline."""
+        if self.deadline_seconds is None:
+            return None
+        return self.deadline_seconds - (time.monotonic() - started_at)
+
+    def retry_delay(self, attempt: int, started_at: float, retry_after: Optional[str] = None) -> Optional[float]:
+        """Delay before retrying, or None if retries are exhausted or the wait would pass the deadline."""
+        if attempt >= self.max_retries:
+            return None
+        delay = self.backoff(attempt, retry_after)
+        remaining = self.remaining(started_at)
+        if remaining is not None and remaining <= delay:
+            return None
+        return delay
+
+
+def _with_deadline(request: httpx.Request, remaining: Optional[float]) -> httpx.Request:
+    """Cap the per-operation timeouts of a request at the remaining deadline."""
+    if remaining is None:
+        return request
+    timeout = dict(request.extensions.get("timeout") or {})
+    for key in ("connect", "read", "write", "pool"):
+        current = timeout.get(key)
+        timeout[key] = remaining if current is None else min(current, remaining)
+    request.extensions = {**request.extensions, "timeout": timeout}
+    return request
+
+
+class RetryingTransport(httpx.BaseTransport):
+    """Sync transport adding deadline-bounded jittered retries and optional request hedging.
+
+    With ``hedge_delay`` set, a duplicate request is sent if the first has not answered
+    within that many seconds; whichever returns first is used and the other is closed.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy, stats: HttpStats,
+                 hedge_delay: Optional[float] = None, max_hedge_workers: int = 16):
+        self._transport = transport
+        self.policy = policy
+        self.stats = stats
+        self.hedge_delay = hedge_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_hedge_workers) if hedge_delay else None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        # Buffer the body so the request can be replayed for retries and hedges
+        request.read()
+        started_at = time.monotonic()
+        attempt = 0
+
+        while True:
+            remaining = self.policy.remaining(started_at)
+            try:
+                response = self._send(_with_deadline(request, remaining))
+            except httpx.TransportError as e:
+                self.stats.record_attempt(None)
+                delay = self.policy.retry_delay(attempt, started_at)
+                if delay is None:
+                    self.stats.record_request(time.monotonic() - started_at, failed=True)
+                    raise
+                logger.warning("llm_http_transport_error_retrying", attempt=attempt, delay=delay, error=str(e))
+                self.stats.record_retry()
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self.stats.record_attempt(response.status_code)
+            if response.status_code in self.policy.retry_status_codes:
+                delay = self.policy.retry_delay(attempt, started_at, response.headers.get("retry-after"))
+                if delay is not None:
+                    response.read()
+                    response.close()
+                    logger.warning("llm_http_retrying", attempt=attempt, delay=delay,
+                                   status_code=response.status_code)
+                    self.stats.record_retry()
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+
+            self.stats.record_request(time.monotonic() - started_at,
+                                      failed=response.status_code >= 400)
+            return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        if self._executor is None:
+            return self._transport.handle_request(request)
+
+        primary = self._executor.submit(self._transport.handle_request, request)
+        done, _ = wait([primary], timeout=self.hedge_delay)
+        if done:
+            return primary.result()
+
+        hedge = self._executor.submit(self._transport.handle_request, request)
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if future.exception() is None]
+            # Use the first success; only surface an error once both requests have failed
+            if succeeded or not pending:
+                winner = succeeded[0] if succeeded else done.pop()
+                for future in {primary, hedge} - {winner}:
+                    future.add_done_callback(_close_future_response)
+                self.stats.record_hedge(won=winner is hedge)
+                return winner.result()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._transport.close()
+
+
+class AsyncRetryingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``RetryingTransport``."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy, stats: HttpStats,
+                 hedge_delay: Optional[float] = None):
+        self._transport = transport
+        self.policy = policy
+        self.stats = stats
+        self.hedge_delay = hedge_delay
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        started_at = time.monotonic()
+        attempt = 0
+
+        while True:
+            remaining = self.policy.remaining(started_at)
+            try:
+                response = await self._send(_with_deadline(request, remaining))
+            except httpx.TransportError as e:
+                self.stats.record_attempt(None)
+                delay = self.policy.retry_delay(attempt, started_at)
+                if delay is None:
+                    self.stats.record_request(time.monotonic() - started_at, failed=True)
+                    raise
+                logger.warning("llm_http_transport_error_retrying", attempt=attempt, delay=delay, error=str(e))
+                self.stats.record_retry()
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self.stats.record_attempt(response.status_code)
+            if response.status_code in self.policy.retry_status_codes:
+                delay = self.policy.retry_delay(attempt, started_at, response.headers.get("retry-after"))
+                if delay is not None:
+                    await response.aread()
+                    await response.aclose()
+                    logger.warning("llm_http_retrying", attempt=attempt, delay=delay,
+                                   status_code=response.status_code)
+                    self.stats.record_retry()
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+
+            self.stats.record_request(time.monotonic() - started_at,
+                                      failed=response.status_code >= 400)
+            return response
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        if not self.hedge_delay:
+            return await self._transport.handle_async_request(request)
+
+        primary = asyncio.ensure_future(self._transport.handle_async_request(request))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay)
+        if done:
+            return primary.result()
+
+        hedge = asyncio.ensure_future(self._transport.handle_async_request(request))
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            succeeded = [task for task in done if not task.exception()]
+            if succeeded or not pending:
+                winner = succeeded[0] if succeeded else done.pop()
+                for task in pending:
+                    task.cancel()
+                for task in done:
+                    if task is not winner and not task.exception():
+                        await task.result().aclose()
+                self.stats.record_hedge(won=winner is hedge)
+                return winner.result()
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def _close_future_response(future):
+    """Close the response of a losing hedged request once it completes."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _build_timeout(connect_timeout: float, read_timeout: float) -> httpx.Timeout:
+    return httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout)
+
+
+def _build_limits(max_connections: int, max_keepalive_connections: int, keepalive_expiry: float) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry
+    )
+
+
+def create_http_client(max_connections: int = 20, max_keepalive_connections: int = 10,
+                       keepalive_expiry: float = 30.0, connect_timeout: float = 5.0,
+                       read_timeout: float = 60.0, max_retries: int = 3,
+                       deadline_seconds: Optional[float] = 120.0,
+                       hedge_delay: Optional[float] = None,
+                       stats: Optional[HttpStats] = None) -> httpx.Client:
+    """Create a pooled keep-alive sync client with retries, deadlines and optional hedging.
+
+    Proxy environment variables are ignored (``trust_env=False``) instead of being
+    removed from the process environment.
+    """
+    stats = stats or HttpStats()
+    limits = _build_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+    transport = RetryingTransport(
+        httpx.HTTPTransport(limits=limits, trust_env=False),
+        RetryPolicy(max_retries=max_retries, deadline_seconds=deadline_seconds),
+        stats,
+        hedge_delay=hedge_delay
+    )
+    client = httpx.Client(transport=transport, timeout=_build_timeout(connect_timeout, read_timeout),
+                          trust_env=False)
+    client.stats = stats
+    return client
+
+
+def create_async_http_client(max_connections: int = 20, max_keepalive_connections: int = 10,
+                             keepalive_expiry: float = 30.0, connect_timeout: float = 5.0,
+                             read_timeout: float = 60.0, max_retries: int = 3,
+                             deadline_seconds: Optional[float] = 120.0,
+                             hedge_delay: Optional[float] = None,
+                             stats: Optional[HttpStats] = None) -> httpx.AsyncClient:
+    """Create a pooled keep-alive async client with the same behaviour as ``create_http_client``."""
+    stats = stats or HttpStats()
+    limits = _build_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+    transport = AsyncRetryingTransport(
+        httpx.AsyncHTTPTransport(limits=limits, trust_env=False),
+        RetryPolicy(max_retries=max_retries, deadline_seconds=deadline_seconds),
+        stats,
+        hedge_delay=hedge_delay
+    )
+    client = httpx.AsyncClient(transport=transport, timeout=_build_timeout(connect_timeout, read_timeout),
+                               trust_env=False)
+    client.stats = stats
+    return client
+
+
+_shared_client: Optional[httpx.Client] = None
+_shared_options: Dict[str, Any] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_http_client(**options: Any) -> httpx.Client:
+    """Get the process-wide pooled sync client, creating it with ``options`` on first use.
+
+    Later calls without options reuse the client as configured. Passing options that
+    differ from the ones it was created with raises ``ValueError`` instead of silently
+    returning a client with other limits or timeouts.
+    """
+    global _shared_client, _shared_options
+    with _shared_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = create_http_client(**options)
+            _shared_options = dict(options)
+            logger.info("shared_llm_http_client_created", **options)
+        elif options and options != _shared_options:
+            raise ValueError(
+                f"Shared LLM HTTP client already created with {_shared_options}, not {options}"
+            )
+        return _shared_client
@@ -0,0 +1,158 @@
+"""Tolerant, incremental parsing of JSON produced by an LLM.
+
+Model output can be wrapped in prose or code fences, or cut off when the completion
+hits its token limit. The parser recovers the longest valid prefix: every complete
+value is kept and the unfinished tail is dropped, so only the missing part has to
+be requested again.
+"""
+
+from typing import Any, List, Optional, Tuple
+import json
+import re
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class IncrementalJSONParser:
+    """Scans JSON text as it arrives and tracks where it could be validly closed.
+
+    A cut is only allowed where no nested object is open, so a half-written item such
+    as ``{"task": "B", "ow`` is dropped rather than returned without its owner.
+
+    ``feed`` is O(len(delta)), so the parser can follow a streamed completion;
+    ``result`` returns the best value recoverable from the text so far.
+    """
+
+    def __init__(self):
+        self._text: List[str] = []
+        self._length = 0
+        self._started = False
+        # Stack of open containers: [kind ('{' or '['), expecting ('key' or 'value')]
+        self._stack: List[List[str]] = []
+        self._nested_objects = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_is_key = False
+        self._complete = False
+        # (cut position, closing brackets) where the prefix forms a valid document
+        self._safe_points: List[Tuple[int, str]] = []
+
+    def feed(self, delta: str):
+        """Consume the next piece of model output."""
+        for char in delta:
+            self._consume(char)
+
+    @property
+    def complete(self) -> bool:
+        """Whether a whole top-level JSON value has been seen."""
+        return self._complete
+
+    def result(self) -> Tuple[Any, bool]:
+        """Return ``(value, complete)``; value is None when nothing could be recovered."""
+        text = ''.join(self._text)
+        if self._complete:
+            for candidate in (text, _TRAILING_COMMA.sub(r"\1", text)):
+                try:
+                    return json.loads(candidate), True
+                except json.JSONDecodeError:
+                    pass
+
+        # Fall back through earlier safe points until a prefix parses
+        for position, closers in reversed(self._safe_points):
+            candidate = text[:position].rstrip().rstrip(',') + closers
+            try:
+                return json.loads(_TRAILING_COMMA.sub(r"\1", candidate)), False
+            except json.JSONDecodeError:
+                continue
+        return None, False
+
+    def _append(self, char: str):
+        self._text.append(char)
+        self._length += 1
+
+    def _mark_safe(self):
+        if self._nested_objects:
+            return
+        closers = ''.join('}' if kind == '{' else ']' for kind, _ in reversed(self._stack))
+        self._safe_points.append((self._length, closers))
+
+    def _consume(self, char: str):
+        if self._complete:
+            return
+        if not self._started:
+            # Skip prose and code fences before the first container
+            if char not in '{[':
+                return
+            self._started = True
+
+        self._append(char)
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == '\\':
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if not self._string_is_key:
+                    self._mark_safe()
+            return
+
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = bool(self._stack) and self._stack[-1] == ['{', 'key']
+        elif char in '{[':
+            if self._stack and self._stack[-1][0] == '{':
+                self._stack[-1][1] = 'value'
+            self._stack.append([char, 'key' if char == '{' else 'value'])
+            if char == '{' and len(self._stack) > 1:
+                self._nested_objects += 1
+            self._mark_safe()
+        elif char in '}]':
+            if self._stack:
+                kind, _ = self._stack.pop()
+                if kind == '{' and self._stack:
+                    self._nested_objects -= 1
+            if not self._stack:
+                self._complete = True
+            else:
+                self._mark_safe()
+        elif char == ':' and self._stack:
+            self._stack[-1][1] = 'value'
+        elif char == ',' and self._stack:
+            # The value before a comma is complete; cut just before it
+            self._length -= 1
+            self._mark_safe()
+            self._length += 1
+            if self._stack[-1][0] == '{':
+                self._stack[-1][1] = 'key'
+
+
+def parse_partial_json(text: Optional[str]) -> Tuple[Any, bool]:
+    """Parse possibly fenced, malformed or truncated JSON.
+
+    Returns:
+        Tuple of the recovered value (None if nothing was recoverable) and whether
+        the document was complete
+    """
+    parser = IncrementalJSONParser()
+    parser.feed(text or "")
+    return parser.result()
+
+
+def merge_json_items(existing: Any, extra: Any) -> Any:
+    """Merge items from a follow-up response into a partial result without duplicates.
+
+    Lists are concatenated (skipping items already present) and dicts are merged key by
+    key; for any other combination the existing value wins.
+    """
+    if existing is None:
+        return extra
+    if isinstance(existing, list) and isinstance(extra, list):
+        seen = {json.dumps(item, sort_keys=True) for item in existing}
+        return existing + [item for item in extra if json.dumps(item, sort_keys=True) not in seen]
+    if isinstance(existing, dict) and isinstance(extra, dict):
+        merged = dict(existing)
+        for key, value in extra.items():
+            merged[key] = merge_json_items(merged[key], value) if key in merged else value
+        return merged
+    return existing
@@ -0,0 +1,186 @@
+"""Persistent response cache for LLM calls keyed by deterministic request hashes."""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import os
+import threading
+import time
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMResponseCache:
+    """File-backed cache of LLM results with TTL expiry and size-bounded LRU eviction.
+
+    Each entry is stored as ``<key>.json`` in the cache directory, so the cache
+    survives restarts and can be shared between processes on the same host. An entry's
+    creation time is stored in the file and its last access is the file's modification
+    time (touched on every hit), so TTL and LRU order both survive a restart. A key
+    missing from the in-memory index is looked up on disk, and the directory is
+    rescanned before evicting, so entries written, used or removed by other processes
+    count towards ``max_entries`` and the LRU order.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 512):
+        self.cache_dir = cache_dir or Path("data/cache/llm")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # key -> {'created_at': float, 'last_access': float}
+        self._index: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a deterministic cache key from the parts that influence the LLM output."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_file(self, key: str) -> Path:
+        """Get the file path for a cache entry."""
+        return self.cache_dir / f"{key}.json"
+
+    def _read_entry(self, entry_file: Path) -> Optional[Dict[str, float]]:
+        """Index entry for a file on disk; None if missing, unreadable ones are removed."""
+        try:
+            last_access = entry_file.stat().st_mtime
+            with open(entry_file, 'r') as f:
+                created_at = json.load(f).get('created_at', last_access)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("llm_cache_entry_unreadable", key=entry_file.stem, error=str(e))
+            entry_file.unlink(missing_ok=True)
+            return None
+        return {'created_at': created_at, 'last_access': last_access}
+
+    def _load_index(self):
+        """Rebuild the in-memory index from entries on disk."""
+        for entry_file in self.cache_dir.glob("*.json"):
+            entry = self._read_entry(entry_file)
+            if entry is not None:
+                self._index[entry_file.stem] = entry
+
+        logger.info("llm_cache_loaded", path=str(self.cache_dir), entries=len(self._index))
+
+    def _sync_index(self):
+        """Pick up entries other processes wrote, used or removed since the index was built."""
+        on_disk = {}
+        for entry_file in self.cache_dir.glob("*.json"):
+            try:
+                on_disk[entry_file.stem] = entry_file.stat().st_mtime
+            except OSError:
+                continue
+
+        for key in [key for key in self._index if key not in on_disk]:
+            del self._index[key]
+        for key, last_access in on_disk.items():
+            entry = self._index.get(key)
+            if entry is None:
+                entry = self._read_entry(self._entry_file(key))
+                if entry is not None:
+                    self._index[key] = entry
+            else:
+                entry['last_access'] = max(entry['last_access'], last_access)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                # Another process may have written it since the index was loaded
+                entry = self._read_entry(self._entry_file(key))
+                if entry is None:
+                    self.misses += 1
+                    return None
+                self._index[key] = entry
+
+            now = time.time()
+            if now - entry['created_at'] > self.ttl_seconds:
+                self._remove(key)
+                self.misses += 1
+                logger.info("llm_cache_entry_expired", key=key)
+                return None
+
+            try:
+                with open(self._entry_file(key), 'r') as f:
+                    value = json.load(f)['value']
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("llm_cache_entry_unreadable", key=key, error=str(e))
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            entry['last_access'] = now
+            try:
+                os.utime(self._entry_file(key), (now, now))
+            except OSError:
+                pass
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store a value and evict least recently used entries beyond ``max_entries``."""
+        with self._lock:
+            now = time.time()
+            entry_file = self._entry_file(key)
+            tmp_file = entry_file.with_suffix(".tmp")
+            try:
+                with open(tmp_file, 'w') as f:
+                    json.dump({'created_at': now, 'value': value}, f, default=str)
+                tmp_file.replace(entry_file)
+            except OSError as e:
+                logger.warning("llm_cache_write_failed", key=key, error=str(e))
+                return
+
+            self._index[key] = {'created_at': now, 'last_access': now}
+            self._evict()
+
+    def _evict(self):
+        """Drop expired entries, then the least recently used ones until within bounds."""
+        self._sync_index()
+        now = time.time()
+        expired = [key for key, entry in self._index.items()
+                   if now - entry['created_at'] > self.ttl_seconds]
+        for key in expired:
+            self._remove(key)
+
+        overflow = len(self._index) - self.max_entries
+        if overflow > 0:
+            by_access = sorted(self._index.items(), key=lambda item: item[1]['last_access'])
+            for key, _ in by_access[:overflow]:
+                self._remove(key)
+            logger.info("llm_cache_evicted", evicted=overflow, entries=len(self._index))
+
+    def _remove(self, key: str):
+        """Remove an entry from the index and disk."""
+        self._index.pop(key, None)
+        self._entry_file(key).unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            'entries': len(self._index),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'cache_dir': str(self.cache_dir)
+        }
@@ -1,56 +1,170 @@
 """LLM service for generating meeting summaries and action items using OpenAI Responses API."""
 
 import openai
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+import queue
+import threading
+import time
 import structlog
 from pathlib import Path
 import json
-import os
+import httpx
+from .llm_cache import LLMResponseCache
+from .http_client import get_shared_http_client
+from .json_repair import merge_json_items, parse_partial_json
+from .token_budget import TokenBudgetExceededError, TokenBudgetPlanner, TokenEstimator
+from .transcript import Transcript
+from .transcript_compaction import CompactedTranscript, StreamingTagExpander, compact_transcript
 
 logger = structlog.get_logger(__name__)
 
+# Bump whenever a prompt template changes so cached responses are not reused across versions
+PROMPT_TEMPLATE_VERSION = "2"
+
+SUMMARY_CONTENT_INSTRUCTION = "Please analyze the following meeting transcript and provide a comprehensive summary:"
+SUMMARY_MERGE_INSTRUCTION = (
+    "The meeting transcript was too long to process at once, so it was summarized in consecutive parts. "
+    "Please merge the following partial summaries into one comprehensive summary of the whole meeting, "
+    "removing duplicates and keeping every action item:"
+)
+
+# Appended to the original prompt when a JSON response was cut off or malformed, so the
+# model only regenerates what could not be recovered
+JSON_CONTINUATION_INSTRUCTION = """
+
+Your previous response was cut off or malformed. These items were already recovered from it:
+{recovered}
+
+Return ONLY a JSON object in the same structure containing just the action items that are missing from the recovered items above. Return an empty object if nothing is missing."""
+
+# Schema-constrained output for single-call action item views
+ACTION_ITEMS_JSON_SCHEMA = {
+    "name": "meeting_action_items",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "action_items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "task": {"type": "string"},
+                        "owner": {"type": "string"},
+                        "primary_for": {"type": "array", "items": {"type": "string"}},
+                        "secondary_for": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["task", "owner", "primary_for", "secondary_for"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["action_items"],
+        "additionalProperties": False
+    }
+}
+
+
+class StreamCancelledError(Exception):
+    """Raised inside a streaming worker once its consumer has stopped reading events."""
+
 
 class LLMService:
     """Service for generating meeting summaries and action items using OpenAI Responses API."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        """Initialize LLM service with OpenAI configuration."""
-        # Clear any proxy environment variables to avoid conflicts
-        proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy']
-        for var in proxy_vars:
-            if var in os.environ:
-                del os.environ[var]
-
-        # Set API key
-        os.environ["OPENAI_API_KEY"] = api_key
-
-        # Initialize OpenAI client with explicit http client to avoid proxy issues
-        import httpx
-        http_client = httpx.Client()
-        self.client = openai.OpenAI(api_key=api_key, http_client=http_client)
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini",
+                 cache: Optional[LLMResponseCache] = None,
+                 chunk_token_threshold: int = 12000,
+                 chunk_target_tokens: int = 4000,
+                 max_concurrent_chunks: int = 4,
+                 max_prompt_tokens: int = 100000,
+                 http_client: Optional[httpx.Client] = None,
+                 compact_transcripts: bool = False,
+                 max_json_repair_requests: int = 1):
+        """Initialize LLM service with OpenAI configuration and an optional response cache.
+
+        Every prompt is sized with a local token estimator before it is sent. Summaries
+        estimated above ``chunk_token_threshold`` tokens are first compacted and, if still
+        too large, summarized with map-reduce: split into chunks of about
+        ``chunk_target_tokens`` on speaker-turn boundaries, summarized concurrently, then
+        merged (in batches first when all partial summaries do not fit one prompt). No
+        single request may exceed ``max_prompt_tokens``.
+
+        HTTP calls go through a pooled keep-alive client (the process-wide shared one by
+        default) that owns timeouts, jittered retries and optional hedging, so the SDK's
+        own retries are disabled.
+
+        With ``compact_transcripts`` every method sends a compacted transcript (fillers and
+        backchannels removed, turns merged, speakers aliased to short tags) by default;
+        each method can override this with its ``compact`` argument.
+
+        Action items are requested in JSON mode and parsed tolerantly; if the output is
+        truncated or malformed, up to ``max_json_repair_requests`` follow-up requests ask
+        only for the items that could not be recovered.
+        """
+        self.http_client = http_client or get_shared_http_client()
+        self.client = openai.OpenAI(api_key=api_key, http_client=self.http_client, max_retries=0)
         self.model = model
+        self.cache = cache
+        self.chunk_token_threshold = chunk_token_threshold
+        self.chunk_target_tokens = chunk_target_tokens
+        self.max_concurrent_chunks = max_concurrent_chunks
+        self.compact_transcripts = compact_transcripts
+        self.max_json_repair_requests = max_json_repair_requests
+        self.token_estimator = TokenEstimator()
+        self.token_planner = TokenBudgetPlanner(
+            self.token_estimator,
+            max_prompt_tokens=max_prompt_tokens,
+            chunk_token_threshold=chunk_token_threshold
+        )
 
         logger.info("llm_service_initialized",
-                   model=model)
+                   model=model,
+                   cache_enabled=cache is not None)
 
-    def generate_meeting_summary(self, speaker_annotated_transcript: str,
+    def generate_meeting_summary(self, speaker_annotated_transcript: Union[str, Transcript],
                                 meeting_metadata: Optional[Dict] = None,
-                                user_notes: Optional[str] = None) -> Dict[str, Any]:
+                                user_notes: Optional[str] = None,
+                                chunked: Optional[bool] = None,
+                                compact: Optional[bool] = None,
+                                on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Generate a comprehensive meeting summary from speaker-annotated transcript.
 
         Args:
-            speaker_annotated_transcript: Full transcript with speaker annotations
+            speaker_annotated_transcript: Full transcript with speaker annotations, as a string
+                or a ``Transcript`` (parsed once and reused)
             meeting_metadata: Optional metadata (duration, participants, etc.)
             user_notes: Optional user-provided notes to incorporate into summary
+            chunked: Force map-reduce (True) or disable it (False); by default the token
+                budget planner decides
+            compact: Send a compacted transcript; defaults to the service setting
+            on_delta: If provided, the (final) completion is streamed and each Markdown
+                delta is passed to this callback as it arrives
 
         Returns:
             Dict containing summary, key points, decisions, and next steps
         """
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
+        speaker_annotated_transcript = meeting_transcript.text
         logger.info("generating_meeting_summary",
                    transcript_length=len(speaker_annotated_transcript))
 
+        temperature = 0.3  # Lower temperature for consistent, factual summaries
+        compact = self.compact_transcripts if compact is None else compact
+        cache_key = self._cache_key(
+            "summary", speaker_annotated_transcript, user_notes=user_notes, temperature=temperature,
+            duration=(meeting_metadata or {}).get('duration'), chunked=chunked, compact=compact
+        )
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            if on_delta is not None:
+                on_delta(cached_result["summary"])
+            return cached_result
+
         # Prepare context
-        participants = self._extract_participants(speaker_annotated_transcript)
+        participants = meeting_transcript.participants
         duration_info = ""
         if meeting_metadata and 'duration' in meeting_metadata:
             duration_info = f"Meeting duration: {meeting_metadata['duration']:.1f} minutes\n"
@@ -65,6 +179,116 @@ Additional User Notes to Incorporate:
 
 Please integrate relevant information from these user notes into the appropriate sections of the summary."""
 
+        transcript, compaction = self._prepare_transcript(meeting_transcript, compact)
+
+        def build_prompt(transcript: str) -> str:
+            return self._build_summary_prompt(
+                self._render_transcript(transcript, compaction), participants, duration_info, user_notes_section
+            )
+
+        if chunked:
+            plan = self._plan_prompt(transcript, build_prompt, force_strategy="chunked")
+        else:
+            plan = self._plan_prompt(transcript, build_prompt, allow_chunking=chunked is None)
+        use_map_reduce = plan['strategy'] == 'chunked'
+
+        try:
+            if use_map_reduce:
+                chunks = self._split_transcript_into_chunks(plan['transcript'], self.chunk_target_tokens)
+                partial_summaries, token_accounting = self._summarize_chunks(chunks, participants, compaction)
+
+                def build_merge_prompt(summaries: List[str]) -> str:
+                    return self._build_summary_prompt(
+                        "\n\n".join(
+                            f"Part {i + 1} of {len(summaries)}:\n{partial}"
+                            for i, partial in enumerate(summaries)
+                        ),
+                        participants, duration_info, user_notes_section,
+                        content_instruction=SUMMARY_MERGE_INSTRUCTION
+                    )
+
+                partial_summaries, merge_rounds, merge_accounting = self._reduce_summaries(
+                    partial_summaries, participants, build_merge_prompt
+                )
+                token_accounting.extend(merge_accounting)
+                prompt = build_merge_prompt(partial_summaries)
+            else:
+                chunks = [plan['transcript']]
+                token_accounting = []
+                merge_rounds = 0
+                prompt = build_prompt(plan['transcript'])
+
+            # Log the prompt being sent to OpenAI
+            logger.info("sending_summary_prompt_to_openai",
+                       model=self.model,
+                       prompt_length=len(prompt),
+                       transcript_length=len(speaker_annotated_transcript),
+                       token_strategy=plan['strategy'],
+                       participants=participants)
+            
+            # Use chat completions API
+            stream_expander = StreamingTagExpander(compaction, on_delta) if on_delta and compaction else None
+            response, accounting = self._create_completion(
+                prompt,
+                temperature=temperature,
+                max_tokens=1500,
+                on_delta=stream_expander or on_delta
+            )
+            if stream_expander is not None:
+                stream_expander.flush()
+            token_accounting.append(accounting)
+            token_accounting = self._merge_token_accounting(token_accounting)
+            summary_content = self._expand_output(response.choices[0].message.content, compaction)
+            tokens_used = token_accounting['tokens_used']
+
+            # Log the raw response from OpenAI
+            logger.info("received_summary_response_from_openai",
+                       response_length=len(summary_content),
+                       tokens_used=tokens_used,
+                       raw_response=summary_content)
+
+            # Parse the structured response
+            result = {
+                "summary": summary_content,
+                "participants": participants,
+                "metadata": {
+                    "model_used": self.model,
+                    "api_used": "chat_completions",
+                    "transcript_length": len(speaker_annotated_transcript),
+                    "participants_count": len(participants),
+                    "tokens_used": tokens_used,
+                    "summarization_mode": "map_reduce" if use_map_reduce else "single_shot",
+                    "chunks": len(chunks),
+                    "merge_rounds": merge_rounds,
+                    "token_strategy": plan['strategy'],
+                    "estimated_prompt_tokens": token_accounting['estimated_prompt_tokens'],
+                    "actual_prompt_tokens": token_accounting['actual_prompt_tokens'],
+                    "transcript_compaction": compaction.stats if compaction else None,
+                    "cache_hit": False,
+                    "tokens_saved": 0
+                }
+            }
+            self._store_cached_result(cache_key, result)
+
+            logger.info("meeting_summary_generated",
+                       participants_count=len(participants),
+                       tokens_used=tokens_used,
+                       api_used="chat_completions",
+                       summary_word_count=len(summary_content.split()),
+                       summary_length=len(summary_content))
+
+            return result
+
+        except (TokenBudgetExceededError, StreamCancelledError):
+            raise
+        except Exception as e:
+            logger.error("meeting_summary_generation_failed", error=str(e))
+            raise RuntimeError(f"Failed to generate meeting summary: {str(e)}")
+
+    def _build_summary_prompt(self, content: str, participants: List[str], duration_info: str = "",
+                              user_notes_section: str = "",
+                              content_instruction: str = SUMMARY_CONTENT_INSTRUCTION) -> str:
+        """Build the structured Markdown summary prompt around a transcript or partial summaries."""
         prompt = f"""You are an expert meeting summarizer. Summarize this meeting transcript as a concise, structured brief for busy stakeholders.
 
         **Handling Different Transcript Lengths**:
@@ -152,9 +376,9 @@ Please integrate relevant information from these user notes into the appropriate
 
         {duration_info} Participants: {', '.join(participants)}
 
-        Please analyze the following meeting transcript and provide a comprehensive summary:
+        {content_instruction}
 
-        {speaker_annotated_transcript}{user_notes_section}"""
+        {content}{user_notes_section}"""
 #         prompt = f"""You are an AI assistant that creates professional meeting summaries.
 
 # {duration_info}Participants: {', '.join(participants)}
@@ -201,73 +425,335 @@ Please integrate relevant information from these user notes into the appropriate
 # - When referring to a participant or speaker, prefix their name with @ (e.g., @Sami, @Aadil). Use exact names if available from the transcript
 # - For action items, include clear assignee and deadline information when available"""
 
-        try:
-            # Log the prompt being sent to OpenAI
-            logger.info("sending_summary_prompt_to_openai",
-                       model=self.model,
-                       prompt_length=len(prompt),
-                       transcript_length=len(speaker_annotated_transcript),
-                       participants=participants)
-            
-            # Use chat completions API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,  # Lower temperature for consistent, factual summaries
-                max_tokens=1500
-            )
-            summary_content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else None
+        return prompt
 
-            # Log the raw response from OpenAI
-            logger.info("received_summary_response_from_openai",
-                       response_length=len(summary_content),
-                       tokens_used=tokens_used,
-                       raw_response=summary_content)
+    def _split_transcript_into_chunks(self, speaker_annotated_transcript: str, max_tokens: int) -> List[str]:
+        """Split a transcript into chunks of at most ``max_tokens`` on speaker-turn boundaries.
 
-            # Parse the structured response
-            result = {
-                "summary": summary_content,
-                "participants": participants,
-                "metadata": {
-                    "model_used": self.model,
-                    "api_used": "chat_completions",
-                    "transcript_length": len(speaker_annotated_transcript),
-                    "participants_count": len(participants),
-                    "tokens_used": tokens_used
-                }
+        A single turn longer than the budget is split on word boundaries, repeating the
+        speaker label so every chunk stays attributable.
+        """
+        turns = [turn.strip() for turn in speaker_annotated_transcript.splitlines() if turn.strip()]
+
+        chunks = []
+        current_turns: List[str] = []
+        current_tokens = 0
+
+        for turn in turns:
+            turn_tokens = self._estimate_tokens(turn)
+
+            if turn_tokens > max_tokens:
+                pieces = self._split_long_turn(turn, max_tokens)
+            else:
+                pieces = [turn]
+
+            for piece in pieces:
+                piece_tokens = turn_tokens if len(pieces) == 1 else self._estimate_tokens(piece)
+                if current_turns and current_tokens + piece_tokens > max_tokens:
+                    chunks.append('\n\n'.join(current_turns))
+                    current_turns = []
+                    current_tokens = 0
+                current_turns.append(piece)
+                current_tokens += piece_tokens
+
+        if current_turns:
+            chunks.append('\n\n'.join(current_turns))
+
+        logger.info("transcript_split_into_chunks",
+                   turns=len(turns),
+                   chunks=len(chunks),
+                   max_tokens_per_chunk=max_tokens)
+        return chunks
+
+    def _split_long_turn(self, turn: str, max_tokens: int) -> List[str]:
+        """Split one oversized speaker turn into word-bounded pieces that keep the speaker label."""
+        speaker, separator, text = turn.partition(':')
+        if not separator:
+            speaker, text = "", turn
+        label = f"{speaker}:" if separator else ""
+
+        pieces = []
+        current_words: List[str] = []
+        for word in text.split():
+            candidate = ' '.join(current_words + [word])
+            if current_words and self._estimate_tokens(f"{label} {candidate}") > max_tokens:
+                pieces.append(f"{label} {' '.join(current_words)}".strip())
+                current_words = []
+            current_words.append(word)
+
+        if current_words:
+            pieces.append(f"{label} {' '.join(current_words)}".strip())
+        return pieces
+
+    def _summarize_chunks(self, chunks: List[str], participants: List[str],
+                          compaction: Optional[CompactedTranscript] = None) -> Tuple[List[str], List[Dict]]:
+        """Summarize transcript chunks concurrently (map step), preserving chunk order."""
+
+        def summarize_chunk(index: int, chunk: str) -> Tuple[str, Dict]:
+            prompt = f"""You are an expert meeting summarizer. The following is part {index + 1} of {len(chunks)} of a longer meeting transcript.
+
+Participants: {', '.join(participants)}
+
+Write concise, factual notes for this part only. Use flat "- " bullets (no nesting) grouped under these H3 headers:
+### Key Points
+### Decisions
+### Action Items
+Use @mentions for speaker names (e.g., @Sami). Only list action items that were explicitly stated, formatted as "- [ ] @Owner task". Omit a header if it has nothing to report. Do not add an introduction or conclusion.
+
+Transcript part:
+
+{self._render_transcript(chunk, compaction)}"""
+            response, accounting = self._create_completion(prompt, temperature=0.2, max_tokens=700)
+            logger.info("chunk_summary_generated",
+                       chunk_index=index,
+                       chunk_length=len(chunk),
+                       tokens_used=accounting['tokens_used'])
+            return self._expand_output(response.choices[0].message.content, compaction), accounting
+
+        max_workers = max(1, min(self.max_concurrent_chunks, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(summarize_chunk, range(len(chunks)), chunks))
+
+        partial_summaries = [summary for summary, _ in results]
+        token_accounting = [accounting for _, accounting in results]
+        return partial_summaries, token_accounting
+
+    def _build_notes_merge_prompt(self, summaries: List[str], participants: List[str]) -> str:
+        """Prompt combining consecutive partial summaries into one set of notes (intermediate reduce step)."""
+        parts = "\n\n".join(f"Part {i + 1} of {len(summaries)}:\n{summary}" for i, summary in enumerate(summaries))
+        return f"""You are an expert meeting summarizer. The following are notes on consecutive parts of a longer meeting.
+
+Participants: {', '.join(participants)}
+
+Combine them into one set of concise, factual notes. Use flat "- " bullets (no nesting) grouped under these H3 headers:
+### Key Points
+### Decisions
+### Action Items
+Use @mentions for speaker names (e.g., @Sami). Remove duplicates but keep every action item, formatted as "- [ ] @Owner task". Omit a header if it has nothing to report. Do not add an introduction or conclusion.
+
+Notes to combine:
+
+{parts}"""
+
+    def _within_budget(self, prompt: str) -> bool:
+        """Whether a single-message request with ``prompt`` fits ``max_prompt_tokens``."""
+        estimated_prompt_tokens = self.token_estimator.count_messages([{"role": "user", "content": prompt}])
+        return estimated_prompt_tokens <= self.token_planner.max_prompt_tokens
+
+    def _reduce_summaries(self, summaries: List[str], participants: List[str],
+                          build_merge_prompt: Callable[[List[str]], str]) -> Tuple[List[str], int, List[Dict]]:
+        """Merge partial summaries in batches until ``build_merge_prompt(summaries)`` fits the budget.
+
+        Each round groups consecutive summaries into the largest batches whose merge prompt
+        fits ``max_prompt_tokens`` and merges the batches concurrently.
+
+        Returns:
+            Tuple of the remaining summaries, the number of merge rounds and their token accounting
+
+        Raises:
+            TokenBudgetExceededError: If no two consecutive summaries fit in one merge prompt
+        """
+        rounds, token_accounting = 0, []
+        while not self._within_budget(build_merge_prompt(summaries)):
+            batches: List[List[str]] = []
+            for summary in summaries:
+                if batches and self._within_budget(self._build_notes_merge_prompt(batches[-1] + [summary], participants)):
+                    batches[-1].append(summary)
+                else:
+                    batches.append([summary])
+            if len(batches) == len(summaries):
+                raise TokenBudgetExceededError(
+                    f"{len(summaries)} partial summaries cannot be merged within the budget of "
+                    f"{self.token_planner.max_prompt_tokens} tokens"
+                )
+
+            def merge_batch(batch: List[str]) -> Tuple[str, Optional[Dict]]:
+                if len(batch) == 1:
+                    return batch[0], None
+                response, accounting = self._create_completion(
+                    self._build_notes_merge_prompt(batch, participants), temperature=0.2, max_tokens=700
+                )
+                return response.choices[0].message.content, accounting
+
+            max_workers = max(1, min(self.max_concurrent_chunks, len(batches)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(merge_batch, batches))
+
+            rounds += 1
+            summaries = [summary for summary, _ in results]
+            token_accounting.extend(accounting for _, accounting in results if accounting is not None)
+            logger.info("partial_summaries_merged", round=rounds, batches=len(batches),
+                        remaining=len(summaries))
+
+        return summaries, rounds, token_accounting
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate the token count of ``text`` with the local tokenizer."""
+        return self.token_estimator.count(text)
+
+    def _prepare_transcript(self, meeting_transcript: Transcript,
+                            compact: bool) -> Tuple[str, Optional[CompactedTranscript]]:
+        """Return the transcript to prompt with and its compaction, if compaction is enabled."""
+        if not compact:
+            return meeting_transcript.text, None
+
+        compaction = CompactedTranscript.build(
+            meeting_transcript.text, count_tokens=self._estimate_tokens, turns=meeting_transcript.turn_pairs()
+        )
+        logger.info("transcript_compacted", **compaction.stats)
+        return compaction.text, compaction
+
+    @staticmethod
+    def _render_transcript(transcript: str, compaction: Optional[CompactedTranscript]) -> str:
+        """Prefix a (possibly partial) compacted transcript with its speaker tag header."""
+        return compaction.render(transcript) if compaction else transcript
+
+    @staticmethod
+    def _expand_output(output: Any, compaction: Optional[CompactedTranscript]) -> Any:
+        """Restore full speaker names in model output produced from a compacted transcript."""
+        return compaction.expand_data(output) if compaction else output
+
+    def _plan_prompt(self, speaker_annotated_transcript: str, build_prompt: Callable[[str], str],
+                     allow_chunking: bool = False, force_strategy: Optional[str] = None) -> Dict:
+        """Choose single-shot, compacted or chunked processing for a transcript within the token budget."""
+        prompt_overhead_tokens = self._estimate_tokens(build_prompt(""))
+        if force_strategy == "chunked":
+            transcript_tokens = self._estimate_tokens(speaker_annotated_transcript)
+            return {
+                'strategy': 'chunked',
+                'transcript': speaker_annotated_transcript,
+                'original_transcript_tokens': transcript_tokens,
+                'transcript_tokens': transcript_tokens,
+                'estimated_prompt_tokens': transcript_tokens + prompt_overhead_tokens,
+                'budget_tokens': self.token_planner.chunk_token_threshold
             }
 
-            logger.info("meeting_summary_generated",
-                       participants_count=len(participants),
-                       tokens_used=tokens_used,
-                       api_used="chat_completions",
-                       summary_word_count=len(summary_content.split()),
-                       summary_length=len(summary_content))
+        return self.token_planner.plan(
+            speaker_annotated_transcript, prompt_overhead_tokens, compact_transcript, allow_chunking=allow_chunking
+        )
 
-            return result
+    def _create_completion(self, prompt: str, temperature: float, max_tokens: int,
+                           on_delta: Optional[Callable[[str], None]] = None, **kwargs: Any) -> Tuple[Any, Dict]:
+        """Send a single-message chat completion after checking it against the token budget.
 
-        except Exception as e:
-            logger.error("meeting_summary_generation_failed", error=str(e))
-            raise RuntimeError(f"Failed to generate meeting summary: {str(e)}")
+        With ``on_delta`` the completion is streamed: each content delta is passed to the
+        callback and the assembled message is returned in the same shape as a non-streamed
+        response.
+
+        Returns:
+            Tuple of the API response and token accounting (estimated vs. actual prompt tokens)
+        """
+        messages = [{"role": "user", "content": prompt}]
+        estimated_prompt_tokens = self.token_estimator.count_messages(messages)
+        if estimated_prompt_tokens > self.token_planner.max_prompt_tokens:
+            raise TokenBudgetExceededError(
+                f"Prompt needs about {estimated_prompt_tokens} tokens, "
+                f"above the budget of {self.token_planner.max_prompt_tokens}"
+            )
 
-    def extract_action_items_by_speaker(self, speaker_annotated_transcript: str,
+        if on_delta is not None:
+            kwargs.update(stream=True, stream_options={"include_usage": True})
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        if on_delta is not None:
+            response = self._consume_stream(response, on_delta)
+
+        usage = response.usage
+        actual_prompt_tokens = getattr(usage, "prompt_tokens", None) if usage else None
+        if isinstance(actual_prompt_tokens, int):
+            self.token_estimator.observe(estimated_prompt_tokens, actual_prompt_tokens)
+        else:
+            actual_prompt_tokens = None
+
+        accounting = {
+            'estimated_prompt_tokens': estimated_prompt_tokens,
+            'actual_prompt_tokens': actual_prompt_tokens,
+            'tokens_used': usage.total_tokens if usage else None
+        }
+        logger.info("llm_token_accounting", **accounting)
+        return response, accounting
+
+    @staticmethod
+    def _consume_stream(stream: Any, on_delta: Callable[[str], None]) -> Any:
+        """Forward content deltas of a streamed completion and assemble the full message."""
+        started_at = time.monotonic()
+        first_token_at = None
+        pieces = []
+        usage = None
+
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                    pieces.append(delta)
+                    on_delta(delta)
+        except BaseException:
+            # Drop the connection so the API stops generating tokens nobody will read
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+            raise
+
+        logger.info("llm_stream_completed",
+                   deltas=len(pieces),
+                   time_to_first_token=round(first_token_at - started_at, 3) if first_token_at else None,
+                   duration=round(time.monotonic() - started_at, 3))
+        message = SimpleNamespace(content="".join(pieces))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+    @staticmethod
+    def _merge_token_accounting(accountings: List[Dict]) -> Dict:
+        """Sum token accounting across several completions; unknown actual counts stay None."""
+        merged = {}
+        for key in ('estimated_prompt_tokens', 'actual_prompt_tokens', 'tokens_used'):
+            values = [accounting.get(key) for accounting in accountings]
+            merged[key] = None if any(value is None for value in values) else sum(values)
+        return merged
+
+    def extract_action_items_by_speaker(self, speaker_annotated_transcript: Union[str, Transcript],
                                         target_speaker: Optional[str] = None,
-                                        user_notes: Optional[str] = None) -> Dict[str, List[Dict]]:
+                                        user_notes: Optional[str] = None,
+                                        compact: Optional[bool] = None) -> Dict[str, List[Dict]]:
         """Extract action items and assign them to specific speakers.
 
         Args:
-            speaker_annotated_transcript: Full transcript with speaker annotations
+            speaker_annotated_transcript: Full transcript with speaker annotations, as a string
+                or a ``Transcript`` (parsed once and reused)
             target_speaker: If provided, focus on this speaker's action items (personalized view)
             user_notes: Optional user-provided notes to incorporate into action items
+            compact: Send a compacted transcript; defaults to the service setting
 
         Returns:
             Dict mapping speaker names to their assigned action items
         """
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
+        speaker_annotated_transcript = meeting_transcript.text
         logger.info("extracting_action_items",
                    transcript_length=len(speaker_annotated_transcript))
 
-        participants = self._extract_participants(speaker_annotated_transcript)
+        temperature = 0.2  # Very low temperature for structured extraction
+        compact = self.compact_transcripts if compact is None else compact
+        cache_key = self._cache_key(
+            "action_items", speaker_annotated_transcript, user_notes=user_notes,
+            target_speaker=target_speaker, temperature=temperature, compact=compact
+        )
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        participants = meeting_transcript.participants
 
         # Include user notes if provided
         user_notes_section = ""
@@ -297,93 +783,64 @@ SPECIAL FOCUS: This request is for {target_speaker}'s personalized view.
             comma_separator = ""
             relevance_field = ""
 
-        prompt = f"""You are an AI assistant specialized in extracting action items from meeting transcripts.
-
-Participants: {', '.join(participants)}
-View Type: {view_type.title()} Action Items{f' for {target_speaker}' if target_speaker else ''}
-
-Analyze the following meeting transcript and extract all action items:
-
-{speaker_annotated_transcript}{user_notes_section}
-
-For each action item, determine:
-1. What specific task needs to be done
-2. Who is responsible (if mentioned or implied)
-3. Any mentioned deadlines or timeframes (embed directly in task description if explicitly mentioned)
-4. Clear, actionable description{focus_instruction}
-
-FORMATTING REQUIREMENTS:
-- DO NOT use emojis unless they are directly relevant to the meeting content
-- Use professional, business-appropriate language
-- Be specific and actionable in task descriptions
-- Focus on concrete outcomes and commitments
-- Embed deadline/priority information directly in the task string if explicitly mentioned
-
-Return your response in JSON format with this structure:
-{{
-  "Sami": ["Task description with deadline if mentioned"],
-  "Aadil": ["Another task description"],
-  "Everyone": ["Optional: tasks for whole group"],
-  "Other": ["Optional: unassigned tasks"]
-}}
+        transcript, compaction = self._prepare_transcript(meeting_transcript, compact)
 
-IMPORTANT SCHEMA NOTES:
-- Use exact participant names as keys (e.g., "Sami", "Aadil", etc.)
-- Include "Everyone" key only if there are group-wide tasks that apply to all participants
-- Include "Other" key only if there are unassigned tasks where no clear owner was identified
-- Each task should be a simple string - embed deadline/priority information directly in the task description if explicitly mentioned
-- Do not use strict schema for deadlines/priorities - only include if explicitly mentioned in the meeting
+        def build_prompt(transcript: str) -> str:
+            return self._build_action_items_prompt(
+                self._render_transcript(transcript, compaction), participants, view_type, target_speaker,
+                user_notes_section, focus_instruction
+            )
 
-Only include actual action items and commitments, not general discussion points. If someone volunteers for something or is asked to do something, assign it to them."""
+        plan = self._plan_prompt(transcript, build_prompt)
+        prompt = build_prompt(plan['transcript'])
 
         try:
             # Log the prompt being sent to OpenAI
             logger.info("sending_action_items_prompt_to_openai",
                        model=self.model,
                        prompt_length=len(prompt),
+                       token_strategy=plan['strategy'],
                        target_speaker=target_speaker,
                        participants=participants)
             
-            # Use chat completions API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.2,  # Very low temperature for structured extraction
-                max_tokens=1000
+            # Use chat completions API in JSON mode
+            response_format = {"type": "json_object"}
+            response, token_accounting = self._create_completion(
+                prompt,
+                temperature=temperature,
+                max_tokens=1000,
+                response_format=response_format
             )
             action_items_text = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else None
 
             # Log the raw response from OpenAI
             logger.info("received_action_items_response_from_openai",
-                       response_length=len(action_items_text),
-                       tokens_used=tokens_used,
+                       response_length=len(action_items_text or ""),
+                       tokens_used=token_accounting['tokens_used'],
                        raw_response=action_items_text)
 
-            # Try to extract JSON from the response
-            try:
-                # Look for JSON block
-                if "```json" in action_items_text:
-                    json_start = action_items_text.find("```json") + 7
-                    json_end = action_items_text.find("```", json_start)
-                    json_text = action_items_text[json_start:json_end].strip()
-                else:
-                    # Assume the whole response is JSON
-                    json_text = action_items_text.strip()
+            # Parse tolerantly; only what could not be recovered is requested again
+            action_items, parsed, json_repair, repair_accounting = self._complete_json_response(
+                prompt, action_items_text, temperature, 1000, response_format=response_format
+            )
+            token_accounting = self._merge_token_accounting([token_accounting] + repair_accounting)
+            tokens_used = token_accounting['tokens_used']
+
+            if isinstance(action_items, dict):
+                action_items = self._expand_output(action_items, compaction)
 
-                action_items = json.loads(json_text)
-                
                 # Log the parsed action items structure
                 logger.info("action_items_json_parsed_successfully",
                            action_items_structure=action_items,
                            total_speakers_with_items=len(action_items),
-                           total_items=sum(len(items) for items in action_items.values()))
-
-            except json.JSONDecodeError as je:
+                           total_items=sum(len(items) for items in action_items.values()),
+                           complete=parsed,
+                           **json_repair)
+            else:
+                parsed = False
                 logger.warning("failed_to_parse_action_items_json",
-                              error=str(je),
                               full_response_text=action_items_text,
-                              json_attempt=json_text if 'json_text' in locals() else 'N/A')
+                              **json_repair)
                 # Fallback: return a simplified structure
                 action_items = {
                     "Other": ["Failed to parse action items - please review meeting manually"]
@@ -399,9 +856,19 @@ Only include actual action items and commitments, not general discussion points.
                     "extraction_method": "llm_structured",
                     "view_type": view_type,
                     "target_speaker": target_speaker,
-                    "tokens_used": tokens_used
+                    "tokens_used": tokens_used,
+                    "token_strategy": plan['strategy'],
+                    "estimated_prompt_tokens": token_accounting['estimated_prompt_tokens'],
+                    "actual_prompt_tokens": token_accounting['actual_prompt_tokens'],
+                    "transcript_compaction": compaction.stats if compaction else None,
+                    **json_repair,
+                    "cache_hit": False,
+                    "tokens_saved": 0
                 }
             }
+            # Never cache a fallback or partially recovered result, so a retry gets a fresh completion
+            if parsed:
+                self._store_cached_result(cache_key, result)
 
             # Count total action items
             total_items = sum(len(items) for items in action_items.values())
@@ -412,41 +879,108 @@ Only include actual action items and commitments, not general discussion points.
 
             return result
 
+        except TokenBudgetExceededError:
+            raise
         except Exception as e:
             logger.error("action_items_extraction_failed", error=str(e))
             raise RuntimeError(f"Failed to extract action items: {str(e)}")
 
-    def extract_all_action_item_views(self, speaker_annotated_transcript: str,
-                                      user_notes: Optional[str] = None) -> Dict[str, Any]:
+    def _build_action_items_prompt(self, transcript: str, participants: List[str], view_type: str,
+                                   target_speaker: Optional[str], user_notes_section: str,
+                                   focus_instruction: str) -> str:
+        """Build the action item extraction prompt for the general or a speaker-specific view."""
+        prompt = f"""You are an AI assistant specialized in extracting action items from meeting transcripts.
+
+Participants: {', '.join(participants)}
+View Type: {view_type.title()} Action Items{f' for {target_speaker}' if target_speaker else ''}
+
+Analyze the following meeting transcript and extract all action items:
+
+{transcript}{user_notes_section}
+
+For each action item, determine:
+1. What specific task needs to be done
+2. Who is responsible (if mentioned or implied)
+3. Any mentioned deadlines or timeframes (embed directly in task description if explicitly mentioned)
+4. Clear, actionable description{focus_instruction}
+
+FORMATTING REQUIREMENTS:
+- DO NOT use emojis unless they are directly relevant to the meeting content
+- Use professional, business-appropriate language
+- Be specific and actionable in task descriptions
+- Focus on concrete outcomes and commitments
+- Embed deadline/priority information directly in the task string if explicitly mentioned
+
+Return your response in JSON format with this structure:
+{{
+  "Sami": ["Task description with deadline if mentioned"],
+  "Aadil": ["Another task description"],
+  "Everyone": ["Optional: tasks for whole group"],
+  "Other": ["Optional: unassigned tasks"]
+}}
+
+IMPORTANT SCHEMA NOTES:
+- Use exact participant names as keys (e.g., "Sami", "Aadil", etc.)
+- Include "Everyone" key only if there are group-wide tasks that apply to all participants
+- Include "Other" key only if there are unassigned tasks where no clear owner was identified
+- Each task should be a simple string - embed deadline/priority information directly in the task description if explicitly mentioned
+- Do not use strict schema for deadlines/priorities - only include if explicitly mentioned in the meeting
+
+Only include actual action items and commitments, not general discussion points. If someone volunteers for something or is asked to do something, assign it to them."""
+
+        return prompt
+
+    def extract_all_action_item_views(self, speaker_annotated_transcript: Union[str, Transcript],
+                                      user_notes: Optional[str] = None,
+                                      generation_method: str = "n_plus_1",
+                                      compact: Optional[bool] = None) -> Dict[str, Any]:
         """Generate all action item views: general + one for each speaker.
 
         Args:
-            speaker_annotated_transcript: Full transcript with speaker annotations
+            speaker_annotated_transcript: Full transcript with speaker annotations, as a string
+                or a ``Transcript`` (parsed once and reused)
             user_notes: Optional user-provided notes to incorporate into action items
+            generation_method: "n_plus_1" for one request per view, or "single_call"
+                to produce every view from one JSON-structured response
+            compact: Send a compacted transcript; defaults to the service setting
 
         Returns:
             Dict containing general view and speaker-specific views
         """
+        # Parse once; every per-view request below reuses the same structure
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
+
+        if generation_method == "single_call":
+            return self._extract_all_action_item_views_single_call(meeting_transcript, user_notes,
+                                                                   compact=compact)
+        if generation_method != "n_plus_1":
+            raise ValueError(f"Unknown action item generation method: {generation_method}")
+
         logger.info("extracting_all_action_item_views",
-                   transcript_length=len(speaker_annotated_transcript))
+                   transcript_length=len(meeting_transcript))
 
-        participants = self._extract_participants(speaker_annotated_transcript)
+        participants = meeting_transcript.participants
 
         # Generate general view (existing behavior)
-        general_view = self.extract_action_items_by_speaker(speaker_annotated_transcript, user_notes=user_notes)
+        general_view = self.extract_action_items_by_speaker(meeting_transcript, user_notes=user_notes,
+                                                            compact=compact)
 
         # Generate speaker-specific views
         speaker_views = {}
         total_tokens = general_view["metadata"].get("tokens_used", 0) or 0
+        cache_hits = 1 if general_view["metadata"].get("cache_hit") else 0
+        tokens_saved = general_view["metadata"].get("tokens_saved", 0) or 0
 
         for speaker in participants:
             logger.info("generating_speaker_specific_view", speaker=speaker)
             try:
                 speaker_view = self.extract_action_items_by_speaker(
-                    speaker_annotated_transcript, target_speaker=speaker, user_notes=user_notes
+                    meeting_transcript, target_speaker=speaker, user_notes=user_notes, compact=compact
                 )
                 speaker_views[speaker] = speaker_view
                 total_tokens += speaker_view["metadata"].get("tokens_used", 0) or 0
+                cache_hits += 1 if speaker_view["metadata"].get("cache_hit") else 0
+                tokens_saved += speaker_view["metadata"].get("tokens_saved", 0) or 0
 
             except Exception as e:
                 logger.error("speaker_view_generation_failed", speaker=speaker, error=str(e))
@@ -469,6 +1003,8 @@ Only include actual action items and commitments, not general discussion points.
                 "total_views_generated": 1 + len(participants),
                 "participants": participants,
                 "total_tokens_used": total_tokens,
+                "cache_hits": cache_hits,
+                "tokens_saved": tokens_saved,
                 "generation_method": "n_plus_1_views"
             }
         }
@@ -480,72 +1016,471 @@ Only include actual action items and commitments, not general discussion points.
 
         return result
 
-    def generate_meeting_insights(self, speaker_annotated_transcript: str,
+    def _extract_all_action_item_views_single_call(self, speaker_annotated_transcript: Union[str, Transcript],
+                                                   user_notes: Optional[str] = None,
+                                                   compact: Optional[bool] = None) -> Dict[str, Any]:
+        """Generate the general view and every speaker view from one structured LLM response.
+
+        The model lists each action item once with its owner and the participants for whom
+        it is a primary or secondary responsibility; the per-speaker views are then derived
+        locally, so the transcript is sent once instead of N+1 times.
+        """
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
+        speaker_annotated_transcript = meeting_transcript.text
+        logger.info("extracting_all_action_item_views_single_call",
+                   transcript_length=len(speaker_annotated_transcript))
+
+        temperature = 0.2
+        compact = self.compact_transcripts if compact is None else compact
+        cache_key = self._cache_key(
+            "action_items_all_views", speaker_annotated_transcript, user_notes=user_notes,
+            temperature=temperature, generation_method="single_call", compact=compact
+        )
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        participants = meeting_transcript.participants
+
+        user_notes_section = ""
+        if user_notes:
+            user_notes_section = f"""
+
+Additional User Notes to Incorporate:
+{user_notes}
+
+Please consider these user notes when identifying and prioritizing action items."""
+
+        transcript, compaction = self._prepare_transcript(meeting_transcript, compact)
+
+        def build_prompt(transcript: str) -> str:
+            return self._build_all_views_prompt(
+                self._render_transcript(transcript, compaction), participants, user_notes_section
+            )
+
+        plan = self._plan_prompt(transcript, build_prompt)
+        prompt = build_prompt(plan['transcript'])
+
+        try:
+            logger.info("sending_all_views_prompt_to_openai",
+                       model=self.model,
+                       prompt_length=len(prompt),
+                       token_strategy=plan['strategy'],
+                       participants=participants)
+
+            # Schema-constrained output: every item carries task, owner and view membership
+            response_format = {"type": "json_schema", "json_schema": ACTION_ITEMS_JSON_SCHEMA}
+            response, token_accounting = self._create_completion(
+                prompt,
+                temperature=temperature,
+                max_tokens=1500,
+                response_format=response_format
+            )
+            response_text = response.choices[0].message.content
+            usage = response.usage
+
+            logger.info("received_all_views_response_from_openai",
+                       response_length=len(response_text or ""),
+                       tokens_used=token_accounting['tokens_used'],
+                       raw_response=response_text)
+
+            structured, parsed, json_repair, repair_accounting = self._complete_json_response(
+                prompt, response_text, temperature, 1500, response_format=response_format
+            )
+            token_accounting = self._merge_token_accounting([token_accounting] + repair_accounting)
+            tokens_used = token_accounting['tokens_used']
+
+            if isinstance(structured, dict) and isinstance(structured.get("action_items"), list):
+                items = [item for item in self._expand_output(structured["action_items"], compaction)
+                         if isinstance(item, dict) and item.get("task")]
+            else:
+                parsed = False
+                logger.warning("failed_to_parse_all_views_json",
+                              full_response_text=response_text,
+                              **json_repair)
+                items = [{"task": "Failed to parse action items - please review meeting manually",
+                          "owner": "Other"}]
+
+            # General view: tasks grouped by owner, identical shape to extract_action_items_by_speaker
+            general_items: Dict[str, List[str]] = {}
+            for item in items:
+                general_items.setdefault(item.get("owner") or "Other", []).append(item["task"])
+
+            base_metadata = {
+                "model_used": self.model,
+                "api_used": "chat_completions",
+                "participants": participants,
+                "extraction_method": "llm_structured_single_call",
+                "cache_hit": False,
+                "tokens_saved": 0
+            }
+            # The one request is accounted to the general view; speaker views are derived locally
+            general_view = {
+                "action_items": general_items,
+                "metadata": {**base_metadata, "tokens_used": tokens_used,
+                             "view_type": "general", "target_speaker": None}
+            }
+
+            speaker_views = {}
+            for speaker in participants:
+                speaker_items: Dict[str, List[Dict[str, str]]] = {}
+                for item in items:
+                    relevance = self._view_relevance(item, speaker)
+                    if relevance is None:
+                        continue
+                    speaker_items.setdefault(item.get("owner") or "Other", []).append({
+                        "task": item["task"],
+                        "relevance": relevance
+                    })
+                speaker_views[speaker] = {
+                    "action_items": speaker_items,
+                    "metadata": {**base_metadata, "tokens_used": 0,
+                                 "view_type": "speaker-specific", "target_speaker": speaker}
+                }
+
+            prompt_tokens = getattr(usage, "prompt_tokens", None) if usage else None
+            completion_tokens = getattr(usage, "completion_tokens", None) if usage else None
+
+            result = {
+                "general_view": general_view,
+                "speaker_views": speaker_views,
+                "metadata": {
+                    "total_speakers": len(participants),
+                    "total_views_generated": 1 + len(participants),
+                    "participants": participants,
+                    "total_tokens_used": tokens_used,
+                    "token_strategy": plan['strategy'],
+                    "estimated_prompt_tokens": token_accounting['estimated_prompt_tokens'],
+                    "actual_prompt_tokens": token_accounting['actual_prompt_tokens'],
+                    "transcript_compaction": compaction.stats if compaction else None,
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "llm_calls": 1 + json_repair['repair_requests'],
+                    **json_repair,
+                    "cache_hit": False,
+                    "tokens_saved": 0,
+                    "generation_method": "single_call_views"
+                }
+            }
+            if parsed:
+                self._store_cached_result(cache_key, result)
+
+            logger.info("all_action_item_views_generated",
+                       total_views=1 + len(participants),
+                       participants_count=len(participants),
+                       total_tokens=tokens_used,
+                       generation_method="single_call_views")
+
+            return result
+
+        except TokenBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.error("all_action_item_views_single_call_failed", error=str(e))
+            raise RuntimeError(f"Failed to extract action item views: {str(e)}")
+
+    @staticmethod
+    def _view_relevance(item: Dict[str, Any], speaker: str) -> Optional[str]:
+        """``primary``/``secondary`` relevance of a structured action item for a speaker's view.
+
+        Items listing the speaker in neither ``primary_for`` nor ``secondary_for`` are left
+        out of that view; items without either list are shown to everyone as secondary.
+        """
+        owner = item.get("owner") or "Other"
+        primary_for = item.get("primary_for") or []
+        secondary_for = item.get("secondary_for") or []
+        if owner == speaker or speaker in primary_for:
+            return "primary"
+        if speaker in secondary_for or not (primary_for or secondary_for):
+            return "secondary"
+        return None
+
+    def _build_all_views_prompt(self, transcript: str, participants: List[str], user_notes_section: str) -> str:
+        """Build the structured prompt that yields every action item view in one response."""
+        prompt = f"""You are an AI assistant specialized in extracting action items from meeting transcripts.
+
+Participants: {', '.join(participants)}
+
+Analyze the following meeting transcript and extract all action items:
+
+{transcript}{user_notes_section}
+
+For each action item, determine:
+1. What specific task needs to be done
+2. Who owns it (exact participant name, "Everyone" for group-wide tasks, or "Other" if no clear owner)
+3. Any mentioned deadlines or timeframes (embed directly in task description if explicitly mentioned)
+4. For every participant, whether the item is their primary responsibility or only secondary context for them
+
+FORMATTING REQUIREMENTS:
+- DO NOT use emojis unless they are directly relevant to the meeting content
+- Use professional, business-appropriate language
+- Be specific and actionable in task descriptions
+- Embed deadline/priority information directly in the task string if explicitly mentioned
+
+Return ONLY a JSON object with this structure:
+{{
+  "action_items": [
+    {{
+      "task": "Task description with deadline if mentioned",
+      "owner": "Sami",
+      "primary_for": ["Sami"],
+      "secondary_for": ["Aadil"]
+    }}
+  ]
+}}
+
+IMPORTANT SCHEMA NOTES:
+- List each action item exactly once
+- "primary_for" and "secondary_for" may only contain exact participant names
+- Every participant should appear in either "primary_for" or "secondary_for" for each item
+
+Only include actual action items and commitments, not general discussion points. If someone volunteers for something or is asked to do something, assign it to them."""
+
+        return prompt
+
+    def generate_meeting_insights(self, speaker_annotated_transcript: Union[str, Transcript],
                                  meeting_metadata: Optional[Dict] = None,
-                                 user_notes: Optional[str] = None) -> Dict[str, Any]:
+                                 user_notes: Optional[str] = None,
+                                 compact: Optional[bool] = None) -> Dict[str, Any]:
         """Generate comprehensive meeting insights including summary and action items.
 
         Args:
-            speaker_annotated_transcript: Full transcript with speaker annotations
+            speaker_annotated_transcript: Full transcript with speaker annotations, as a string
+                or a ``Transcript`` (parsed once and reused)
             meeting_metadata: Optional metadata (duration, participants, etc.)
             user_notes: Optional user-provided notes to incorporate into insights
+            compact: Send a compacted transcript; defaults to the service setting
 
         Returns:
             Dict containing both summary and action items
         """
         logger.info("generating_comprehensive_meeting_insights")
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
 
         try:
             # Generate summary and action items in parallel conceptually
             summary_result = self.generate_meeting_summary(
-                speaker_annotated_transcript, meeting_metadata, user_notes
+                meeting_transcript, meeting_metadata, user_notes, compact=compact
             )
 
             action_items_result = self.extract_action_items_by_speaker(
-                speaker_annotated_transcript, user_notes=user_notes
+                meeting_transcript, user_notes=user_notes, compact=compact
             )
 
-            # Combine results
-            insights = {
-                "summary": summary_result["summary"],
-                "action_items_by_speaker": action_items_result["action_items"],
-                "participants": summary_result["participants"],
-                "metadata": {
-                    "summary_metadata": summary_result["metadata"],
-                    "action_items_metadata": action_items_result["metadata"],
-                    "total_tokens_used": (
-                        (summary_result["metadata"].get("tokens_used", 0) or 0) +
-                        (action_items_result["metadata"].get("tokens_used", 0) or 0)
-                    )
-                }
-            }
+            insights = self._combine_insights(summary_result, action_items_result)
 
             logger.info("comprehensive_meeting_insights_generated",
                        total_tokens=insights["metadata"]["total_tokens_used"])
 
             return insights
 
+        except TokenBudgetExceededError:
+            raise
         except Exception as e:
             logger.error("comprehensive_insights_generation_failed", error=str(e))
             raise RuntimeError(f"Failed to generate meeting insights: {str(e)}")
 
-    def _extract_participants(self, speaker_annotated_transcript: str) -> List[str]:
-        """Extract unique participant names from speaker-annotated transcript."""
-        participants = set()
+    def stream_meeting_summary(self, speaker_annotated_transcript: Union[str, Transcript],
+                               meeting_metadata: Optional[Dict] = None,
+                               user_notes: Optional[str] = None,
+                               compact: Optional[bool] = None) -> Iterator[Tuple[str, Any]]:
+        """Stream a meeting summary as ``(event, data)`` pairs.
+
+        Yields ``("delta", markdown)`` while the completion streams, then
+        ``("summary", result)`` with the same result as ``generate_meeting_summary``,
+        or ``("error", {"detail", "status_code"})`` if generation fails.
+        """
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
+
+        def run(emit: Callable[[str, Any], None]):
+            summary_result = self.generate_meeting_summary(
+                meeting_transcript, meeting_metadata, user_notes, compact=compact,
+                on_delta=lambda delta: emit("delta", delta)
+            )
+            emit("summary", summary_result)
+
+        return self._stream_events(run)
+
+    def stream_meeting_insights(self, speaker_annotated_transcript: Union[str, Transcript],
+                                meeting_metadata: Optional[Dict] = None,
+                                user_notes: Optional[str] = None,
+                                compact: Optional[bool] = None) -> Iterator[Tuple[str, Any]]:
+        """Stream meeting insights as ``(event, data)`` pairs.
+
+        Action items are extracted concurrently with the streamed summary and yielded as
+        one ``("action_items", result)`` event once complete. The final event is
+        ``("insights", insights)``, shaped like ``generate_meeting_insights``.
+        """
+        meeting_transcript = Transcript.coerce(speaker_annotated_transcript)
+
+        def run(emit: Callable[[str, Any], None]):
+            def emit_action_items(future):
+                # Failures surface from future.result() below; a cancelled stream drops the event
+                if future.exception() is None:
+                    try:
+                        emit("action_items", future.result())
+                    except StreamCancelledError:
+                        pass
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                action_items_future = executor.submit(
+                    self.extract_action_items_by_speaker, meeting_transcript,
+                    user_notes=user_notes, compact=compact
+                )
+                action_items_future.add_done_callback(emit_action_items)
+                summary_result = self.generate_meeting_summary(
+                    meeting_transcript, meeting_metadata, user_notes, compact=compact,
+                    on_delta=lambda delta: emit("delta", delta)
+                )
+                emit("summary", summary_result)
+                action_items_result = action_items_future.result()
+            emit("insights", self._combine_insights(summary_result, action_items_result))
+
+        return self._stream_events(run)
+
+    def _stream_events(self, run: Callable[[Callable[[str, Any], None]], None]) -> Iterator[Tuple[str, Any]]:
+        """Run ``run(emit)`` on a worker thread and yield the events it emits as they happen.
+
+        Once the consumer stops iterating (e.g. the SSE client disconnected) ``emit``
+        raises ``StreamCancelledError``, which aborts the worker at its next event and
+        closes any completion it is streaming instead of paying for unread tokens.
+        """
+        events: queue.Queue = queue.Queue()
+        finished = object()
+        cancelled = threading.Event()
+
+        def emit(event: str, data: Any):
+            if cancelled.is_set():
+                raise StreamCancelledError("Stream consumer went away")
+            events.put((event, data))
+
+        def worker():
+            try:
+                run(emit)
+            except Exception as e:
+                if cancelled.is_set():
+                    logger.info("llm_stream_cancelled")
+                    return
+                logger.error("llm_stream_failed", error=str(e))
+                status_code = 413 if isinstance(e, TokenBudgetExceededError) else 500
+                events.put(("error", {"detail": str(e), "status_code": status_code}))
+            finally:
+                events.put(finished)
+
+        threading.Thread(target=worker, daemon=True).start()
+        try:
+            while True:
+                item = events.get()
+                if item is finished:
+                    return
+                yield item
+        finally:
+            cancelled.set()
+
+    @staticmethod
+    def _combine_insights(summary_result: Dict[str, Any], action_items_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine summary and action item results into the insights structure."""
+        return {
+            "summary": summary_result["summary"],
+            "action_items_by_speaker": action_items_result["action_items"],
+            "participants": summary_result["participants"],
+            "metadata": {
+                "summary_metadata": summary_result["metadata"],
+                "action_items_metadata": action_items_result["metadata"],
+                "total_tokens_used": (
+                    (summary_result["metadata"].get("tokens_used", 0) or 0) +
+                    (action_items_result["metadata"].get("tokens_used", 0) or 0)
+                ),
+                "cache_hits": sum(
+                    1 for metadata in (summary_result["metadata"], action_items_result["metadata"])
+                    if metadata.get("cache_hit")
+                ),
+                "tokens_saved": (
+                    (summary_result["metadata"].get("tokens_saved", 0) or 0) +
+                    (action_items_result["metadata"].get("tokens_saved", 0) or 0)
+                )
+            }
+        }
 
-        # Split transcript by speaker turns
-        lines = speaker_annotated_transcript.split('\n\n')
+    def get_http_stats(self) -> Optional[Dict[str, Any]]:
+        """Get retry and latency statistics of the underlying HTTP client."""
+        stats = getattr(self.http_client, "stats", None)
+        return stats.snapshot() if stats is not None else None
+
+    def _cache_key(self, kind: str, speaker_annotated_transcript: str,
+                   user_notes: Optional[str] = None, target_speaker: Optional[str] = None,
+                   temperature: Optional[float] = None, **extra: Any) -> Optional[str]:
+        """Build the deterministic cache key for a request, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+
+        return self.cache.make_key(
+            model=self.model,
+            prompt_version=PROMPT_TEMPLATE_VERSION,
+            kind=kind,
+            transcript=speaker_annotated_transcript,
+            user_notes=user_notes or "",
+            target_speaker=target_speaker,
+            temperature=temperature,
+            **extra
+        )
+
+    def _get_cached_result(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a cached result annotated as a cache hit, or None on a miss."""
+        if cache_key is None:
+            return None
+
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+
+        metadata = cached["metadata"]
+        tokens_key = "total_tokens_used" if "total_tokens_used" in metadata else "tokens_used"
+        tokens_saved = metadata.get(tokens_key, 0) or 0
+        metadata["tokens_saved"] = tokens_saved
+        metadata[tokens_key] = 0
+        metadata["cache_hit"] = True
+
+        logger.info("llm_cache_hit", cache_key=cache_key, tokens_saved=tokens_saved)
+        return cached
+
+    def _store_cached_result(self, cache_key: Optional[str], result: Dict[str, Any]):
+        """Persist a freshly generated result in the cache."""
+        if cache_key is None:
+            return
+        self.cache.set(cache_key, result)
+
+    def _complete_json_response(self, prompt: str, response_text: Optional[str], temperature: float,
+                                max_tokens: int, **kwargs: Any) -> Tuple[Any, bool, Dict[str, Any], List[Dict]]:
+        """Parse a JSON response, re-requesting only the items lost to truncation or malformed output.
 
-        for line in lines:
-            line = line.strip()
-            if ':' in line:
-                # Extract speaker name (everything before the first colon)
-                speaker = line.split(':', 1)[0].strip()
-                # Remove quotes if present
-                speaker = speaker.strip('"\'')
+        Returns:
+            Tuple of the parsed value (None if nothing was recoverable), whether it is complete,
+            repair metadata and token accounting of any follow-up requests
+        """
+        value, complete = parse_partial_json(response_text)
+        repair = {"json_repaired": False, "repair_requests": 0}
+        accounting = []
+
+        while not complete and repair["repair_requests"] < self.max_json_repair_requests:
+            repair["repair_requests"] += 1
+            logger.warning("json_response_incomplete_requesting_missing_items",
+                           recovered=value is not None,
+                           attempt=repair["repair_requests"])
+            continuation_prompt = prompt + JSON_CONTINUATION_INSTRUCTION.format(
+                recovered=json.dumps(value if value is not None else {})
+            )
+            response, continuation_accounting = self._create_completion(
+                continuation_prompt, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+            accounting.append(continuation_accounting)
+            extra, complete = parse_partial_json(response.choices[0].message.content)
+            if extra is not None:
+                value = merge_json_items(value, extra)
 
-                # Filter out obvious non-names
-                if speaker and not speaker.startswith('Unknown') and len(speaker) > 1:
-                    participants.add(speaker)
+        repair["json_repaired"] = repair["repair_requests"] > 0 and complete
+        return value, complete, repair, accounting
 
-        return sorted(list(participants))
\ No newline at end of file
+    def _extract_participants(self, speaker_annotated_transcript: Union[str, Transcript]) -> List[str]:
+        """Extract unique participant names from speaker-annotated transcript."""
+        return Transcript.coerce(speaker_annotated_transcript).participants
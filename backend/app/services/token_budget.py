@@ -0,0 +1,155 @@
+"""Local token estimation and prompt budget planning for LLM calls."""
+
+from typing import Callable, Dict, List, Optional
+import math
+import re
+import threading
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Approximates the pre-tokenization split used by OpenAI's BPE encodings: contractions,
+# letter runs, 1-3 digit groups, punctuation runs and whitespace.
+_PRETOKEN_PATTERN = re.compile(
+    r"'(?:s|t|re|ve|m|ll|d)|[^\W\d_]+|\d{1,3}|[^\s\w]+|\s+",
+    re.IGNORECASE
+)
+
+# Fixed per-message overhead of the chat format (role markers and separators)
+_MESSAGE_OVERHEAD_TOKENS = 4
+_REPLY_PRIMING_TOKENS = 3
+
+
+class TokenBudgetExceededError(ValueError):
+    """Raised when a prompt cannot be brought within the configured token budget."""
+
+
+class TokenEstimator:
+    """Counts tokens locally without a network round-trip or downloaded vocabulary.
+
+    Words are split like the BPE pre-tokenizer; common short words count as one token and
+    longer ones as several. Actual usage reported by the API can be fed back through
+    ``observe`` to calibrate the estimate for the deployed model.
+    """
+
+    def __init__(self, calibration_smoothing: float = 0.2):
+        self.calibration_smoothing = calibration_smoothing
+        self.calibration = 1.0
+        self._lock = threading.Lock()
+
+    def count_raw(self, text: str) -> int:
+        """Count tokens with the uncalibrated local tokenizer."""
+        if not text:
+            return 0
+
+        tokens = 0
+        for match in _PRETOKEN_PATTERN.finditer(text):
+            piece = match.group(0)
+            if piece.isspace():
+                # Runs of whitespace collapse into a token per line break at most
+                tokens += piece.count('\n') or (1 if len(piece) > 1 else 0)
+            elif piece[0].isalpha():
+                # Frequent words are single tokens; long/rare words split into ~5-char pieces
+                tokens += 1 if len(piece) <= 7 else math.ceil(len(piece) / 5)
+            else:
+                tokens += math.ceil(len(piece) / 2) if not piece[0].isdigit() else 1
+        return tokens
+
+    def count(self, text: str) -> int:
+        """Estimate the number of tokens in ``text``."""
+        return int(round(self.count_raw(text) * self.calibration))
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """Estimate prompt tokens for a list of chat messages."""
+        return sum(
+            _MESSAGE_OVERHEAD_TOKENS + self.count(message.get("content", ""))
+            for message in messages
+        ) + _REPLY_PRIMING_TOKENS
+
+    def observe(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Update the calibration factor from an estimate and the API-reported actual count."""
+        if not actual_tokens or not estimated_tokens:
+            return
+
+        with self._lock:
+            ratio = actual_tokens / (estimated_tokens / self.calibration)
+            self.calibration += self.calibration_smoothing * (ratio - self.calibration)
+
+
+class TokenBudgetPlanner:
+    """Chooses how to send a transcript to the LLM within a token budget.
+
+    Strategies, in order of preference:
+      - ``single_shot``: the prompt fits as-is
+      - ``compacted``: the prompt fits after compacting the transcript
+      - ``chunked``: the transcript is split and processed map-reduce (when the caller supports it)
+
+    ``chunk_token_threshold`` is the soft limit above which chunking is preferred;
+    ``max_prompt_tokens`` is the hard limit no single request may exceed.
+    """
+
+    def __init__(self, estimator: TokenEstimator, max_prompt_tokens: int = 100000,
+                 chunk_token_threshold: int = 12000):
+        self.estimator = estimator
+        self.max_prompt_tokens = max_prompt_tokens
+        self.chunk_token_threshold = chunk_token_threshold
+
+    def plan(self, transcript: str, prompt_overhead_tokens: int,
+             compact: Callable[[str], str], allow_chunking: bool = True) -> Dict:
+        """Plan the strategy for a transcript.
+
+        Args:
+            transcript: Speaker-annotated transcript
+            prompt_overhead_tokens: Tokens used by the prompt template without the transcript
+            compact: Function producing the compacted transcript
+            allow_chunking: Whether the caller can process the transcript in chunks
+
+        Returns:
+            Dict with 'strategy', 'transcript' to send and token estimates
+
+        Raises:
+            TokenBudgetExceededError: If no strategy fits within ``max_prompt_tokens``
+        """
+        limit = self.chunk_token_threshold if allow_chunking else self.max_prompt_tokens
+        transcript_tokens = self.estimator.count(transcript)
+        plan = {
+            'strategy': 'single_shot',
+            'transcript': transcript,
+            'original_transcript_tokens': transcript_tokens,
+            'transcript_tokens': transcript_tokens,
+            'estimated_prompt_tokens': transcript_tokens + prompt_overhead_tokens,
+            'budget_tokens': limit
+        }
+
+        if plan['estimated_prompt_tokens'] <= limit:
+            return self._log_plan(plan)
+
+        compacted = compact(transcript)
+        compacted_tokens = self.estimator.count(compacted)
+        plan.update({
+            'transcript': compacted,
+            'transcript_tokens': compacted_tokens,
+            'estimated_prompt_tokens': compacted_tokens + prompt_overhead_tokens
+        })
+
+        if plan['estimated_prompt_tokens'] <= limit:
+            plan['strategy'] = 'compacted'
+            return self._log_plan(plan)
+
+        if allow_chunking:
+            plan['strategy'] = 'chunked'
+            return self._log_plan(plan)
+
+        raise TokenBudgetExceededError(
+            f"Prompt needs about {plan['estimated_prompt_tokens']} tokens after compaction, "
+            f"above the budget of {self.max_prompt_tokens}"
+        )
+
+    def _log_plan(self, plan: Dict) -> Dict:
+        logger.info("token_budget_planned",
+                   strategy=plan['strategy'],
+                   original_transcript_tokens=plan['original_transcript_tokens'],
+                   transcript_tokens=plan['transcript_tokens'],
+                   estimated_prompt_tokens=plan['estimated_prompt_tokens'],
+                   budget_tokens=plan['budget_tokens'])
+        return plan
@@ -0,0 +1,163 @@
+"""Structured speaker-annotated transcript shared by transcription and the LLM service."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .token_budget import TokenEstimator
+from .transcript_compaction import parse_turns
+
+_default_estimator = TokenEstimator()
+
+
+class Turn:
+    """One speaker turn: consecutive words by the same speaker."""
+
+    __slots__ = ('speaker', 'text', 'start', 'end', 'word_count')
+
+    def __init__(self, speaker: str, text: str, start: Optional[float] = None,
+                 end: Optional[float] = None, word_count: Optional[int] = None):
+        self.speaker = speaker
+        self.text = text
+        self.start = start
+        self.end = end
+        self.word_count = word_count if word_count is not None else len(text.split())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'speaker': self.speaker,
+            'text': self.text,
+            'start': self.start,
+            'end': self.end,
+            'word_count': self.word_count
+        }
+
+
+class Transcript:
+    """Speaker turns with time offsets, parsed once and serialized on demand.
+
+    Build it from Whisper words with ``from_words`` (or from an existing
+    ``Speaker: "text"`` string with ``parse``) and pass it to ``LLMService`` in place of
+    the string. Participants, the prompt string and the token count are computed on
+    first use and cached.
+    """
+
+    def __init__(self, turns: List[Turn], duration: Optional[float] = None,
+                 text: Optional[str] = None):
+        self.turns = turns
+        self.duration = duration
+        self._text = text
+        self._participants: Optional[List[str]] = None
+        self._token_count: Optional[int] = None
+
+    @classmethod
+    def from_words(cls, words_with_speakers: Iterable[Dict[str, Any]],
+                   duration: Optional[float] = None) -> 'Transcript':
+        """Group word dicts (``word``, ``start``, ``end``, ``speaker``) into speaker turns."""
+        turns: List[Turn] = []
+        current_speaker = None
+        current_words: List[Dict[str, Any]] = []
+
+        def flush():
+            if current_words and current_speaker:
+                text = ''.join(word_info['word'] for word_info in current_words).strip()
+                if text:
+                    turns.append(Turn(current_speaker, text, current_words[0].get('start'),
+                                      current_words[-1].get('end'), len(current_words)))
+
+        for word_info in words_with_speakers:
+            speaker = word_info['speaker']
+            if speaker != current_speaker:
+                flush()
+                current_words = []
+                current_speaker = speaker
+            current_words.append(word_info)
+        flush()
+
+        return cls(turns, duration=duration)
+
+    @classmethod
+    def from_word_table(cls, table, duration: Optional[float] = None) -> 'Transcript':
+        """Group a speaker-labelled ``WordTable`` into turns without per-word dicts."""
+        import numpy as np
+
+        turns: List[Turn] = []
+        if table.speaker_ids is None or not len(table.speaker_ids):
+            return cls(turns, duration=duration)
+
+        speaker_ids = table.speaker_ids
+        boundaries = np.flatnonzero(np.diff(speaker_ids)) + 1
+        run_starts = np.concatenate([[0], boundaries]).tolist()
+        run_ends = np.concatenate([boundaries, [len(speaker_ids)]]).tolist()
+        texts, text_ids = table.texts, table.text_ids.tolist()
+        for first, last in zip(run_starts, run_ends):
+            text = ''.join(texts[text_id] for text_id in text_ids[first:last]).strip()
+            if text:
+                turns.append(Turn(table.speakers[speaker_ids[first]], text,
+                                  round(float(table.starts[first]), 3), round(float(table.ends[last - 1]), 3),
+                                  last - first))
+        return cls(turns, duration=duration)
+
+    @classmethod
+    def parse(cls, speaker_annotated_transcript: str) -> 'Transcript':
+        """Parse a ``Speaker: "text"`` transcript; turns have no time offsets."""
+        turns = [Turn(speaker, text) for speaker, text in parse_turns(speaker_annotated_transcript)]
+        return cls(turns, text=speaker_annotated_transcript)
+
+    @classmethod
+    def coerce(cls, transcript: Union[str, 'Transcript']) -> 'Transcript':
+        """Return ``transcript`` unchanged if already structured, otherwise parse it."""
+        return transcript if isinstance(transcript, Transcript) else cls.parse(transcript)
+
+    @property
+    def text(self) -> str:
+        """The ``Speaker: "text"`` prompt string, serialized on first access."""
+        if self._text is None:
+            self._text = '\n\n'.join(f'{turn.speaker}: "{turn.text}"' for turn in self.turns)
+        return self._text
+
+    @property
+    def speakers(self) -> List[str]:
+        """Speakers in order of first appearance."""
+        return list(dict.fromkeys(turn.speaker for turn in self.turns if turn.speaker))
+
+    @property
+    def participants(self) -> List[str]:
+        """Sorted named participants, excluding unknown speakers."""
+        if self._participants is None:
+            names = {speaker.strip('"\'') for speaker in self.speakers}
+            self._participants = sorted(
+                name for name in names if len(name) > 1 and not name.startswith('Unknown')
+            )
+        return self._participants
+
+    @property
+    def offsets(self) -> List[Tuple[Optional[float], Optional[float]]]:
+        """(start, end) time of every turn in seconds; None when parsed from text."""
+        return [(turn.start, turn.end) for turn in self.turns]
+
+    @property
+    def word_count(self) -> int:
+        return sum(turn.word_count for turn in self.turns)
+
+    @property
+    def token_count(self) -> int:
+        """Estimated tokens of the serialized transcript (uncalibrated local estimate)."""
+        if self._token_count is None:
+            self._token_count = _default_estimator.count_raw(self.text)
+        return self._token_count
+
+    def turn_pairs(self) -> List[Tuple[str, str]]:
+        """Turns as (speaker, text) pairs."""
+        return [(turn.speaker, turn.text) for turn in self.turns]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'turns': [turn.to_dict() for turn in self.turns],
+            'speakers': self.speakers,
+            'duration': self.duration
+        }
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return len(self.text)
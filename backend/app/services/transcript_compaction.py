@@ -0,0 +1,247 @@
+"""Compaction of speaker-annotated transcripts to reduce LLM prompt tokens."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import re
+
+from .token_budget import TokenEstimator
+
+_WHITESPACE = re.compile(r"\s+")
+_TURN_BOUNDARY = re.compile(r"\n[ \t]*\n")
+_TURN_START = re.compile(r'^\s*[^\s:"][^:"\n]*:\s*"')
+
+# Hesitation sounds are never content; discourse fillers only when set off by commas
+# ("so, like, we..." or "you know, ...") so that "I like it" survives.
+_HESITATION_PATTERN = re.compile(r"(?:,\s*)?\b(?:u+[hm]+|e+r+m*|hmm+|mm+)\b(?:\s*,)?", re.IGNORECASE)
+_DISCOURSE_FILLER_PATTERN = re.compile(
+    r"(?:^|,|(?<=[.!?;]))\s*(?:like|you know|i mean|basically|actually)\s*(?:,|(?=[.!?;]|$))",
+    re.IGNORECASE
+)
+_REPEATED_COMMAS = re.compile(r"\s*,(?:\s*,)+")
+_SPACE_BEFORE_PUNCTUATION = re.compile(r"\s+([,.!?;])")
+_COMMA_BEFORE_STOP = re.compile(r",+(?=[.!?;])")
+_LEADING_PUNCTUATION = re.compile(r"^[\s,.;]+")
+
+# Turns consisting only of these are listener feedback rather than content
+BACKCHANNELS = {
+    "yeah", "yes", "yep", "yup", "okay", "ok", "right", "sure", "mm-hmm", "mhm", "uh-huh",
+    "got it", "cool", "nice", "great", "exactly", "totally", "true", "i see", "oh"
+}
+
+ALIAS_PREFIXES = ("S", "SPK", "SPEAKER")
+
+
+def parse_turns(speaker_annotated_transcript: str) -> List[Tuple[str, str]]:
+    """Split a ``Speaker: "text"`` transcript into (speaker, text) turns.
+
+    Turns are separated by blank lines, as written by ``Transcript.text``. Inside a
+    block a line only starts a new turn when the previous turn's quote is closed
+    and the line itself opens with ``Name: "``; any other line continues the turn,
+    so a quoted text spanning several lines (``Note: the deadline moved.``) stays
+    one turn instead of inventing a speaker.
+    """
+    turns = []
+    for block in _TURN_BOUNDARY.split(speaker_annotated_transcript):
+        current: List[str] = []
+        for line in block.strip().splitlines():
+            if current and _TURN_START.match(line) and _is_closed_quote(current[-1]):
+                turns.append(_split_turn("\n".join(current)))
+                current = []
+            current.append(line)
+        if current:
+            turns.append(_split_turn("\n".join(current)))
+    return [turn for turn in turns if turn[0] or turn[1]]
+
+
+def _is_closed_quote(line: str) -> bool:
+    line = line.strip()
+    return len(line) >= 2 and line.endswith('"')
+
+
+def _split_turn(turn: str) -> Tuple[str, str]:
+    turn = turn.strip()
+    speaker, separator, text = turn.partition(':')
+    if not separator:
+        speaker, text = "", turn
+    text = text.strip()
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        text = text[1:-1]
+    return speaker.strip(), text.strip()
+
+
+def strip_disfluencies(text: str) -> str:
+    """Remove hesitations ("um", "uh") and comma-delimited fillers ("like", "you know")."""
+    text = _DISCOURSE_FILLER_PATTERN.sub(' ', text)
+    text = _HESITATION_PATTERN.sub(' ', text)
+    text = _REPEATED_COMMAS.sub(',', text)
+    text = _SPACE_BEFORE_PUNCTUATION.sub(r'\1', text)
+    text = _COMMA_BEFORE_STOP.sub('', text)
+    text = _LEADING_PUNCTUATION.sub('', _WHITESPACE.sub(' ', text)).strip()
+    return text[:1].upper() + text[1:] if text else text
+
+
+def is_backchannel(text: str) -> bool:
+    """Whether a turn is only listener feedback such as "yeah" or "mm-hmm"."""
+    normalized = re.sub(r"[^\w\s'-]", ' ', text.lower())
+    normalized = _WHITESPACE.sub(' ', normalized).strip()
+    return bool(normalized) and normalized in BACKCHANNELS
+
+
+def compact_turns(turns: List[Tuple[str, str]], strip_fillers: bool = True,
+                  drop_backchannels: bool = True) -> List[Tuple[str, str]]:
+    """Clean turns and merge consecutive turns by the same speaker.
+
+    A backchannel micro-turn is dropped when the other speaker carries on around it
+    (A, B: "yeah", A), which lets A's interrupted turns merge. It is kept after a
+    question, where "yes" may be a commitment.
+    """
+    cleaned = []
+    for speaker, text in turns:
+        text = _WHITESPACE.sub(' ', text).strip()
+        if strip_fillers:
+            text = strip_disfluencies(text)
+        if text:
+            cleaned.append((speaker, text))
+
+    merged: List[Tuple[str, str]] = []
+    for index, (speaker, text) in enumerate(cleaned):
+        if drop_backchannels and 0 < index < len(cleaned) - 1 and merged and is_backchannel(text):
+            previous_speaker, previous_text = merged[-1]
+            if (previous_speaker == cleaned[index + 1][0] and previous_speaker != speaker
+                    and not previous_text.endswith('?')):
+                continue
+        if merged and merged[-1][0] == speaker:
+            merged[-1] = (speaker, f"{merged[-1][1]} {text}")
+        else:
+            merged.append((speaker, text))
+    return merged
+
+
+def format_turns(turns: List[Tuple[str, str]]) -> str:
+    return '\n'.join(f"{speaker}: {text}" if speaker else text for speaker, text in turns)
+
+
+def compact_transcript(speaker_annotated_transcript: str) -> str:
+    """Merge consecutive turns by the same speaker, drop fillers/backchannels and collapse whitespace."""
+    return format_turns(compact_turns(parse_turns(speaker_annotated_transcript)))
+
+
+class CompactedTranscript:
+    """A compacted transcript with speakers aliased to short tags.
+
+    ``text`` holds one ``S1: ...`` line per turn; ``header`` maps tags back to names and
+    must accompany the text in the prompt. Model output is passed through ``expand`` (or
+    ``expand_data`` for parsed JSON) to restore the full names.
+    """
+
+    def __init__(self, text: str, aliases: Dict[str, str], stats: Dict[str, Any]):
+        self.text = text
+        self.aliases = aliases
+        self.stats = stats
+        self._alias_pattern = (
+            re.compile(r"\b(" + "|".join(re.escape(tag) for tag in aliases) + r")\b") if aliases else None
+        )
+
+    @classmethod
+    def build(cls, speaker_annotated_transcript: str,
+              count_tokens: Optional[Callable[[str], int]] = None,
+              strip_fillers: bool = True, drop_backchannels: bool = True,
+              alias_speakers: bool = True,
+              turns: Optional[List[Tuple[str, str]]] = None) -> 'CompactedTranscript':
+        """Compact a ``_format_as_conversation`` transcript and measure the token reduction.
+
+        ``turns`` can pass already parsed (speaker, text) turns to skip re-parsing.
+        """
+        count_tokens = count_tokens or TokenEstimator().count
+        if turns is None:
+            turns = parse_turns(speaker_annotated_transcript)
+        compacted = compact_turns(turns, strip_fillers=strip_fillers, drop_backchannels=drop_backchannels)
+
+        aliases: Dict[str, str] = {}
+        if alias_speakers:
+            aliases = _assign_aliases(compacted)
+            names_to_tags = {name: tag for tag, name in aliases.items()}
+            compacted = [(names_to_tags.get(speaker, speaker), text) for speaker, text in compacted]
+
+        transcript = cls(format_turns(compacted), aliases, {})
+        original_tokens = count_tokens(speaker_annotated_transcript)
+        compacted_tokens = count_tokens(transcript.render())
+        transcript.stats = {
+            'original_tokens': original_tokens,
+            'compacted_tokens': compacted_tokens,
+            'tokens_reduced': original_tokens - compacted_tokens,
+            'reduction_ratio': round(1 - compacted_tokens / original_tokens, 3) if original_tokens else 0.0,
+            'original_turns': len(turns),
+            'compacted_turns': len(compacted),
+            'speaker_aliases': len(aliases)
+        }
+        return transcript
+
+    @property
+    def header(self) -> str:
+        if not self.aliases:
+            return ""
+        mapping = "; ".join(f"{tag} = {name}" for tag, name in self.aliases.items())
+        return f"Speakers: {mapping}. Use full names in the answer."
+
+    def render(self, text: Optional[str] = None) -> str:
+        """Prefix ``text`` (default: the whole compacted transcript) with the speaker header."""
+        text = self.text if text is None else text
+        return f"{self.header}\n\n{text}" if self.header else text
+
+    def expand(self, output: str) -> str:
+        """Replace speaker tags in model output with the full speaker names."""
+        if self._alias_pattern is None or not output:
+            return output
+        return self._alias_pattern.sub(lambda m: self.aliases[m.group(1)], output)
+
+    def expand_data(self, data: Any) -> Any:
+        """Expand speaker tags in every string (and dict key) of parsed JSON output."""
+        if isinstance(data, str):
+            return self.expand(data)
+        if isinstance(data, list):
+            return [self.expand_data(item) for item in data]
+        if isinstance(data, dict):
+            return {self.expand(key) if isinstance(key, str) else key: self.expand_data(value)
+                    for key, value in data.items()}
+        return data
+
+
+def _assign_aliases(turns: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Map short tags to speaker names in order of first appearance.
+
+    Uses the first tag prefix that does not already occur in the spoken text, so that
+    expanding the model output cannot rewrite words that were actually said.
+    """
+    speakers = list(dict.fromkeys(speaker for speaker, _ in turns if speaker))
+    spoken = "\n".join(text for _, text in turns)
+    for prefix in ALIAS_PREFIXES:
+        if speakers and not re.search(rf"\b{prefix}\d+\b", spoken + "\n" + "\n".join(speakers)):
+            return {f"{prefix}{index + 1}": speaker for index, speaker in enumerate(speakers)}
+    return {}
+
+
+class StreamingTagExpander:
+    """Expands speaker tags in streamed model output.
+
+    A delta may end inside a tag ("@S" then "1 will..."), so the trailing partial word is
+    held back until the next delta or ``flush``.
+    """
+
+    _TRAILING_WORD = re.compile(r"\w*$")
+
+    def __init__(self, compaction: CompactedTranscript, emit: Callable[[str], None]):
+        self.compaction = compaction
+        self.emit = emit
+        self._pending = ""
+
+    def __call__(self, delta: str):
+        self._pending += delta
+        split_at = self._TRAILING_WORD.search(self._pending).start()
+        ready, self._pending = self._pending[:split_at], self._pending[split_at:]
+        if ready:
+            self.emit(self.compaction.expand(ready))
+
+    def flush(self):
+        if self._pending:
+            self.emit(self.compaction.expand(self._pending))
+            self._pending = ""
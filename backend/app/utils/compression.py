@@ -0,0 +1,91 @@
+"""Response compression that leaves server-sent event streams alone.
+
+Starlette's ``GZipMiddleware`` also wraps ``text/event-stream`` responses, where the
+compressor holds events back until its buffer fills. This middleware compresses only
+responses sent as one body of known ``Content-Length``, uses brotli when it is installed,
+configured and accepted by the client, and passes streamed, chunked and already-encoded
+bodies through untouched, without holding them in memory.
+"""
+
+from typing import Optional
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+COMPRESSION_MODES = ("none", "gzip", "br")
+
+
+class CompressionMiddleware:
+    """Compress HTTP responses larger than ``minimum_size`` with gzip or brotli."""
+
+    def __init__(self, app: ASGIApp, mode: str = "gzip", minimum_size: int = 1024,
+                 gzip_level: int = 6, brotli_quality: int = 5):
+        if mode not in COMPRESSION_MODES:
+            raise ValueError(f"Unknown compression mode: {mode}")
+        self.app = app
+        self.mode = mode
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _encoding(self, scope: Scope) -> Optional[str]:
+        accepted = Headers(scope=scope).get('accept-encoding', '')
+        if self.mode == 'br' and brotli is not None and 'br' in accepted:
+            return 'br'
+        if self.mode in ('gzip', 'br') and 'gzip' in accepted:
+            return 'gzip'
+        return None
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        encoding = self._encoding(scope) if scope['type'] == 'http' else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start, passthrough
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message['headers'])
+                # Only complete bodies of known size are compressed; streams go out as produced
+                if ('text/event-stream' in headers.get('content-type', '') or 'content-encoding' in headers
+                        or 'content-length' not in headers):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+            if passthrough or message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            passthrough = True
+            body = message.get('body', b'')
+            if message.get('more_body', False):
+                await send(start)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start['headers'])
+            if len(body) >= self.minimum_size:
+                body = self._compress(body, encoding)
+                headers['Content-Encoding'] = encoding
+                headers['Content-Length'] = str(len(body))
+                headers.add_vary_header('Accept-Encoding')
+            await send(start)
+            await send({'type': 'http.response.body', 'body': body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,86 @@
+"""Fast, NumPy-aware JSON serialization for meeting results and API responses.
+
+Uses orjson when it is installed (it serializes NumPy arrays and scalars natively) and
+falls back to the standard library otherwise. Output is always compact UTF-8 bytes.
+Parts that appear in several documents, like the segment list written to the result
+file and returned by ``/process``, can be serialized once and embedded as ``RawJSON``.
+"""
+
+from typing import Any, Dict
+import json
+import uuid
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# How deep in nested dicts ``dumps`` looks for RawJSON values
+_RAW_DEPTH = 3
+
+
+class RawJSON:
+    """Already-serialized JSON embedded verbatim by ``dumps``."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, 'tolist'):  # NumPy arrays and scalars (json fallback)
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _encode(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes.
+
+    ``RawJSON`` values are spliced in verbatim; they are looked for as dict values up to
+    ``_RAW_DEPTH`` levels deep (document fields, not list items).
+    """
+    raw_parts: Dict[bytes, bytes] = {}
+
+    def substitute(value: Any, depth: int) -> Any:
+        if isinstance(value, RawJSON):
+            marker = f"__raw_json_{uuid.uuid4().hex}__"
+            raw_parts[f'"{marker}"'.encode()] = value.data
+            return marker
+        # Only dicts on the path to a RawJSON are copied
+        if isinstance(value, dict) and depth < _RAW_DEPTH and _contains_raw(value, depth):
+            return {key: substitute(item, depth + 1) for key, item in value.items()}
+        return value
+
+    data = _encode(substitute(obj, 0))
+    for marker, raw in raw_parts.items():
+        data = data.replace(marker, raw, 1)
+    return data
+
+
+def _contains_raw(value: Any, depth: int) -> bool:
+    if isinstance(value, RawJSON):
+        return True
+    if isinstance(value, dict) and depth < _RAW_DEPTH:
+        return any(_contains_raw(item, depth + 1) for item in value.values())
+    return False
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with ``dumps``: NumPy-aware, compact, ``RawJSON``-aware."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
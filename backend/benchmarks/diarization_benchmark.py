@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare the pyannote and lightweight diarization backends for speed and DER.
+
+Without ``--reference`` RTTM files, pyannote's output is used as the reference, so the
+reported DER is the lightweight backend's disagreement with pyannote.
+
+    python benchmarks/diarization_benchmark.py ../data/audio_test_files_1/sample_meeting_sparsh_aadil_sami.m4a
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+from app.pipeline.processor import AudioProcessor, SpeakerDiarizer
+from app.pipeline.diarization_metrics import diarization_error_rate, load_rttm
+
+load_dotenv()
+
+DEFAULT_AUDIO = Path(__file__).resolve().parents[2] / "data" / "audio_test_files_1" / "sample_meeting_sparsh_aadil_sami.m4a"
+
+
+def time_backend(diarizer: SpeakerDiarizer, wav_path: Path, backend: str, num_speakers=None):
+    """Run one backend twice: the first run includes model loading (cold), the second does not."""
+    timings = []
+    result = None
+    for _ in range(2):
+        started = time.perf_counter()
+        result = diarizer.diarize(wav_path, num_speakers=num_speakers, backend=backend)
+        timings.append(time.perf_counter() - started)
+    return result, {'cold_seconds': round(timings[0], 3), 'warm_seconds': round(timings[1], 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark diarization backends")
+    parser.add_argument("audio_files", nargs="*", type=Path, default=[DEFAULT_AUDIO])
+    parser.add_argument("--reference", nargs="*", type=Path, default=[],
+                        help="RTTM reference per audio file (default: pyannote output)")
+    parser.add_argument("--num-speakers", type=int, default=None)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    hf_token = os.getenv("HUGGINGFACE_TOKEN")
+    if not hf_token:
+        print("❌ HUGGINGFACE_TOKEN required")
+        return
+
+    audio_processor = AudioProcessor()
+    diarizer = SpeakerDiarizer(hf_token)
+    results = []
+
+    for index, audio_file in enumerate(args.audio_files):
+        wav_path = audio_processor.convert_to_wav(audio_file, audio_file.with_suffix('.bench.wav'))
+        waveform, sample_rate = diarizer.load_waveform(wav_path)
+        duration = len(waveform) / sample_rate
+
+        pyannote_result, pyannote_timing = time_backend(diarizer, wav_path, 'pyannote', args.num_speakers)
+        light_result, light_timing = time_backend(diarizer, wav_path, 'light', args.num_speakers)
+
+        reference = (load_rttm(args.reference[index]) if index < len(args.reference)
+                     else pyannote_result['segments'])
+        entry = {
+            'file': audio_file.name,
+            'duration_seconds': round(duration, 2),
+            'reference': 'rttm' if index < len(args.reference) else 'pyannote',
+            'pyannote': {**pyannote_timing, 'speakers': pyannote_result['total_speakers'],
+                         'real_time_factor': round(pyannote_timing['warm_seconds'] / duration, 4)},
+            'light': {**light_timing, 'speakers': light_result['total_speakers'],
+                      'real_time_factor': round(light_timing['warm_seconds'] / duration, 4),
+                      **diarization_error_rate(reference, light_result['segments'])}
+        }
+        if index < len(args.reference):
+            entry['pyannote'].update(diarization_error_rate(reference, pyannote_result['segments']))
+        results.append(entry)
+
+        print(f"\n🎧 {audio_file.name} ({duration:.1f}s, reference: {entry['reference']})")
+        for backend in ('pyannote', 'light'):
+            stats = entry[backend]
+            der = f"DER {stats['der']:.1%}" if 'der' in stats else "DER n/a (reference)"
+            print(f"   {backend:9s} cold {stats['cold_seconds']:7.2f}s  warm {stats['warm_seconds']:7.2f}s  "
+                  f"RTF {stats['real_time_factor']:.3f}  speakers {stats['speakers']}  {der}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
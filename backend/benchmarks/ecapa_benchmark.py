@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Check parity and speed of the optimized ECAPA speaker-encoder backends on CPU.
+
+Each backend embeds the sample voice files and is compared with the eager SpeechBrain
+model (cosine similarity per file, must stay >= --threshold), then timed on batches of
+1.5s windows, the shape the lightweight diarizer and speaker matching use.
+
+    python benchmarks/ecapa_benchmark.py --threads 4
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from pathlib import Path
+import numpy as np
+import torch
+import torchaudio
+from speechbrain.pretrained import EncoderClassifier
+from app.core.config import get_settings
+from app.pipeline.ecapa_backends import ECAPAEncoder, embedding_parity
+
+DEFAULT_SAMPLES = sorted((Path(__file__).resolve().parents[2] / "data" / "audio_test_files_1").glob("voice_sample_*.wav"))
+BACKENDS = [('torchscript', False), ('onnx', False), ('onnx', True)]
+
+
+def load_mono(path: Path) -> torch.Tensor:
+    waveform, sample_rate = torchaudio.load(str(path))
+    if sample_rate != 16000:
+        waveform = torchaudio.functional.resample(waveform, sample_rate, 16000)
+    return waveform.mean(dim=0, keepdim=True)
+
+
+def embed_files(encoder, waveforms):
+    with torch.no_grad():
+        return np.stack([encoder.encode_batch(waveform).squeeze().numpy() for waveform in waveforms])
+
+
+def time_windows(encoder, windows: torch.Tensor, batch_size: int, repeats: int) -> float:
+    """Best-of-``repeats`` seconds to embed all windows in batches."""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        with torch.no_grad():
+            for first in range(0, len(windows), batch_size):
+                encoder.encode_batch(windows[first:first + batch_size])
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ECAPA encoder backends")
+    parser.add_argument("voice_samples", nargs="*", type=Path, default=DEFAULT_SAMPLES)
+    parser.add_argument("--threshold", type=float, default=0.99, help="Minimum cosine vs eager")
+    parser.add_argument("--windows", type=int, default=64, help="1.5s windows to time")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=None, help="torch/ORT intra-op threads")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    if not args.voice_samples:
+        print("❌ No voice samples found")
+        return
+
+    classifier = EncoderClassifier.from_hparams(
+        source="speechbrain/spkrec-ecapa-voxceleb",
+        savedir="pretrained_models/spkrec-ecapa-voxceleb"
+    )
+    waveforms = [load_mono(path) for path in args.voice_samples]
+    longest = torch.cat(waveforms, dim=1)[0]
+    window = 24000
+    starts = np.linspace(0, max(0, len(longest) - window), args.windows).astype(int)
+    windows = torch.stack([longest[start:start + window] for start in starts])
+
+    reference = embed_files(classifier, waveforms)
+    eager_seconds = time_windows(classifier, windows, args.batch_size, args.repeats)
+    print(f"\n🎙️  {len(waveforms)} voice samples, {len(windows)} x 1.5s windows, "
+          f"batch {args.batch_size}, {torch.get_num_threads()} threads")
+    print(f"   eager        {eager_seconds:7.3f}s")
+
+    report = [{'backend': 'eager', 'seconds': round(eager_seconds, 4), 'speedup': 1.0, 'min_cosine': 1.0}]
+    export_dir = get_settings().ecapa_export_dir
+    for backend, quantize in BACKENDS:
+        try:
+            encoder = ECAPAEncoder(classifier, backend, export_dir, quantize=quantize)
+        except Exception as e:
+            print(f"   {backend:12s} ⚠️  unavailable: {e}")
+            continue
+        parity = embedding_parity(reference, embed_files(encoder, waveforms))
+        seconds = time_windows(encoder, windows, args.batch_size, args.repeats)
+        passed = parity['min_cosine'] >= args.threshold
+        print(f"   {encoder.name:12s} {seconds:7.3f}s  x{eager_seconds / seconds:4.2f}  "
+              f"min cosine {parity['min_cosine']:.4f} {'✅' if passed else '❌'}")
+        report.append({'backend': encoder.name, 'seconds': round(seconds, 4),
+                       'speedup': round(eager_seconds / seconds, 3), 'passed': passed, **parity})
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
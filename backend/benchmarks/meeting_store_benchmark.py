@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Partial meeting retrieval: parse the full result file vs query the SQLite meeting store.
+
+Writes synthetic long meetings both as ``data/results``-style JSON files and into a
+``MeetingStore``, then times fetching a 5-minute transcript slice and the insights
+alone each way. Needs only NumPy; uses orjson when it is installed.
+
+    python benchmarks/meeting_store_benchmark.py --meetings 50 --segments 2000
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from app.pipeline.meeting_store import MeetingStore
+from app.pipeline.segments import Segment
+from app.services.transcript import Transcript, Turn
+from app.utils.serialization import dumps
+
+
+def synthetic_result(segment_count: int, rng: random.Random):
+    segments, cursor = [], 0.0
+    for index in range(segment_count):
+        duration = rng.uniform(0.5, 12.0)
+        segment = Segment(cursor, cursor + duration, f"SPEAKER_{index % 5:02d}",
+                          matched_speaker=f"Speaker {index % 5}", similarity_score=rng.random())
+        segment.text = " ".join(rng.choice(["we", "should", "ship", "the", "docs", "friday"])
+                                for _ in range(int(duration * 2.5)))
+        segments.append(segment)
+        cursor += duration + 0.3
+    transcript = Transcript([Turn(s.matched_speaker, s.text, s.start, s.end) for s in segments], cursor)
+    return {
+        'segments': segments,
+        'transcript': transcript,
+        'processing_metadata': {'total_duration': cursor, 'speakers_identified': 5},
+        'llm_insights': {'summary': 'Synthetic meeting. ' * 40, 'action_items': [{'task': 'Docs'}] * 10},
+    }
+
+
+def timed(function, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark partial meeting retrieval")
+    parser.add_argument("--meetings", type=int, default=50)
+    parser.add_argument("--segments", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results_dir = Path(temp_dir) / "results"
+        results_dir.mkdir()
+        store = MeetingStore(Path(temp_dir) / "meetings.sqlite3")
+        for index in range(args.meetings):
+            result = synthetic_result(args.segments, rng)
+            (results_dir / f"meeting_{index}.json").write_bytes(dumps(result))
+            store.save(str(index), result)
+
+        meeting_ids = [str(rng.randrange(args.meetings)) for _ in range(args.repeats)]
+        ids = iter(meeting_ids * 4)
+
+        def file_slice():
+            with open(results_dir / f"meeting_{next(ids)}.json", 'rb') as f:
+                result = json.load(f)
+            return [s for s in result['segments'] if s['start'] < 900 and s['end'] > 600]
+
+        def file_insights():
+            with open(results_dir / f"meeting_{next(ids)}.json", 'rb') as f:
+                return json.load(f)['llm_insights']
+
+        report = {
+            'meetings': args.meetings,
+            'segments_per_meeting': args.segments,
+            'file_slice_ms': timed(file_slice, args.repeats) * 1000,
+            'store_slice_ms': timed(lambda: dumps(store.get_transcript(next(ids), 600, 900)), args.repeats) * 1000,
+            'file_insights_ms': timed(file_insights, args.repeats) * 1000,
+            'store_insights_ms': timed(lambda: dumps({'insights': store.get_insights(next(ids))}), args.repeats) * 1000,
+        }
+
+    print(f"\n🗄️  {args.meetings} meetings x {args.segments:,} segments")
+    print(f"   transcript 10:00-15:00  file {report['file_slice_ms']:7.2f} ms   store {report['store_slice_ms']:7.2f} ms")
+    print(f"   insights only           file {report['file_insights_ms']:7.2f} ms   store {report['store_insights_ms']:7.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
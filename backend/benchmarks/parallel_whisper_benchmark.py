@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Scaling of chunk-parallel Whisper transcription with worker count.
+
+Transcribes the same recording sequentially and with each worker count, reporting wall
+time, speedup and WER against the sequential transcript (stitching errors show up as
+insertions/deletions around chunk cuts). The first parallel call per worker count
+starts the pool and loads the models, so it is excluded from timing.
+
+    python benchmarks/parallel_whisper_benchmark.py long_meeting.wav --workers 2 4 8 16
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from pathlib import Path
+from faster_whisper import decode_audio
+from app.pipeline.processor import Transcriber
+from app.pipeline.transcription_metrics import word_error_rate
+
+
+def transcript_text(words):
+    return " ".join(word['word'].strip() for word in words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunk-parallel Whisper transcription")
+    parser.add_argument("audio_file", type=Path, help="A long recording (several chunks)")
+    parser.add_argument("--workers", nargs="+", type=int, default=[2, 4, 8])
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--chunk-seconds", type=float, default=60.0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    audio = decode_audio(str(args.audio_file), sampling_rate=16000)
+    duration = len(audio) / 16000
+
+    sequential = Transcriber(args.model)
+    sequential._load_model()
+    started = time.perf_counter()
+    reference_words, _ = sequential.transcribe_words(audio)
+    sequential_seconds = time.perf_counter() - started
+    reference = transcript_text(reference_words)
+
+    print(f"\n🎧 {args.audio_file.name} ({duration:.0f}s), model {args.model}, {os.cpu_count()} cores")
+    print(f"   sequential   {sequential_seconds:8.2f}s  RTF {sequential_seconds / duration:.3f}")
+    report = [{'workers': 1, 'seconds': round(sequential_seconds, 3), 'speedup': 1.0, 'wer': 0.0}]
+
+    for workers in args.workers:
+        transcriber = Transcriber(args.model, parallel_workers=workers, parallel_chunk_seconds=args.chunk_seconds)
+        transcriber.transcribe_words(audio)  # warm the pool
+        started = time.perf_counter()
+        words, _ = transcriber.transcribe_words(audio)
+        seconds = time.perf_counter() - started
+        transcriber.parallel.close()
+
+        wer = word_error_rate(reference, transcript_text(words))
+        print(f"   {workers:2d} workers   {seconds:8.2f}s  RTF {seconds / duration:.3f}  "
+              f"x{sequential_seconds / seconds:5.2f}  WER vs sequential {wer['wer']:.2%}")
+        report.append({'workers': workers, 'seconds': round(seconds, 3),
+                       'speedup': round(sequential_seconds / seconds, 3), **wer})
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
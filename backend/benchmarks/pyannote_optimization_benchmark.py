@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Compare eager and optimized pyannote diarization on CPU for throughput and DER parity.
+
+Profiles: the pipeline as loaded, tuned sliding-window batch sizes, and batch sizes plus
+dynamic int8 segmentation/embedding models (DIARIZATION_OPTIMIZED). Without
+``--reference`` the eager run is the reference, so DER is the optimized pipeline's
+disagreement with it.
+
+    python benchmarks/pyannote_optimization_benchmark.py --batch-size 32 --threads 4
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from pathlib import Path
+import torch
+import torchaudio
+from dotenv import load_dotenv
+from pyannote.audio import Pipeline
+from app.pipeline.diarization_metrics import diarization_error_rate, load_rttm
+from app.pipeline.pyannote_optimization import optimize_pipeline
+
+load_dotenv()
+
+DEFAULT_AUDIO = Path(__file__).resolve().parents[2] / "data" / "audio_test_files_1" / "sample_meeting_sparsh_aadil_sami.wav"
+
+
+def run_profile(hf_token: str, audio_path: Path, repeats: int, **options):
+    pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization-3.1", use_auth_token=hf_token)
+    if options:
+        optimize_pipeline(pipeline, **options)
+
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        diarization = pipeline(str(audio_path))
+        best = min(best, time.perf_counter() - started)
+
+    segments = [{'start': turn.start, 'end': turn.end, 'speaker': speaker}
+                for turn, _, speaker in diarization.itertracks(yield_label=True)]
+    return segments, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark optimized pyannote diarization")
+    parser.add_argument("audio_file", nargs="?", type=Path, default=DEFAULT_AUDIO)
+    parser.add_argument("--reference", type=Path, help="RTTM reference")
+    parser.add_argument("--batch-size", type=int, default=32,
+                        help="Segmentation and embedding batch size for the tuned profiles")
+    parser.add_argument("--repeats", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    hf_token = os.getenv("HUGGINGFACE_TOKEN")
+    if not hf_token:
+        print("❌ HUGGINGFACE_TOKEN required")
+        return
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    info = torchaudio.info(str(args.audio_file))
+    audio_seconds = info.num_frames / info.sample_rate
+    batches = {'segmentation_batch_size': args.batch_size, 'embedding_batch_size': args.batch_size}
+    profiles = {
+        'eager': {},
+        'batched': {**batches},
+        'batched+int8': {**batches, 'quantize': True}
+    }
+
+    runs = {name: run_profile(hf_token, args.audio_file, args.repeats, **options)
+            for name, options in profiles.items()}
+    reference = load_rttm(args.reference) if args.reference else runs['eager'][0]
+
+    print(f"\n🎧 {args.audio_file.name} ({audio_seconds:.0f}s audio, {torch.get_num_threads()} threads), "
+          f"reference: {'rttm' if args.reference else 'eager'}")
+    report = []
+    for name, (segments, seconds) in runs.items():
+        der = diarization_error_rate(reference, segments)
+        throughput = audio_seconds / seconds
+        speedup = runs['eager'][1] / seconds
+        print(f"   {name:13s} {seconds:7.2f}s  {throughput:6.1f}x realtime  x{speedup:4.2f} vs eager  "
+              f"DER {der['der']:.2%}")
+        report.append({'profile': name, **profiles[name], 'seconds': round(seconds, 3),
+                       'realtime_factor': round(seconds / audio_seconds, 4),
+                       'speedup': round(speedup, 3), **der})
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Full-text search latency over many synthetic meetings with the FTS5 transcript index.
+
+Indexes ``--meetings`` synthetic meetings (transcript turns plus segments, as
+``process_meeting`` does) with a Zipf-distributed vocabulary and times rare, topic and
+phrase queries. Standard library only.
+
+    python benchmarks/search_benchmark.py --meetings 10000 --turns 60
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from app.pipeline.search_index import TranscriptSearchIndex
+
+STOPWORDS = ("the we I you that to and of a it is on but so should can think let's okay yes sure "
+             "make sense before next first send").split()
+TOPIC_WORDS = ("ship beta friday docs review budget numbers sync meeting notes hiring roadmap customer "
+               "churn pricing launch onboarding metrics quarter marketing design security incident retro").split()
+RARE_TERMS = ["kubernetes", "reimbursement", "offsite", "acquisition", "trademark"]
+
+QUERIES = {
+    'rare word': 'kubernetes',
+    'topic word': 'budget',
+    'two words': 'pricing churn',
+    'phrase': '"ship the beta"',
+}
+
+
+def zipf_vocabulary(size: int = 20000):
+    """Stopwords at the top ranks, topic words among the next few hundred, then filler terms."""
+    filler = [f"term{index}" for index in range(size)]
+    words = list(STOPWORDS) + filler[:200]
+    for offset, word in enumerate(TOPIC_WORDS):
+        words.insert(len(STOPWORDS) + 8 * offset, word)
+    words += filler[200:]
+    weights, total = [], 0.0
+    for rank in range(len(words)):
+        total += 1.0 / (rank + 1)
+        weights.append(total)
+    return words, weights
+
+
+VOCABULARY, CUMULATIVE_WEIGHTS = zipf_vocabulary()
+
+
+def synthetic_meeting(rng: random.Random, turns: int):
+    speakers = [f"Speaker {index}" for index in range(rng.randint(2, 6))]
+    entries, cursor = [], 0.0
+    for _ in range(turns):
+        words = rng.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=rng.randint(5, 40))
+        if rng.random() < 0.002:
+            words.insert(rng.randrange(len(words)), rng.choice(RARE_TERMS))
+        if rng.random() < 0.01:
+            words[rng.randrange(len(words)):0] = ["ship", "the", "beta"]
+        duration = len(words) * 0.4
+        entries.append({'speaker': rng.choice(speakers), 'matched_speaker': rng.choice(speakers),
+                        'start': cursor, 'end': cursor + duration, 'text': ' '.join(words)})
+        cursor += duration + 0.5
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-text meeting search")
+    parser.add_argument("--meetings", type=int, default=10000)
+    parser.add_argument("--turns", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    import structlog
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(30))
+
+    rng = random.Random(0)
+    report = {'meetings': args.meetings, 'turns_per_meeting': args.turns, 'queries': {}}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = TranscriptSearchIndex(Path(temp_dir) / "search.sqlite3")
+
+        start = time.perf_counter()
+        for meeting in range(args.meetings):
+            entries = synthetic_meeting(rng, args.turns)
+            transcript = {'turns': [{'speaker': e['matched_speaker'], 'start': e['start'], 'end': e['end'],
+                                     'text': e['text']} for e in entries]}
+            index.index_meeting(f"meeting-{meeting}", entries, transcript)
+        report['index_seconds'] = round(time.perf_counter() - start, 2)
+        report['index_ms_per_meeting'] = round(report['index_seconds'] * 1000 / args.meetings, 2)
+        report['entries'] = index.stats()['entries']
+
+        for label, query in QUERIES.items():
+            index.search(query)
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                hits = index.search(query, limit=20)
+            report['queries'][label] = {'query': query, 'hits': len(hits),
+                                        'ms': round((time.perf_counter() - start) * 1000 / args.repeats, 2)}
+
+        report['db_mb'] = round(sum(path.stat().st_size for path in Path(temp_dir).iterdir()) / 1e6, 1)
+
+    print(f"\n🔎 {args.meetings:,} meetings, {report['entries']:,} entries, {report['db_mb']} MB")
+    print(f"   indexing {report['index_ms_per_meeting']} ms/meeting")
+    for label, data in report['queries'].items():
+        print(f"   {label:11s} {data['query']:18s} {data['ms']:8.2f} ms  ({data['hits']} hits)")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Meeting result serialization: indented ``json.dump`` vs the shared compact serializer.
+
+The old path encoded segments twice (indented into the result file, then again for the
+``/process`` response). The new path encodes them once with ``dumps`` and splices the
+bytes into both documents. Needs only NumPy; uses orjson when it is installed.
+
+    python benchmarks/serialization_benchmark.py --segments 5000
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import gzip
+import json
+import random
+import time
+import numpy as np
+from app.pipeline.segments import Segment
+from app.utils import serialization
+from app.utils.serialization import RawJSON, dumps
+
+
+def synthetic_result(segment_count: int):
+    rng = random.Random(0)
+    segments, cursor = [], 0.0
+    for index in range(segment_count):
+        duration = rng.uniform(0.5, 12.0)
+        segment = Segment(cursor, cursor + duration, f"SPEAKER_{index % 6:02d}",
+                          matched_speaker=f"Speaker {index % 6}", similarity_score=rng.random())
+        segment.text = " ".join(rng.choice(["we", "should", "ship", "the", "docs", "friday"])
+                                for _ in range(int(duration * 2.5)))
+        segment.confidence = rng.random()
+        segments.append(segment)
+        cursor += duration + 0.3
+    return {
+        'segments': segments,
+        'processing_metadata': {'total_duration': np.float64(cursor), 'speakers_identified': 6},
+        'speaker_embeddings': {f"SPEAKER_{index:02d}": np.random.default_rng(index).random(192, dtype=np.float32)
+                               for index in range(6)},
+    }
+
+
+def legacy_default(value):
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def legacy(result):
+    file_data = json.dumps(result, indent=2, default=legacy_default).encode()
+    response = {'transcription': {'segments': [segment.to_dict() for segment in result['segments']]}}
+    return file_data, json.dumps(response).encode()
+
+
+def shared(result):
+    segments_json = RawJSON(dumps([segment.to_dict() for segment in result['segments']]))
+    file_data = dumps({**result, 'segments': segments_json})
+    return file_data, dumps({'transcription': {'segments': segments_json}})
+
+
+def timed(function, result, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = function(result)
+        best = min(best, time.perf_counter() - start)
+    return output, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark meeting result serialization")
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    result = synthetic_result(args.segments)
+    (legacy_file, legacy_response), legacy_seconds = timed(legacy, result, args.repeats)
+    (shared_file, shared_response), shared_seconds = timed(shared, result, args.repeats)
+    assert json.loads(shared_file)['segments'] == json.loads(legacy_file)['segments']
+
+    report = {
+        'segments': args.segments,
+        'encoder': 'orjson' if serialization.orjson is not None else 'json',
+        'legacy_ms': round(legacy_seconds * 1000, 2),
+        'shared_ms': round(shared_seconds * 1000, 2),
+        'legacy_file_bytes': len(legacy_file),
+        'shared_file_bytes': len(shared_file),
+        'response_bytes': len(shared_response),
+        'response_gzip_bytes': len(gzip.compress(shared_response, compresslevel=6)),
+    }
+
+    print(f"\n🧾 {args.segments:,} segments ({report['encoder']})")
+    print(f"   json indent + response  {report['legacy_ms']:8.1f} ms  file {len(legacy_file) / 1e6:6.2f} MB")
+    print(f"   shared compact dumps    {report['shared_ms']:8.1f} ms  file {len(shared_file) / 1e6:6.2f} MB")
+    print(f"   speedup x{legacy_seconds / shared_seconds:.1f}")
+    print(f"   response {len(shared_response) / 1e6:.2f} MB, gzip {report['response_gzip_bytes'] / 1e6:.2f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
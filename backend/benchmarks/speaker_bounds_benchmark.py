@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Measure how speaker-count hints change pyannote diarization time and accuracy.
+
+Runs the same recording with automatic detection, with min/max bounds derived from the
+given names / voice samples / attendee count, and with the exact count. DER is reported
+against an RTTM reference when one is given, otherwise against the exact-count run.
+
+    python benchmarks/speaker_bounds_benchmark.py --speaker-names Sparsh,Aadil,Sami --voice-samples 2
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+from app.pipeline.processor import AudioProcessor, SpeakerDiarizer
+from app.pipeline.diarization_metrics import diarization_error_rate, load_rttm
+from app.pipeline.speaker_bounds import derive_speaker_bounds
+
+load_dotenv()
+
+DEFAULT_AUDIO = Path(__file__).resolve().parents[2] / "data" / "audio_test_files_1" / "sample_meeting_sparsh_aadil_sami.m4a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark speaker-count hints for diarization")
+    parser.add_argument("audio_file", nargs="?", type=Path, default=DEFAULT_AUDIO)
+    parser.add_argument("--speaker-names", default="Sparsh,Aadil,Sami", help="Comma-separated names")
+    parser.add_argument("--voice-samples", type=int, default=0,
+                        help="How many of the named speakers uploaded a voice sample")
+    parser.add_argument("--attendee-count", type=int, default=None)
+    parser.add_argument("--num-speakers", type=int, default=None, help="True speaker count")
+    parser.add_argument("--reference", type=Path, help="RTTM reference")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    hf_token = os.getenv("HUGGINGFACE_TOKEN")
+    if not hf_token:
+        print("❌ HUGGINGFACE_TOKEN required")
+        return
+
+    names = [name.strip() for name in args.speaker_names.split(",") if name.strip()]
+    bounds = derive_speaker_bounds(names, names[:args.voice_samples], args.attendee_count)
+    exact = args.num_speakers or len(names)
+    configurations = {
+        'auto': {},
+        'bounds': {'min_speakers': bounds['min_speakers'], 'max_speakers': bounds['max_speakers']},
+        'exact': {'num_speakers': exact}
+    }
+
+    wav_path = AudioProcessor().convert_to_wav(args.audio_file, args.audio_file.with_suffix('.bench.wav'))
+    diarizer = SpeakerDiarizer(hf_token)
+    diarizer.diarize(wav_path, backend='pyannote')  # load the pipeline before timing
+
+    runs = {}
+    for name, options in configurations.items():
+        timings = []
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            result = diarizer.diarize(wav_path, backend='pyannote', **options)
+            timings.append(time.perf_counter() - started)
+        runs[name] = {'options': options, 'seconds': round(min(timings), 3),
+                      'speakers': result['total_speakers'], 'segments': result['segments']}
+
+    reference = load_rttm(args.reference) if args.reference else runs['exact']['segments']
+    print(f"\n🎧 {args.audio_file.name}  bounds {bounds['min_speakers']}..{bounds['max_speakers']} "
+          f"({bounds['source']}), reference: {'rttm' if args.reference else 'exact count'}")
+    report = []
+    for name, run in runs.items():
+        der = diarization_error_rate(reference, run['segments'])
+        speedup = runs['auto']['seconds'] / run['seconds'] if run['seconds'] else 0.0
+        print(f"   {name:7s} {run['seconds']:7.2f}s  x{speedup:4.2f} vs auto  "
+              f"speakers {run['speakers']}  DER {der['der']:.1%}")
+        report.append({'configuration': name, **run['options'], 'seconds': run['seconds'],
+                       'speakers': run['speakers'], 'speedup_vs_auto': round(speedup, 3), **der})
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+""""Which meetings did this voice appear in": one-matrix lookup vs one file per meeting.
+
+Builds a ``SpeakerOccurrenceIndex`` over ``--meetings`` synthetic meetings (a few
+192-dim speaker embeddings each) and times a vectorized lookup against loading and
+scoring per-meeting ``.npz`` files, the layout of the diarization cache, plus one
+incremental add and a full reload of the matrix from SQLite. Needs only NumPy.
+
+    python benchmarks/speaker_index_benchmark.py --meetings 10000
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import structlog
+from app.pipeline.speaker_index import SpeakerOccurrenceIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-meeting speaker lookup")
+    parser.add_argument("--meetings", type=int, default=10000)
+    parser.add_argument("--voices", type=int, default=300, help="Distinct people across all meetings")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(30))
+    rng = np.random.default_rng(0)
+    voices = rng.normal(size=(args.voices, 192)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files_dir = Path(temp_dir) / "per_meeting"
+        files_dir.mkdir()
+        meetings = {}
+        for meeting in range(args.meetings):
+            people = rng.choice(args.voices, size=rng.integers(2, 7), replace=False)
+            meetings[f"meeting-{meeting}"] = {
+                f"SPEAKER_{index:02d}": voices[person] + 0.3 * rng.normal(size=192).astype(np.float32)
+                for index, person in enumerate(people)
+            }
+
+        for meeting_id, embeddings in meetings.items():
+            np.savez(files_dir / f"{meeting_id}.npz", **embeddings)
+
+        # Bulk build, then time one incremental add as process_meeting does
+        index = SpeakerOccurrenceIndex(Path(temp_dir) / "meetings.sqlite3")
+        last_id = f"meeting-{args.meetings - 1}"
+        index.add_meetings({meeting_id: (embeddings, None) for meeting_id, embeddings in meetings.items()
+                            if meeting_id != last_id})
+        start = time.perf_counter()
+        index.add_meeting(last_id, meetings[last_id])
+        add_ms = (time.perf_counter() - start) * 1000
+        # Another instance's writes make the next lookup reload every row from SQLite
+        start = time.perf_counter()
+        len(index)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        def per_file(query):
+            query = query / np.linalg.norm(query)
+            hits = []
+            for path in files_dir.glob("*.npz"):
+                with np.load(path) as data:
+                    best = max(float(data[key] @ query / np.linalg.norm(data[key])) for key in data.files)
+                if best >= args.threshold:
+                    hits.append(path.stem)
+            return hits
+
+        queries = [voices[rng.integers(args.voices)] for _ in range(args.repeats)]
+        start = time.perf_counter()
+        hits = [index.find(query, args.threshold) for query in queries]
+        index_ms = (time.perf_counter() - start) * 1000 / args.repeats
+        start = time.perf_counter()
+        file_hits = per_file(queries[0])
+        file_ms = (time.perf_counter() - start) * 1000
+        assert sorted(hit['meeting_id'] for hit in hits[0]) == sorted(file_hits)
+
+        report = {
+            'meetings': args.meetings,
+            'rows': len(index),
+            'matrix_mb': round(index.embeddings.nbytes / 1e6, 1),
+            'index_lookup_ms': round(index_ms, 2),
+            'per_file_lookup_ms': round(file_ms, 1),
+            'incremental_add_ms': round(add_ms, 1),
+            'matrix_load_ms': round(load_ms, 1),
+            'mean_hits': round(float(np.mean([len(h) for h in hits])), 1),
+        }
+
+    print(f"\n🗣️  {args.meetings:,} meetings, {report['rows']:,} speaker rows ({report['matrix_mb']} MB)")
+    print(f"   vectorized lookup  {report['index_lookup_ms']:9.2f} ms  (~{report['mean_hits']} meetings per voice)")
+    print(f"   per-meeting files  {report['per_file_lookup_ms']:9.1f} ms")
+    print(f"   add one meeting    {report['incremental_add_ms']:9.1f} ms")
+    print(f"   reload all rows    {report['matrix_load_ms']:9.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Real-time factor vs word error rate for Whisper transcription profiles on CPU.
+
+Each profile is a set of ``Transcriber`` options (the WHISPER_* settings). WER is
+measured against ``--reference`` (a plain-text transcript) when given, otherwise against
+the ``--reference-profile`` output, in which case it is agreement, not accuracy.
+
+    python benchmarks/whisper_benchmark.py --reference meeting.txt --profiles base-int8 base-int8-batched distil-small
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import time
+from pathlib import Path
+from app.pipeline.processor import Transcriber
+from app.pipeline.transcription_metrics import word_error_rate
+
+DEFAULT_AUDIO = Path(__file__).resolve().parents[2] / "data" / "audio_test_files_1" / "sample_meeting_sparsh_aadil_sami.wav"
+
+PROFILES = {
+    'tiny-int8': {'model_name': 'tiny', 'compute_type': 'int8'},
+    'base-int8': {'model_name': 'base', 'compute_type': 'int8'},
+    'base-int8-greedy': {'model_name': 'base', 'compute_type': 'int8', 'beam_size': 1},
+    'base-int8-batched': {'model_name': 'base', 'compute_type': 'int8', 'batch_size': 8},
+    'small-int8': {'model_name': 'small', 'compute_type': 'int8'},
+    'small-int8-batched': {'model_name': 'small', 'compute_type': 'int8', 'batch_size': 8},
+    'distil-small': {'model_name': 'distil-small.en', 'compute_type': 'int8'},
+    'distil-large-v3': {'model_name': 'distil-large-v3', 'compute_type': 'int8', 'batch_size': 8},
+    'small-fp32': {'model_name': 'small', 'compute_type': 'float32'},
+}
+
+
+def run_profile(audio_path: Path, options: dict, cpu_threads: int, num_workers: int):
+    transcriber = Transcriber(cpu_threads=cpu_threads, num_workers=num_workers, **options)
+    started = time.perf_counter()
+    transcriber._load_model()
+    load_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    words, info = transcriber.transcribe_words(str(audio_path))
+    seconds = time.perf_counter() - started
+    text = " ".join(word['word'].strip() for word in words)
+    return text, info.duration, load_seconds, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Whisper transcription profiles")
+    parser.add_argument("audio_file", nargs="?", type=Path, default=DEFAULT_AUDIO)
+    parser.add_argument("--profiles", nargs="+", default=['base-int8', 'base-int8-greedy', 'base-int8-batched', 'small-int8'],
+                        choices=sorted(PROFILES))
+    parser.add_argument("--reference", type=Path, help="Plain-text reference transcript")
+    parser.add_argument("--reference-profile", default='small-fp32', choices=sorted(PROFILES),
+                        help="Profile used as reference when no transcript is given")
+    parser.add_argument("--cpu-threads", type=int, default=0, help="0 = CTranslate2 default")
+    parser.add_argument("--num-workers", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    if args.reference:
+        reference_text, reference_label = args.reference.read_text(), args.reference.name
+    else:
+        reference_text = run_profile(args.audio_file, PROFILES[args.reference_profile],
+                                     args.cpu_threads, args.num_workers)[0]
+        reference_label = f"{args.reference_profile} output (agreement, not accuracy)"
+
+    print(f"\n🎧 {args.audio_file.name}, reference: {reference_label}")
+    print(f"   {'profile':20s} {'load':>7s} {'transcribe':>11s} {'RTF':>7s} {'WER':>7s}")
+    report = []
+    for name in args.profiles:
+        text, duration, load_seconds, seconds = run_profile(args.audio_file, PROFILES[name],
+                                                             args.cpu_threads, args.num_workers)
+        wer = word_error_rate(reference_text, text)
+        rtf = seconds / duration if duration else 0.0
+        print(f"   {name:20s} {load_seconds:6.2f}s {seconds:10.2f}s {rtf:7.3f} {wer['wer']:7.2%}")
+        report.append({'profile': name, **PROFILES[name], 'cpu_threads': args.cpu_threads,
+                       'num_workers': args.num_workers, 'load_seconds': round(load_seconds, 3),
+                       'seconds': round(seconds, 3), 'audio_seconds': round(duration, 3),
+                       'rtf': round(rtf, 4), 'reference': reference_label, **wer})
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
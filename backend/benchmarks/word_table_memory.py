@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Memory held by per-word dicts vs the columnar WordTable for a long synthetic meeting.
+
+The dict layout is what transcription used to keep alive: one ``word``/``start``/``end``
+/``midpoint`` dict per word for segment assignment plus one ``word``/``start``/``end``/
+``speaker`` dict per word for the transcript. Needs only NumPy.
+
+    python benchmarks/word_table_memory.py --words 300000
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import gc
+import random
+import tracemalloc
+from app.pipeline.word_table import WordTable, assign_speakers
+
+VOCABULARY = [f" {word}" for word in (
+    "the we should ship this on friday but docs first okay I think that makes sense let's "
+    "review budget numbers before the next sync meeting sure can you send notes yes."
+).split()]
+
+
+def synthetic_meeting(word_count: int, speakers: int = 6):
+    rng = random.Random(0)
+    words, segments = [], []
+    time_cursor = 0.0
+    while len(words) < word_count:
+        turn_start = time_cursor
+        for _ in range(rng.randint(3, 40)):
+            duration = round(rng.uniform(0.1, 0.5), 2)
+            words.append({'word': rng.choice(VOCABULARY), 'start': round(time_cursor, 2),
+                          'end': round(time_cursor + duration, 2)})
+            time_cursor += duration + rng.choice([0.0, 0.05, 0.2])
+        segments.append({'start': turn_start, 'end': time_cursor,
+                         'matched_speaker': f"Speaker {rng.randrange(speakers)}"})
+        time_cursor += rng.uniform(0.2, 1.5)
+    return words[:word_count], segments
+
+
+def measure(build):
+    """Bytes still allocated after ``build()`` returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure word storage memory")
+    parser.add_argument("--words", type=int, default=300000)
+    args = parser.parse_args()
+
+    words, segments = synthetic_meeting(args.words)
+    raw = [(word['word'], word['start'], word['end']) for word in words]
+    speakers = [segment['matched_speaker'] for segment in segments]
+    del words
+    gc.collect()
+
+    def dict_layout():
+        # Fresh strings, as Whisper returns them
+        all_words = [{'text': ''.join(text), 'start': start, 'end': end, 'midpoint': (start + end) / 2}
+                     for text, start, end in raw]
+        with_speakers = [{'word': ''.join(text), 'start': start, 'end': end, 'speaker': speakers[index % len(speakers)]}
+                         for index, (text, start, end) in enumerate(raw)]
+        return all_words, with_speakers
+
+    def table_layout():
+        table = WordTable.from_words({'word': ''.join(text), 'start': start, 'end': end} for text, start, end in raw)
+        return table, assign_speakers(table, segments)
+
+    _, dict_bytes = measure(dict_layout)
+    (table, _), table_bytes = measure(table_layout)
+
+    print(f"\n📏 {args.words:,} words, {len(segments):,} segments, {len(table.texts)} distinct words")
+    print(f"   dicts      {dict_bytes / 1e6:8.1f} MB  ({dict_bytes / args.words:6.1f} B/word)")
+    print(f"   WordTable  {table_bytes / 1e6:8.1f} MB  ({table_bytes / args.words:6.1f} B/word), "
+          f"with speaker labels")
+    print(f"   saving     x{dict_bytes / table_bytes:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Replay an audio file to the live transcription WebSocket in real time."""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from pydub import AudioSegment
+
+
+def load_pcm(audio_file: Path) -> bytes:
+    """Decode any audio file to 16kHz mono 16-bit PCM."""
+    audio = AudioSegment.from_file(str(audio_file))
+    audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
+    return audio.raw_data
+
+
+async def replay(audio_file: Path, url: str, chunk_ms: int, speed: float):
+    """Stream the file in ``chunk_ms`` chunks and print segments as they arrive."""
+    try:
+        import websockets
+    except ImportError:
+        print("❌ The websockets package is required (installed with uvicorn[standard])")
+        return
+
+    pcm = load_pcm(audio_file)
+    chunk_bytes = int(16000 * chunk_ms / 1000) * 2
+    print(f"🎙️  Replaying {audio_file.name} ({len(pcm) / 32000:.1f}s) to {url} at {speed}x")
+
+    async with websockets.connect(url, max_size=None) as websocket:
+        async def send():
+            started = time.monotonic()
+            for offset in range(0, len(pcm), chunk_bytes):
+                await websocket.send(pcm[offset:offset + chunk_bytes])
+                # Pace chunks against the wall clock so slow sends do not accumulate drift
+                sent_seconds = (offset + chunk_bytes) / 32000
+                await asyncio.sleep(max(0.0, started + sent_seconds / speed - time.monotonic()))
+            await websocket.send("end")
+
+        sender = asyncio.create_task(send())
+        async for raw in websocket:
+            message = json.loads(raw)
+            if message["type"] == "segment":
+                print(f"[{message['start']:7.2f}-{message['end']:7.2f}] "
+                      f"{message['speaker']}: {message['text']}  (latency {message['latency']:.2f}s)")
+            elif message["type"] == "done":
+                print(f"\n✅ Done: {json.dumps(message['stats'])}")
+            elif message["type"] == "error":
+                print(f"❌ {message['detail']}")
+        await sender
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay an audio file to the /live WebSocket")
+    parser.add_argument("audio_file", type=Path, help="Meeting recording (any format ffmpeg reads)")
+    parser.add_argument("--url", default="ws://localhost:8000/live", help="Live endpoint URL")
+    parser.add_argument("--chunk-ms", type=int, default=100, help="Audio per message in milliseconds")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed (1.0 = real time)")
+    args = parser.parse_args()
+
+    if not args.audio_file.exists():
+        print(f"❌ Audio file not found: {args.audio_file}")
+        return
+    asyncio.run(replay(args.audio_file, args.url, args.chunk_ms, args.speed))
+
+
+if __name__ == "__main__":
+    main()
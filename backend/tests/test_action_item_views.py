@@ -0,0 +1,108 @@
+"""
+Unit tests for single-call generation of all action item views.
+Verifies the output shape matches the N+1 approach and that only one request is made.
+"""
+
+import json
+import unittest
+from unittest.mock import Mock
+
+from backend.app.services.llm_service import LLMService
+
+
+TRANSCRIPT = (
+    'Sami: "Let\'s ship the beta on Friday."\n\n'
+    'Aadil: "I will update the docs before then."\n\n'
+    'Sami: "Everyone please test the build."'
+)
+
+STRUCTURED_RESPONSE = json.dumps({
+    "action_items": [
+        {"task": "Ship the beta by Friday", "owner": "Sami",
+         "primary_for": ["Sami"], "secondary_for": ["Aadil"]},
+        {"task": "Update the docs before Friday", "owner": "Aadil",
+         "primary_for": ["Aadil"], "secondary_for": ["Sami"]},
+        {"task": "Test the build", "owner": "Everyone",
+         "primary_for": ["Sami", "Aadil"], "secondary_for": []},
+    ]
+})
+
+
+class TestSingleCallActionItemViews(unittest.TestCase):
+
+    def setUp(self):
+        self.service = LLMService("test-key")
+        self.service.client = Mock()
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=STRUCTURED_RESPONSE))]
+        response.usage = Mock(total_tokens=700, prompt_tokens=600, completion_tokens=100)
+        self.service.client.chat.completions.create.return_value = response
+
+    def test_single_request_for_all_views(self):
+        """All views come from exactly one completion request."""
+        self.service.extract_all_action_item_views(TRANSCRIPT, generation_method="single_call")
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 1)
+
+    def test_output_shape_matches_n_plus_1(self):
+        """General view groups tasks by owner; speaker views carry relevance."""
+        result = self.service.extract_all_action_item_views(TRANSCRIPT, generation_method="single_call")
+
+        self.assertEqual(set(result), {"general_view", "speaker_views", "metadata"})
+        self.assertEqual(result["general_view"]["action_items"], {
+            "Sami": ["Ship the beta by Friday"],
+            "Aadil": ["Update the docs before Friday"],
+            "Everyone": ["Test the build"],
+        })
+        self.assertEqual(set(result["speaker_views"]), {"Aadil", "Sami"})
+
+        aadil_view = result["speaker_views"]["Aadil"]
+        self.assertEqual(aadil_view["metadata"]["view_type"], "speaker-specific")
+        self.assertEqual(aadil_view["metadata"]["target_speaker"], "Aadil")
+        self.assertEqual(aadil_view["action_items"]["Aadil"][0]["relevance"], "primary")
+        self.assertEqual(aadil_view["action_items"]["Sami"][0]["relevance"], "secondary")
+        self.assertEqual(aadil_view["action_items"]["Everyone"][0]["relevance"], "primary")
+
+    def test_views_honor_secondary_for(self):
+        """A speaker's view holds the items listing them as primary or secondary, and no others."""
+        response = self.service.client.chat.completions.create.return_value
+        response.choices[0].message.content = json.dumps({
+            "action_items": [
+                {"task": "Ship the beta by Friday", "owner": "Sami",
+                 "primary_for": ["Sami"], "secondary_for": ["Aadil"]},
+                {"task": "Book the launch venue", "owner": "Sami",
+                 "primary_for": ["Sami"], "secondary_for": []},
+                {"task": "Review the pricing page", "owner": "Other",
+                 "primary_for": [], "secondary_for": []},
+            ]
+        })
+
+        result = self.service.extract_all_action_item_views(TRANSCRIPT, generation_method="single_call")
+
+        self.assertEqual(result["speaker_views"]["Aadil"]["action_items"], {
+            "Sami": [{"task": "Ship the beta by Friday", "relevance": "secondary"}],
+            "Other": [{"task": "Review the pricing page", "relevance": "secondary"}],
+        })
+        self.assertEqual(result["speaker_views"]["Sami"]["action_items"]["Sami"], [
+            {"task": "Ship the beta by Friday", "relevance": "primary"},
+            {"task": "Book the launch venue", "relevance": "primary"},
+        ])
+
+    def test_token_accounting_per_view(self):
+        """The one request is accounted to the general view; derived speaker views cost nothing."""
+        result = self.service.extract_all_action_item_views(TRANSCRIPT, generation_method="single_call")
+        metadata = result["metadata"]
+
+        self.assertEqual(metadata["total_tokens_used"], 700)
+        self.assertEqual(result["general_view"]["metadata"]["tokens_used"], 700)
+        self.assertEqual({view["metadata"]["tokens_used"] for view in result["speaker_views"].values()}, {0})
+        self.assertEqual((metadata["prompt_tokens"], metadata["completion_tokens"]), (600, 100))
+        self.assertNotIn("estimated_n_plus_1_tokens", metadata)
+        self.assertEqual(metadata["generation_method"], "single_call_views")
+
+    def test_unknown_method_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.extract_all_action_item_views(TRANSCRIPT, generation_method="bogus")
+
+
+if __name__ == '__main__':
+    unittest.main()
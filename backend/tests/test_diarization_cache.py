@@ -0,0 +1,79 @@
+"""
+Unit tests for the diarization cache and re-clustering of cached turns.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from backend.app.pipeline.diarization_cache import DiarizationCache, recluster_turns
+
+# Three voices; pyannote merged the second and third into SPEAKER_01
+SEGMENTS = [
+    {'start': 0.0, 'end': 2.0, 'speaker': 'SPEAKER_00', 'duration': 2.0},
+    {'start': 2.0, 'end': 4.0, 'speaker': 'SPEAKER_01', 'duration': 2.0},
+    {'start': 4.0, 'end': 4.05, 'speaker': 'SPEAKER_01', 'duration': 0.05},
+    {'start': 4.1, 'end': 6.0, 'speaker': 'SPEAKER_01', 'duration': 1.9},
+    {'start': 6.0, 'end': 8.0, 'speaker': 'SPEAKER_00', 'duration': 2.0},
+]
+VOICES = np.eye(4, dtype=np.float32)
+TURN_EMBEDDINGS = [VOICES[0], VOICES[1] + 0.3 * VOICES[2], None, VOICES[2] + 0.3 * VOICES[1], VOICES[0]]
+WORDS = [{'word': ' Hello', 'start': 0.1, 'end': 0.5}, {'word': ' there.', 'start': 0.5, 'end': 0.9}]
+
+
+class TestDiarizationCache(unittest.TestCase):
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiarizationCache(Path(temp_dir))
+            cache.save('meeting-1', SEGMENTS, TURN_EMBEDDINGS, WORDS, {'duration': 8.0, 'language': 'en'})
+            loaded = cache.load('meeting-1')
+
+        self.assertEqual([(s['start'], s['end'], s['speaker']) for s in loaded['segments']],
+                         [(s['start'], s['end'], s['speaker']) for s in SEGMENTS])
+        self.assertIsNone(loaded['turn_embeddings'][2])
+        np.testing.assert_allclose(loaded['turn_embeddings'][1], TURN_EMBEDDINGS[1])
+        self.assertEqual(loaded['words'].to_dicts(), WORDS)
+        self.assertEqual(loaded['metadata'], {'duration': 8.0, 'language': 'en'})
+
+    def test_reads_per_word_text_column(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiarizationCache(Path(temp_dir))
+            np.savez_compressed(
+                Path(temp_dir) / 'old.npz', starts=np.array([0.0]), ends=np.array([2.0]),
+                speakers=np.array(['SPEAKER_00']), embeddings=np.zeros((1, 4), dtype=np.float32),
+                has_embedding=np.array([False]), word_text=np.array([w['word'] for w in WORDS]),
+                word_starts=np.array([w['start'] for w in WORDS]), word_ends=np.array([w['end'] for w in WORDS]),
+                metadata=np.array('{}')
+            )
+            self.assertEqual(cache.load('old')['words'].to_dicts(), WORDS)
+
+    def test_missing_meeting(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertIsNone(DiarizationCache(Path(temp_dir)).load('nope'))
+
+
+class TestReclusterTurns(unittest.TestCase):
+
+    def test_num_speakers_splits_merged_speaker(self):
+        result = recluster_turns(SEGMENTS, TURN_EMBEDDINGS, num_speakers=3)
+
+        self.assertEqual(result['total_speakers'], 3)
+        self.assertEqual([s['speaker'] for s in result['segments']],
+                         ['SPEAKER_00', 'SPEAKER_01', 'SPEAKER_02', 'SPEAKER_02', 'SPEAKER_00'])
+        self.assertEqual([s['start'] for s in result['segments']], [s['start'] for s in SEGMENTS])
+
+    def test_max_speakers_merges(self):
+        result = recluster_turns(SEGMENTS, TURN_EMBEDDINGS, max_speakers=2, threshold=0.0)
+        self.assertEqual(result['total_speakers'], 2)
+
+    def test_turns_without_embeddings_follow_nearest_turn(self):
+        result = recluster_turns(SEGMENTS, TURN_EMBEDDINGS, num_speakers=3)
+        # The 50ms turn sits next to the fourth turn
+        self.assertEqual(result['segments'][2]['speaker'], result['segments'][3]['speaker'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Unit tests for the ECAPA backend helpers that do not need the model.
+"""
+
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.ecapa_backends import PROBE_SECONDS, ECAPAEncoder, embedding_parity, load_ecapa_encoder
+
+
+class TestEmbeddingParity(unittest.TestCase):
+
+    def test_identical_embeddings(self):
+        embeddings = np.random.default_rng(0).normal(size=(3, 192))
+        parity = embedding_parity(embeddings, embeddings.astype(np.float32))
+        self.assertAlmostEqual(parity['min_cosine'], 1.0, places=5)
+        self.assertEqual(len(parity['cosines']), 3)
+
+    def test_reports_worst_row(self):
+        reference = np.eye(3)
+        candidate = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 1.0], [0.0, 0.0, 2.0]])
+        parity = embedding_parity(reference, candidate)
+        self.assertAlmostEqual(parity['min_cosine'], np.sqrt(0.5), places=5)
+        self.assertAlmostEqual(parity['cosines'][2], 1.0, places=5)
+
+    def test_accepts_speechbrain_shape(self):
+        embeddings = np.ones((2, 1, 4))
+        self.assertAlmostEqual(embedding_parity(embeddings, embeddings)['mean_cosine'], 1.0, places=5)
+
+    def test_probes_cover_other_lengths_than_the_trace(self):
+        """Verification must include inputs longer and shorter than the traced one."""
+        traced = PROBE_SECONDS[0]
+        self.assertTrue(any(seconds < traced for seconds in PROBE_SECONDS))
+        self.assertTrue(any(seconds > traced for seconds in PROBE_SECONDS))
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    def test_eager_returns_classifier(self):
+        classifier = object()
+        self.assertIs(load_ecapa_encoder(classifier, 'eager', export_dir='unused'), classifier)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            load_ecapa_encoder(object(), 'tensorrt', export_dir='unused')
+        with self.assertRaises(ValueError):
+            ECAPAEncoder(object(), 'eager', export_dir='unused')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit tests for the pooled LLM HTTP client.
+Runs against a local stub server to exercise retries, Retry-After, hedging and the OpenAI SDK path.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.app.services import http_client
+from backend.app.services.http_client import create_async_http_client, create_http_client, get_shared_http_client
+from backend.app.services.llm_service import LLMService
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Replies from the server's scripted list of (status, headers, delay) tuples."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        with self.server.lock:
+            self.server.requests += 1
+            script = self.server.script
+            status, headers, delay = script.pop(0) if len(script) > 1 else script[0]
+        time.sleep(delay)
+        body = json.dumps(self.server.body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = 0
+        self.server.script = [(200, {}, 0)]
+        self.server.body = {"ok": True}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestRetryingHttpClient(StubServerTestCase):
+
+    def test_retries_server_errors_then_succeeds(self):
+        self.server.script = [(503, {}, 0), (502, {}, 0), (200, {}, 0)]
+        client = create_http_client(max_retries=3)
+        client._transport.policy.backoff_base = 0.01
+
+        response = client.get(self.base_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.requests, 3)
+        stats = client.stats.snapshot()
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["status_counts"], {503: 1, 502: 1, 200: 1})
+        self.assertIsNotNone(stats["latency_p50"])
+
+    def test_honours_retry_after_on_429(self):
+        self.server.script = [(429, {"Retry-After": "0.2"}, 0), (200, {}, 0)]
+        client = create_http_client(max_retries=1)
+
+        started = time.monotonic()
+        response = client.get(self.base_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_gives_up_after_max_retries(self):
+        self.server.script = [(500, {}, 0)]
+        client = create_http_client(max_retries=2)
+        client._transport.policy.backoff_base = 0.01
+
+        response = client.get(self.base_url)
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.server.requests, 3)
+        self.assertEqual(client.stats.snapshot()["failures"], 1)
+
+    def test_deadline_stops_retrying(self):
+        self.server.script = [(503, {"Retry-After": "5"}, 0)]
+        client = create_http_client(max_retries=5, deadline_seconds=0.5)
+
+        started = time.monotonic()
+        response = client.get(self.base_url)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_hedge_beats_slow_request(self):
+        self.server.script = [(200, {}, 1.0), (200, {}, 0)]
+        client = create_http_client(hedge_delay=0.1)
+
+        started = time.monotonic()
+        response = client.get(self.base_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(client.stats.snapshot()["hedge_wins"], 1)
+
+    def test_async_client_retries(self):
+        self.server.script = [(503, {}, 0), (200, {}, 0)]
+
+        async def run():
+            client = create_async_http_client(max_retries=2)
+            client._transport.policy.backoff_base = 0.01
+            try:
+                return await client.get(self.base_url), client.stats.snapshot()
+            finally:
+                await client.aclose()
+
+        response, stats = asyncio.run(run())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(stats["retries"], 1)
+
+
+class TestLLMServiceHttpClient(StubServerTestCase):
+
+    def test_completion_goes_through_pooled_client(self):
+        """LLMService retries a 503 from the API once and reports it in its HTTP stats."""
+        self.server.body = {
+            "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "## Summary"}}],
+            "usage": {"prompt_tokens": 50, "completion_tokens": 5, "total_tokens": 55}
+        }
+        self.server.script = [(503, {"Retry-After": "0"}, 0), (200, {}, 0)]
+
+        service = LLMService("test-key", http_client=create_http_client(max_retries=2))
+        service.client = service.client.with_options(base_url=self.base_url)
+
+        result = service.generate_meeting_summary('Sami: "Hello there."')
+
+        self.assertEqual(result["summary"], "## Summary")
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(service.get_http_stats()["retries"], 1)
+
+
+class TestSharedHttpClient(unittest.TestCase):
+
+    def setUp(self):
+        self._saved = (http_client._shared_client, http_client._shared_options)
+        http_client._shared_client, http_client._shared_options = None, {}
+        self.addCleanup(self._restore)
+
+    def _restore(self):
+        if http_client._shared_client is not None:
+            http_client._shared_client.close()
+        http_client._shared_client, http_client._shared_options = self._saved
+
+    def test_reused_and_rejects_different_options(self):
+        client = get_shared_http_client(max_retries=1, read_timeout=10.0)
+        self.assertIs(get_shared_http_client(), client)
+        self.assertIs(get_shared_http_client(read_timeout=10.0, max_retries=1), client)
+        with self.assertRaises(ValueError):
+            get_shared_http_client(max_retries=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for tolerant JSON parsing of action items.
+Verifies truncated/malformed output is repaired and only the missing items are re-requested.
+"""
+
+import json
+import unittest
+from unittest.mock import Mock
+
+from backend.app.services.json_repair import IncrementalJSONParser, merge_json_items, parse_partial_json
+from backend.app.services.llm_service import LLMService
+
+
+TRANSCRIPT = 'Sami: "I will ship the beta."\n\nAadil: "I will update the docs and the changelog."'
+
+
+def make_completion(content, total_tokens=100):
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content))]
+    response.usage = Mock(total_tokens=total_tokens, prompt_tokens=total_tokens - 20, completion_tokens=20)
+    return response
+
+
+class TestParsePartialJson(unittest.TestCase):
+
+    def test_complete_document(self):
+        self.assertEqual(parse_partial_json('```json\n{"Sami": ["Ship"]}\n```'), ({"Sami": ["Ship"]}, True))
+
+    def test_truncated_string_dropped(self):
+        value, complete = parse_partial_json('{"Sami": ["Ship beta", "Write do')
+        self.assertFalse(complete)
+        self.assertEqual(value, {"Sami": ["Ship beta"]})
+
+    def test_half_written_object_dropped(self):
+        value, _ = parse_partial_json('{"action_items": [{"task": "A", "owner": "Sami"}, {"task": "B", "ow')
+        self.assertEqual(value, {"action_items": [{"task": "A", "owner": "Sami"}]})
+
+    def test_trailing_commas_repaired(self):
+        self.assertEqual(parse_partial_json('{"Sami": ["Ship",],}'), ({"Sami": ["Ship"]}, True))
+
+    def test_no_json(self):
+        self.assertEqual(parse_partial_json("I could not find any action items."), (None, False))
+
+    def test_incremental_feed_matches_whole_text(self):
+        text = '{"Sami": ["Ship beta"], "Aadil": ["Update docs", "Write changelog"]}'
+        parser = IncrementalJSONParser()
+        for start in range(0, len(text), 7):
+            parser.feed(text[start:start + 7])
+        self.assertEqual(parser.result(), (json.loads(text), True))
+
+    def test_merge_skips_duplicates(self):
+        merged = merge_json_items({"Sami": ["Ship"]}, {"Sami": ["Ship", "Demo"], "Aadil": ["Docs"]})
+        self.assertEqual(merged, {"Sami": ["Ship", "Demo"], "Aadil": ["Docs"]})
+
+
+class TestActionItemRepair(unittest.TestCase):
+
+    def setUp(self):
+        self.service = LLMService("test-key")
+        self.service.client = Mock()
+        self.create = self.service.client.chat.completions.create
+
+    def test_requests_json_mode(self):
+        self.create.return_value = make_completion('{"Sami": ["Ship the beta"]}')
+        self.service.extract_action_items_by_speaker(TRANSCRIPT)
+        self.assertEqual(self.create.call_args.kwargs["response_format"], {"type": "json_object"})
+
+    def test_truncated_output_requests_only_missing_items(self):
+        self.create.side_effect = [
+            make_completion('{"Sami": ["Ship the beta"], "Aadil": ["Update the docs", "Write the chan', 300),
+            make_completion('{"Aadil": ["Write the changelog"]}', 320),
+        ]
+
+        result = self.service.extract_action_items_by_speaker(TRANSCRIPT)
+
+        self.assertEqual(result["action_items"], {
+            "Sami": ["Ship the beta"],
+            "Aadil": ["Update the docs", "Write the changelog"],
+        })
+        continuation_prompt = self.create.call_args.kwargs["messages"][0]["content"]
+        self.assertIn('{"Sami": ["Ship the beta"], "Aadil": ["Update the docs"]}', continuation_prompt)
+        self.assertTrue(result["metadata"]["json_repaired"])
+        self.assertEqual(result["metadata"]["repair_requests"], 1)
+        self.assertEqual(result["metadata"]["tokens_used"], 620)
+
+    def test_single_call_uses_schema_and_repairs(self):
+        self.create.side_effect = [
+            make_completion('{"action_items": [{"task": "Ship the beta", "owner": "Sami", '
+                            '"primary_for": ["Sami"], "secondary_for": ["Aadil"]}, {"task": "Upd'),
+            make_completion(json.dumps({"action_items": [{"task": "Update the docs", "owner": "Aadil",
+                                                          "primary_for": ["Aadil"], "secondary_for": []}]})),
+        ]
+
+        result = self.service.extract_all_action_item_views(TRANSCRIPT, generation_method="single_call")
+
+        response_format = self.create.call_args_list[0].kwargs["response_format"]
+        self.assertEqual(response_format["type"], "json_schema")
+        self.assertTrue(response_format["json_schema"]["strict"])
+        self.assertEqual(result["general_view"]["action_items"],
+                         {"Sami": ["Ship the beta"], "Aadil": ["Update the docs"]})
+        self.assertEqual(result["metadata"]["llm_calls"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Unit tests for the lightweight diarization backend and the DER metric.
+Synthetic audio and a fake window embedder stand in for ECAPA.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from backend.app.core.config import Settings
+from backend.app.pipeline.diarization_metrics import diarization_error_rate
+from backend.app.pipeline.light_diarization import (
+    LightweightDiarizer, agglomerative_cluster, energy_vad
+)
+
+SAMPLE_RATE = 16000
+
+# (start, end, amplitude): speakers are told apart by loudness in these tests
+TURNS = [(0.5, 3.0, 0.2), (3.5, 6.0, 0.6), (6.4, 8.0, 0.2)]
+
+
+def make_waveform(seconds=9.0):
+    rng = np.random.default_rng(0)
+    waveform = rng.normal(0, 0.001, int(seconds * SAMPLE_RATE)).astype(np.float32)
+    for start, end, amplitude in TURNS:
+        span = slice(int(start * SAMPLE_RATE), int(end * SAMPLE_RATE))
+        waveform[span] += amplitude * np.sin(np.linspace(0, 800 * np.pi, span.stop - span.start))
+    return waveform
+
+
+def fake_embed_windows(windows, sample_rate):
+    """Two-dimensional voice print from window loudness."""
+    rms = np.sqrt(np.mean(windows ** 2, axis=1))
+    return np.stack([np.where(rms < 0.25, 1.0, 0.1), np.where(rms < 0.25, 0.1, 1.0)], axis=1)
+
+
+class TestEnergyVAD(unittest.TestCase):
+
+    def test_detects_speech_regions(self):
+        regions = energy_vad(make_waveform(), SAMPLE_RATE)
+
+        self.assertEqual(len(regions), 3)
+        for (start, end), (ref_start, ref_end, _) in zip(regions, TURNS):
+            self.assertAlmostEqual(start, ref_start, delta=0.05)
+            self.assertAlmostEqual(end, ref_end, delta=0.05)
+
+    def test_bridges_short_pauses(self):
+        regions = energy_vad(make_waveform(), SAMPLE_RATE, min_silence_seconds=0.45)
+        self.assertEqual(len(regions), 2)
+
+
+def rescan_cluster(embeddings, num_speakers, threshold):
+    """Reference average linkage that rescans the full distance matrix for every merge."""
+    vectors = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    distances = 1.0 - vectors @ vectors.T
+    np.fill_diagonal(distances, np.inf)
+    sizes, labels, clusters = np.ones(len(vectors)), np.arange(len(vectors)), len(vectors)
+    while clusters > 1:
+        i, j = divmod(int(np.argmin(distances)), len(vectors))
+        if (clusters <= num_speakers) if num_speakers else distances[i, j] > threshold:
+            break
+        merged = (sizes[i] * distances[i] + sizes[j] * distances[j]) / (sizes[i] + sizes[j])
+        distances[i, :] = distances[:, i] = merged
+        distances[i, i] = np.inf
+        distances[j, :] = distances[:, j] = np.inf
+        sizes[i] += sizes[j]
+        labels[labels == j] = i
+        clusters -= 1
+    first_seen = list(dict.fromkeys(labels.tolist()))
+    return np.array([first_seen.index(label) for label in labels.tolist()])
+
+
+class TestAgglomerativeCluster(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        centers = np.eye(4)[:3]
+        self.labels = np.array([0, 0, 1, 1, 2, 2, 0, 1])
+        self.embeddings = centers[self.labels] + rng.normal(0, 0.05, (8, 4))
+
+    def test_threshold_finds_speaker_count(self):
+        labels = agglomerative_cluster(self.embeddings)
+        np.testing.assert_array_equal(labels, self.labels)
+
+    def test_num_speakers_and_bounds(self):
+        self.assertEqual(len(set(agglomerative_cluster(self.embeddings, num_speakers=2))), 2)
+        self.assertEqual(len(set(agglomerative_cluster(self.embeddings, max_speakers=2))), 2)
+        self.assertEqual(len(set(agglomerative_cluster(self.embeddings, threshold=2.0, min_speakers=3))), 3)
+
+    def test_matches_full_matrix_rescan(self):
+        """Cached nearest neighbours merge the same pairs as an argmin over the whole matrix."""
+        rng = np.random.default_rng(7)
+        for count in (2, 30, 120):
+            centers = rng.normal(size=(4, 16))
+            embeddings = centers[rng.integers(0, 4, count)] + rng.normal(0, 0.8, (count, 16))
+            for num_speakers in (None, 3):
+                np.testing.assert_array_equal(agglomerative_cluster(embeddings, num_speakers, threshold=0.5),
+                                              rescan_cluster(embeddings, num_speakers, threshold=0.5))
+
+
+class TestLightweightDiarizer(unittest.TestCase):
+
+    def test_returns_diarization_format(self):
+        result = LightweightDiarizer(fake_embed_windows).diarize(make_waveform(), SAMPLE_RATE)
+
+        self.assertEqual(result['total_speakers'], 2)
+        self.assertEqual(result['unique_speakers'], ['SPEAKER_00', 'SPEAKER_01'])
+        self.assertEqual([s['speaker'] for s in result['segments']], ['SPEAKER_00', 'SPEAKER_01', 'SPEAKER_00'])
+        for segment in result['segments']:
+            self.assertEqual(set(segment), {'start', 'end', 'speaker', 'duration'})
+
+        reference = [{'start': s, 'end': e, 'speaker': 'A' if a < 0.5 else 'B'} for s, e, a in TURNS]
+        self.assertLess(diarization_error_rate(reference, result['segments'])['der'], 0.05)
+
+    def test_silence_gives_no_segments(self):
+        result = LightweightDiarizer(fake_embed_windows).diarize(np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE)
+        self.assertEqual(result['segments'], [])
+
+
+class TestBackendSetting(unittest.TestCase):
+
+    def test_default_is_pyannote(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(Settings(_env_file=None).diarization_backend, 'pyannote')
+
+    def test_auto_is_opt_in(self):
+        with mock.patch.dict(os.environ, {'DIARIZATION_BACKEND': 'auto'}, clear=True):
+            self.assertEqual(Settings(_env_file=None).diarization_backend, 'auto')
+
+
+class TestDiarizationErrorRate(unittest.TestCase):
+
+    def test_label_names_do_not_matter(self):
+        reference = [{'start': 0, 'end': 2, 'speaker': 'A'}, {'start': 2, 'end': 4, 'speaker': 'B'}]
+        hypothesis = [{'start': 0, 'end': 2, 'speaker': 'x'}, {'start': 2, 'end': 4, 'speaker': 'y'}]
+        self.assertAlmostEqual(diarization_error_rate(reference, hypothesis)['der'], 0.0)
+
+    def test_components(self):
+        reference = [{'start': 0, 'end': 2, 'speaker': 'A'}, {'start': 2, 'end': 4, 'speaker': 'B'}]
+        hypothesis = [{'start': 0, 'end': 3, 'speaker': 'x'}, {'start': 4, 'end': 5, 'speaker': 'y'}]
+        result = diarization_error_rate(reference, hypothesis)
+
+        self.assertAlmostEqual(result['confusion'], 0.25, places=2)
+        self.assertAlmostEqual(result['missed'], 0.25, places=2)
+        self.assertAlmostEqual(result['false_alarm'], 0.25, places=2)
+        self.assertAlmostEqual(result['der'], 0.75, places=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the live transcription session.
+Whisper and ECAPA are replaced by scripted callables so the rolling-window logic,
+speaker assignment and latency bound can be checked without the ML stack.
+"""
+
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.live import LiveTranscriptionSession
+
+SAMPLE_RATE = 16000
+
+# Scripted speech: (word, start, end, speaker level); the fake embedder recognises
+# a speaker by the constant amplitude of their audio.
+SCRIPT = [
+    (' We', 0.5, 0.8, 1), (' ship', 0.8, 1.2, 1), (' Friday.', 1.2, 1.9, 1),
+    (' Docs', 3.0, 3.4, 2), (' first.', 3.4, 4.1, 2),
+    (' Agreed.', 5.5, 6.2, 1),
+]
+LEVELS = {1: 0.2, 2: 0.6}
+
+
+def make_pcm(seconds):
+    """16-bit PCM where each scripted word is a constant tone at its speaker's level."""
+    samples = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+    for _, start, end, speaker in SCRIPT:
+        samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] = LEVELS[speaker]
+    return (samples * 32767).astype('<i2').tobytes()
+
+
+def fake_transcribe(audio, offset, initial_prompt=None):
+    """Return scripted words lying entirely inside the window."""
+    window_end = offset + len(audio) / SAMPLE_RATE
+    return [
+        {'word': word, 'start': start, 'end': end}
+        for word, start, end, _ in SCRIPT
+        if start >= offset - 1e-6 and end <= window_end + 1e-6
+    ]
+
+
+def fake_embed(waveform, sample_rate):
+    """One-hot voice print from the loudest level in the clip."""
+    level = float(np.abs(waveform).max())
+    return np.array([1.0, 0.0]) if abs(level - 0.2) < abs(level - 0.6) else np.array([0.0, 1.0])
+
+
+class TestLiveTranscriptionSession(unittest.TestCase):
+
+    def stream(self, session, seconds, chunk_seconds=0.5):
+        """Feed audio in chunks, processing whenever the session is ready."""
+        pcm = make_pcm(seconds)
+        chunk = int(chunk_seconds * SAMPLE_RATE) * 2
+        segments = []
+        for offset in range(0, len(pcm), chunk):
+            session.add_audio(pcm[offset:offset + chunk])
+            if session.ready():
+                segments.extend(session.process())
+        segments.extend(session.finish())
+        return segments
+
+    def test_words_are_emitted_once_in_order(self):
+        """Overlapping windows never emit a word twice or out of order."""
+        session = LiveTranscriptionSession(fake_transcribe, fake_embed, {'Sami': np.array([1.0, 0.0])},
+                                           window_seconds=4.0, step_seconds=1.0, holdback_seconds=0.5)
+        segments = self.stream(session, 7.0)
+
+        words = [word['word'] for segment in segments for word in segment['words']]
+        self.assertEqual(words, [word for word, *_ in SCRIPT])
+        self.assertEqual([segment['text'] for segment in segments], ['We ship Friday.', 'Docs first.', 'Agreed.'])
+
+    def test_known_and_unknown_speakers_are_assigned(self):
+        """Known voices match the database snapshot; a new voice keeps a stable unknown label."""
+        session = LiveTranscriptionSession(fake_transcribe, fake_embed, {'Sami': np.array([1.0, 0.0])},
+                                           window_seconds=4.0, step_seconds=1.0, holdback_seconds=0.5)
+        segments = self.stream(session, 7.0)
+
+        self.assertEqual([segment['matched_speaker'] for segment in segments], ['Sami', 'Unknown 1', 'Sami'])
+        self.assertEqual([segment['speaker'] for segment in segments], ['SPEAKER_00', 'SPEAKER_01', 'SPEAKER_00'])
+
+    def test_latency_is_bounded_when_processing_falls_behind(self):
+        """Audio older than max_lag_seconds is skipped rather than delaying new segments."""
+        session = LiveTranscriptionSession(fake_transcribe, fake_embed, {}, max_lag_seconds=3.0)
+        session.add_audio(make_pcm(7.0))
+        segments = session.finish()
+
+        self.assertEqual([segment['text'] for segment in segments], ['Agreed.'])
+        self.assertAlmostEqual(session.stats()['skipped_seconds'], 4.0, places=2)
+
+    def test_stats_report_latency(self):
+        clock = iter(float(tick) for tick in range(1000))
+        session = LiveTranscriptionSession(fake_transcribe, fake_embed, {}, window_seconds=4.0,
+                                           step_seconds=1.0, clock=lambda: next(clock))
+        self.stream(session, 7.0)
+
+        stats = session.stats()
+        self.assertEqual(stats['segments'], 3)
+        self.assertGreater(stats['latency_max'], 0)
+        self.assertAlmostEqual(stats['audio_seconds'], 7.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for LLMResponseCache and its integration with LLMService.
+Uses a mocked OpenAI client so no network access is required.
+"""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from backend.app.services.llm_cache import LLMResponseCache
+from backend.app.services.llm_service import LLMService
+
+
+TRANSCRIPT = 'Sami: "Let\'s ship the beta on Friday."\n\nAadil: "I will update the docs before then."'
+
+
+def make_completion(content, total_tokens=120):
+    """Build a fake chat completion response."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content))]
+    response.usage = Mock(total_tokens=total_tokens)
+    return response
+
+
+class TestLLMResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_keys_are_deterministic(self):
+        """Same parts produce the same key regardless of argument order."""
+        key_a = LLMResponseCache.make_key(model="m", transcript="t", temperature=0.2)
+        key_b = LLMResponseCache.make_key(temperature=0.2, transcript="t", model="m")
+        key_c = LLMResponseCache.make_key(model="m", transcript="t", temperature=0.3)
+        self.assertEqual(key_a, key_b)
+        self.assertNotEqual(key_a, key_c)
+
+    def test_persists_across_instances(self):
+        """Entries written by one instance are readable by a new one."""
+        LLMResponseCache(self.cache_dir).set("abc", {"summary": "hello"})
+        reloaded = LLMResponseCache(self.cache_dir)
+        self.assertEqual(reloaded.get("abc"), {"summary": "hello"})
+
+    def test_ttl_expiry(self):
+        """Expired entries are treated as misses and removed."""
+        cache = LLMResponseCache(self.cache_dir, ttl_seconds=0.05)
+        cache.set("abc", {"summary": "hello"})
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("abc"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted once max_entries is exceeded."""
+        cache = LLMResponseCache(self.cache_dir, max_entries=2)
+        cache.set("a", {"v": 1})
+        time.sleep(0.01)
+        cache.set("b", {"v": 2})
+        time.sleep(0.01)
+        cache.get("a")  # "a" is now more recently used than "b"
+        time.sleep(0.01)
+        cache.set("c", {"v": 3})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"v": 1})
+        self.assertEqual(cache.get("c"), {"v": 3})
+
+    def test_lru_order_survives_restart(self):
+        """An early entry that is read often outlives a later unread one after a restart."""
+        cache = LLMResponseCache(self.cache_dir, max_entries=2)
+        cache.set("a", {"v": 1})
+        time.sleep(0.01)
+        cache.set("b", {"v": 2})
+        time.sleep(0.01)
+        cache.get("a")
+
+        reloaded = LLMResponseCache(self.cache_dir, max_entries=2)
+        time.sleep(0.01)
+        reloaded.set("c", {"v": 3})
+
+        self.assertIsNone(reloaded.get("b"))
+        self.assertEqual(reloaded.get("a"), {"v": 1})
+
+    def test_shared_between_live_instances(self):
+        """Two instances on one directory see each other's entries, hits and the shared size bound."""
+        first = LLMResponseCache(self.cache_dir, max_entries=2)
+        second = LLMResponseCache(self.cache_dir, max_entries=2)
+        first.set("a", {"v": 1})
+        self.assertEqual(second.get("a"), {"v": 1})
+        time.sleep(0.01)
+        second.set("b", {"v": 2})
+        time.sleep(0.01)
+        second.get("a")  # "a" is now more recently used than "b", as seen on disk
+        time.sleep(0.01)
+        first.set("c", {"v": 3})
+
+        self.assertEqual(len(list(self.cache_dir.glob("*.json"))), 2)
+        self.assertIsNone(first.get("b"))
+        self.assertEqual(first.get("a"), {"v": 1})
+
+    def test_hits_do_not_extend_ttl_across_restart(self):
+        cache = LLMResponseCache(self.cache_dir, ttl_seconds=0.2)
+        cache.set("abc", {"summary": "hello"})
+        time.sleep(0.15)
+        cache.get("abc")
+        time.sleep(0.1)
+
+        self.assertIsNone(LLMResponseCache(self.cache_dir, ttl_seconds=0.2).get("abc"))
+
+
+class TestLLMServiceCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = LLMResponseCache(Path(self.temp_dir.name))
+        self.service = LLMService("test-key", cache=self.cache)
+        self.service.client = Mock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_summary_cache_hit_reports_tokens_saved(self):
+        """A repeated summary request is served from cache without calling the API."""
+        self.service.client.chat.completions.create.return_value = make_completion("### Summary", 150)
+
+        first = self.service.generate_meeting_summary(TRANSCRIPT, user_notes="notes")
+        second = self.service.generate_meeting_summary(TRANSCRIPT, user_notes="notes")
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 1)
+        self.assertFalse(first["metadata"]["cache_hit"])
+        self.assertTrue(second["metadata"]["cache_hit"])
+        self.assertEqual(second["metadata"]["tokens_saved"], 150)
+        self.assertEqual(second["metadata"]["tokens_used"], 0)
+        self.assertEqual(second["summary"], "### Summary")
+
+    def test_different_inputs_miss(self):
+        """Changing notes or target speaker produces a different key."""
+        self.service.client.chat.completions.create.return_value = make_completion('{"Sami": ["Ship beta"]}')
+
+        self.service.extract_action_items_by_speaker(TRANSCRIPT)
+        self.service.extract_action_items_by_speaker(TRANSCRIPT, target_speaker="Sami")
+        self.service.extract_action_items_by_speaker(TRANSCRIPT, user_notes="extra")
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 3)
+
+    def test_parse_failures_are_not_cached(self):
+        """The fallback result for unparseable output is never cached."""
+        self.service.client.chat.completions.create.return_value = make_completion("not json")
+
+        self.service.extract_action_items_by_speaker(TRANSCRIPT)
+        self.service.extract_action_items_by_speaker(TRANSCRIPT)
+
+        # Each extraction makes the original request plus one repair request
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 4)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_insights_aggregate_cache_metadata(self):
+        """Insights report combined cache hits and tokens saved."""
+        self.service.client.chat.completions.create.side_effect = [
+            make_completion("### Summary", 100),
+            make_completion('{"Sami": ["Ship beta"]}', 50),
+        ]
+        self.service.generate_meeting_insights(TRANSCRIPT)
+        insights = self.service.generate_meeting_insights(TRANSCRIPT)
+
+        self.assertEqual(insights["metadata"]["cache_hits"], 2)
+        self.assertEqual(insights["metadata"]["tokens_saved"], 150)
+        self.assertEqual(insights["metadata"]["total_tokens_used"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+Integration tests for the transcript-only LLM endpoints.
+Runs the FastAPI app with a processor whose LLMService uses a mocked OpenAI client.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+from backend.app import main
+from backend.app.services.llm_service import LLMService
+
+TRANSCRIPT = 'Sami: "Ship the beta on Friday."\n\nAadil: "I will update the docs."'
+
+
+class TestLLMEndpointBudget(unittest.TestCase):
+
+    def setUp(self):
+        # The prompt templates alone exceed this budget
+        service = LLMService("test-key", max_prompt_tokens=100, chunk_token_threshold=80)
+        service.client = Mock()
+        self.create = service.client.chat.completions.create
+        patcher = patch.object(main, "get_processor", return_value=Mock(llm_service=service))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def test_oversized_transcript_returns_413(self):
+        for endpoint in ("/summarize", "/action-items", "/insights"):
+            response = self.client.post(endpoint, data={"transcript": TRANSCRIPT})
+            self.assertEqual(response.status_code, 413, endpoint)
+            self.assertIn("budget", response.json()["detail"])
+        self.create.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
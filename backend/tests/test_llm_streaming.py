@@ -0,0 +1,161 @@
+"""
+Unit tests for streamed summaries and insights.
+Runs LLMService against a local stub that streams chat completion chunks with delays.
+"""
+
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.app.services.http_client import create_http_client
+from backend.app.services.llm_service import LLMService
+from backend.app.services.token_budget import TokenBudgetPlanner
+
+
+TRANSCRIPT = (
+    'Sami Inourji: "We need to ship the beta on Friday."\n\n'
+    'Aadil Khan: "I will update the docs before then."'
+)
+
+CHUNK_DELAY = 0.2
+
+
+class _StreamingStubHandler(BaseHTTPRequestHandler):
+    """Streams ``server.deltas`` as chat.completion.chunk events; answers non-streamed calls with JSON."""
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not request.get("stream"):
+            body = json.dumps(_completion(self.server.json_reply)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for delta in self.server.deltas:
+            try:
+                self._event(_chunk({"content": delta}))
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            self.server.sent_deltas += 1
+            time.sleep(CHUNK_DELAY)
+        self._event({**_chunk(None), "choices": [],
+                     "usage": {"prompt_tokens": 80, "completion_tokens": 20, "total_tokens": 100}})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _event(self, payload):
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+def _chunk(delta):
+    return {"id": "chatcmpl-1", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": delta or {}, "finish_reason": None}]}
+
+
+def _completion(content):
+    return {"id": "chatcmpl-2", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 60, "completion_tokens": 10, "total_tokens": 70}}
+
+
+class TestLLMStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StreamingStubHandler)
+        self.server.deltas = ["## Summary\n", "- Beta ships ", "on Friday\n"]
+        self.server.sent_deltas = 0
+        self.server.json_reply = json.dumps({"Aadil Khan": ["Update the docs before Friday"]})
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.service = LLMService("test-key", http_client=create_http_client())
+        self.service.client = self.service.client.with_options(
+            base_url=f"http://127.0.0.1:{self.server.server_address[1]}"
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def collect(self, events):
+        started = time.monotonic()
+        timed_events = [(event, data, time.monotonic() - started) for event, data in events]
+        return timed_events, time.monotonic() - started
+
+    def test_summary_deltas_arrive_before_completion_finishes(self):
+        timed_events, total = self.collect(self.service.stream_meeting_summary(TRANSCRIPT))
+
+        deltas = [(data, at) for event, data, at in timed_events if event == "delta"]
+        self.assertEqual([data for data, _ in deltas], self.server.deltas)
+        self.assertGreaterEqual(total, CHUNK_DELAY * len(self.server.deltas))
+        self.assertLess(deltas[0][1], CHUNK_DELAY * len(self.server.deltas) - CHUNK_DELAY)
+
+        event, result, _ = timed_events[-1]
+        self.assertEqual(event, "summary")
+        self.assertEqual(result["summary"], "".join(self.server.deltas))
+        self.assertEqual(result["metadata"]["tokens_used"], 100)
+
+    def test_speaker_tags_expanded_across_delta_boundaries(self):
+        self.server.deltas = ["- @S", "1 ships the beta, @S2 ", "updates docs"]
+
+        events = list(self.service.stream_meeting_summary(TRANSCRIPT, compact=True))
+
+        streamed = "".join(data for event, data in events if event == "delta")
+        self.assertEqual(streamed, "- @Sami Inourji ships the beta, @Aadil Khan updates docs")
+        self.assertEqual(events[-1][1]["summary"], streamed)
+
+    def test_insights_deliver_action_items_once_complete(self):
+        events = list(self.service.stream_meeting_insights(TRANSCRIPT))
+        names = [event for event, _ in events]
+
+        # Action items are extracted concurrently, so they arrive while the summary still streams
+        self.assertEqual(names.count("action_items"), 1)
+        self.assertLess(names.index("action_items"), names.index("summary"))
+        self.assertEqual(names[-1], "insights")
+
+        insights = events[-1][1]
+        self.assertEqual(insights["summary"], "".join(self.server.deltas))
+        self.assertEqual(insights["action_items_by_speaker"], {"Aadil Khan": ["Update the docs before Friday"]})
+        self.assertEqual(insights["metadata"]["total_tokens_used"], 170)
+
+    def test_budget_error_event_instead_of_generic_failure(self):
+        # Chunk prompts of the map step exceed the hard budget
+        self.service.token_planner = TokenBudgetPlanner(self.service.token_estimator, max_prompt_tokens=500,
+                                                        chunk_token_threshold=400)
+
+        for stream in (self.service.stream_meeting_summary, self.service.stream_meeting_insights):
+            events = list(stream(TRANSCRIPT))
+            self.assertEqual(events[-1][0], "error")
+            self.assertEqual(events[-1][1]["status_code"], 413)
+            self.assertIn("budget", events[-1][1]["detail"])
+
+    def test_closing_the_stream_stops_the_completion(self):
+        """A consumer that goes away (SSE disconnect) stops the worker reading further tokens."""
+        self.server.deltas = [f"- point {i}\n" for i in range(20)]
+        worker_threads = set(threading.enumerate())
+
+        events = self.service.stream_meeting_summary(TRANSCRIPT)
+        self.assertEqual(next(events)[0], "delta")
+        events.close()
+
+        worker = next(thread for thread in threading.enumerate()
+                      if thread not in worker_threads and thread.name.endswith("(worker)"))
+        worker.join(timeout=CHUNK_DELAY * 5)
+        self.assertFalse(worker.is_alive())
+        time.sleep(CHUNK_DELAY * 3)
+        self.assertLess(self.server.sent_deltas, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Unit tests for map-reduce summarization of long transcripts.
+Uses a mocked OpenAI client; checks chunking on speaker-turn boundaries and the merge step.
+"""
+
+import threading
+import unittest
+from unittest.mock import Mock
+
+from backend.app.services.llm_service import LLMService
+from backend.app.services.token_budget import TokenBudgetExceededError
+
+
+def make_transcript(num_turns):
+    """Build a transcript alternating between two speakers."""
+    speakers = ["Sami", "Aadil"]
+    return "\n\n".join(
+        f'{speakers[i % 2]}: "This is turn number {i} discussing the launch plan in some detail."'
+        for i in range(num_turns)
+    )
+
+
+class TestMapReduceSummary(unittest.TestCase):
+
+    def setUp(self):
+        # The threshold applies to the whole prompt, including the ~1.2k token instruction template
+        self.service = LLMService("test-key", chunk_token_threshold=1500, chunk_target_tokens=100)
+        self.service.client = Mock()
+        self.prompts = []
+        lock = threading.Lock()
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            with lock:
+                self.prompts.append(prompt)
+            response = Mock()
+            is_chunk = "Transcript part:" in prompt
+            response.choices = [Mock(message=Mock(content="- partial" if is_chunk else "### Final"))]
+            response.usage = Mock(total_tokens=10)
+            return response
+
+        self.service.client.chat.completions.create.side_effect = create
+
+    def test_chunks_respect_turn_boundaries(self):
+        """Every chunk contains whole turns and stays within the token budget."""
+        transcript = make_transcript(20)
+        chunks = self.service._split_transcript_into_chunks(transcript, 100)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("\n\n".join(chunks), transcript)
+        for chunk in chunks:
+            self.assertLessEqual(self.service._estimate_tokens(chunk), 100)
+
+    def test_oversized_turn_keeps_speaker_label(self):
+        """A single turn above the budget is split into labelled pieces."""
+        long_turn = "Sami: " + " ".join(["word"] * 400)
+        chunks = self.service._split_transcript_into_chunks(long_turn, 50)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.startswith("Sami:") for chunk in chunks))
+
+    def test_long_transcript_switches_to_map_reduce(self):
+        """Transcripts above the threshold are summarized per chunk and merged."""
+        result = self.service.generate_meeting_summary(make_transcript(40))
+
+        metadata = result["metadata"]
+        self.assertEqual(metadata["summarization_mode"], "map_reduce")
+        self.assertEqual(len(self.prompts), metadata["chunks"] + 1)
+        self.assertEqual(metadata["tokens_used"], 10 * (metadata["chunks"] + 1))
+        self.assertEqual(result["summary"], "### Final")
+
+        merge_prompt = next(p for p in self.prompts if "Transcript part:" not in p)
+        self.assertIn("partial summaries", merge_prompt)
+        self.assertIn(f"Part {metadata['chunks']} of {metadata['chunks']}", merge_prompt)
+
+    def test_many_chunks_merge_hierarchically_within_budget(self):
+        """Partial summaries too large for one merge prompt are merged in batches first."""
+        service = LLMService("test-key", chunk_token_threshold=1500, chunk_target_tokens=100,
+                             max_prompt_tokens=2500)
+        service.client = Mock()
+        partial = "- The launch plan was discussed at length in this part.\n" * 30
+        prompts = []
+        lock = threading.Lock()
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            with lock:
+                prompts.append(prompt)
+            if "Transcript part:" in prompt:
+                content = partial
+            elif "Notes to combine:" in prompt:
+                content = "- Merged launch notes"
+            else:
+                content = "### Final"
+            response = Mock()
+            response.choices = [Mock(message=Mock(content=content))]
+            response.usage = Mock(total_tokens=10)
+            return response
+
+        service.client.chat.completions.create.side_effect = create
+        result = service.generate_meeting_summary(make_transcript(120))
+
+        metadata = result["metadata"]
+        chunk_prompts = [p for p in prompts if "Transcript part:" in p]
+        batch_prompts = [p for p in prompts if "Notes to combine:" in p]
+        self.assertEqual(len(chunk_prompts), metadata["chunks"])
+        self.assertGreaterEqual(metadata["merge_rounds"], 1)
+        self.assertGreater(len(batch_prompts), 1)
+        self.assertEqual(len(prompts), len(chunk_prompts) + len(batch_prompts) + 1)
+        self.assertEqual(result["summary"], "### Final")
+        for prompt in prompts:
+            self.assertLessEqual(service.token_estimator.count_messages([{"role": "user", "content": prompt}]),
+                                 2500)
+
+        # Without batching, the merge prompt would have exceeded the budget
+        all_parts = service._build_summary_prompt("\n\n".join([partial] * metadata["chunks"]), [])
+        self.assertFalse(service._within_budget(all_parts))
+
+    def test_merge_fails_when_no_two_summaries_fit(self):
+        service = LLMService("test-key", chunk_token_threshold=1500, chunk_target_tokens=100,
+                             max_prompt_tokens=600)
+        service.client = Mock()
+        response = Mock()
+        response.choices = [Mock(message=Mock(content="- partial " * 200))]
+        response.usage = Mock(total_tokens=10)
+        service.client.chat.completions.create.return_value = response
+
+        with self.assertRaises(TokenBudgetExceededError):
+            service.generate_meeting_summary(make_transcript(40))
+
+    def test_short_transcript_stays_single_shot(self):
+        result = self.service.generate_meeting_summary(make_transcript(2))
+
+        self.assertEqual(result["metadata"]["summarization_mode"], "single_shot")
+        self.assertEqual(len(self.prompts), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the SQLite meeting store and its partial retrieval queries.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.app.pipeline.meeting_store import MeetingStore
+from backend.app.pipeline.segments import Segment
+from backend.app.services.transcript import Transcript, Turn
+from backend.app.utils.serialization import dumps
+
+
+def make_result(speakers=('Sami', 'Aadil'), insights=None):
+    segments = []
+    for index in range(6):
+        segment = Segment(index * 10.0, index * 10.0 + 8.0, f"SPEAKER_0{index % 2}",
+                          matched_speaker=speakers[index % len(speakers)], similarity_score=0.8)
+        segment.text = f"Point number {index}."
+        segments.append(segment)
+    transcript = Transcript([Turn(segment.matched_speaker, segment.text, segment.start, segment.end)
+                             for segment in segments], duration=58.0)
+    result = {
+        'audio_path': 'meeting.m4a',
+        'segments': segments,
+        'transcript': transcript,
+        'diarization_metadata': {'total_speakers': len(speakers)},
+        'processing_metadata': {'total_segments': 6, 'total_duration': 48.0,
+                                'speakers_identified': len(speakers)}
+    }
+    if insights is not None:
+        result['llm_insights'] = insights
+    return result
+
+
+class TestMeetingStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = MeetingStore(Path(self.temp_dir.name) / 'meetings.sqlite3')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_list_by_speaker_and_date(self):
+        self.store.save('old', make_result(('Sami', 'Maya')), created_at=1_700_000_000)  # 2023-11-14
+        self.store.save('new', make_result(), created_at=1_760_000_000)  # 2025-10-09
+
+        self.assertEqual([m['id'] for m in self.store.list_meetings()], ['new', 'old'])
+        self.assertEqual([m['id'] for m in self.store.list_meetings(speaker='Maya')], ['old'])
+        self.assertEqual([m['id'] for m in self.store.list_meetings(since='2025-01-01')], ['new'])
+        self.assertEqual([m['id'] for m in self.store.list_meetings(until='2025-01-01')], ['old'])
+        self.assertEqual(self.store.list_meetings(limit=1, offset=1)[0]['id'], 'old')
+        with self.assertRaises(ValueError):
+            self.store.list_meetings(since='last week')
+
+    def test_get_meeting_metadata(self):
+        self.store.save('m1', make_result())
+        meeting = self.store.get_meeting('m1')
+
+        self.assertEqual(meeting['segment_count'], 6)
+        self.assertEqual(meeting['duration'], 48.0)
+        self.assertEqual(meeting['speakers'], [{'name': 'Aadil', 'speaking_seconds': 24.0},
+                                               {'name': 'Sami', 'speaking_seconds': 24.0}])
+        self.assertEqual(meeting['metadata']['diarization_metadata'], {'total_speakers': 2})
+        self.assertFalse(meeting['has_insights'])
+        self.assertIsNone(self.store.get_meeting('missing'))
+
+    def test_transcript_time_range(self):
+        self.store.save('m1', make_result())
+        sliced = self.store.get_transcript('m1', start=15.0, end=30.0)
+
+        segments = json.loads(dumps({'segments': sliced['segments']}))['segments']
+        self.assertEqual([s['start'] for s in segments], [10.0, 20.0])
+        self.assertEqual(segments[0]['text'], 'Point number 1.')
+        self.assertEqual([turn['speaker'] for turn in sliced['turns']], ['Aadil', 'Sami'])
+        self.assertEqual(sliced['speaker_annotated_transcript'],
+                         'Aadil: "Point number 1."\n\nSami: "Point number 2."')
+
+        self.assertEqual(len(self.store.get_transcript('m1')['turns']), 6)
+        self.assertIsNone(self.store.get_transcript('missing'))
+
+    def test_insights_and_resave(self):
+        self.store.save('m1', make_result(), created_at=1_700_000_000)
+        self.assertEqual(self.store.get_insights('m1').data, b'null')
+
+        insights = {'summary': 'Shipped.', 'action_items': [{'task': 'Docs'}]}
+        self.store.save('m1', make_result(('Sami',), insights))
+
+        self.assertEqual(json.loads(self.store.get_insights('m1').data), insights)
+        meeting = self.store.get_meeting('m1')
+        self.assertTrue(meeting['has_insights'])
+        self.assertTrue(meeting['created_at'].startswith('2023-11-14'))
+        self.assertEqual([s['name'] for s in meeting['speakers']], ['Sami'])
+        self.assertIsNone(self.store.get_insights('missing'))
+
+    def test_import_result_file(self):
+        path = Path(self.temp_dir.name) / 'meeting_abc.json'
+        path.write_bytes(dumps(make_result()))
+
+        self.assertEqual(self.store.import_result_file(path), 'abc')
+        self.assertEqual(len(self.store.get_transcript('abc', end=5.0)['turns']), 1)
+        self.assertTrue(self.store.delete('abc'))
+        self.assertIsNone(self.store.get_meeting('abc'))
+
+
+if __name__ == '__main__':
+    unittest.main()
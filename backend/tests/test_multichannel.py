@@ -0,0 +1,96 @@
+"""
+Unit tests for per-channel diarization of multi-track recordings.
+Synthetic channels with crosstalk stand in for conferencing exports.
+"""
+
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.multichannel import MultiChannelDiarizer, channel_activity, channels_are_duplicates
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, amplitude, frequency=220.0):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def make_tracks():
+    """Channel 0 talks 0.5-3s, channel 1 talks 4-6s; each bleeds into the other at -26 dB."""
+    rng = np.random.default_rng(0)
+    tracks = rng.normal(0, 0.0005, (2, 7 * SAMPLE_RATE)).astype(np.float32)
+    for channel, (start, end) in enumerate([(0.5, 3.0), (4.0, 6.0)]):
+        span = slice(int(start * SAMPLE_RATE), int(end * SAMPLE_RATE))
+        voice = tone(end - start, 0.3)
+        tracks[channel, span] += voice
+        tracks[1 - channel, span] += 0.05 * voice
+    return tracks
+
+
+class TestChannelActivity(unittest.TestCase):
+
+    def test_crosstalk_is_not_counted_as_speech(self):
+        activity = channel_activity(make_tracks(), SAMPLE_RATE)
+        frame_seconds = 0.03
+
+        # Channel 1 only carries bleed during channel 0's turn, and vice versa
+        self.assertTrue(activity[0, int(1.5 / frame_seconds)])
+        self.assertFalse(activity[1, int(1.5 / frame_seconds)])
+        self.assertTrue(activity[1, int(5.0 / frame_seconds)])
+        self.assertFalse(activity[0, int(5.0 / frame_seconds)])
+
+    def test_duplicate_channels(self):
+        tracks = make_tracks()
+        self.assertTrue(channels_are_duplicates(np.stack([tracks[0], tracks[0]])))
+        self.assertFalse(channels_are_duplicates(tracks))
+
+
+class TestMultiChannelDiarizer(unittest.TestCase):
+
+    def test_segments_come_from_channel_activity(self):
+        result = MultiChannelDiarizer().diarize(make_tracks(), SAMPLE_RATE)
+
+        self.assertEqual(result['unique_speakers'], ['CHANNEL_1', 'CHANNEL_2'])
+        self.assertEqual(result['mixed_channels'], [])
+        self.assertEqual(len(result['segments']), 2)
+        first, second = result['segments']
+        self.assertAlmostEqual(first['start'], 0.5, delta=0.05)
+        self.assertAlmostEqual(first['end'], 3.0, delta=0.05)
+        self.assertEqual(second['channel'], 1)
+        self.assertEqual(set(first), {'start', 'end', 'speaker', 'duration', 'channel'})
+
+    def test_mixed_channels_fall_back_to_neural_diarization(self):
+        calls = []
+
+        def diarize_mixed(waveform, sample_rate):
+            calls.append(waveform)
+            return {'segments': [{'start': 4.0, 'end': 5.0, 'speaker': 'SPEAKER_00', 'duration': 1.0},
+                                 {'start': 5.0, 'end': 6.0, 'speaker': 'SPEAKER_01', 'duration': 1.0}]}
+
+        result = MultiChannelDiarizer(diarize_mixed=diarize_mixed).diarize(
+            make_tracks(), SAMPLE_RATE, mixed_channels=[1]
+        )
+
+        self.assertEqual(len(calls), 1)
+        # Crosstalk outside the channel's own speech is silenced before diarization
+        self.assertEqual(float(np.abs(calls[0][int(1.5 * SAMPLE_RATE)])), 0.0)
+        self.assertEqual(result['unique_speakers'], ['CHANNEL_1', 'CHANNEL_2/SPEAKER_00', 'CHANNEL_2/SPEAKER_01'])
+
+    def test_mixed_channels_are_detected_from_embeddings(self):
+        tracks = make_tracks()
+        # Second voice on channel 0 at a different loudness
+        tracks[0, int(3.2 * SAMPLE_RATE):int(3.8 * SAMPLE_RATE)] += tone(0.6, 0.9)
+
+        def embed_windows(windows, sample_rate):
+            rms = np.sqrt(np.mean(windows ** 2, axis=1))
+            return np.stack([np.where(rms < 0.4, 1.0, 0.0), np.where(rms < 0.4, 0.0, 1.0)], axis=1)
+
+        result = MultiChannelDiarizer(embed_windows).diarize(tracks, SAMPLE_RATE)
+        self.assertEqual(result['mixed_channels'], [0])
+        self.assertIn('CHANNEL_2', result['unique_speakers'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Unit tests for OnlineSpeakerClusterer.
+Uses synthetic embeddings around fixed voice directions, so no models are required.
+"""
+
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.online_clustering import OnlineSpeakerClusterer
+
+DIM = 16
+
+
+def voice(index, rng, noise=0.2):
+    """A noisy embedding near the index-th basis direction."""
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[index] = 1.0
+    return vector + rng.normal(0, noise / np.sqrt(DIM), DIM).astype(np.float32)
+
+
+class TestOnlineSpeakerClusterer(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_windows_from_the_same_voice_share_a_cluster(self):
+        clusterer = OnlineSpeakerClusterer()
+        assignments = [clusterer.assign(voice(index, self.rng)) for index in [0, 1, 0, 2, 1, 0]]
+
+        self.assertEqual([a['cluster'] for a in assignments], [0, 1, 0, 2, 1, 0])
+        self.assertEqual([a['new_cluster'] for a in assignments], [True, True, False, True, False, False])
+        self.assertEqual(assignments[0]['matched_speaker'], 'Unknown 1')
+        self.assertEqual(assignments[3]['matched_speaker'], 'Unknown 3')
+
+    def test_centroid_is_running_mean(self):
+        """The centroid tracks the mean direction of the windows assigned to it."""
+        clusterer = OnlineSpeakerClusterer(cluster_threshold=0.0)
+        windows = [voice(0, self.rng, noise=0.5) for _ in range(20)]
+        for window in windows:
+            clusterer.assign(window)
+
+        expected = np.mean([w / np.linalg.norm(w) for w in windows], axis=0)
+        expected /= np.linalg.norm(expected)
+        np.testing.assert_allclose(clusterer._centroids[0], expected, atol=1e-5)
+
+    def test_clusters_are_matched_to_known_speakers(self):
+        """Clusters take database names; voices not in the database stay unknown."""
+        clusterer = OnlineSpeakerClusterer({'Sami': voice(0, self.rng), 'Aadil': voice(1, self.rng)})
+
+        self.assertEqual(clusterer.assign(voice(1, self.rng))['matched_speaker'], 'Aadil')
+        self.assertEqual(clusterer.assign(voice(0, self.rng))['matched_speaker'], 'Sami')
+        self.assertEqual(clusterer.assign(voice(5, self.rng))['matched_speaker'], 'Unknown 1')
+        self.assertEqual(clusterer.labels(), {'SPEAKER_00': 'Aadil', 'SPEAKER_01': 'Sami',
+                                              'SPEAKER_02': 'Unknown 1'})
+
+    def test_cluster_count_is_bounded(self):
+        """Past max_clusters, windows join the closest cluster so per-window work stays constant."""
+        clusterer = OnlineSpeakerClusterer(max_clusters=3)
+        for index in range(6):
+            clusterer.assign(voice(index, self.rng))
+
+        self.assertEqual(clusterer.num_clusters, 3)
+        self.assertEqual(clusterer.stats()['windows'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
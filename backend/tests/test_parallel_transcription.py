@@ -0,0 +1,73 @@
+"""
+Unit tests for silence-cut chunk planning and word stitching.
+"""
+
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.parallel_transcription import ChunkParallelTranscriber, plan_chunks, stitch_words
+
+SR = 16000
+
+
+def speech_with_pauses(duration: float, pauses):
+    """Noise with silent ``(start, end)`` gaps."""
+    audio = np.random.default_rng(0).normal(scale=0.1, size=int(duration * SR)).astype(np.float32)
+    for start, end in pauses:
+        audio[int(start * SR):int(end * SR)] = 0.0
+    return audio
+
+
+class TestPlanChunks(unittest.TestCase):
+
+    def test_short_audio_is_one_chunk(self):
+        chunks = plan_chunks(np.zeros(30 * SR, dtype=np.float32), SR, chunk_seconds=60)
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual((chunks[0]['start'], chunks[0]['end']), (0, 30 * SR))
+
+    def test_cuts_land_in_pauses(self):
+        audio = speech_with_pauses(170, [(57.0, 58.0), (121.0, 122.0)])
+        chunks = plan_chunks(audio, SR, chunk_seconds=60, search_seconds=5, overlap_seconds=0.5)
+
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(57.0 <= chunks[0]['keep_end'] <= 58.0)
+        self.assertTrue(121.0 <= chunks[1]['keep_end'] <= 122.0)
+        self.assertEqual(chunks[0]['keep_end'], chunks[1]['keep_start'])
+        self.assertEqual(chunks[1]['start'], int(chunks[1]['keep_start'] * SR) - SR // 2)
+        self.assertEqual(chunks[-1]['end'], len(audio))
+
+
+class TestStitchWords(unittest.TestCase):
+
+    def test_overlap_words_kept_once(self):
+        first = {'keep_start': 0.0, 'keep_end': 10.0}
+        second = {'keep_start': 10.0, 'keep_end': 20.0}
+        stitched = stitch_words([
+            (first, [{'word': ' one', 'start': 9.0, 'end': 9.5}, {'word': ' two', 'start': 10.1, 'end': 10.4}]),
+            (second, [{'word': ' one', 'start': 9.05, 'end': 9.5}, {'word': ' two', 'start': 10.1, 'end': 10.4},
+                      {'word': ' three', 'start': 11.0, 'end': 11.3}]),
+        ])
+        self.assertEqual([word['word'] for word in stitched], [' one', ' two', ' three'])
+
+    def test_word_straddling_cut_not_duplicated(self):
+        first = {'keep_start': 0.0, 'keep_end': 10.0}
+        second = {'keep_start': 10.0, 'keep_end': 20.0}
+        stitched = stitch_words([
+            (first, [{'word': ' budget', 'start': 9.7, 'end': 10.25}]),
+            (second, [{'word': ' Budget', 'start': 9.8, 'end': 10.3}]),
+        ])
+        self.assertEqual(len(stitched), 1)
+
+
+class TestChunkParallelTranscriber(unittest.TestCase):
+
+    def test_splits_only_long_audio_and_shares_cores(self):
+        transcriber = ChunkParallelTranscriber('base', workers=4, chunk_seconds=60)
+        self.assertFalse(transcriber.should_split(90))
+        self.assertTrue(transcriber.should_split(600))
+        self.assertGreaterEqual(transcriber.model_options['cpu_threads'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Unit tests for pyannote pipeline tuning that do not need the models.
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from backend.app.pipeline.pyannote_optimization import optimize_pipeline
+
+
+class TestOptimizePipeline(unittest.TestCase):
+
+    def test_applies_batch_sizes(self):
+        pipeline = SimpleNamespace(segmentation_batch_size=1, embedding_batch_size=1)
+        applied = optimize_pipeline(pipeline, segmentation_batch_size=32, embedding_batch_size=16)
+
+        self.assertEqual((pipeline.segmentation_batch_size, pipeline.embedding_batch_size), (32, 16))
+        self.assertEqual(applied['quantized'], [])
+
+    def test_skips_unsupported_attributes(self):
+        pipeline = SimpleNamespace()
+        applied = optimize_pipeline(pipeline, segmentation_batch_size=32, embedding_batch_size=32)
+
+        self.assertNotIn('segmentation_batch_size', applied)
+        self.assertFalse(hasattr(pipeline, 'embedding_batch_size'))
+
+    def test_quantize_without_submodels_is_a_no_op(self):
+        applied = optimize_pipeline(SimpleNamespace(_segmentation=None, _embedding=None), quantize=True)
+        self.assertEqual(applied['quantized'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the FTS5 transcript search index.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.app.pipeline.search_index import TranscriptSearchIndex, match_expression
+from backend.app.pipeline.segments import Segment
+from backend.app.services.transcript import Transcript, Turn
+
+
+def meeting(lines):
+    segments, turns = [], []
+    for index, (speaker, text) in enumerate(lines):
+        segment = Segment(index * 5.0, index * 5.0 + 4.0, f"SPEAKER_0{index}", matched_speaker=speaker)
+        segment.text = text
+        segments.append(segment)
+        turns.append(Turn(speaker, text, segment.start, segment.end))
+    return segments, Transcript(turns)
+
+
+class TestTranscriptSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index = TranscriptSearchIndex(Path(self.temp_dir.name) / 'search.sqlite3')
+        self.index.index_meeting('budget', *meeting([
+            ('Sami', "Let's review the Q3 budget before Friday."),
+            ('Aadil', 'The marketing budget is over by ten percent.'),
+        ]))
+        self.index.index_meeting('launch', *meeting([
+            ('Maya', 'We should ship the beta launch on Friday.'),
+        ]))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_hits_carry_meeting_speaker_and_time(self):
+        hits = self.index.search('marketing budget')
+
+        self.assertEqual(len(hits), 1)
+        self.assertEqual((hits[0]['meeting_id'], hits[0]['speaker'], hits[0]['start'], hits[0]['end']),
+                         ('budget', 'Aadil', 5.0, 9.0))
+        self.assertIn('[marketing]', hits[0]['snippet'])
+
+    def test_filters(self):
+        self.assertEqual({hit['meeting_id'] for hit in self.index.search('friday')}, {'budget', 'launch'})
+        self.assertEqual({hit['source'] for hit in self.index.search('friday', meeting_id='launch')},
+                         {'transcript'})
+        self.assertEqual({hit['source'] for hit in self.index.search('friday', meeting_id='launch', source=None)},
+                         {'transcript', 'segment'})
+        self.assertEqual([hit['speaker'] for hit in self.index.search('friday', speaker='Sami', source='segment')],
+                         ['Sami'])
+        with self.assertRaises(ValueError):
+            self.index.search('friday', source='notes')
+
+    def test_reindex_replaces_meeting(self):
+        self.index.index_meeting('launch', *meeting([('Maya', 'Launch moved to Monday.')]))
+
+        self.assertEqual({hit['meeting_id'] for hit in self.index.search('friday')}, {'budget'})
+        self.assertEqual(self.index.search('monday')[0]['meeting_id'], 'launch')
+        self.assertEqual(self.index.remove_meeting('launch'), 2)
+        self.assertEqual(self.index.stats(), {'meetings': 1, 'entries': 4})
+
+    def test_each_passage_is_returned_once(self):
+        hits = self.index.search('friday')
+
+        self.assertEqual(len(hits), 2)
+        self.assertEqual(len({(hit['meeting_id'], hit['start']) for hit in hits}), 2)
+
+    def test_older_meetings_are_ranked_with_the_rest(self):
+        self.index.index_meeting('older', *meeting([('Sami', 'Friday friday friday release.')]))
+        for number in range(50):
+            self.index.index_meeting(f'newer-{number}', *meeting([('Maya', 'Maybe Friday, maybe later this week.')]))
+
+        self.assertEqual(self.index.search('friday', limit=1)[0]['meeting_id'], 'older')
+
+    def test_segments_stand_in_for_a_missing_transcript(self):
+        segments, _ = meeting([('Sami', 'Quarterly offsite planning.')])
+        self.index.index_meeting('untranscribed', segments)
+
+        hits = self.index.search('offsite')
+        self.assertEqual([(hit['meeting_id'], hit['source']) for hit in hits], [('untranscribed', 'transcript')])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(match_expression('budget NEAR( "beta  launch" -x'), '"budget" "NEAR" "beta launch" "x"')
+        self.assertIsNone(match_expression('*( )"'))
+        self.assertEqual(self.index.search('"ship the beta"')[0]['meeting_id'], 'launch')
+        self.assertEqual(self.index.search('?!'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
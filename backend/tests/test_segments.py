@@ -0,0 +1,53 @@
+"""
+Unit tests for the slot-based Segment shared across the pipeline.
+"""
+
+import json
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.segments import Segment, as_segments
+
+
+class TestSegment(unittest.TestCase):
+
+    def test_dict_compatible_access(self):
+        segment = Segment(np.float64(1.0), 2.5, 'SPEAKER_00')
+
+        self.assertEqual(segment['start'], 1.0)
+        self.assertEqual(segment['duration'], 1.5)
+        self.assertEqual(segment.get('matched_speaker', 'Unknown'), 'Unknown')
+        self.assertNotIn('text', segment)
+        with self.assertRaises(KeyError):
+            segment['text']
+
+        segment['matched_speaker'] = 'Sami'
+        segment['channel'] = 1
+        self.assertEqual(segment.matched_speaker, 'Sami')
+        self.assertEqual(segment['channel'], 1)
+        self.assertEqual({**segment}['channel'], 1)
+
+    def test_to_dict_is_json_ready(self):
+        segment = Segment(np.float32(0.5), np.float64(1.5), 'SPEAKER_01',
+                          similarity_score=np.float32(0.8), channel=2)
+        segment.text = 'Hello'
+        data = segment.to_dict()
+
+        self.assertEqual(type(data['start']), float)
+        self.assertEqual(type(data['similarity_score']), float)
+        self.assertEqual(data['channel'], 2)
+        self.assertNotIn('confidence', data)
+        self.assertEqual(json.loads(json.dumps(data))['text'], 'Hello')
+
+    def test_as_segments_reuses_objects(self):
+        existing = Segment(0.0, 1.0, 'SPEAKER_00')
+        converted = as_segments([existing, {'start': 1.0, 'end': 2.0, 'speaker': 'SPEAKER_01', 'duration': 1.0}])
+
+        self.assertIs(converted[0], existing)
+        self.assertEqual(converted[1].to_dict(),
+                         {'start': 1.0, 'end': 2.0, 'speaker': 'SPEAKER_01', 'duration': 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
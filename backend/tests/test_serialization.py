@@ -0,0 +1,137 @@
+"""
+Unit tests for the shared JSON serializer and the SSE-safe compression middleware.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from backend.app.pipeline.segments import Segment
+from backend.app.utils import serialization
+from backend.app.utils.compression import CompressionMiddleware
+from backend.app.utils.serialization import FastJSONResponse, RawJSON, dumps
+
+
+class TestDumps(unittest.TestCase):
+
+    def _document(self):
+        return {
+            'segments': [Segment(0.0, 1.5, 'SPEAKER_00', similarity_score=np.float32(0.75))],
+            'embedding': np.arange(3, dtype=np.float32),
+            'duration': np.float64(12.5),
+            'speakers': np.int64(2),
+            'name': 'Café',
+        }
+
+    def test_numpy_and_segments(self):
+        for encoder in (serialization.orjson, None):
+            with self.subTest(orjson=encoder is not None), patch.object(serialization, 'orjson', encoder):
+                data = dumps(self._document())
+                decoded = json.loads(data)
+
+                self.assertEqual(decoded['embedding'], [0.0, 1.0, 2.0])
+                self.assertEqual(decoded['duration'], 12.5)
+                self.assertEqual(decoded['speakers'], 2)
+                self.assertEqual(decoded['segments'][0]['similarity_score'], 0.75)
+                self.assertEqual(decoded['name'], 'Café')
+                self.assertNotIn(b'\n', data)
+                self.assertNotIn(b': ', data)
+
+    def test_raw_json_is_spliced_verbatim(self):
+        segments = RawJSON(dumps([{'start': 0.0, 'text': 'hi "there"'}]))
+        data = dumps({'success': True, 'transcription': {'segments': segments}})
+
+        self.assertIn(segments.data, data)
+        self.assertEqual(json.loads(data)['transcription']['segments'][0]['text'], 'hi "there"')
+        self.assertEqual(json.loads(dumps({'file': segments, 'response': segments}))['file'][0]['start'], 0.0)
+
+    def test_fast_json_response(self):
+        response = FastJSONResponse(content={'segments': RawJSON(b'[1,2]'), 'value': np.float32(0.5)})
+
+        self.assertEqual(json.loads(response.body), {'segments': [1, 2], 'value': 0.5})
+        self.assertEqual(response.headers['content-type'], 'application/json')
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+
+    def _client(self, mode='gzip'):
+        async def large(request):
+            return FastJSONResponse({'text': 'meeting notes ' * 500})
+
+        async def small(request):
+            return FastJSONResponse({'ok': True})
+
+        async def events(request):
+            async def stream():
+                for index in range(3):
+                    yield f"event: delta\ndata: {index}\n\n"
+            return StreamingResponse(stream(), media_type='text/event-stream')
+
+        app = Starlette(routes=[Route('/large', large), Route('/small', small), Route('/events', events)])
+        app.add_middleware(CompressionMiddleware, mode=mode, minimum_size=1024)
+        return TestClient(app)
+
+    def test_large_json_is_gzipped(self):
+        response = self._client().get('/large', headers={'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(response.headers['content-encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['vary'])
+        self.assertEqual(response.json()['text'], 'meeting notes ' * 500)
+
+    def test_small_and_unaccepted_responses_are_untouched(self):
+        client = self._client()
+
+        self.assertNotIn('content-encoding', client.get('/small', headers={'Accept-Encoding': 'gzip'}).headers)
+        self.assertNotIn('content-encoding', client.get('/large', headers={'Accept-Encoding': 'identity'}).headers)
+        self.assertNotIn('content-encoding', self._client('none').get('/large').headers)
+
+    def test_event_streams_pass_through(self):
+        response = self._client().get('/events', headers={'Accept-Encoding': 'gzip'})
+
+        self.assertNotIn('content-encoding', response.headers)
+        self.assertEqual(response.text.count('event: delta'), 3)
+
+    def test_streamed_bodies_are_forwarded_unbuffered(self):
+        """Chunks of streams without Content-Length, or sent in several parts, go out as produced."""
+        middleware_scope = {'type': 'http', 'headers': [(b'accept-encoding', b'gzip')]}
+
+        for headers in ([(b'content-type', b'application/json')],
+                        [(b'content-type', b'application/json'), (b'content-length', b'4000')]):
+            sent = []
+
+            async def app(scope, receive, send):
+                await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+                for index in range(2):
+                    await send({'type': 'http.response.body', 'body': b'x' * 2000, 'more_body': True})
+                    # The middleware has already forwarded this chunk
+                    self.assertEqual(sent[-1]['body'], b'x' * 2000)
+                await send({'type': 'http.response.body', 'body': b''})
+
+            async def send(message):
+                sent.append(message)
+
+            asyncio.run(CompressionMiddleware(app, minimum_size=1024)(middleware_scope, None, send))
+
+            self.assertEqual(len(sent), 4)
+            self.assertNotIn(b'content-encoding', dict(sent[0]['headers']))
+
+    def test_brotli_falls_back_to_gzip(self):
+        with patch('backend.app.utils.compression.brotli', None):
+            response = self._client('br').get('/large', headers={'Accept-Encoding': 'br, gzip'})
+
+        self.assertEqual(response.headers['content-encoding'], 'gzip')
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            CompressionMiddleware(None, mode='zstd')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+Unit tests for deriving speaker-count bounds from request hints.
+"""
+
+import unittest
+
+from backend.app.pipeline.speaker_bounds import derive_speaker_bounds
+
+
+class TestDeriveSpeakerBounds(unittest.TestCase):
+
+    def test_no_hints_is_fully_automatic(self):
+        bounds = derive_speaker_bounds()
+        self.assertEqual((bounds['min_speakers'], bounds['max_speakers'], bounds['source']), (None, None, 'auto'))
+
+    def test_explicit_count_wins(self):
+        bounds = derive_speaker_bounds(['Sami', 'Aadil'], ['Sami'], attendee_count=6, num_speakers=3)
+        self.assertEqual(bounds['num_speakers'], 3)
+        self.assertIsNone(bounds['max_speakers'])
+
+    def test_names_and_samples(self):
+        bounds = derive_speaker_bounds(['Sami', 'Aadil', 'Sparsh', ''], ['Sami', 'Aadil'])
+        self.assertEqual((bounds['min_speakers'], bounds['max_speakers']), (2, 4))
+        self.assertEqual(bounds['source'], 'speaker_names+voice_samples')
+
+    def test_attendee_count_raises_upper_bound(self):
+        bounds = derive_speaker_bounds(['Sami'], attendee_count=5, slack=0)
+        self.assertEqual((bounds['min_speakers'], bounds['max_speakers']), (None, 5))
+
+    def test_single_sample_is_not_a_lower_bound(self):
+        bounds = derive_speaker_bounds(voice_sample_names=['Sami'])
+        self.assertEqual((bounds['min_speakers'], bounds['max_speakers']), (None, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Unit tests for the cross-meeting speaker occurrence index and label propagation.
+"""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from backend.app.pipeline.meeting_store import MeetingStore
+from backend.app.pipeline.search_index import TranscriptSearchIndex
+from backend.app.pipeline.segments import Segment
+from backend.app.pipeline.speaker_index import SpeakerOccurrenceIndex, propagate_label
+
+rng = np.random.default_rng(0)
+VOICES = {name: rng.normal(size=192).astype(np.float32) for name in ('sami', 'maya', 'aadil')}
+
+
+def voice(name, noise=0.2):
+    return VOICES[name] + noise * rng.normal(size=192).astype(np.float32)
+
+
+class TestSpeakerOccurrenceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / 'meetings.sqlite3'
+        self.index = SpeakerOccurrenceIndex(self.path)
+        self.index.add_meeting('m1', {'SPEAKER_00': voice('sami'), 'SPEAKER_01': voice('maya')},
+                               {'SPEAKER_00': 'Sami', 'SPEAKER_01': 'Unknown 1'})
+        self.index.add_meeting('m2', {'SPEAKER_00': voice('maya'), 'SPEAKER_01': voice('aadil')},
+                               {'SPEAKER_00': 'Unknown 1', 'SPEAKER_01': 'Unknown 2'})
+        self.index.add_meeting('m3', {'SPEAKER_00': voice('maya'), 'SPEAKER_01': None},
+                               {'SPEAKER_00': 'Maria'})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_find_returns_best_speaker_per_meeting(self):
+        hits = self.index.find(VOICES['maya'], threshold=0.6)
+
+        self.assertEqual(sorted(hit['meeting_id'] for hit in hits), ['m1', 'm2', 'm3'])
+        self.assertEqual({hit['meeting_id']: hit['label'] for hit in hits},
+                         {'m1': 'Unknown 1', 'm2': 'Unknown 1', 'm3': 'Maria'})
+        self.assertEqual(hits, sorted(hits, key=lambda hit: -hit['similarity']))
+        self.assertEqual(self.index.find(VOICES['aadil'], threshold=0.6)[0]['meeting_id'], 'm2')
+
+    def test_occurrences_by_either_label(self):
+        by_label = self.index.occurrences('m1', 'Unknown 1')
+        by_speaker = self.index.occurrences('m1', 'SPEAKER_01')
+
+        self.assertEqual(by_label, by_speaker)
+        self.assertEqual(sorted(hit['meeting_id'] for hit in by_label), ['m2', 'm3'])
+        self.assertIsNone(self.index.occurrences('m1', 'SPEAKER_09'))
+
+    def test_persistence_and_readd(self):
+        other = SpeakerOccurrenceIndex(self.path)
+        self.assertEqual(len(other), 5)
+
+        other.add_meeting('m2', {'SPEAKER_00': voice('aadil')}, {'SPEAKER_00': 'Unknown 1'})
+        # The first instance notices the other's write
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.find(VOICES['aadil'], threshold=0.6)[0]['speaker'], 'SPEAKER_00')
+        self.assertEqual(self.index.remove_meeting('m3'), 1)
+        self.assertEqual(len(other), 3)
+
+    def test_concurrent_writers_keep_every_update(self):
+        """Adds through one instance and relabels through another interleave without losing either."""
+        other = SpeakerOccurrenceIndex(self.path)
+        embeddings = {f'new-{number}': {'SPEAKER_00': voice('aadil')} for number in range(20)}
+
+        def add(meeting_id):
+            self.index.add_meeting(meeting_id, embeddings[meeting_id], {'SPEAKER_00': 'Unknown 1'})
+
+        def relabel(number):
+            other.set_labels([{'meeting_id': 'm2', 'speaker': 'SPEAKER_00'}], f'Maya {number}')
+
+        threads = [threading.Thread(target=add, args=(meeting_id,)) for meeting_id in embeddings]
+        threads += [threading.Thread(target=relabel, args=(number,)) for number in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index in (self.index, other, SpeakerOccurrenceIndex(self.path)):
+            self.assertEqual(len(index), 5 + len(embeddings))
+            self.assertTrue(index.lookup('m2', 'SPEAKER_00')['label'].startswith('Maya'))
+            self.assertEqual(index.lookup('new-7', 'SPEAKER_00')['label'], 'Unknown 1')
+
+
+class TestPropagateLabel(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.store = MeetingStore(root / 'meetings.sqlite3')
+        self.index = SpeakerOccurrenceIndex(root / 'meetings.sqlite3')
+        self.search = TranscriptSearchIndex(root / 'search.sqlite3')
+
+        meetings = {
+            'm1': [('maya', 'Unknown 1'), ('sami', 'Sami')],
+            'm2': [('aadil', 'Unknown 1'), ('maya', 'Unknown 2')],
+            'm3': [('maya', 'Maria')],
+        }
+        for meeting_id, speakers in meetings.items():
+            segments = []
+            for index, (voice_name, label) in enumerate(speakers):
+                segment = Segment(index * 5.0, index * 5.0 + 4.0, f"SPEAKER_0{index}", matched_speaker=label)
+                segment.text = f"{voice_name} talking about the roadmap"
+                segments.append(segment)
+            self.store.save(meeting_id, {'segments': segments, 'processing_metadata': {}})
+            self.search.index_meeting(meeting_id, segments)
+            self.index.add_meeting(meeting_id, {f"SPEAKER_0{index}": voice(voice_name)
+                                                for index, (voice_name, _) in enumerate(speakers)},
+                                   {f"SPEAKER_0{index}": label for index, (_, label) in enumerate(speakers)})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_labels_unknown_occurrences_only(self):
+        result = propagate_label(self.index, 'm1', 'Unknown 1', 'Maya', threshold=0.6,
+                                 stores=(self.store, self.search))
+
+        self.assertEqual([(o['meeting_id'], o['label']) for o in result['relabelled']],
+                         [('m1', 'Unknown 1'), ('m2', 'Unknown 2')])
+        self.assertEqual([(o['meeting_id'], o['label']) for o in result['skipped']], [('m3', 'Maria')])
+
+        m2 = self.store.get_meeting('m2')
+        self.assertEqual(sorted(s['name'] for s in m2['speakers']), ['Maya', 'Unknown 1'])
+        self.assertEqual(sorted(m['id'] for m in self.store.list_meetings(speaker='Maya')), ['m1', 'm2'])
+        self.assertIn(b'"matched_speaker":"Maya"', self.store.get_transcript('m2', start=5.0)['segments'].data)
+        self.assertEqual({hit['meeting_id'] for hit in self.search.search('roadmap', speaker='Maya')}, {'m1', 'm2'})
+        self.assertEqual(self.index.lookup('m2', 'SPEAKER_01')['label'], 'Maya')
+        # Aadil's cluster in m2 keeps its label
+        self.assertEqual(self.index.lookup('m2', 'SPEAKER_00')['label'], 'Unknown 1')
+
+    def test_relabels_only_the_named_cluster(self):
+        """Two clusters matched to the same label: only the one being named is relabelled."""
+        segments = []
+        for index, voice_name in enumerate(('aadil', 'maya')):
+            segment = Segment(index * 5.0, index * 5.0 + 4.0, f"SPEAKER_0{index}", matched_speaker='Unknown 1')
+            segment.text = f"{voice_name} on the budget"
+            segments.append(segment)
+        transcript = {'turns': [{'speaker': 'Unknown 1', 'text': 'aadil on the budget', 'start': 0.2, 'end': 3.9},
+                                {'speaker': 'Unknown 1', 'text': 'maya on the budget', 'start': 5.1, 'end': 8.8}]}
+        self.store.save('m4', {'segments': segments, 'transcript': transcript, 'processing_metadata': {}})
+        self.search.index_meeting('m4', segments, transcript)
+        self.index.add_meeting('m4', {'SPEAKER_00': voice('aadil'), 'SPEAKER_01': voice('maya')},
+                               {'SPEAKER_00': 'Unknown 1', 'SPEAKER_01': 'Unknown 1'})
+
+        propagate_label(self.index, 'm4', 'SPEAKER_01', 'Maya', threshold=0.6, stores=(self.store, self.search))
+
+        speakers = {s['name']: s['speaking_seconds'] for s in self.store.get_meeting('m4')['speakers']}
+        self.assertEqual(speakers, {'Maya': 4.0, 'Unknown 1': 4.0})
+        turns = self.store.get_transcript('m4')['turns']
+        self.assertEqual([turn['speaker'] for turn in turns], ['Unknown 1', 'Maya'])
+        self.assertIn(b'"matched_speaker":"Unknown 1","text":"aadil',
+                      self.store.get_transcript('m4', end=4.0)['segments'].data)
+        for source in ('transcript', 'segment'):
+            hits = self.search.search('budget', speaker='Maya', meeting_id='m4', source=source)
+            self.assertEqual([hit['start'] for hit in hits], [5.0 if source == 'segment' else 5.1], source)
+        self.assertEqual(self.index.lookup('m4', 'SPEAKER_00')['label'], 'Unknown 1')
+
+    def test_unknown_speaker(self):
+        self.assertIsNone(propagate_label(self.index, 'm1', 'Nobody', 'Maya'))
+
+
+if __name__ == '__main__':
+    unittest.main()
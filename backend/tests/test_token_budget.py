@@ -0,0 +1,113 @@
+"""
+Unit tests for local token estimation and the token budget planner.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from backend.app.services.llm_service import LLMService
+from backend.app.services.token_budget import TokenBudgetExceededError, TokenBudgetPlanner, TokenEstimator
+from backend.app.services.transcript_compaction import compact_transcript
+
+
+class TestTokenEstimator(unittest.TestCase):
+
+    def setUp(self):
+        self.estimator = TokenEstimator()
+
+    def test_counts_are_plausible_for_english(self):
+        """Common English prose lands near the usual ~0.75 words per token."""
+        text = "We agreed to ship the beta on Friday and review the metrics next week. " * 20
+        words = len(text.split())
+        tokens = self.estimator.count(text)
+        self.assertGreater(tokens, words * 0.9)
+        self.assertLess(tokens, words * 1.6)
+
+    def test_empty_text(self):
+        self.assertEqual(self.estimator.count(""), 0)
+
+    def test_calibration_moves_toward_actual(self):
+        """Observed API usage pulls future estimates toward the real tokenizer."""
+        text = "alpha beta gamma " * 50
+        before = self.estimator.count(text)
+        for _ in range(30):
+            self.estimator.observe(self.estimator.count(text), before * 2)
+        after = self.estimator.count(text)
+        self.assertAlmostEqual(after / before, 2.0, delta=0.1)
+
+
+class TestTokenBudgetPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.estimator = TokenEstimator()
+        self.transcript = "\n\n".join(
+            f'Sami: "Point number {i} about the roadmap."' for i in range(60)
+        )
+        self.transcript_tokens = self.estimator.count(self.transcript)
+        self.compacted_tokens = self.estimator.count(compact_transcript(self.transcript))
+
+    def plan(self, threshold, max_prompt_tokens=100000, allow_chunking=True):
+        planner = TokenBudgetPlanner(self.estimator, max_prompt_tokens=max_prompt_tokens,
+                                     chunk_token_threshold=threshold)
+        return planner.plan(self.transcript, 100, compact_transcript, allow_chunking=allow_chunking)
+
+    def test_single_shot_when_within_budget(self):
+        plan = self.plan(threshold=self.transcript_tokens + 100)
+        self.assertEqual(plan['strategy'], 'single_shot')
+        self.assertEqual(plan['transcript'], self.transcript)
+
+    def test_compacted_when_compaction_fits(self):
+        self.assertLess(self.compacted_tokens, self.transcript_tokens)
+        plan = self.plan(threshold=self.compacted_tokens + 100)
+        self.assertEqual(plan['strategy'], 'compacted')
+        self.assertEqual(plan['estimated_prompt_tokens'], self.compacted_tokens + 100)
+
+    def test_chunked_when_nothing_fits(self):
+        plan = self.plan(threshold=50)
+        self.assertEqual(plan['strategy'], 'chunked')
+
+    def test_rejects_oversized_prompt_without_chunking(self):
+        with self.assertRaises(TokenBudgetExceededError):
+            self.plan(threshold=50, max_prompt_tokens=50, allow_chunking=False)
+
+
+class TestLLMServiceTokenAccounting(unittest.TestCase):
+
+    def test_metadata_reports_estimated_and_actual_tokens(self):
+        service = LLMService("test-key")
+        service.client = Mock()
+        response = Mock()
+        response.choices = [Mock(message=Mock(content='{"Sami": ["Ship beta"]}'))]
+        response.usage = Mock(total_tokens=900, prompt_tokens=850, completion_tokens=50)
+        service.client.chat.completions.create.return_value = response
+
+        result = service.extract_action_items_by_speaker('Sami: "Ship the beta."')
+        metadata = result["metadata"]
+
+        self.assertEqual(metadata["token_strategy"], "single_shot")
+        self.assertEqual(metadata["actual_prompt_tokens"], 850)
+        self.assertGreater(metadata["estimated_prompt_tokens"], 0)
+
+    def test_request_over_hard_budget_is_never_sent(self):
+        service = LLMService("test-key", max_prompt_tokens=100)
+        service.client = Mock()
+
+        with self.assertRaises(TokenBudgetExceededError):
+            service.extract_action_items_by_speaker('Sami: "Ship the beta."')
+        service.client.chat.completions.create.assert_not_called()
+
+    def test_summary_over_budget_keeps_budget_error(self):
+        """A merge prompt above the hard budget surfaces as a budget error, not a generic failure."""
+        service = LLMService("test-key", max_prompt_tokens=500, chunk_token_threshold=400)
+        service.client = Mock()
+        response = Mock()
+        response.choices = [Mock(message=Mock(content="- partial"))]
+        response.usage = Mock(total_tokens=10, prompt_tokens=None)
+        service.client.chat.completions.create.return_value = response
+
+        with self.assertRaises(TokenBudgetExceededError):
+            service.generate_meeting_summary('Sami: "Ship the beta."\n\nAadil: "I will update the docs."')
+
+
+if __name__ == '__main__':
+    unittest.main()
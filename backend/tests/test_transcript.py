@@ -0,0 +1,100 @@
+"""
+Unit tests for the structured Transcript object.
+Verifies turn grouping from Whisper words, lazy serialization and single parsing in LLMService.
+"""
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from backend.app.services.llm_service import LLMService
+from backend.app.services.transcript import Transcript
+
+
+WORDS = [
+    {'word': ' Let\'s', 'start': 0.0, 'end': 0.3, 'speaker': 'Sami'},
+    {'word': ' ship', 'start': 0.3, 'end': 0.6, 'speaker': 'Sami'},
+    {'word': ' Friday.', 'start': 0.6, 'end': 1.0, 'speaker': 'Sami'},
+    {'word': ' Docs', 'start': 1.4, 'end': 1.7, 'speaker': 'Aadil'},
+    {'word': ' first.', 'start': 1.7, 'end': 2.1, 'speaker': 'Aadil'},
+    {'word': ' Hmm', 'start': 2.5, 'end': 2.7, 'speaker': 'Unknown_1'},
+]
+
+
+class TestTranscript(unittest.TestCase):
+
+    def test_from_words_groups_turns_with_offsets(self):
+        transcript = Transcript.from_words(WORDS, duration=3.0)
+
+        self.assertEqual([turn.speaker for turn in transcript.turns], ['Sami', 'Aadil', 'Unknown_1'])
+        self.assertEqual(transcript.offsets, [(0.0, 1.0), (1.4, 2.1), (2.5, 2.7)])
+        self.assertEqual(transcript.word_count, 6)
+        self.assertEqual(transcript.participants, ['Aadil', 'Sami'])
+
+    def test_serializes_like_format_as_conversation(self):
+        transcript = Transcript.from_words(WORDS)
+        self.assertEqual(transcript.text, (
+            'Sami: "Let\'s ship Friday."\n\n'
+            'Aadil: "Docs first."\n\n'
+            'Unknown_1: "Hmm"'
+        ))
+
+    def test_serialization_is_lazy_and_cached(self):
+        transcript = Transcript.from_words(WORDS)
+        self.assertIsNone(transcript._text)
+        self.assertIs(transcript.text, transcript.text)
+        self.assertGreater(transcript.token_count, 0)
+
+    def test_parse_round_trip(self):
+        text = Transcript.from_words(WORDS).text
+        parsed = Transcript.parse(text)
+        self.assertEqual(parsed.turn_pairs(), Transcript.from_words(WORDS).turn_pairs())
+        self.assertEqual(parsed.text, text)
+
+    def test_multi_line_turn_adds_no_participants(self):
+        text = 'Sami: "Let us review.\nNote: the deadline moved.\nAlso item 2: budget."\n\nAadil: "OK"'
+        transcript = Transcript.parse(text)
+        self.assertEqual(transcript.participants, ['Aadil', 'Sami'])
+        self.assertEqual(transcript.turns[0].text, 'Let us review.\nNote: the deadline moved.\nAlso item 2: budget.')
+        self.assertEqual(transcript.text, text)
+
+
+class TestLLMServiceTranscriptReuse(unittest.TestCase):
+
+    def setUp(self):
+        self.service = LLMService("test-key")
+        self.service.client = Mock()
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=json.dumps({"Sami": ["Ship Friday"]})))]
+        response.usage = Mock(total_tokens=100, prompt_tokens=80, completion_tokens=20)
+        self.service.client.chat.completions.create.return_value = response
+
+    def test_all_views_parse_transcript_once(self):
+        """The N+1 views share one parsed transcript instead of re-parsing per request."""
+        text = Transcript.from_words(WORDS).text
+        with patch.object(Transcript, 'parse', side_effect=Transcript.parse) as parse:
+            result = self.service.extract_all_action_item_views(text)
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(set(result['speaker_views']), {'Aadil', 'Sami'})
+
+    def test_multi_line_turn_costs_no_extra_speaker_calls(self):
+        text = 'Sami: "Let us review.\nNote: the deadline moved.\nAlso item 2: budget."\n\nAadil: "OK"'
+        result = self.service.extract_all_action_item_views(text)
+
+        self.assertEqual(set(result['speaker_views']), {'Aadil', 'Sami'})
+        self.assertLessEqual(self.service.client.chat.completions.create.call_count, 3)
+
+    def test_accepts_transcript_object(self):
+        transcript = Transcript.from_words(WORDS)
+        with patch.object(Transcript, 'parse') as parse:
+            result = self.service.extract_action_items_by_speaker(transcript)
+
+        parse.assert_not_called()
+        self.assertEqual(result['metadata']['participants'], ['Aadil', 'Sami'])
+        prompt = self.service.client.chat.completions.create.call_args.kwargs['messages'][0]['content']
+        self.assertIn(transcript.text, prompt)
+
+
+if __name__ == '__main__':
+    unittest.main()
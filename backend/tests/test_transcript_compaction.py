@@ -0,0 +1,134 @@
+"""
+Unit tests for token-compacted transcripts.
+Verifies filler stripping, micro-turn merging, speaker aliasing and expansion of model output.
+"""
+
+import json
+import unittest
+from unittest.mock import Mock
+
+from backend.app.services.llm_service import LLMService
+from backend.app.services.transcript_compaction import CompactedTranscript, parse_turns, strip_disfluencies
+
+
+TRANSCRIPT = (
+    'Sami Inourji: "Um, so, like, we need to ship the beta on Friday."\n\n'
+    'Aadil Khan: "Yeah."\n\n'
+    'Sami Inourji: "And uh, you know, I like the new onboarding flow."\n\n'
+    'Aadil Khan: "Can you own the release notes?"\n\n'
+    'Sami Inourji: "Yes."\n\n'
+    'Aadil Khan: "Great, I mean, thanks."'
+)
+
+
+class TestStripDisfluencies(unittest.TestCase):
+
+    def test_removes_hesitations_and_fillers(self):
+        self.assertEqual(strip_disfluencies("Um, so, like, we need it, you know."), "So we need it.")
+
+    def test_keeps_content_uses_of_filler_words(self):
+        self.assertEqual(strip_disfluencies("I like the design"), "I like the design")
+        self.assertEqual(strip_disfluencies("Do you know the owner?"), "Do you know the owner?")
+
+
+class TestCompactedTranscript(unittest.TestCase):
+
+    def setUp(self):
+        self.compaction = CompactedTranscript.build(TRANSCRIPT)
+
+    def test_aliases_speakers_with_header(self):
+        self.assertEqual(self.compaction.aliases, {"S1": "Sami Inourji", "S2": "Aadil Khan"})
+        rendered = self.compaction.render()
+        self.assertTrue(rendered.startswith("Speakers: S1 = Sami Inourji; S2 = Aadil Khan."))
+        self.assertNotIn("Sami Inourji:", rendered)
+
+    def test_backchannel_dropped_and_turns_merged(self):
+        """'Yeah' between two of Sami's turns is dropped; 'Yes' answering a question is kept."""
+        self.assertEqual(self.compaction.text.splitlines(), [
+            "S1: So we need to ship the beta on Friday. And I like the new onboarding flow.",
+            "S2: Can you own the release notes?",
+            "S1: Yes.",
+            "S2: Great thanks.",
+        ])
+
+    def test_reports_token_reduction(self):
+        stats = self.compaction.stats
+        self.assertLess(stats["compacted_tokens"], stats["original_tokens"])
+        self.assertEqual(stats["tokens_reduced"], stats["original_tokens"] - stats["compacted_tokens"])
+        self.assertEqual((stats["original_turns"], stats["compacted_turns"]), (6, 4))
+
+    def test_expands_tags_in_output(self):
+        self.assertEqual(self.compaction.expand("- [ ] @S1 ship the beta (S2's request)"),
+                         "- [ ] @Sami Inourji ship the beta (Aadil Khan's request)")
+        self.assertEqual(self.compaction.expand_data({"S2": ["Review S1's notes"]}),
+                         {"Aadil Khan": ["Review Sami Inourji's notes"]})
+
+    def test_no_alias_collision_with_spoken_tags(self):
+        transcript = 'Sami: "Use the S3 bucket."\n\nAadil: "Fine, S3 it is."'
+        compaction = CompactedTranscript.build(transcript)
+        self.assertEqual(compaction.aliases, {"SPK1": "Sami", "SPK2": "Aadil"})
+        self.assertEqual(compaction.expand("S3 and SPK1"), "S3 and Sami")
+
+    def test_multi_line_turn_is_one_turn(self):
+        """Colons inside a quoted turn that spans lines don't start new turns."""
+        transcript = 'Sami: "Let us review.\nNote: the deadline moved.\nAlso item 2: budget."\n\nAadil: "OK"'
+        self.assertEqual(parse_turns(transcript), [
+            ("Sami", "Let us review.\nNote: the deadline moved.\nAlso item 2: budget."),
+            ("Aadil", "OK"),
+        ])
+        compaction = CompactedTranscript.build(transcript)
+        self.assertEqual(compaction.aliases, {"S1": "Sami", "S2": "Aadil"})
+        self.assertEqual(compaction.stats["original_turns"], 2)
+
+    def test_one_turn_per_line_still_parses(self):
+        self.assertEqual(parse_turns('Sami: "Ship it."\nAadil: "Agreed."'),
+                         [("Sami", "Ship it."), ("Aadil", "Agreed.")])
+
+
+class TestLLMServiceCompaction(unittest.TestCase):
+
+    def setUp(self):
+        self.service = LLMService("test-key")
+        self.service.client = Mock()
+
+    def respond(self, content):
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=content))]
+        response.usage = Mock(total_tokens=120, prompt_tokens=100, completion_tokens=20)
+        self.service.client.chat.completions.create.return_value = response
+
+    def sent_prompt(self):
+        return self.service.client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+
+    def test_summary_uses_compacted_transcript_and_expands_names(self):
+        self.respond("## Summary\n- @S1 will ship the beta; @S2 asked for release notes")
+
+        result = self.service.generate_meeting_summary(TRANSCRIPT, compact=True)
+
+        self.assertIn("S1: So we need to ship the beta", self.sent_prompt())
+        self.assertNotIn("Um,", self.sent_prompt())
+        self.assertEqual(result["summary"],
+                         "## Summary\n- @Sami Inourji will ship the beta; @Aadil Khan asked for release notes")
+        self.assertGreater(result["metadata"]["transcript_compaction"]["tokens_reduced"], 0)
+
+    def test_action_items_expand_owner_keys(self):
+        self.respond(json.dumps({"S1": ["Write the release notes"]}))
+
+        result = self.service.extract_action_items_by_speaker(TRANSCRIPT, compact=True)
+
+        self.assertEqual(result["action_items"], {"Sami Inourji": ["Write the release notes"]})
+
+    def test_service_default_applies_when_not_overridden(self):
+        self.respond("## Summary")
+        self.service.compact_transcripts = True
+
+        self.service.generate_meeting_insights(TRANSCRIPT)
+        self.assertIn("Speakers: S1 = Sami Inourji", self.sent_prompt())
+
+        result = self.service.generate_meeting_summary(TRANSCRIPT, compact=False)
+        self.assertIn('Sami Inourji: "Um, so', self.sent_prompt())
+        self.assertIsNone(result["metadata"]["transcript_compaction"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+"""
+Unit tests for word error rate.
+"""
+
+import unittest
+
+from backend.app.pipeline.transcription_metrics import normalize_words, word_error_rate
+
+
+class TestWordErrorRate(unittest.TestCase):
+
+    def test_identical_ignores_case_and_punctuation(self):
+        result = word_error_rate("Hello there. Let's start!", "hello there let’s start")
+        self.assertEqual(result['wer'], 0.0)
+        self.assertEqual(result['reference_words'], 4)
+
+    def test_counts_each_edit_type(self):
+        result = word_error_rate("the quick brown fox", "the quack fox jumps")
+        self.assertEqual((result['substitutions'], result['deletions'], result['insertions']), (1, 1, 1))
+        self.assertAlmostEqual(result['wer'], 0.75)
+
+    def test_empty_reference(self):
+        self.assertEqual(word_error_rate("", "")['wer'], 0.0)
+        self.assertEqual(word_error_rate("", "extra")['wer'], 1.0)
+
+    def test_normalize_words(self):
+        self.assertEqual(normalize_words("Q3 budget, OK?"), ['q3', 'budget', 'ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the columnar word table and its segment/speaker assignment.
+"""
+
+import unittest
+
+import numpy as np
+
+from backend.app.pipeline.word_table import UNASSIGNED, WordTable, assign_speakers, segment_texts
+from backend.app.services.transcript import Transcript
+
+WORDS = [
+    {'word': ' Hello', 'start': 1.2, 'end': 1.5},
+    {'word': ' world.', 'start': 1.5, 'end': 1.8},
+    {'word': ' Hello', 'start': 3.6, 'end': 3.9},
+    {'word': ' again', 'start': 3.9, 'end': 4.3},
+    {'word': ' bye', 'start': 9.0, 'end': 9.2},
+]
+
+
+class TestWordTable(unittest.TestCase):
+
+    def test_interns_text_and_round_trips(self):
+        table = WordTable.from_words(WORDS)
+
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table.texts, [' Hello', ' world.', ' again', ' bye'])
+        self.assertEqual(table.starts.dtype, np.float32)
+        self.assertEqual(table.to_dicts(), WORDS)
+        self.assertEqual(table.full_text, "Hello  world.  Hello  again  bye")
+
+    def test_arrays_round_trip(self):
+        table = WordTable.from_words(WORDS)
+        self.assertEqual(WordTable.from_arrays(table.to_arrays()).to_dicts(), WORDS)
+
+    def test_coerce_keeps_tables(self):
+        table = WordTable.from_words(WORDS)
+        self.assertIs(WordTable.coerce(table), table)
+
+
+class TestSegmentTexts(unittest.TestCase):
+
+    def test_midpoint_and_fallbacks(self):
+        segments = [
+            {'start': 1.0, 'end': 2.0},   # direct
+            {'start': 3.5, 'end': 4.5},   # direct
+            {'start': 7.5, 'end': 8.0},   # empty: expanded window reaches ' bye'
+            {'start': 20.0, 'end': 21.0},  # nothing near
+        ]
+        texts = segment_texts(WordTable.from_words(WORDS), segments)
+        self.assertEqual(texts, ["Hello  world.", "Hello  again", "bye", ""])
+
+    def test_empty_table(self):
+        self.assertEqual(segment_texts(WordTable.from_words([]), [{'start': 0.0, 'end': 1.0}]), [""])
+
+
+class TestAssignSpeakers(unittest.TestCase):
+
+    SEGMENTS = [
+        {'start': 1.0, 'end': 1.7, 'matched_speaker': 'Sami'},
+        {'start': 1.9, 'end': 3.0, 'matched_speaker': 'Aadil'},
+        {'start': 3.7, 'end': 4.5, 'matched_speaker': 'Sparsh'},
+    ]
+
+    def speakers(self, words):
+        return [word['speaker'] for word in assign_speakers(WordTable.from_words(words), self.SEGMENTS).to_dicts()]
+
+    def test_hit_tolerance_and_unassigned(self):
+        self.assertEqual(self.speakers(WORDS), ['Sami', 'Sami', 'Sparsh', 'Sparsh', UNASSIGNED])
+
+    def test_sentence_end_prefers_previous_speaker(self):
+        # Starts at 1.8: 0.1s after Sami's segment and 0.1s before Aadil's
+        self.assertEqual(self.speakers([{'word': ' done.', 'start': 1.8, 'end': 1.85}]), ['Sami'])
+        self.assertEqual(self.speakers([{'word': ' and', 'start': 1.85, 'end': 1.9}]), ['Aadil'])
+
+    def test_transcript_matches_dict_grouping(self):
+        table = assign_speakers(WordTable.from_words(WORDS), self.SEGMENTS)
+        from_table = Transcript.from_word_table(table, duration=10.0)
+        from_dicts = Transcript.from_words(table.to_dicts(), duration=10.0)
+
+        self.assertEqual(from_table.turn_pairs(), from_dicts.turn_pairs())
+        self.assertEqual(from_table.offsets, from_dicts.offsets)
+        self.assertEqual(from_table.word_count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()